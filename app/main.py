@@ -1,4 +1,6 @@
-from fastapi import FastAPI, APIRouter
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, APIRouter, Depends
 from fastapi.middleware.cors import CORSMiddleware
 import os
 from dotenv import load_dotenv
@@ -6,6 +8,9 @@ from dotenv import load_dotenv
 from modules.auth.adapter.input.web.auth_router import router as auth_router
 from modules.finder_request.adapter.input.web.router.finder_request_router import router as finder_request_router
 from modules.mq.adapter.input.web.router.search_house_router import router as search_house_router
+from modules.mq.adapter.input.web.dependencies import close_message_queue
+from infrastructure.db.dependencies import unit_of_work_scope
+from infrastructure.db.async_postgres import dispose_async_engine
 from modules.utils.address_autocomplete.router.address_autocomplete_router import router as address_autocomplete
 from modules.observations_assistance.adapter.input.router.building_ledger_batch_router import router as building_ledger_batch_router
 from modules.house_analysis.adapter.input.web.router.house_analysis_router import router as house_analysis_router
@@ -18,9 +23,23 @@ from modules.send_message.adapter.input.web.router.send_message_router import ro
 from modules.owner_recommendation.adapter.input.web.router.owner_recommendation_router import (
     router as owner_recommendation_router,
 )
+from modules.student_house_decision_policy.adapter.input.web.router.policy_sandbox_router import (
+    router as policy_sandbox_router,
+)
+from modules.system.adapter.input.web.router.db_pool_router import router as db_pool_router
 
 load_dotenv()
-app = FastAPI()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 프로세스 단위로 재사용하던 MQ 연결을 정리한다.
+    close_message_queue()
+    await dispose_async_engine()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # ✅ CORS 미들웨어 추가
 app.add_middleware(
@@ -32,7 +51,8 @@ app.add_middleware(
 )
 
 # 모든 API 엔드포인트는 /api prefix 아래로 통일하기 위해 api_router를 사용합니다.
-api_router = APIRouter(prefix="/api")
+# 요청마다 작업 단위(UnitOfWork)를 열어 저장소 호출이 세션/연결 하나를 공유한다.
+api_router = APIRouter(prefix="/api", dependencies=[Depends(unit_of_work_scope)])
 
 # 모듈 라우터 등록 예시:
 # 아래와 같이 각 모듈의 router(APIRouter)를 include_router로 추가해주시면 됩니다.
@@ -50,6 +70,8 @@ api_router.include_router(house_platform_router)
 api_router.include_router(send_message_router)
 api_router.include_router(owner_recommendation_router)
 api_router.include_router(finder_request_router)
+api_router.include_router(policy_sandbox_router)
+api_router.include_router(db_pool_router)
 
 # 등록한 /api 라우터를 메인 앱에 연결합니다.
 app.include_router(api_router)
@@ -0,0 +1,52 @@
+"""키마다 JSON 파일 하나에 정수 값을 저장한다. (체크포인트/진행 위치 공용)"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+
+class KeyedJsonFileStore:
+    """
+    directory/.{prefix}_{key}.json 파일의 field 값으로 정수 하나를 기록한다.
+    - 저장은 임시 파일에 쓴 뒤 교체한다.
+    - 파일이 없거나 읽을 수 없으면 None 을 반환한다.
+    """
+
+    def __init__(self, directory: str, prefix: str, field: str):
+        self.directory = directory
+        self.prefix = prefix
+        self.field = field
+
+    def load(self, key: str) -> int | None:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return int(json.load(file)[self.field])
+        except Exception:  # noqa: BLE001
+            logger.warning("%s 읽기 실패 key=%s", self.prefix, key)
+            return None
+
+    def save(self, key: str, value: int) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"key": key, self.field: value}, file)
+        # 중간에 죽어도 이전 값이 깨지지 않도록 교체한다.
+        os.replace(tmp_path, path)
+
+    def clear(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, key: str) -> str:
+        safe_key = re.sub(r"[^0-9A-Za-z_.-]", "_", key)
+        return os.path.join(self.directory, f".{self.prefix}_{safe_key}.json")
@@ -0,0 +1,71 @@
+"""
+asyncio DB 접근 경로 (SQLAlchemy asyncio + asyncpg)
+- 동기 엔진(postgres.py)과 같은 DB/프로필 설정을 쓰고, async 라우터의 읽기 경로에서 사용한다.
+- sqlalchemy.ext.asyncio 는 greenlet/asyncpg 가 필요하므로 첫 사용 시 엔진을 만든다.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING, AsyncGenerator
+
+from dotenv import load_dotenv
+
+from infrastructure.db.engine_factory import create_async_db_engine, load_engine_profile
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+load_dotenv()
+
+ASYNC_DATABASE_URL = (
+    f"postgresql+asyncpg://{os.getenv('POSTGRES_USER')}:{os.getenv('POSTGRES_PASSWORD')}"
+    f"@{os.getenv('POSTGRES_HOST')}:{os.getenv('POSTGRES_PORT')}/{os.getenv('POSTGRES_DATABASE')}"
+)
+
+_engine: "AsyncEngine | None" = None
+_session_factory: "async_sessionmaker | None" = None
+_lock = threading.Lock()
+
+
+def get_async_engine() -> "AsyncEngine":
+    """프로세스 기본 프로필로 async 엔진을 만들어 재사용한다."""
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = create_async_db_engine(
+                    ASYNC_DATABASE_URL, load_engine_profile()
+                )
+    return _engine
+
+
+def get_async_session_factory() -> "async_sessionmaker":
+    global _session_factory
+    if _session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        engine = get_async_engine()
+        with _lock:
+            if _session_factory is None:
+                _session_factory = async_sessionmaker(
+                    bind=engine,
+                    autoflush=False,
+                    expire_on_commit=False,
+                )
+    return _session_factory
+
+
+async def get_async_db_session() -> AsyncGenerator["AsyncSession", None]:
+    """FastAPI 요청 단위 AsyncSession 의존성."""
+    async with get_async_session_factory()() as session:
+        yield session
+
+
+async def dispose_async_engine() -> None:
+    """앱 종료 시 async 풀 연결을 닫는다. (엔진을 만든 적 없으면 아무 일도 하지 않음)"""
+    global _engine, _session_factory
+    with _lock:
+        engine, _engine, _session_factory = _engine, None, None
+    if engine is not None:
+        await engine.dispose()
@@ -1,9 +1,10 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from threading import Lock
 
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from infrastructure.db.postgres import SessionLocal
+from infrastructure.db.postgres import SessionLocal, unit_of_work
 from infrastructure.db.redis_client import get_redis_client
 
 _redis_lock = Lock()
@@ -19,6 +20,32 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def unit_of_work_scope() -> AsyncGenerator[Session, None]:
+    """
+    요청 하나를 작업 단위로 묶는다.
+    - 컨텍스트 변수가 엔드포인트까지 전달되도록 진입은 이벤트 루프에서 한다.
+      (세션 생성만 하므로 연결은 첫 쿼리 때 잡힌다)
+    - commit/rollback/close 는 스레드풀에서 수행한다.
+    """
+    uow = unit_of_work()
+    uow.__enter__()
+    try:
+        yield uow.session
+    except BaseException as e:
+        await _exit_unit_of_work(uow, type(e), e, e.__traceback__)
+        raise
+    else:
+        await _exit_unit_of_work(uow, None, None, None)
+
+
+async def _exit_unit_of_work(uow, exc_type, exc, tb) -> None:
+    # 동기 세션을 쓰지 않은 요청(async 경로)은 연결이 없으므로 바로 정리한다.
+    if not uow.session.in_transaction():
+        uow.__exit__(exc_type, exc, tb)
+        return
+    await run_in_threadpool(uow.__exit__, exc_type, exc, tb)
+
+
 def get_redis():
     """Thread-safe Redis 의존성 (전역 싱글톤 재사용)."""
     global _redis_instance
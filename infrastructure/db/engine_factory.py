@@ -0,0 +1,247 @@
+"""프로세스 유형(profile)별 SQLAlchemy 엔진 생성 및 풀 통계 (공용 인프라)."""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Mapping
+
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+PROFILE_API = "api"
+PROFILE_WORKER = "worker"
+PROFILE_BATCH = "batch"
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """엔진/커넥션 풀 설정 묶음."""
+
+    name: str
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool = True
+    echo: bool = False
+
+
+# API: 동시 요청이 많고 짧다 / worker: 워커 스레드 수만큼 / batch: 긴 트랜잭션 소수
+ENGINE_PROFILES: dict[str, EngineProfile] = {
+    PROFILE_API: EngineProfile(
+        PROFILE_API, pool_size=10, max_overflow=10, pool_timeout=10, pool_recycle=1800
+    ),
+    PROFILE_WORKER: EngineProfile(
+        PROFILE_WORKER, pool_size=4, max_overflow=4, pool_timeout=30, pool_recycle=1800
+    ),
+    PROFILE_BATCH: EngineProfile(
+        PROFILE_BATCH, pool_size=2, max_overflow=2, pool_timeout=60, pool_recycle=3600
+    ),
+}
+
+
+def _env_bool(raw: str) -> bool:
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+def load_engine_profile(
+    name: str | None = None, environ: Mapping[str, str] | None = None
+) -> EngineProfile:
+    """
+    프로필을 고르고 환경변수로 덮어쓴다.
+    - DB_ENGINE_PROFILE: 프로세스 기본 프로필 api | worker | batch (기본 api)
+    - DB_<PROFILE>_POOL_SIZE 처럼 프로필별 값이 우선한다.
+    - DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT / DB_POOL_RECYCLE / DB_ECHO 는
+      프로세스 기본 프로필에만 적용한다.
+    """
+    environ = os.environ if environ is None else environ
+    default_name = environ.get("DB_ENGINE_PROFILE") or PROFILE_API
+    name = name or default_name
+    if name not in ENGINE_PROFILES:
+        raise ValueError(f"unknown engine profile: {name}")
+    profile = ENGINE_PROFILES[name]
+
+    def lookup(field: str) -> str | None:
+        value = environ.get(f"DB_{name.upper()}_{field}")
+        if not value and name == default_name:
+            value = environ.get(f"DB_{field}")
+        return value or None
+
+    overrides: dict = {}
+    for field, key, cast in (
+        ("pool_size", "POOL_SIZE", int),
+        ("max_overflow", "MAX_OVERFLOW", int),
+        ("pool_timeout", "POOL_TIMEOUT", float),
+        ("pool_recycle", "POOL_RECYCLE", int),
+        ("echo", "ECHO", _env_bool),
+    ):
+        value = lookup(key)
+        if value is not None:
+            overrides[field] = cast(value)
+    return replace(profile, **overrides) if overrides else profile
+
+
+class PoolWaitStats:
+    """커넥션 획득 대기 시간 누적값."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.timeouts = 0
+        self.total_wait_sec = 0.0
+        self.max_wait_sec = 0.0
+
+    def record(self, elapsed: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.acquired += 1
+            self.total_wait_sec += elapsed
+            self.max_wait_sec = max(self.max_wait_sec, elapsed)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            attempts = self.acquired + self.timeouts
+            return {
+                "acquired": self.acquired,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait_sec / attempts * 1000, 3)
+                if attempts
+                else 0.0,
+                "max_wait_ms": round(self.max_wait_sec * 1000, 3),
+            }
+
+
+class _WaitStatsMixin:
+    """QueuePool 에서 커넥션을 얻기까지 걸린 시간(대기+신규 연결)을 기록한다."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+        self._depth = threading.local()
+
+    def recreate(self):
+        pool = super().recreate()
+        # dispose() 후에도 누적 통계를 이어간다.
+        pool.wait_stats = self.wait_stats
+        return pool
+
+    def _do_get(self):
+        # QueuePool._do_get 은 재귀 호출되므로 가장 바깥 호출만 잰다.
+        depth = getattr(self._depth, "value", 0)
+        if depth:
+            return super()._do_get()
+        self._depth.value = 1
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self._depth.value = 0
+            self.wait_stats.record(time.perf_counter() - start, timed_out)
+
+
+class InstrumentedQueuePool(_WaitStatsMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_WaitStatsMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+_engines: dict[str, tuple[EngineProfile, Engine]] = {}
+_engines_lock = threading.Lock()
+
+
+def _pool_options(profile: EngineProfile) -> dict:
+    return {
+        "echo": profile.echo,
+        "pool_size": profile.pool_size,
+        "max_overflow": profile.max_overflow,
+        "pool_timeout": profile.pool_timeout,
+        "pool_recycle": profile.pool_recycle,
+        "pool_pre_ping": profile.pool_pre_ping,
+    }
+
+
+def _register(name: str, profile: EngineProfile, engine: Engine) -> None:
+    with _engines_lock:
+        _engines[name] = (profile, engine)
+
+
+def create_db_engine(url: str, profile: EngineProfile) -> Engine:
+    """프로필 설정으로 엔진을 만들고 풀 통계 조회 대상으로 등록한다."""
+    engine = create_engine(
+        url, poolclass=InstrumentedQueuePool, **_pool_options(profile)
+    )
+    _register(profile.name, profile, engine)
+    return engine
+
+
+def create_async_db_engine(url: str, profile: EngineProfile) -> "AsyncEngine":
+    """asyncio 엔진을 만든다. 풀 통계는 '<profile>_async' 이름으로 등록한다."""
+    # sqlalchemy.ext.asyncio 는 greenlet 이 필요하므로 async 경로를 쓸 때만 import 한다.
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(
+        url, poolclass=InstrumentedAsyncQueuePool, **_pool_options(profile)
+    )
+    _register(f"{profile.name}_async", profile, engine.sync_engine)
+    return engine
+
+
+def get_registered_engines() -> dict[str, Engine]:
+    with _engines_lock:
+        return {name: engine for name, (_, engine) in _engines.items()}
+
+
+def _find_registration(engine: Engine) -> tuple[str | None, EngineProfile | None]:
+    with _engines_lock:
+        for name, (profile, registered) in _engines.items():
+            if registered is engine:
+                return name, profile
+    return None, None
+
+
+def get_engine_profile(engine: Engine) -> EngineProfile | None:
+    return _find_registration(engine)[1]
+
+
+def get_pool_stats(engine: Engine) -> dict:
+    """엔진 풀의 현재 상태와 대기 통계를 반환한다."""
+    pool = engine.pool
+    name, profile = _find_registration(engine)
+    stats = {
+        "engine": name,
+        "profile": profile.name if profile else None,
+        "pool_class": type(pool).__name__,
+    }
+    if isinstance(pool, QueuePool):
+        stats.update(
+            {
+                "pool_size": pool.size(),
+                "max_overflow": profile.max_overflow if profile else None,
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                # QueuePool.overflow() 는 풀이 덜 찼을 때 음수이므로 사용 중인 초과분만 보인다.
+                "overflow": max(pool.overflow(), 0),
+            }
+        )
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        stats["wait"] = wait_stats.snapshot()
+    return stats
+
+
+def get_all_pool_stats() -> list[dict]:
+    return [get_pool_stats(engine) for engine in get_registered_engines().values()]
@@ -1,9 +1,19 @@
-from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 import os
+import threading
 from dotenv import load_dotenv
 from typing import Generator
 
+from infrastructure.db.session_helper import UnitOfWork, current_unit_of_work
+from infrastructure.db.engine_factory import (
+    PROFILE_BATCH,
+    create_db_engine,
+    get_engine_profile,
+    get_registered_engines,
+    load_engine_profile,
+)
+
 load_dotenv()
 
 DATABASE_URL = (
@@ -11,24 +21,72 @@ DATABASE_URL = (
     f"@{os.getenv('POSTGRES_HOST')}:{os.getenv('POSTGRES_PORT')}/{os.getenv('POSTGRES_DATABASE')}"
 )
 
-engine = create_engine(
-    DATABASE_URL,
-    echo=True,
-    pool_pre_ping=True
-)
+# 프로세스 기본 엔진 (DB_ENGINE_PROFILE=api|worker|batch, 기본 api)
+engine = create_db_engine(DATABASE_URL, load_engine_profile())
 
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-    expire_on_commit=True  # 커밋 후 자동으로 객체 만료 (항상 최신 데이터 조회)
-)
+
+def _build_session_factory(bind: Engine) -> sessionmaker:
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=bind,
+        expire_on_commit=True  # 커밋 후 자동으로 객체 만료 (항상 최신 데이터 조회)
+    )
+
+
+SessionLocal = _build_session_factory(engine)
 
 Base = declarative_base()
 
+_session_factories: dict[str, sessionmaker] = {
+    get_engine_profile(engine).name: SessionLocal
+}
+_session_factories_lock = threading.Lock()
+
+
+def get_session_factory(profile_name: str) -> sessionmaker:
+    """프로필 전용 풀을 가진 세션 팩토리를 반환한다. (처음 요청 시 엔진 생성)"""
+    factory = _session_factories.get(profile_name)
+    if factory is not None:
+        return factory
+    with _session_factories_lock:
+        factory = _session_factories.get(profile_name)
+        if factory is None:
+            profile_engine = get_registered_engines().get(profile_name)
+            if profile_engine is None:
+                profile_engine = create_db_engine(
+                    DATABASE_URL, load_engine_profile(profile_name)
+                )
+            factory = _build_session_factory(profile_engine)
+            _session_factories[profile_name] = factory
+    return factory
+
+
 def get_db_session() -> Generator[Session, None, None]:
+    uow = current_unit_of_work()
+    if uow is not None and uow.joins(SessionLocal):
+        # 요청 작업 단위가 열려 있으면 그 세션을 그대로 쓴다. (정리는 작업 단위가 한다)
+        yield uow.session
+        return
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()  
+
+
+def unit_of_work(session_factory=None) -> UnitOfWork:
+    """기본 엔진의 요청/작업 단위. SessionLocal/get_db_session 호출이 참여한다."""
+    return UnitOfWork(
+        session_factory or SessionLocal,
+        join_factories=(SessionLocal, get_db_session),
+    )
+
+
+def get_batch_db_session() -> Generator[Session, None, None]:
+    """배치 라우터용 세션. API 요청 풀과 분리된 batch 풀을 쓴다."""
+    db = get_session_factory(PROFILE_BATCH)()
+    try:
+        yield db
+    finally:
+        db.close()
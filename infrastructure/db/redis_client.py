@@ -20,3 +20,24 @@ def get_redis_client():
                     decode_responses=False,
                 )
     return _redis_client
+
+
+_async_redis_client = None
+
+
+def get_async_redis_client():
+    """asyncio Redis 클라이언트 싱글톤 (pub/sub 구독 등 이벤트 루프에서 사용)"""
+    global _async_redis_client
+    if _async_redis_client is None:
+        with _redis_lock:
+            if _async_redis_client is None:
+                from redis import asyncio as redis_asyncio
+
+                _async_redis_client = redis_asyncio.Redis(
+                    host=os.getenv("REDIS_HOST", "localhost"),
+                    port=int(os.getenv("REDIS_PORT", 6379)),
+                    db=int(os.getenv("REDIS_DB", 0)),
+                    password=os.getenv("REDIS_PASSWORD", None),
+                    decode_responses=False,
+                )
+    return _async_redis_client
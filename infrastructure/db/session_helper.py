@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-from typing import Generator
+from contextvars import ContextVar
+from typing import Generator, Iterable
 
 from sqlalchemy.orm import Session
 
+_current_uow: ContextVar["UnitOfWork | None"] = ContextVar(
+    "current_unit_of_work", default=None
+)
 
-def open_session(session_factory) -> tuple[Session, Generator | None]:
-    """세션을 열고 종료용 제너레이터를 반환한다."""
+
+def _joined_session() -> Generator[None, None, None]:
+    # 시작하지 않은 제너레이터의 close() 는 아무 일도 하지 않는다.
+    # 작업 단위 세션에 참여한 호출자가 세션을 닫지 않도록 종료용으로 돌려준다.
+    yield
+
+
+def _open_new_session(session_factory) -> tuple[Session, Generator | None]:
     if callable(session_factory):
         candidate = session_factory()
     else:
@@ -18,3 +28,71 @@ def open_session(session_factory) -> tuple[Session, Generator | None]:
         return session, generator
 
     return candidate, None
+
+
+def open_session(
+    session_factory, join: bool = True
+) -> tuple[Session, Generator | None]:
+    """
+    세션을 열고 종료용 제너레이터를 반환한다.
+    - 같은 DB 를 가리키는 작업 단위(UnitOfWork)가 열려 있으면 그 세션에 참여한다.
+    - join=False 면 작업 단위와 무관하게 새 세션을 연다.
+    """
+    uow = _current_uow.get()
+    if join and uow is not None and uow.joins(session_factory):
+        return uow.session, _joined_session()
+    return _open_new_session(session_factory)
+
+
+def current_unit_of_work() -> "UnitOfWork | None":
+    return _current_uow.get()
+
+
+class UnitOfWork:
+    """
+    요청/작업 단위 세션 범위.
+    - with 블록 안의 open_session 호출은 세션 하나(연결 하나)를 공유한다.
+    - join_factories 에 있는 팩토리(같은 DB 의 다른 진입점)도 같은 세션에 참여한다.
+    - 정상 종료 시 commit, 예외 시 rollback 후 세션을 닫는다.
+    """
+
+    def __init__(self, session_factory, join_factories: Iterable = ()):
+        self.session_factory = session_factory
+        self._join_factories = tuple(join_factories)
+        self.session: Session | None = None
+        self._generator: Generator | None = None
+        self._token = None
+
+    def joins(self, session_factory) -> bool:
+        if self.session is None:
+            return False
+        return session_factory is self.session_factory or any(
+            session_factory is factory for factory in self._join_factories
+        )
+
+    def __enter__(self) -> "UnitOfWork":
+        if self.session is not None:
+            raise RuntimeError("unit of work already started")
+        self.session, self._generator = _open_new_session(self.session_factory)
+        self._token = _current_uow.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        session = self.session
+        try:
+            if exc_type is None:
+                session.commit()
+            else:
+                session.rollback()
+        finally:
+            # 이후의 open_session 은 새 세션을 연다. (스트리밍 응답 등 범위를 벗어난 사용)
+            self.session = None
+            try:
+                _current_uow.reset(self._token)
+            except ValueError:
+                # 다른 컨텍스트에서 종료되는 경우 (예: FastAPI 의존성 정리)
+                _current_uow.set(None)
+            if self._generator is not None:
+                self._generator.close()
+            else:
+                session.close()
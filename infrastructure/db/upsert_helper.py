@@ -0,0 +1,28 @@
+"""ON CONFLICT 기반 일괄 업서트 공용 헬퍼."""
+from __future__ import annotations
+
+from typing import Callable
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+# ON CONFLICT ... DO UPDATE 를 지원하는 방언별 insert 생성자
+_BULK_INSERTS: dict[str, Callable] = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def bulk_insert_for(session: Session) -> Callable | None:
+    """세션 방언이 ON CONFLICT 를 지원하면 insert 생성자를, 아니면 None 을 반환한다."""
+    return _BULK_INSERTS.get(session.get_bind().dialect.name)
+
+
+def is_missing_conflict_target(exc: DBAPIError) -> bool:
+    """ON CONFLICT 대상 유니크 인덱스가 없어서 난 오류인지 확인한다."""
+    # postgres: 42P10 invalid_column_reference, sqlite: 메시지로 판별
+    if getattr(exc.orig, "pgcode", None) == "42P10":
+        return True
+    return "ON CONFLICT" in str(exc.orig)
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, BigInteger, String, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, BigInteger, String, DateTime, ForeignKey, JSON, LargeBinary
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from infrastructure.db.postgres import Base
 
@@ -44,5 +45,14 @@ class SearchHouse(Base):
         nullable=False
     )
 
-    result_json = Column(JSON, nullable=True)
+    # 이전 형식 결과 (새 결과는 result_blob 에 저장)
+    result_json = deferred(Column(JSON, nullable=True))
+
+    # 직렬화/압축된 결과 바이트와 형식(json/gzip/zstd)
+    # 상태 조회 시 함께 읽지 않도록 지연 로딩한다.
+    # ALTER TABLE search_house
+    #     ADD COLUMN IF NOT EXISTS result_blob BYTEA,
+    #     ADD COLUMN IF NOT EXISTS result_encoding VARCHAR(16);
+    result_blob = deferred(Column(LargeBinary, nullable=True))
+    result_encoding = deferred(Column(String(16), nullable=True))
     completed_at = Column(DateTime, nullable=True)
\ No newline at end of file
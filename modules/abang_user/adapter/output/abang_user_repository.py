@@ -1,5 +1,5 @@
-from sqlalchemy.orm import Session
 from typing import Optional, Dict
+from infrastructure.db.session_helper import open_session
 from modules.abang_user.adapter.output.abang_user_model import AbangUser
 from modules.abang_user.domain.app_user import AppUser
 from modules.abang_user.application.port.abang_user_repository_port import AbangUserRepositoryPort
@@ -9,7 +9,7 @@ class AbangUserRepository(AbangUserRepositoryPort):
         self.db_session_factory = db_session_factory
 
     def find_by_email(self, email: str) -> Optional[Dict]:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             user: Optional[AbangUser] = db.query(AbangUser).filter(
                 AbangUser.email == email
@@ -28,10 +28,13 @@ class AbangUserRepository(AbangUserRepositoryPort):
                 "updated_at": user.updated_at
             }
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     def create_user(self, nickname: str | None, email: str, user_type: str) -> Dict:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             new_user = AbangUser(
                 nickname=nickname,
@@ -52,11 +55,14 @@ class AbangUserRepository(AbangUserRepositoryPort):
                 "updated_at": new_user.updated_at
             }
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     def find_by_id(self, user_id: int) -> Optional[AppUser]:
 
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
 
         try:
 
@@ -99,14 +105,16 @@ class AbangUserRepository(AbangUserRepositoryPort):
             )
 
         finally:
-
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
 
 
     def update(self, user: AppUser) -> Optional[AppUser]:
 
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
 
         try:
 
@@ -167,7 +175,9 @@ class AbangUserRepository(AbangUserRepositoryPort):
             )
 
         finally:
-
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     
\ No newline at end of file
@@ -14,7 +14,7 @@ from infrastructure.db.postgres import SessionLocal
 
 # DB factory -----------------------------------------
 def _get_db_factory():
-    return lambda: SessionLocal()
+    return SessionLocal
 
 
 # Token Repository (Port → Adapter) --------------------
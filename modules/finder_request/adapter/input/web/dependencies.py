@@ -1,12 +1,17 @@
 from fastapi import Depends
 from infrastructure.db.postgres import get_db_session
+from infrastructure.db.async_postgres import get_async_db_session
 from infrastructure.external.embedding_agent import OpenAIEmbeddingAgent
 from modules.finder_request.adapter.output.repository.finder_request_repository import FinderRequestRepository
+from modules.finder_request.adapter.output.repository.async_finder_request_repository import AsyncFinderRequestRepository
 from modules.finder_request.infrastructure.repository.finder_request_embedding_repository import (
     FinderRequestEmbeddingRepository,
 )
 from modules.finder_request.application.usecase.create_finder_request_usecase import CreateFinderRequestUseCase
-from modules.finder_request.application.usecase.view_finder_requests_usecase import ViewFinderRequestsUseCase
+from modules.finder_request.application.usecase.view_finder_requests_usecase import (
+    ViewFinderRequestsAsyncUseCase,
+    ViewFinderRequestsUseCase,
+)
 from modules.finder_request.application.usecase.get_finder_request_detail_usecase import GetFinderRequestDetailUseCase
 from modules.finder_request.application.usecase.edit_finder_request_usecase import EditFinderRequestUseCase
 from modules.finder_request.application.usecase.delete_finder_request_usecase import DeleteFinderRequestUseCase
@@ -45,6 +50,13 @@ def get_view_finder_requests_usecase(
     return ViewFinderRequestsUseCase(repository)
 
 
+def get_view_finder_requests_async_usecase(
+    db_session=Depends(get_async_db_session)
+) -> ViewFinderRequestsAsyncUseCase:
+    """ViewFinderRequests UseCase (async 조회) 인스턴스 생성"""
+    return ViewFinderRequestsAsyncUseCase(AsyncFinderRequestRepository(db_session))
+
+
 from modules.send_message.adapter.input.web.dependencies import get_send_message_repository
 from modules.abang_user.adapter.input.web.dependencies import get_abang_user_repository
 from modules.send_message.application.port.output.send_message_repository import SendMessageRepository
@@ -6,13 +6,13 @@ from modules.finder_request.adapter.input.web.response.finder_request_response i
 from modules.auth.adapter.input.auth_middleware import auth_required
 from modules.finder_request.adapter.input.web.dependencies import (
     get_create_finder_request_usecase,
-    get_view_finder_requests_usecase,
+    get_view_finder_requests_async_usecase,
     get_finder_request_detail_usecase,
     get_edit_finder_request_usecase,
     get_delete_finder_request_usecase
 )
 from modules.finder_request.application.usecase.create_finder_request_usecase import CreateFinderRequestUseCase
-from modules.finder_request.application.usecase.view_finder_requests_usecase import ViewFinderRequestsUseCase
+from modules.finder_request.application.usecase.view_finder_requests_usecase import ViewFinderRequestsAsyncUseCase
 from modules.finder_request.application.usecase.get_finder_request_detail_usecase import GetFinderRequestDetailUseCase
 from modules.finder_request.application.usecase.edit_finder_request_usecase import EditFinderRequestUseCase
 from modules.finder_request.application.usecase.delete_finder_request_usecase import DeleteFinderRequestUseCase
@@ -104,9 +104,9 @@ def create_finder_request(
     summary="임차인 요구서 목록 조회",
     description="특정 임차인의 요구서 목록을 조회합니다."
 )
-def view_finder_requests(
+async def view_finder_requests(
     abang_user_id: int = Depends(auth_required),
-    usecase: ViewFinderRequestsUseCase = Depends(get_view_finder_requests_usecase)
+    usecase: ViewFinderRequestsAsyncUseCase = Depends(get_view_finder_requests_async_usecase)
 ):
     """
     임차인의 요구서 목록을 조회합니다.
@@ -114,8 +114,8 @@ def view_finder_requests(
     - **abang_user_id**: 임차인 사용자 ID (query parameter)
     """
     try:
-        # UseCase 실행
-        results = usecase.execute(abang_user_id)
+        # UseCase 실행 (async 세션으로 조회해 스레드풀 워커를 점유하지 않음)
+        results = await usecase.execute(abang_user_id)
         
         # Application DTO → Web Response DTO 변환
         return [
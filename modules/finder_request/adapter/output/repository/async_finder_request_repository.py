@@ -0,0 +1,26 @@
+from typing import List
+from sqlalchemy import select
+from modules.finder_request.application.port.finder_request_async_read_port import FinderRequestAsyncReadPort
+from modules.finder_request.domain.finder_request import FinderRequest
+from modules.finder_request.adapter.output.finder_request_model import FinderRequestModel
+from modules.finder_request.adapter.output.repository.finder_request_repository import FinderRequestRepository
+
+
+class AsyncFinderRequestRepository(FinderRequestAsyncReadPort):
+    """
+    FinderRequest 조회 전용 구현체 (AsyncSession)
+    쓰기는 동기 FinderRequestRepository 가 담당한다.
+    """
+    def __init__(self, db_session):
+        self.db = db_session
+
+    async def find_by_user_id(self, abang_user_id: int) -> List[FinderRequest]:
+        result = await self.db.execute(
+            select(FinderRequestModel)
+            .where(FinderRequestModel.abang_user_id == abang_user_id)
+            .order_by(FinderRequestModel.created_at.desc())
+        )
+        return [
+            FinderRequestRepository._to_domain(model)
+            for model in result.scalars().all()
+        ]
@@ -81,7 +81,8 @@ class FinderRequestRepository(FinderRequestRepositoryPort):
         # finally:
         #     self.db.close()
     
-    def _to_domain(self, model: FinderRequestModel) -> FinderRequest:
+    @staticmethod
+    def _to_domain(model: FinderRequestModel) -> FinderRequest:
         """ORM 모델을 도메인 모델로 변환"""
         return FinderRequest(
             abang_user_id=model.abang_user_id,
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import List
+from modules.finder_request.domain.finder_request import FinderRequest
+
+
+class FinderRequestAsyncReadPort(ABC):
+    """
+    FinderRequest 조회 포트 (async)
+    목록 조회처럼 호출이 잦은 읽기 경로를 이벤트 루프에서 처리하기 위한 추상화
+    """
+
+    @abstractmethod
+    async def find_by_user_id(self, abang_user_id: int) -> List[FinderRequest]:
+        """
+        사용자 ID로 요구서 목록 조회 (최신순)
+
+        Args:
+            abang_user_id: 임차인 사용자 ID
+
+        Returns:
+            요구서 도메인 모델 리스트
+        """
+        pass
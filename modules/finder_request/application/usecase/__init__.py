@@ -1,12 +1,16 @@
 # finder_request application usecase module
 from modules.finder_request.application.usecase.create_finder_request_usecase import CreateFinderRequestUseCase
-from modules.finder_request.application.usecase.view_finder_requests_usecase import ViewFinderRequestsUseCase
+from modules.finder_request.application.usecase.view_finder_requests_usecase import (
+    ViewFinderRequestsAsyncUseCase,
+    ViewFinderRequestsUseCase,
+)
 from modules.finder_request.application.usecase.edit_finder_request_usecase import EditFinderRequestUseCase
 from modules.finder_request.application.usecase.delete_finder_request_usecase import DeleteFinderRequestUseCase
 
 __all__ = [
     "CreateFinderRequestUseCase",
     "ViewFinderRequestsUseCase",
+    "ViewFinderRequestsAsyncUseCase",
     "EditFinderRequestUseCase",
     "DeleteFinderRequestUseCase"
 ]
@@ -1,5 +1,7 @@
 from typing import List
 from modules.finder_request.application.port.finder_request_repository_port import FinderRequestRepositoryPort
+from modules.finder_request.application.port.finder_request_async_read_port import FinderRequestAsyncReadPort
+from modules.finder_request.domain.finder_request import FinderRequest
 from modules.finder_request.application.dto.finder_request_dto import FinderRequestDTO
 
 
@@ -25,27 +27,50 @@ class ViewFinderRequestsUseCase:
         finder_requests = self.finder_request_repository.find_by_user_id(abang_user_id)
         
         # 도메인 모델 → DTO 변환
-        return [
-            FinderRequestDTO(
-                finder_request_id=req.finder_request_id,
-                abang_user_id=req.abang_user_id,
-                status=req.status,
-                preferred_region=req.preferred_region,
-                price_type=req.price_type,
-                max_deposit=req.max_deposit,
-                max_rent=req.max_rent,
-                house_type=req.house_type,
-                additional_condition=req.additional_condition,
-                university_name=req.university_name,
-                roomcount=req.roomcount,
-                bathroomcount=req.bathroomcount,
-                is_near=req.is_near,
-                aircon_yn=req.aircon_yn,
-                washer_yn=req.washer_yn,
-                fridge_yn=req.fridge_yn,
-                max_building_age=req.max_building_age,
-                created_at=req.created_at,
-                updated_at=req.updated_at
-            )
-            for req in finder_requests
-        ]
+        return [_to_dto(req) for req in finder_requests]
+
+
+class ViewFinderRequestsAsyncUseCase:
+    """
+    임차인의 요구서 목록 조회 유스케이스 (async)
+    """
+
+    def __init__(self, finder_request_reader: FinderRequestAsyncReadPort):
+        self.finder_request_reader = finder_request_reader
+
+    async def execute(self, abang_user_id: int) -> List[FinderRequestDTO]:
+        """
+        특정 사용자의 요구서 목록을 이벤트 루프에서 조회합니다.
+
+        Args:
+            abang_user_id: 임차인 사용자 ID
+
+        Returns:
+            요구서 목록
+        """
+        finder_requests = await self.finder_request_reader.find_by_user_id(abang_user_id)
+        return [_to_dto(req) for req in finder_requests]
+
+
+def _to_dto(req: FinderRequest) -> FinderRequestDTO:
+    return FinderRequestDTO(
+        finder_request_id=req.finder_request_id,
+        abang_user_id=req.abang_user_id,
+        status=req.status,
+        preferred_region=req.preferred_region,
+        price_type=req.price_type,
+        max_deposit=req.max_deposit,
+        max_rent=req.max_rent,
+        house_type=req.house_type,
+        additional_condition=req.additional_condition,
+        university_name=req.university_name,
+        roomcount=req.roomcount,
+        bathroomcount=req.bathroomcount,
+        is_near=req.is_near,
+        aircon_yn=req.aircon_yn,
+        washer_yn=req.washer_yn,
+        fridge_yn=req.fridge_yn,
+        max_building_age=req.max_building_age,
+        created_at=req.created_at,
+        updated_at=req.updated_at
+    )
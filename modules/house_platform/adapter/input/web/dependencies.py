@@ -1,9 +1,20 @@
 from infrastructure.db.postgres import SessionLocal
+from infrastructure.db.async_postgres import get_async_db_session
 from modules.house_platform.infrastructure.repository.house_platform_repository import HousePlatformRepository
 from modules.house_platform.application.usecase.create_house_platform_usecase import CreateHousePlatformUseCase
-from modules.house_platform.application.usecase.get_house_platform_usecase import GetHousePlatformUseCase
+from modules.house_platform.application.usecase.get_house_platform_usecase import (
+    GetHousePlatformDetailAsyncUseCase,
+    GetHousePlatformUseCase,
+)
+from modules.house_platform.infrastructure.repository.async_house_platform_detail_repository import (
+    AsyncHousePlatformDetailRepository,
+)
 from modules.house_platform.application.usecase.update_house_platform_usecase import UpdateHousePlatformUseCase
 from modules.house_platform.application.usecase.delete_house_platform_usecase import DeleteHousePlatformUseCase
+from infrastructure.db.redis_client import get_redis_client
+from modules.recommendations.infrastructure.cache.redis_recommendation_result_cache import (
+    RedisRecommendationResultCache,
+)
 
 # Repository Singleton
 _house_platform_repo = None
@@ -14,9 +25,20 @@ def get_house_platform_repository():
         _house_platform_repo = HousePlatformRepository(SessionLocal)
     return _house_platform_repo
 
+# 매물 등록/수정/삭제 시 추천 결과 캐시를 무효화한다.
+_recommendation_cache = None
+
+def get_recommendation_cache_invalidator():
+    global _recommendation_cache
+    if _recommendation_cache is None:
+        _recommendation_cache = RedisRecommendationResultCache(get_redis_client())
+    return _recommendation_cache
+
 # UseCase Dependencies
 def get_create_house_platform_usecase() -> CreateHousePlatformUseCase:
-    return CreateHousePlatformUseCase(get_house_platform_repository())
+    return CreateHousePlatformUseCase(
+        get_house_platform_repository(), get_recommendation_cache_invalidator()
+    )
 
 from fastapi import Depends
 from modules.send_message.adapter.input.web.dependencies import get_send_message_repository
@@ -32,8 +54,17 @@ def get_get_house_platform_usecase(
 ) -> GetHousePlatformUseCase:
     return GetHousePlatformUseCase(repo, message_repo, user_repo)
 
+def get_house_platform_detail_async_usecase(
+    db_session=Depends(get_async_db_session),
+) -> GetHousePlatformDetailAsyncUseCase:
+    return GetHousePlatformDetailAsyncUseCase(AsyncHousePlatformDetailRepository(db_session))
+
 def get_update_house_platform_usecase() -> UpdateHousePlatformUseCase:
-    return UpdateHousePlatformUseCase(get_house_platform_repository())
+    return UpdateHousePlatformUseCase(
+        get_house_platform_repository(), get_recommendation_cache_invalidator()
+    )
 
 def get_delete_house_platform_usecase() -> DeleteHousePlatformUseCase:
-    return DeleteHousePlatformUseCase(get_house_platform_repository())
+    return DeleteHousePlatformUseCase(
+        get_house_platform_repository(), get_recommendation_cache_invalidator()
+    )
@@ -7,12 +7,16 @@ from modules.house_platform.application.dto.house_platform_dto import (
     HousePlatformResponse
 )
 from modules.house_platform.application.usecase.create_house_platform_usecase import CreateHousePlatformUseCase
-from modules.house_platform.application.usecase.get_house_platform_usecase import GetHousePlatformUseCase
+from modules.house_platform.application.usecase.get_house_platform_usecase import (
+    GetHousePlatformDetailAsyncUseCase,
+    GetHousePlatformUseCase,
+)
 from modules.house_platform.application.usecase.update_house_platform_usecase import UpdateHousePlatformUseCase
 from modules.house_platform.application.usecase.delete_house_platform_usecase import DeleteHousePlatformUseCase
 from modules.house_platform.adapter.input.web.dependencies import (
     get_create_house_platform_usecase,
     get_get_house_platform_usecase,
+    get_house_platform_detail_async_usecase,
     get_update_house_platform_usecase,
     get_delete_house_platform_usecase
 )
@@ -51,13 +55,13 @@ def get_my_house_platforms(
     summary="매물 상세 조회",
     description="특정 매물의 상세 정보를 조회합니다."
 )
-def get_house_platform(
+async def get_house_platform(
     house_platform_id: int,
     abang_user_id: int = Depends(auth_required), # Assuming authentication is required even for viewing details for now, or to check ownership if needed in future logic
-    usecase: GetHousePlatformUseCase = Depends(get_get_house_platform_usecase)
+    usecase: GetHousePlatformDetailAsyncUseCase = Depends(get_house_platform_detail_async_usecase)
 ):
-    # viewer_id 전달
-    house = usecase.execute_get_by_id(house_platform_id, abang_user_id)
+    # viewer_id 전달 (async 세션으로 조회)
+    house = await usecase.execute(house_platform_id, abang_user_id)
     if not house:
         raise HTTPException(status_code=404, detail="House platform not found")
     
@@ -63,7 +63,7 @@ class ZigbangAdapter:
         """상세 조회 후 매핑 결과와 에러를 모아 반환한다."""
         errors = list(errors or [])
         skip_ids = skip_ids or set()
-        converted: list[HousePlatformUpsertBundle] = []
+        target_ids: list[int] = []
         for item in items:
             item_id = item.get("item_id") or item.get("itemId")
             if not item_id:
@@ -72,10 +72,20 @@ class ZigbangAdapter:
             if str(item_id) in skip_ids:
                 continue
             try:
-                detail = self.fetch_port.fetch_detail(int(item_id))
-                converted.append(self._map_raw_item_to_bundle(detail))
-            except Exception as exc:  # noqa: BLE001
+                target_ids.append(int(item_id))
+            except (TypeError, ValueError) as exc:
                 errors.append(f"상세 조회/매핑 실패 {item_id}: {exc}")
+
+        # 상세 조회는 fetch_port 정책(순차 또는 속도 제한 동시 조회)에 맡긴다.
+        converted: list[HousePlatformUpsertBundle] = []
+        for result in self.fetch_port.fetch_details(target_ids):
+            if result.error is not None:
+                errors.append(f"상세 조회/매핑 실패 {result.item_id}: {result.error}")
+                continue
+            try:
+                converted.append(self._map_raw_item_to_bundle(result.detail))
+            except Exception as exc:  # noqa: BLE001
+                errors.append(f"상세 조회/매핑 실패 {result.item_id}: {exc}")
         return converted, errors
 
     def convert_detail_item(
@@ -28,6 +28,9 @@ class HousePlatformSemanticSource:
     management_included: Sequence[str] | None
     management_excluded: Sequence[str] | None
     semantic_description: str | None
+    # 증분 모드 비교용: 현재 매물 스냅샷, 마지막 임베딩 입력 해시
+    snapshot_id: str | None = None
+    content_hash: str | None = None
 
 
 @dataclass
@@ -35,6 +38,16 @@ class HousePlatformEmbeddingUpsert:
     house_platform_id: int
     embedding: list[float]
     semantic_description: str | None = None
+    content_hash: str | None = None
+    source_snapshot_id: str | None = None
+
+
+@dataclass
+class HousePlatformEmbeddingSourceMark:
+    """입력 문장이 그대로라 임베딩 없이 스냅샷 ID만 갱신할 대상."""
+
+    house_platform_id: int
+    source_snapshot_id: str | None
 
 
 @dataclass
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Sequence
+from typing import Any, Mapping, Sequence
 
 from modules.house_platform.application.dto.house_platform_dto import (
     HousePlatformManagementUpsertModel,
@@ -15,6 +15,8 @@ class FetchAndStoreCommand:
     """크롤링 입력 조건."""
 
     item_ids: Sequence[int] | None = None
+    # 지정하면 배치 저장마다 진행 위치를 남기고, 같은 키로 다시 실행하면 이어서 수행한다.
+    checkpoint_key: str | None = None
 
     def has_no_filter(self) -> bool:
         """필터 미설정 여부를 판단한다."""
@@ -29,6 +31,7 @@ class FetchAndStoreResult:
     stored: int
     skipped: int = 0
     errors: list[str] = field(default_factory=list)
+    resumed_from: int = 0
 
 
 @dataclass
@@ -38,3 +41,12 @@ class HousePlatformUpsertBundle:
     house_platform: HousePlatformUpsertModel
     management: HousePlatformManagementUpsertModel | None = None
     options: HousePlatformOptionUpsertModel | None = None
+
+
+@dataclass
+class ZigbangDetailFetchResult:
+    """상세 조회 결과. 실패하면 detail 대신 error 를 담는다."""
+
+    item_id: int
+    detail: Mapping[str, Any] | None = None
+    error: Exception | None = None
@@ -32,3 +32,4 @@ class HousePlatformMonitorTarget:
     rgst_no: str | None
     updated_at: datetime | None = None
     is_banned: bool | None = None
+    snapshot_id: str | None = None
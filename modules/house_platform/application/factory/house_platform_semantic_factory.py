@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+
 from modules.house_platform.application.dto.embedding_dto import (
     HousePlatformSemanticSource,
 )
 
 
+def hash_semantic_description(text: str) -> str:
+    """임베딩 입력 문장의 내용 해시를 만든다."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 def build_semantic_house_description(source: HousePlatformSemanticSource) -> str:
     """대학생 선호 포인트를 강조한 매물 설명문을 생성한다."""
 
@@ -0,0 +1,237 @@
+"""
+house_platform 스냅샷 ID 전용 정규 인코더.
+- normalize_house_platform_bundle + json.dumps(sort_keys=True) 결과와 바이트 단위로 같은 JSON 을
+  중간 dict(asdict 깊은 복사) 없이 정해진 키 순서대로 만들어 해시에 넣는다.
+- SnapshotFieldCache 를 주면 nearby_pois/이미지 목록처럼 자주 같은 하위 구조의 직렬화 결과를 재사용한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import fields
+from typing import Any, Callable
+
+from modules.house_platform.application.dto.fetch_and_store_dto import (
+    HousePlatformUpsertBundle,
+)
+from modules.house_platform.application.dto.house_platform_dto import (
+    HousePlatformManagementUpsertModel,
+    HousePlatformOptionUpsertModel,
+    HousePlatformUpsertModel,
+)
+from modules.house_platform.application.factory.house_platform_snapshot_normalizer import (
+    normalize_lat_lng as _normalize_lat_lng,
+    normalize_list as _normalize_list,
+    normalize_list_value as _normalize_list_value,
+    normalize_nearby_pois as _normalize_nearby_pois,
+    to_iso as _to_iso,
+)
+
+_JSON_ENCODER = json.JSONEncoder(
+    ensure_ascii=False, sort_keys=True, separators=(",", ":")
+)
+_encode_basestring = json.encoder.encode_basestring
+
+# 스냅샷에서 빠지는 house_platform 필드 (_normalize_house_platform 과 같아야 한다)
+_HOUSE_EXCLUDED = {"house_platform_id", "updated_at", "snapshot_id"}
+# 캐시를 적용할 필드 (값이 크고 매물 간/회차 간 반복이 많은 필드)
+_CACHED_FIELDS = {"image_urls", "lat_lng", "built_in", "nearby_pois"}
+
+
+class SnapshotFieldCache:
+    """필드 원본 값 -> 직렬화 결과 LRU 캐시. (스레드 안전)"""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_encode(
+        self, field_name: str, value: Any, encode: Callable[[Any], str]
+    ) -> str:
+        try:
+            key = (field_name, _freeze(value))
+            hash(key)
+        except TypeError:
+            return encode(value)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+        encoded = encode(value)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = encoded
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return encoded
+
+
+def hash_house_platform_bundle(
+    bundle: HousePlatformUpsertBundle, cache: SnapshotFieldCache | None = None
+) -> str | None:
+    """
+    번들의 스냅샷 ID(sha256 hex)를 계산한다.
+    모델 타입이 예상과 다르면 None 을 반환하고, 호출자는 기존 경로를 사용한다.
+    """
+    house = bundle.house_platform
+    management = bundle.management
+    options = bundle.options
+    if (
+        type(house) is not HousePlatformUpsertModel
+        or (
+            management is not None
+            and type(management) is not HousePlatformManagementUpsertModel
+        )
+        or (
+            options is not None
+            and type(options) is not HousePlatformOptionUpsertModel
+        )
+    ):
+        return None
+
+    hasher = hashlib.sha256()
+    hasher.update(b'{"house_platform":')
+    hasher.update(_encode_house_platform(house, cache).encode("utf-8"))
+    hasher.update(b',"management":')
+    hasher.update(_encode_management(management).encode("utf-8"))
+    hasher.update(b',"options":')
+    hasher.update(_encode_options(options, cache).encode("utf-8"))
+    hasher.update(b"}")
+    return hasher.hexdigest()
+
+
+def _encode_value(value: Any) -> str:
+    """json.dumps(ensure_ascii=False, sort_keys=True, separators=(",", ":")) 와 같은 결과."""
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    cls = type(value)
+    if cls is str:
+        return _encode_basestring(value)
+    if cls is int:
+        return int.__repr__(value)
+    return _JSON_ENCODER.encode(value)
+
+
+def _encode_house_platform(
+    model: HousePlatformUpsertModel, cache: SnapshotFieldCache | None
+) -> str:
+    parts = []
+    for name, prefix in _house_field_prefixes():
+        value = getattr(model, name)
+        if name == "is_banned":
+            encoded = "true" if value else "false"
+        elif name in ("created_at", "registered_at"):
+            encoded = _encode_value(_to_iso(value))
+        elif name == "image_urls":
+            encoded = _encode_cached(
+                cache, name, value, lambda v: _encode_value(_normalize_list(v))
+            )
+        elif name == "lat_lng":
+            encoded = _encode_cached(
+                cache, name, value, lambda v: _encode_value(_normalize_lat_lng(v))
+            )
+        else:
+            encoded = _encode_value(value)
+        parts.append(prefix + encoded)
+    return "{" + ",".join(parts) + "}"
+
+
+def _encode_management(model: HousePlatformManagementUpsertModel | None) -> str:
+    if not model:
+        return "null"
+    included = _normalize_list_value(model.management_included)
+    excluded = _normalize_list_value(model.management_excluded)
+    if not included and not excluded:
+        return "null"
+    return (
+        '{"management_excluded":'
+        + _encode_value(excluded)
+        + ',"management_included":'
+        + _encode_value(included)
+        + "}"
+    )
+
+
+def _encode_options(
+    model: HousePlatformOptionUpsertModel | None, cache: SnapshotFieldCache | None
+) -> str:
+    if not model:
+        return "null"
+    built_in = _encode_cached(
+        cache,
+        "built_in",
+        model.built_in,
+        lambda v: _encode_value(_normalize_list_value(v)),
+    )
+    nearby_pois = _encode_cached(
+        cache,
+        "nearby_pois",
+        model.nearby_pois,
+        lambda v: _encode_value(_normalize_nearby_pois(v)),
+    )
+    # 정규화 결과가 비었는지는 직렬화 문자열로 판단한다. (빈 목록 "[]" 또는 "null")
+    has_built_in = built_in not in ("null", "[]")
+    if not has_built_in and not any(
+        [model.near_univ, model.near_transport, model.near_mart, nearby_pois != "null"]
+    ):
+        return "null"
+    return (
+        '{"built_in":'
+        + built_in
+        + ',"near_mart":'
+        + _encode_value(model.near_mart)
+        + ',"near_transport":'
+        + _encode_value(model.near_transport)
+        + ',"near_univ":'
+        + _encode_value(model.near_univ)
+        + ',"nearby_pois":'
+        + nearby_pois
+        + "}"
+    )
+
+
+def _encode_cached(
+    cache: SnapshotFieldCache | None,
+    field_name: str,
+    value: Any,
+    encode: Callable[[Any], str],
+) -> str:
+    if cache is None or value is None or field_name not in _CACHED_FIELDS:
+        return encode(value)
+    return cache.get_or_encode(field_name, value, encode)
+
+
+_house_prefixes: list[tuple[str, str]] | None = None
+
+
+def _house_field_prefixes() -> list[tuple[str, str]]:
+    """정렬된 house_platform 키와 '"키":' 접두어. (한 번만 계산)"""
+    global _house_prefixes
+    if _house_prefixes is None:
+        names = sorted(
+            field.name
+            for field in fields(HousePlatformUpsertModel)
+            if field.name not in _HOUSE_EXCLUDED
+        )
+        _house_prefixes = [(name, _encode_basestring(name) + ":") for name in names]
+    return _house_prefixes
+
+
+def _freeze(value: Any) -> Any:
+    """캐시 키용으로 값을 해시 가능한 형태로 바꾼다. (타입까지 구분)"""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    return (type(value), value)
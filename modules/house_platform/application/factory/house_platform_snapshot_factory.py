@@ -3,7 +3,7 @@ from __future__ import annotations
 import hashlib
 import json
 from dataclasses import asdict
-from typing import Any, Mapping
+from typing import Any
 
 from modules.house_platform.application.dto.fetch_and_store_dto import (
     HousePlatformUpsertBundle,
@@ -11,10 +11,26 @@ from modules.house_platform.application.dto.fetch_and_store_dto import (
 from modules.house_platform.application.dto.house_platform_dto import (
     HousePlatformOptionUpsertModel,
 )
+from modules.house_platform.application.factory.house_platform_snapshot_encoder import (
+    SnapshotFieldCache,
+    hash_house_platform_bundle,
+)
+from modules.house_platform.application.factory.house_platform_snapshot_normalizer import (
+    normalize_lat_lng as _normalize_lat_lng,
+    normalize_list as _normalize_list,
+    normalize_list_value as _normalize_list_value,
+    normalize_nearby_pois as _normalize_nearby_pois,
+    to_iso as _to_iso,
+)
 
 
-def build_house_platform_snapshot_id(bundle: HousePlatformUpsertBundle) -> str:
+def build_house_platform_snapshot_id(
+    bundle: HousePlatformUpsertBundle, cache: SnapshotFieldCache | None = None
+) -> str:
     """house_platform 스냅샷 ID를 생성한다."""
+    snapshot_id = hash_house_platform_bundle(bundle, cache=cache)
+    if snapshot_id is not None:
+        return snapshot_id
     payload = normalize_house_platform_bundle(bundle, include_snapshot_id=False)
     serialized = json.dumps(
         payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")
@@ -90,73 +106,3 @@ def _normalize_options(model: HousePlatformOptionUpsertModel | None) -> dict | N
         "near_mart": data.get("near_mart"),
         "nearby_pois": nearby_pois,
     }
-
-
-def _normalize_list(value: Any) -> list[str] | None:
-    if value is None:
-        return None
-    if isinstance(value, list):
-        return [str(item) for item in value]
-    return None
-
-
-def _normalize_list_value(value: Any) -> list[str] | None:
-    if value is None:
-        return None
-    if isinstance(value, list):
-        return sorted([str(item) for item in value if item])
-    if isinstance(value, str):
-        try:
-            parsed = json.loads(value)
-        except json.JSONDecodeError:
-            return sorted([value]) if value else None
-        if isinstance(parsed, list):
-            return sorted([str(item) for item in parsed if item])
-    return None
-
-
-def _normalize_lat_lng(value: Any) -> dict[str, float] | None:
-    if not value or not isinstance(value, Mapping):
-        return None
-    lat = value.get("lat")
-    lng = value.get("lng")
-    try:
-        if lat is None or lng is None:
-            return None
-        return {"lat": float(lat), "lng": float(lng)}
-    except (TypeError, ValueError):
-        return None
-
-
-def _normalize_nearby_pois(value: Any) -> list[dict[str, Any]] | None:
-    if not value:
-        return None
-    if not isinstance(value, list):
-        return None
-    normalized: list[dict[str, Any]] = []
-    for item in value:
-        if not isinstance(item, Mapping):
-            continue
-        poi_type = item.get("poiType")
-        distance = item.get("distance")
-        payload: dict[str, Any] = {}
-        if poi_type:
-            payload["poiType"] = poi_type
-        if distance is not None:
-            try:
-                payload["distance"] = int(float(distance))
-            except (TypeError, ValueError):
-                pass
-        if payload:
-            normalized.append(payload)
-    normalized.sort(key=lambda row: (row.get("poiType", ""), row.get("distance", 0)))
-    return normalized or None
-
-
-def _to_iso(value: Any) -> str | None:
-    if not value:
-        return None
-    try:
-        return value.isoformat()
-    except AttributeError:
-        return None
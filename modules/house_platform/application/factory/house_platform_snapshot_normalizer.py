@@ -0,0 +1,75 @@
+"""house_platform 스냅샷 비교/해시용 값 정규화 함수."""
+from __future__ import annotations
+
+import json
+from typing import Any, Mapping
+
+
+def normalize_list(value: Any) -> list[str] | None:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    return None
+
+
+def normalize_list_value(value: Any) -> list[str] | None:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return sorted([str(item) for item in value if item])
+    if isinstance(value, str):
+        try:
+            parsed = json.loads(value)
+        except json.JSONDecodeError:
+            return sorted([value]) if value else None
+        if isinstance(parsed, list):
+            return sorted([str(item) for item in parsed if item])
+    return None
+
+
+def normalize_lat_lng(value: Any) -> dict[str, float] | None:
+    if not value or not isinstance(value, Mapping):
+        return None
+    lat = value.get("lat")
+    lng = value.get("lng")
+    try:
+        if lat is None or lng is None:
+            return None
+        return {"lat": float(lat), "lng": float(lng)}
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_nearby_pois(value: Any) -> list[dict[str, Any]] | None:
+    if not value:
+        return None
+    if not isinstance(value, list):
+        return None
+    normalized: list[dict[str, Any]] = []
+    for item in value:
+        if not isinstance(item, Mapping):
+            continue
+        poi_type = item.get("poiType")
+        distance = item.get("distance")
+        payload: dict[str, Any] = {}
+        if poi_type:
+            payload["poiType"] = poi_type
+        if distance is not None:
+            try:
+                payload["distance"] = int(float(distance))
+            except (TypeError, ValueError):
+                pass
+        if payload:
+            normalized.append(payload)
+    normalized.sort(key=lambda row: (row.get("poiType", ""), row.get("distance", 0)))
+    return normalized or None
+
+
+def to_iso(value: Any) -> str | None:
+    if not value:
+        return None
+    try:
+        return value.isoformat()
+    except AttributeError:
+        return None
@@ -12,7 +12,14 @@ class GenerateHousePlatformEmbeddingsPort(ABC):
 
     @abstractmethod
     async def execute(
-        self, batch_size: int, concurrency: int
+        self,
+        batch_size: int,
+        concurrency: int,
+        incremental: bool = False,
+        page_size: int = 1000,
     ) -> HousePlatformEmbeddingResult:
-        """전체 매물 임베딩을 생성/저장한다."""
+        """
+        매물 임베딩을 생성/저장한다.
+        incremental 이면 마지막 실행 이후 바뀐 매물만 page_size 단위로 처리한다.
+        """
         raise NotImplementedError
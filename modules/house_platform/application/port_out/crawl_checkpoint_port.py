@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class CrawlCheckpointPort(ABC):
+    """크롤링 진행 위치(입력 item_id 목록의 오프셋)를 저장하는 Port."""
+
+    @abstractmethod
+    def load(self, key: str) -> int | None:
+        """저장된 다음 시작 오프셋을 반환한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, key: str, next_offset: int) -> None:
+        """저장까지 끝난 다음 시작 오프셋을 기록한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self, key: str) -> None:
+        """크롤링이 끝나면 진행 위치를 지운다."""
+        raise NotImplementedError
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from modules.house_platform.domain.house_platform import HousePlatform
+
+
+class HousePlatformDetailReadPort(ABC):
+    """매물 상세 조회 전용 async 저장소 추상화."""
+
+    @abstractmethod
+    async def find_by_id(self, house_platform_id: int) -> Optional[HousePlatform]:
+        """ID로 도메인 객체를 조회한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def has_accepted_offer(
+        self, house_platform_id: int, owner_id: int, viewer_id: int
+    ) -> bool:
+        """owner 가 viewer 에게 보낸 매물 제안을 viewer 가 수락(Y)했는지 확인한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_phone_number(self, abang_user_id: int) -> Optional[str]:
+        """사용자 연락처를 조회한다."""
+        raise NotImplementedError
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Iterable, Sequence
 
 from modules.house_platform.application.dto.embedding_dto import (
+    HousePlatformEmbeddingSourceMark,
     HousePlatformEmbeddingUpsert,
     HousePlatformSemanticSource,
 )
@@ -17,6 +18,16 @@ class HousePlatformEmbeddingReadPort(ABC):
         """전체 매물 + 옵션 + 관리비 + 기존 설명을 조회한다."""
         raise NotImplementedError
 
+    @abstractmethod
+    def fetch_stale_sources(
+        self, after_house_platform_id: int, limit: int
+    ) -> Sequence[HousePlatformSemanticSource]:
+        """
+        임베딩이 없거나 마지막 임베딩 이후 스냅샷이 바뀐 매물을
+        house_platform_id 오름차순 키셋 페이지로 조회한다.
+        """
+        raise NotImplementedError
+
 
 class HousePlatformEmbeddingWritePort(ABC):
     """임베딩 저장 포트."""
@@ -25,3 +36,10 @@ class HousePlatformEmbeddingWritePort(ABC):
     def upsert_embeddings(self, items: Iterable[HousePlatformEmbeddingUpsert]) -> int:
         """임베딩을 업서트하고 저장 건수를 반환한다."""
         raise NotImplementedError
+
+    @abstractmethod
+    def mark_embedding_sources(
+        self, items: Sequence[HousePlatformEmbeddingSourceMark]
+    ) -> int:
+        """임베딩은 그대로 두고 기준 스냅샷 ID만 갱신한다."""
+        raise NotImplementedError
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, Sequence, Set, Optional, List
+from typing import Dict, Iterable, Sequence, Set, Optional, List
 
 from modules.house_platform.domain.house_platform import HousePlatform
 from modules.house_platform.application.dto.fetch_and_store_dto import (
@@ -70,9 +70,23 @@ class HousePlatformRepositoryPort(ABC):
         """기존 저장 데이터를 번들 형태로 조회한다."""
         raise NotImplementedError
 
+    @abstractmethod
+    def fetch_bundles_by_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, HousePlatformUpsertBundle]:
+        """여러 매물의 번들을 한 번에 조회한다. (없는 매물은 제외)"""
+        raise NotImplementedError
+
     @abstractmethod
     def fetch_location_by_id(
         self, house_platform_id: int
     ) -> HousePlatformLocation | None:
         """매물 경위도 정보를 단건 조회한다."""
         raise NotImplementedError
+
+    @abstractmethod
+    def fetch_locations(
+        self, house_platform_ids: Sequence[int]
+    ) -> List[HousePlatformLocation]:
+        """매물 경위도 정보를 일괄 조회한다. (위치가 없는 매물은 제외)"""
+        raise NotImplementedError
@@ -3,6 +3,10 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Iterable, Mapping, Sequence
 
+from modules.house_platform.application.dto.fetch_and_store_dto import (
+    ZigbangDetailFetchResult,
+)
+
 
 class ZigbangFetchPort(ABC):
     """직방에서 매물(raw) 데이터를 가져오는 Port."""
@@ -16,3 +20,19 @@ class ZigbangFetchPort(ABC):
     def fetch_detail(self, item_id: int) -> Mapping:
         """단건 상세 조회한다."""
         raise NotImplementedError
+
+    def fetch_details(
+        self, item_ids: Sequence[int]
+    ) -> list[ZigbangDetailFetchResult]:
+        """여러 건을 상세 조회한다. 결과는 입력 순서를 따르고 실패도 담는다."""
+        results: list[ZigbangDetailFetchResult] = []
+        for item_id in item_ids:
+            try:
+                results.append(
+                    ZigbangDetailFetchResult(
+                        item_id=item_id, detail=self.fetch_detail(item_id)
+                    )
+                )
+            except Exception as exc:  # noqa: BLE001
+                results.append(ZigbangDetailFetchResult(item_id=item_id, error=exc))
+        return results
@@ -1,10 +1,20 @@
+from __future__ import annotations
+
 from modules.house_platform.application.port_out.house_platform_repository_port import HousePlatformRepositoryPort
 from modules.house_platform.application.dto.house_platform_dto import HousePlatformCreateRequest
 from modules.house_platform.domain.house_platform import HousePlatform
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationCacheInvalidationPort,
+)
 
 class CreateHousePlatformUseCase:
-    def __init__(self, repository: HousePlatformRepositoryPort):
+    def __init__(
+        self,
+        repository: HousePlatformRepositoryPort,
+        cache_invalidator: RecommendationCacheInvalidationPort | None = None,
+    ):
         self.repository = repository
+        self.cache_invalidator = cache_invalidator
 
     def execute(self, user_id: int, request: HousePlatformCreateRequest) -> HousePlatform:
         # Create domain entity from request
@@ -39,4 +49,8 @@ class CreateHousePlatformUseCase:
             created_at=None,
             updated_at=None
         )
-        return self.repository.save(new_house)
+        saved = self.repository.save(new_house)
+        if self.cache_invalidator:
+            # 매물이 바뀌었으므로 이전 추천 결과를 무효화한다.
+            self.cache_invalidator.invalidate()
+        return saved
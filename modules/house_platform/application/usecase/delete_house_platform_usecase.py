@@ -1,8 +1,18 @@
+from __future__ import annotations
+
 from modules.house_platform.application.port_out.house_platform_repository_port import HousePlatformRepositoryPort
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationCacheInvalidationPort,
+)
 
 class DeleteHousePlatformUseCase:
-    def __init__(self, repository: HousePlatformRepositoryPort):
+    def __init__(
+        self,
+        repository: HousePlatformRepositoryPort,
+        cache_invalidator: RecommendationCacheInvalidationPort | None = None,
+    ):
         self.repository = repository
+        self.cache_invalidator = cache_invalidator
 
     def execute(self, user_id: int, house_platform_id: int) -> bool:
         existing_house = self.repository.find_by_id(house_platform_id)
@@ -13,4 +23,8 @@ class DeleteHousePlatformUseCase:
         if existing_house.abang_user_id != user_id:
             raise PermissionError("User is not the owner of this house platform.")
             
-        return self.repository.delete(house_platform_id)
+        deleted = self.repository.delete(house_platform_id)
+        if deleted and self.cache_invalidator:
+            # 매물이 바뀌었으므로 이전 추천 결과를 무효화한다.
+            self.cache_invalidator.invalidate()
+        return deleted
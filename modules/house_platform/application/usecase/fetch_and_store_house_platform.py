@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Sequence
+
 from modules.house_platform.adapter.output.zigbang_adapter import ZigbangAdapter
 from modules.house_platform.application.dto.fetch_and_store_dto import (
     FetchAndStoreCommand,
     FetchAndStoreResult,
+    HousePlatformUpsertBundle,
+)
+from modules.house_platform.application.factory.house_platform_snapshot_encoder import (
+    SnapshotFieldCache,
 )
 from modules.house_platform.application.factory.house_platform_snapshot_factory import (
     build_house_platform_snapshot_id,
@@ -11,27 +20,70 @@ from modules.house_platform.application.factory.house_platform_snapshot_factory
 from modules.house_platform.application.port_in.fetch_and_store_house_platform_port import (
     FetchAndStoreHousePlatformPort,
 )
+from modules.house_platform.application.port_out.crawl_checkpoint_port import (
+    CrawlCheckpointPort,
+)
 from modules.house_platform.application.port_out.house_platform_repository_port import (
     HousePlatformRepositoryPort,
 )
 from modules.house_platform.application.port_out.zigbang_fetch_port import (
     ZigbangFetchPort,
 )
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationCacheInvalidationPort,
+)
+
+
+@dataclass(frozen=True)
+class _ChunkDone:
+    """요약 청크 하나의 번들을 모두 내보냈다는 표시. (다음 시작 오프셋)"""
+
+    next_offset: int
+
+
+@dataclass
+class _CrawlStats:
+    fetched: int = 0
+    produced: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+_END = object()
 
 
 class FetchAndStoreHousePlatformService(FetchAndStoreHousePlatformPort):
-    """직방 크롤링 → 정제 → 저장 유스케이스."""
+    """
+    직방 크롤링 → 정제 → 저장 유스케이스.
+    - 요약 조회/상세 조회/스냅샷 계산은 생산 스레드에서, 저장은 호출 스레드에서 수행한다.
+    - 두 단계는 크기가 제한된 큐로 이어져, 저장이 밀리면 조회도 기다린다.
+    - upsert_batch_size 개씩 저장하고, 저장이 끝난 위치까지 체크포인트를 남긴다.
+    - chunk_delay 가 있으면 요약 청크 사이마다 호출한다. (요청 간격 조절용)
+    """
 
     def __init__(
         self,
         fetch_port: ZigbangFetchPort,
         repository_port: HousePlatformRepositoryPort,
         region_filters: list[str] | None = None,
+        cache_invalidator: RecommendationCacheInvalidationPort | None = None,
+        checkpoint_port: CrawlCheckpointPort | None = None,
+        summary_chunk_size: int = 15,
+        upsert_batch_size: int = 100,
+        queue_size: int | None = None,
+        chunk_delay: Callable[[], None] | None = None,
     ):
         self.fetch_port = fetch_port
         self.repository_port = repository_port
         self.region_filters = region_filters or []
         self.adapter = ZigbangAdapter(fetch_port)
+        self.cache_invalidator = cache_invalidator
+        # 같은 이미지/POI 목록의 직렬화 결과를 실행 동안 재사용한다.
+        self.snapshot_cache = SnapshotFieldCache()
+        self.checkpoint_port = checkpoint_port
+        self.summary_chunk_size = max(1, summary_chunk_size)
+        self.upsert_batch_size = max(1, upsert_batch_size)
+        self.queue_size = queue_size or self.upsert_batch_size * 2
+        self.chunk_delay = chunk_delay
 
     def execute(self, command: FetchAndStoreCommand) -> FetchAndStoreResult:
         """입력 조건을 받아 크롤링/저장을 수행한다."""
@@ -40,40 +92,136 @@ class FetchAndStoreHousePlatformService(FetchAndStoreHousePlatformPort):
                 fetched=0, stored=0, skipped=0, errors=["크롤링 조건이 없습니다."]
             )
 
-        summary_items, errors = self.adapter.fetch_summary_items(command.item_ids or [])
-        fetched = len(summary_items)
-        if not summary_items:
-            return FetchAndStoreResult(fetched=0, stored=0, skipped=0, errors=errors)
+        item_ids = list(command.item_ids)
+        checkpoint_key = command.checkpoint_key if self.checkpoint_port else None
+        start_offset = self._load_offset(checkpoint_key, len(item_ids))
 
-        filtered = self.adapter.filter_by_region(summary_items, self.region_filters)
-        if not filtered:
-            return FetchAndStoreResult(
-                fetched=fetched, stored=0, skipped=fetched, errors=errors
-            )
+        stats = _CrawlStats()
+        stored = 0
+        pending: list[HousePlatformUpsertBundle] = []
+        try:
+            for event in _iter_in_background(
+                self._stream_bundles(item_ids, start_offset, stats),
+                maxsize=self.queue_size,
+            ):
+                if isinstance(event, _ChunkDone):
+                    if len(pending) >= self.upsert_batch_size:
+                        stored += self._store(pending)
+                        pending = []
+                    if not pending:
+                        # 이 청크까지의 번들은 모두 저장됐다.
+                        self._save_offset(checkpoint_key, event.next_offset)
+                    continue
+                pending.append(event)
+            if pending:
+                stored += self._store(pending)
+            if checkpoint_key:
+                self.checkpoint_port.clear(checkpoint_key)
+        finally:
+            if stored and self.cache_invalidator:
+                # 새 스냅샷이 후보에 들어오므로 추천 결과 캐시를 무효화한다.
+                self.cache_invalidator.invalidate()
 
-        summary_ids = self.adapter.collect_item_ids(filtered)
-        existing = (
-            self.repository_port.exists_rgst_nos(summary_ids)
-            if summary_ids
-            else set()
-        )
-        filtered = [
-            item
-            for item in filtered
-            if str(item.get("item_id") or item.get("itemId")) not in existing
-        ]
-
-        bundles, errors = self.adapter.convert_details(
-            filtered, errors, skip_ids=existing
+        return FetchAndStoreResult(
+            fetched=stats.fetched,
+            stored=stored,
+            skipped=stats.fetched - stats.produced,
+            errors=stats.errors,
+            resumed_from=start_offset,
         )
-        for bundle in bundles:
-            # 스냅샷 ID를 생성해 저장에 반영한다.
-            bundle.house_platform.snapshot_id = build_house_platform_snapshot_id(
-                bundle
+
+    def _stream_bundles(
+        self, item_ids: Sequence[int], start_offset: int, stats: _CrawlStats
+    ) -> Iterator[HousePlatformUpsertBundle | _ChunkDone]:
+        """요약 청크마다 필터링/상세 조회/스냅샷 계산을 거친 번들을 내보낸다."""
+        for start in range(start_offset, len(item_ids), self.summary_chunk_size):
+            if start > start_offset and self.chunk_delay:
+                self.chunk_delay()
+            end = min(start + self.summary_chunk_size, len(item_ids))
+            summary_items, errors = self.adapter.fetch_summary_items(
+                item_ids[start:end]
             )
-        stored = self.repository_port.upsert_batch(bundles) if bundles else 0
-        skipped = fetched - len(bundles)
+            stats.errors.extend(errors)
+            stats.fetched += len(summary_items)
 
-        return FetchAndStoreResult(
-            fetched=fetched, stored=stored, skipped=skipped, errors=errors
-        )
+            filtered = self.adapter.filter_by_region(
+                summary_items, self.region_filters
+            )
+            summary_ids = self.adapter.collect_item_ids(filtered)
+            existing = (
+                self.repository_port.exists_rgst_nos(summary_ids)
+                if summary_ids
+                else set()
+            )
+            bundles, errors = self.adapter.convert_details(
+                filtered, skip_ids=existing
+            )
+            stats.errors.extend(errors)
+            stats.produced += len(bundles)
+            for bundle in bundles:
+                # 스냅샷 ID를 생성해 저장에 반영한다.
+                bundle.house_platform.snapshot_id = build_house_platform_snapshot_id(
+                    bundle, cache=self.snapshot_cache
+                )
+                yield bundle
+            yield _ChunkDone(next_offset=end)
+
+    def _store(self, bundles: list[HousePlatformUpsertBundle]) -> int:
+        return self.repository_port.upsert_batch(bundles)
+
+    def _load_offset(self, checkpoint_key: str | None, total: int) -> int:
+        if not checkpoint_key:
+            return 0
+        offset = self.checkpoint_port.load(checkpoint_key)
+        if offset is None or offset < 0 or offset > total:
+            return 0
+        return offset
+
+    def _save_offset(self, checkpoint_key: str | None, next_offset: int) -> None:
+        if checkpoint_key:
+            self.checkpoint_port.save(checkpoint_key, next_offset)
+
+
+def _iter_in_background(source: Iterator, maxsize: int) -> Iterator:
+    """
+    제너레이터를 별도 스레드에서 돌리고 크기 제한 큐로 받아 온다.
+    - 소비가 멈추면 큐가 차서 생산도 멈춘다. (backpressure)
+    - 생산 중 예외는 소비 쪽에서 다시 발생시킨다.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in source:
+                if not _put(item):
+                    return
+        except BaseException as exc:  # noqa: BLE001
+            _put(exc)
+            return
+        _put(_END)
+
+    producer = threading.Thread(
+        target=_produce, name="house-platform-crawl", daemon=True
+    )
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Iterable, Sequence, TypeVar
 
 from modules.house_platform.application.dto.embedding_dto import (
     HousePlatformEmbeddingResult,
+    HousePlatformEmbeddingSourceMark,
     HousePlatformEmbeddingUpsert,
     HousePlatformSemanticSource,
 )
 from modules.house_platform.application.factory.house_platform_semantic_factory import (
     build_semantic_house_description,
+    hash_semantic_description,
 )
 from modules.house_platform.application.port_in.generate_house_platform_embeddings_port import (
     GenerateHousePlatformEmbeddingsPort,
@@ -19,9 +22,17 @@ from modules.house_platform.application.port_out.house_platform_embedding_port i
     HousePlatformEmbeddingWritePort,
 )
 
+_T = TypeVar("_T")
+_END = object()
+
 
 class GenerateHousePlatformEmbeddingsService(GenerateHousePlatformEmbeddingsPort):
-    """전체 매물 임베딩을 생성하고 저장한다."""
+    """
+    매물 임베딩을 생성하고 저장한다.
+    - 전체 모드: 모든 매물을 다시 임베딩한다.
+    - 증분 모드: 스냅샷이 바뀐 매물만 키셋 페이지로 읽고,
+      설명문 해시까지 같으면 임베딩 API 를 호출하지 않는다.
+    """
 
     def __init__(
         self,
@@ -34,81 +45,209 @@ class GenerateHousePlatformEmbeddingsService(GenerateHousePlatformEmbeddingsPort
         self.embedder = embedder
 
     async def execute(
-        self, batch_size: int, concurrency: int
+        self,
+        batch_size: int,
+        concurrency: int,
+        incremental: bool = False,
+        page_size: int = 1000,
     ) -> HousePlatformEmbeddingResult:
-        """전체 매물을 조회하고 임베딩을 저장한다."""
-        sources = list(self.reader.fetch_all_sources())
+        """매물을 조회하고 임베딩을 저장한다."""
+        if incremental:
+            return await self._execute_incremental(batch_size, concurrency, page_size)
+
+        sources = list(await asyncio.to_thread(self.reader.fetch_all_sources))
         if not sources:
             return HousePlatformEmbeddingResult(
                 total=0, embedded=0, saved=0, skipped=0, errors=[]
             )
 
-        batches = _chunked(sources, batch_size)
+        targets = [_full_target(source) for source in sources]
         errors: list[str] = []
+        embedded, saved = await self._embed_targets(
+            targets, batch_size, concurrency, errors
+        )
+        return HousePlatformEmbeddingResult(
+            total=len(sources),
+            embedded=embedded,
+            saved=saved,
+            skipped=len(sources) - embedded,
+            errors=errors,
+        )
+
+    async def _execute_incremental(
+        self, batch_size: int, concurrency: int, page_size: int
+    ) -> HousePlatformEmbeddingResult:
+        """바뀐 매물만 house_platform_id 키셋 페이지로 읽어 처리한다."""
+        page_size = max(page_size, 1)
+        total = 0
         embedded = 0
         saved = 0
+        errors: list[str] = []
+        after_id = 0
 
-        for i in range(0, len(batches), max(concurrency, 1)):
-            chunk = batches[i : i + max(concurrency, 1)]
-            results = await asyncio.gather(
-                *(self._process_batch(batch) for batch in chunk),
-                return_exceptions=True,
+        while True:
+            page = list(
+                await asyncio.to_thread(
+                    self.reader.fetch_stale_sources, after_id, page_size
+                )
             )
-            for result in results:
-                if isinstance(result, Exception):
-                    errors.append(str(result))
+            if not page:
+                break
+            after_id = page[-1].house_platform_id
+            total += len(page)
+
+            targets: list[_EmbeddingTarget] = []
+            marks: list[HousePlatformEmbeddingSourceMark] = []
+            for source in page:
+                text = build_semantic_house_description(source)
+                content_hash = hash_semantic_description(text)
+                if source.content_hash == content_hash:
+                    # 스냅샷만 바뀌고 설명문은 같으면 기준 스냅샷만 옮긴다.
+                    marks.append(
+                        HousePlatformEmbeddingSourceMark(
+                            house_platform_id=source.house_platform_id,
+                            source_snapshot_id=source.snapshot_id,
+                        )
+                    )
                     continue
-                batch_embedded, batch_saved = result
-                embedded += batch_embedded
-                saved += batch_saved
+                targets.append(
+                    _EmbeddingTarget(source, text, text, content_hash)
+                )
+
+            if marks:
+                try:
+                    await asyncio.to_thread(self.writer.mark_embedding_sources, marks)
+                except Exception as exc:
+                    errors.append(str(exc))
+            page_embedded, page_saved = await self._embed_targets(
+                targets, batch_size, concurrency, errors
+            )
+            embedded += page_embedded
+            saved += page_saved
+
+            if len(page) < page_size:
+                break
 
         return HousePlatformEmbeddingResult(
-            total=len(sources),
+            total=total,
             embedded=embedded,
             saved=saved,
-            skipped=len(sources) - embedded,
+            skipped=total - embedded,
             errors=errors,
         )
 
-    async def _process_batch(
-        self, batch: Sequence[HousePlatformSemanticSource]
+    async def _embed_targets(
+        self,
+        targets: Sequence[_EmbeddingTarget],
+        batch_size: int,
+        concurrency: int,
+        errors: list[str],
     ) -> tuple[int, int]:
-        texts: list[str] = []
-        house_ids: list[int] = []
-        desc_updates: dict[int, str | None] = {}
-
-        for source in batch:
-            if source.semantic_description:
-                text = source.semantic_description
-                desc_updates[source.house_platform_id] = None
-            else:
-                text = build_semantic_house_description(source)
-                desc_updates[source.house_platform_id] = text
-            texts.append(text)
-            house_ids.append(source.house_platform_id)
-
-        vectors = await self.embedder.embed_texts(texts)
-        upserts: list[HousePlatformEmbeddingUpsert] = []
-        for house_id, vector in zip(house_ids, vectors):
-            upserts.append(
-                HousePlatformEmbeddingUpsert(
-                    house_platform_id=house_id,
-                    embedding=vector,
-                    semantic_description=desc_updates.get(house_id),
+        """
+        임베딩 호출과 저장을 파이프라인으로 처리한다.
+        - 동시에 진행 중인 embed_texts 호출은 concurrency 개로 제한하고, 하나가 끝나면 바로 다음 배치를 시작한다.
+        - 저장은 별도 writer 태스크가 스레드에서 수행하며, 쌓인 결과를 모아 한 번에 업서트한다.
+        """
+        batches = _chunked(targets, batch_size)
+        if not batches:
+            return 0, 0
+        concurrency = max(concurrency, 1)
+        slots = asyncio.Semaphore(concurrency)
+        # writer 가 밀리면 임베딩 결과를 넘기는 쪽도 기다린다.
+        results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        writer = asyncio.create_task(self._write_results(results, errors))
+
+        async def _embed(batch: Sequence[_EmbeddingTarget]) -> None:
+            try:
+                vectors = await self.embedder.embed_texts(
+                    [target.text for target in batch]
                 )
-            )
+                await results.put((batch, vectors))
+            except Exception as exc:
+                errors.append(str(exc))
+            finally:
+                slots.release()
+
+        tasks = []
+        try:
+            for batch in batches:
+                await slots.acquire()
+                tasks.append(asyncio.create_task(_embed(batch)))
+            await asyncio.gather(*tasks)
+        finally:
+            await results.put(_END)
+        return await writer
+
+    async def _write_results(
+        self, results: asyncio.Queue, errors: list[str]
+    ) -> tuple[int, int]:
+        """임베딩 결과를 받아 이벤트 루프 밖에서 일괄 업서트한다."""
+        embedded = 0
+        saved = 0
+        finished = False
+        while not finished:
+            ready = [await results.get()]
+            while not results.empty():
+                ready.append(results.get_nowait())
+            if _END in ready:
+                finished = True
+                ready = [item for item in ready if item is not _END]
+            if not ready:
+                continue
+
+            upserts: list[HousePlatformEmbeddingUpsert] = []
+            vector_count = 0
+            for batch, vectors in ready:
+                vector_count += len(vectors)
+                for target, vector in zip(batch, vectors):
+                    upserts.append(
+                        HousePlatformEmbeddingUpsert(
+                            house_platform_id=target.source.house_platform_id,
+                            embedding=vector,
+                            semantic_description=target.description_update,
+                            content_hash=target.content_hash,
+                            source_snapshot_id=target.source.snapshot_id,
+                        )
+                    )
+            try:
+                saved += await asyncio.to_thread(
+                    self.writer.upsert_embeddings, upserts
+                )
+                embedded += vector_count
+            except Exception as exc:
+                errors.append(str(exc))
+        return embedded, saved
+
+
+@dataclass(frozen=True)
+class _EmbeddingTarget:
+    """임베딩할 매물과 입력 문장. (description_update 가 None 이면 설명문 유지)"""
+
+    source: HousePlatformSemanticSource
+    text: str
+    description_update: str | None
+    content_hash: str
+
 
-        saved = self.writer.upsert_embeddings(upserts)
-        return len(vectors), saved
+def _full_target(source: HousePlatformSemanticSource) -> _EmbeddingTarget:
+    """전체 모드는 저장된 설명문이 있으면 그대로 임베딩한다."""
+    if source.semantic_description:
+        text = source.semantic_description
+        description_update = None
+    else:
+        text = build_semantic_house_description(source)
+        description_update = text
+    return _EmbeddingTarget(
+        source, text, description_update, hash_semantic_description(text)
+    )
 
 
-def _chunked(
-    items: Iterable[HousePlatformSemanticSource], size: int
-) -> list[list[HousePlatformSemanticSource]]:
+def _chunked(items: Iterable[_T], size: int) -> list[list[_T]]:
     if size <= 0:
-        return [list(items)]
-    chunks: list[list[HousePlatformSemanticSource]] = []
-    buf: list[HousePlatformSemanticSource] = []
+        items = list(items)
+        return [items] if items else []
+    chunks: list[list[_T]] = []
+    buf: list[_T] = []
     for item in items:
         buf.append(item)
         if len(buf) >= size:
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from modules.house_platform.application.port_out.house_platform_repository_port import HousePlatformRepositoryPort
+from modules.house_platform.application.port_out.house_platform_detail_read_port import HousePlatformDetailReadPort
 from modules.house_platform.domain.house_platform import HousePlatform
 from modules.send_message.application.port.output.send_message_repository import SendMessageRepository
 from modules.abang_user.application.port.abang_user_repository_port import AbangUserRepositoryPort
@@ -49,3 +50,27 @@ class GetHousePlatformUseCase:
 
     def execute_get_all_by_user(self, user_id: int) -> List[HousePlatform]:
         return self.repository.find_all_by_user_id(user_id)
+
+
+class GetHousePlatformDetailAsyncUseCase:
+    """매물 상세 조회 (async). 연락처 노출 규칙은 GetHousePlatformUseCase 와 같다."""
+
+    def __init__(self, reader: HousePlatformDetailReadPort):
+        self.reader = reader
+
+    async def execute(self, house_platform_id: int, viewer_id: int = None) -> Optional[HousePlatform]:
+        house = await self.reader.find_by_id(house_platform_id)
+        if not house:
+            return None
+
+        if viewer_id:
+            # 본인 글이거나, OWNER 가 보낸 제안을 FINDER(viewer) 가 수락(Y)했으면 연락처를 보인다.
+            has_accepted = viewer_id == house.abang_user_id or await self.reader.has_accepted_offer(
+                house_platform_id, house.abang_user_id, viewer_id
+            )
+            if has_accepted:
+                phone_number = await self.reader.find_phone_number(house.abang_user_id)
+                if phone_number is not None:
+                    setattr(house, 'phone_number', phone_number)
+
+        return house
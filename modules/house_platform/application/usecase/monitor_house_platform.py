@@ -7,11 +7,14 @@ from modules.house_platform.adapter.output.zigbang_adapter import ZigbangAdapter
 from modules.house_platform.application.dto.fetch_and_store_dto import (
     HousePlatformUpsertBundle,
 )
+from modules.house_platform.application.factory.house_platform_snapshot_encoder import (
+    SnapshotFieldCache,
+)
 from modules.house_platform.application.factory.house_platform_snapshot_factory import (
     build_house_platform_snapshot_id,
-    normalize_house_platform_bundle,
 )
 from modules.house_platform.application.dto.monitor_house_platform_dto import (
+    HousePlatformMonitorTarget,
     MonitorHousePlatformCommand,
     MonitorHousePlatformResult,
 )
@@ -24,6 +27,9 @@ from modules.house_platform.application.port_out.house_platform_repository_port
 from modules.house_platform.application.port_out.zigbang_fetch_port import (
     ZigbangFetchPort,
 )
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationCacheInvalidationPort,
+)
 from modules.house_platform.domain.value_object.house_platform_domain import (
     HousePlatformDomainType,
 )
@@ -36,10 +42,14 @@ class MonitorHousePlatformService(MonitorHousePlatformPort):
         self,
         fetch_port: ZigbangFetchPort,
         repository_port: HousePlatformRepositoryPort,
+        cache_invalidator: RecommendationCacheInvalidationPort | None = None,
     ):
         self.fetch_port = fetch_port
         self.repository_port = repository_port
         self.adapter = ZigbangAdapter(fetch_port)
+        self.cache_invalidator = cache_invalidator
+        # 같은 이미지/POI 목록의 직렬화 결과를 실행 동안 재사용한다.
+        self.snapshot_cache = SnapshotFieldCache()
 
     def execute(
         self, command: MonitorHousePlatformCommand
@@ -56,6 +66,7 @@ class MonitorHousePlatformService(MonitorHousePlatformPort):
         banned = 0
         errors: list[str] = []
 
+        fetch_targets: list[tuple[HousePlatformMonitorTarget, int]] = []
         for target in targets:
             checked += 1
             if target.domain_id != HousePlatformDomainType.ZIGBANG:
@@ -65,12 +76,25 @@ class MonitorHousePlatformService(MonitorHousePlatformPort):
                 skipped += 1
                 continue
             try:
-                detail = self.fetch_port.fetch_detail(int(target.rgst_no))
-            except Exception as exc:  # noqa: BLE001
+                fetch_targets.append((target, int(target.rgst_no)))
+            except (TypeError, ValueError) as exc:
                 errors.append(f"상세 조회 실패 {target.rgst_no}: {exc}")
-                continue
 
-            bundle = self.adapter.convert_detail_item(detail)
+        # 상세 조회는 fetch_port 정책(순차 또는 속도 제한 동시 조회)에 맡긴다.
+        results = self.fetch_port.fetch_details(
+            [item_id for _, item_id in fetch_targets]
+        )
+        changed: list[HousePlatformUpsertBundle] = []
+        for (target, _), result in zip(fetch_targets, results):
+            if result.error is not None:
+                errors.append(f"상세 조회 실패 {target.rgst_no}: {result.error}")
+                continue
+            detail = result.detail
+            try:
+                bundle = self.adapter.convert_detail_item(detail)
+            except Exception as exc:  # noqa: BLE001
+                errors.append(f"상세 변환 실패 {target.rgst_no}: {exc}")
+                continue
             if _is_closed(detail):
                 bundle.house_platform.is_banned = True
                 banned += 1
@@ -79,21 +103,22 @@ class MonitorHousePlatformService(MonitorHousePlatformPort):
             bundle.house_platform.updated_at = None
             # 스냅샷 ID를 생성해 저장에 반영한다.
             bundle.house_platform.snapshot_id = build_house_platform_snapshot_id(
-                bundle
+                bundle, cache=self.snapshot_cache
             )
 
-            existing = self.repository_port.fetch_bundle_by_id(
-                target.house_platform_id
-            )
-            if existing and _is_same_bundle(existing, bundle):
+            # 저장된 스냅샷 ID(대상 조회 시 함께 읽음)와 같으면 변경이 없다.
+            if target.snapshot_id == bundle.house_platform.snapshot_id:
                 skipped += 1
                 continue
+            changed.append(bundle)
 
-            try:
-                self.repository_port.upsert_batch([bundle])
-                updated += 1
-            except Exception as exc:  # noqa: BLE001
-                errors.append(f"업데이트 실패 {target.rgst_no}: {exc}")
+        if changed:
+            updated, upsert_errors = self._store_changed(changed)
+            errors.extend(upsert_errors)
+
+        if updated and self.cache_invalidator:
+            # 스냅샷이 바뀐 매물이 있으면 추천 결과 캐시를 무효화한다.
+            self.cache_invalidator.invalidate()
 
         return MonitorHousePlatformResult(
             checked=checked,
@@ -103,6 +128,25 @@ class MonitorHousePlatformService(MonitorHousePlatformPort):
             errors=errors,
         )
 
+    def _store_changed(
+        self, bundles: list[HousePlatformUpsertBundle]
+    ) -> tuple[int, list[str]]:
+        """변경된 번들을 한 번에 업서트한다. 실패하면 건별로 다시 시도해 실패 건을 가린다."""
+        try:
+            return self.repository_port.upsert_batch(bundles), []
+        except Exception:  # noqa: BLE001
+            pass
+        updated = 0
+        errors: list[str] = []
+        for bundle in bundles:
+            try:
+                updated += self.repository_port.upsert_batch([bundle])
+            except Exception as exc:  # noqa: BLE001
+                errors.append(
+                    f"업데이트 실패 {bundle.house_platform.rgst_no}: {exc}"
+                )
+        return updated, errors
+
 
 def _is_closed(detail: Mapping[str, Any]) -> bool:
     status = detail.get("status")
@@ -113,11 +157,3 @@ def _is_closed(detail: Mapping[str, Any]) -> bool:
     value = str(status).strip().lower()
     return value in {"close", "closed", "false", "0", "n"}
 
-
-def _is_same_bundle(
-    existing: HousePlatformUpsertBundle,
-    incoming: HousePlatformUpsertBundle,
-) -> bool:
-    return normalize_house_platform_bundle(
-        existing, include_snapshot_id=True
-    ) == normalize_house_platform_bundle(incoming, include_snapshot_id=True)
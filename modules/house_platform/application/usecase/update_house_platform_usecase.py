@@ -1,11 +1,21 @@
+from __future__ import annotations
+
 from typing import Optional
 from modules.house_platform.application.port_out.house_platform_repository_port import HousePlatformRepositoryPort
 from modules.house_platform.application.dto.house_platform_dto import HousePlatformUpdateRequest
 from modules.house_platform.domain.house_platform import HousePlatform
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationCacheInvalidationPort,
+)
 
 class UpdateHousePlatformUseCase:
-    def __init__(self, repository: HousePlatformRepositoryPort):
+    def __init__(
+        self,
+        repository: HousePlatformRepositoryPort,
+        cache_invalidator: RecommendationCacheInvalidationPort | None = None,
+    ):
         self.repository = repository
+        self.cache_invalidator = cache_invalidator
 
     def execute(self, user_id: int, house_platform_id: int, request: HousePlatformUpdateRequest) -> Optional[HousePlatform]:
         existing_house = self.repository.find_by_id(house_platform_id)
@@ -40,4 +50,8 @@ class UpdateHousePlatformUseCase:
         if request.dong_nm is not None: existing_house.dong_nm = request.dong_nm
         if request.snapshot_id is not None: existing_house.snapshot_id = request.snapshot_id
         
-        return self.repository.save(existing_house)
+        saved = self.repository.save(existing_house)
+        if self.cache_invalidator:
+            # 매물이 바뀌었으므로 이전 추천 결과를 무효화한다.
+            self.cache_invalidator.invalidate()
+        return saved
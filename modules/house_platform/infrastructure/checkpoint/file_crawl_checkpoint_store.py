@@ -0,0 +1,24 @@
+"""크롤링 진행 위치를 파일로 저장한다."""
+from __future__ import annotations
+
+from infrastructure.checkpoint.keyed_json_file_store import KeyedJsonFileStore
+from modules.house_platform.application.port_out.crawl_checkpoint_port import (
+    CrawlCheckpointPort,
+)
+
+
+class FileCrawlCheckpointStore(CrawlCheckpointPort):
+    """키마다 JSON 파일 하나에 다음 시작 오프셋을 기록한다."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._store = KeyedJsonFileStore(directory, "crawl_checkpoint", "next_offset")
+
+    def load(self, key: str) -> int | None:
+        return self._store.load(key)
+
+    def save(self, key: str, next_offset: int) -> None:
+        self._store.save(key, next_offset)
+
+    def clear(self, key: str) -> None:
+        self._store.clear(key)
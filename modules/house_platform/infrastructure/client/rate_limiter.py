@@ -0,0 +1,46 @@
+"""외부 API 호출 속도 제한기."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucketRateLimiter:
+    """
+    초당 요청 수를 토큰 버킷으로 제한한다. (스레드 안전)
+    - rate_per_sec 속도로 토큰이 차고, 최대 burst 개까지 모인다.
+    - acquire() 는 토큰이 생길 때까지 호출 스레드를 재운다.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self.rate_per_sec = rate_per_sec
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = self._clock()
+                elapsed = max(0.0, now - self._updated_at)
+                self._tokens = min(
+                    float(self.burst), self._tokens + elapsed * self.rate_per_sec
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate_per_sec
+            self._sleep(wait)
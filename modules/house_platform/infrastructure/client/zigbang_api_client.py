@@ -3,20 +3,35 @@ from __future__ import annotations
 
 import logging
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, Mapping, Sequence
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from modules.house_platform.application.dto.fetch_and_store_dto import (
+    ZigbangDetailFetchResult,
+)
 from modules.house_platform.application.port_out.zigbang_fetch_port import (
     ZigbangFetchPort,
 )
+from modules.house_platform.infrastructure.client.rate_limiter import (
+    TokenBucketRateLimiter,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class ZigbangApiClient(ZigbangFetchPort):
-    """직방 API 호출 및 재시도/지연 정책을 캡슐화한다."""
+    """
+    직방 API 호출 및 재시도/지연 정책을 캡슐화한다.
+    - requests_per_sec 또는 max_concurrency(>1)를 주면 fetch_details 가 동시 조회 모드로 동작한다.
+      요청 간 고정 지연 대신 토큰 버킷으로 초당 요청 수를 맞추고, 호스트별 동시 요청 수를 제한한다.
+    - 동시 조회인데 requests_per_sec 가 없으면 순차 모드의 평균 지연과 같은 속도를 기본값으로 쓴다.
+    """
 
     def __init__(
         self,
@@ -25,12 +40,34 @@ class ZigbangApiClient(ZigbangFetchPort):
         max_delay_sec: float = 1.5,
         session: requests.Session | None = None,
         max_retries: int = 2,
+        requests_per_sec: float | None = None,
+        max_concurrency: int = 1,
+        max_per_host: int | None = None,
+        backoff_base_sec: float = 0.5,
+        backoff_max_sec: float = 8.0,
     ):
         self.base_url = base_url.rstrip("/")
         self.min_delay_sec = min_delay_sec
         self.max_delay_sec = max_delay_sec
-        self.session = session or requests.Session()
         self.max_retries = max_retries
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_host = max(1, max_per_host or self.max_concurrency)
+        self.backoff_base_sec = backoff_base_sec
+        self.backoff_max_sec = backoff_max_sec
+        if requests_per_sec is None and self.max_concurrency > 1:
+            requests_per_sec = _default_requests_per_sec(min_delay_sec, max_delay_sec)
+        self.rate_limiter = (
+            TokenBucketRateLimiter(requests_per_sec) if requests_per_sec else None
+        )
+        if session is None:
+            session = requests.Session()
+            # 동시 조회 시 워커마다 연결을 재사용하도록 풀 크기를 맞춘다.
+            adapter = HTTPAdapter(pool_maxsize=max(10, self.max_concurrency))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self._host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._host_lock = threading.Lock()
 
     def fetch_by_item_ids(self, item_ids: Iterable[int]) -> Sequence[Mapping]:
         """item_id를 15개씩 묶어 배치 조회한다."""
@@ -82,19 +119,81 @@ class ZigbangApiClient(ZigbangFetchPort):
         finally:
             self._sleep_with_jitter()
 
+    def fetch_details(
+        self, item_ids: Sequence[int]
+    ) -> list[ZigbangDetailFetchResult]:
+        """여러 건을 상세 조회한다. 동시 조회 모드면 속도 제한 안에서 요청을 겹친다."""
+        if not self._is_concurrent():
+            return super().fetch_details(item_ids)
+        if not item_ids:
+            return []
+        workers = min(self.max_concurrency, len(item_ids))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="zigbang-detail"
+        ) as executor:
+            return list(executor.map(self._fetch_detail_limited, item_ids))
+
+    def _is_concurrent(self) -> bool:
+        return self.rate_limiter is not None or self.max_concurrency > 1
+
+    def _fetch_detail_limited(self, item_id: int) -> ZigbangDetailFetchResult:
+        """속도 제한/호스트 상한/지수 백오프를 적용해 단건을 조회한다."""
+        url = f"{self.base_url}/items/{item_id}"
+        semaphore = self._host_semaphore(urlsplit(url).netloc)
+        attempts = self.max_retries + 1
+        for attempt in range(1, attempts + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            retry_after = None
+            try:
+                with semaphore:
+                    return ZigbangDetailFetchResult(
+                        item_id=item_id, detail=self._request_detail(url)
+                    )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "상세 요청 실패 item_id=%s attempt=%s/%s err=%s",
+                    item_id,
+                    attempt,
+                    attempts,
+                    exc,
+                )
+                if attempt == attempts:
+                    return ZigbangDetailFetchResult(item_id=item_id, error=exc)
+                retry_after = _retry_after_sec(exc)
+            time.sleep(self._backoff_delay(attempt, retry_after))
+
+    def _backoff_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """지수 백오프 + 지터. 서버가 Retry-After 를 주면 그 값을 따른다."""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max_sec)
+        delay = min(self.backoff_max_sec, self.backoff_base_sec * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _host_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+
+    def _request_detail(self, url: str) -> Mapping:
+        resp = self.session.get(
+            url,
+            headers=self._headers(),
+            params={"version": "", "domain": "zigbang"},
+            timeout=10,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        return data.get("item") or data
+
     def _retry_detail(self, url: str, item_id: int) -> Mapping:
         last_exc: Exception | None = None
         for attempt in range(1, self.max_retries + 2):
             try:
-                resp = self.session.get(
-                    url,
-                    headers=self._headers(),
-                    params={"version": "", "domain": "zigbang"},
-                    timeout=10,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                return data.get("item") or data
+                return self._request_detail(url)
             except Exception as exc:  # noqa: BLE001
                 last_exc = exc
                 logger.warning(
@@ -133,3 +232,22 @@ class ZigbangApiClient(ZigbangFetchPort):
                 }
             )
         return base
+
+
+def _default_requests_per_sec(min_delay_sec: float, max_delay_sec: float) -> float | None:
+    """순차 모드의 평균 요청 간격으로 초당 요청 수를 정한다. 지연이 0 이면 제한하지 않는다."""
+    average_delay = (min_delay_sec + max_delay_sec) / 2
+    if average_delay <= 0:
+        return None
+    return 1.0 / average_delay
+
+
+def _retry_after_sec(exc: Exception) -> float | None:
+    """429/503 응답의 Retry-After(초)를 읽는다."""
+    response = getattr(exc, "response", None)
+    if response is None or response.status_code not in {429, 503}:
+        return None
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "")))
+    except ValueError:
+        return None
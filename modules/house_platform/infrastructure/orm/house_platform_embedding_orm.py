@@ -1,6 +1,6 @@
 from infrastructure.db.postgres import Base
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Text, func
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, String, Text, func
 
 
 class HousePlatformEmbeddingORM(Base):
@@ -19,6 +19,12 @@ class HousePlatformEmbeddingORM(Base):
     )
     semantic_description = Column("semantic_description", Text, nullable=True)
     embedding = Column(Vector(1536), nullable=True)
+    # 증분 임베딩용 (ALTER TABLE house_platform_embedding
+    #   ADD COLUMN content_hash VARCHAR(64), ADD COLUMN source_snapshot_id VARCHAR(64);)
+    content_hash = Column(String(64), nullable=True, comment="임베딩 입력 문장 해시")
+    source_snapshot_id = Column(
+        String(64), nullable=True, comment="임베딩 시점 매물 스냅샷 ID"
+    )
     created_at = Column(DateTime, server_default=func.now(), nullable=True)
     updated_at = Column(
         DateTime, server_default=func.now(), onupdate=func.now(), nullable=True
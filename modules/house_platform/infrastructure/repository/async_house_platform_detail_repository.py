@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import exists, select
+
+from modules.abang_user.adapter.output.abang_user_model import AbangUser
+from modules.house_platform.application.port_out.house_platform_detail_read_port import (
+    HousePlatformDetailReadPort,
+)
+from modules.house_platform.domain.house_platform import HousePlatform
+from modules.house_platform.infrastructure.orm.house_platform_orm import HousePlatformORM
+from modules.house_platform.infrastructure.repository.house_platform_repository import (
+    HousePlatformRepository,
+)
+from modules.send_message.infrastructure.orm.send_message_orm import SendMessageORM
+
+
+class AsyncHousePlatformDetailRepository(HousePlatformDetailReadPort):
+    """AsyncSession 기반 매물 상세 조회 저장소."""
+
+    def __init__(self, db_session):
+        self.db = db_session
+
+    async def find_by_id(self, house_platform_id: int) -> Optional[HousePlatform]:
+        result = await self.db.execute(
+            select(HousePlatformORM).where(
+                HousePlatformORM.house_platform_id == house_platform_id
+            )
+        )
+        orm = result.scalar_one_or_none()
+        return HousePlatformRepository.to_domain(orm) if orm else None
+
+    async def has_accepted_offer(
+        self, house_platform_id: int, owner_id: int, viewer_id: int
+    ) -> bool:
+        # 수신 메시지 전체를 읽지 않고 EXISTS 한 번으로 확인한다.
+        result = await self.db.execute(
+            select(
+                exists().where(
+                    SendMessageORM.house_platform_id == house_platform_id,
+                    SendMessageORM.sender_id == owner_id,
+                    SendMessageORM.receiver_id == viewer_id,
+                    SendMessageORM.accept_type == "Y",
+                )
+            )
+        )
+        return bool(result.scalar())
+
+    async def find_phone_number(self, abang_user_id: int) -> Optional[str]:
+        result = await self.db.execute(
+            select(AbangUser.phone_number).where(
+                AbangUser.abang_user_id == abang_user_id
+            )
+        )
+        return result.scalar_one_or_none()
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import json
-from typing import Iterable, Sequence
+import logging
+from typing import Callable, Iterable, Sequence
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, func, or_, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, defer
 
 from infrastructure.db.postgres import get_db_session
 from infrastructure.db.session_helper import open_session
+from infrastructure.db.upsert_helper import (
+    bulk_insert_for,
+    is_missing_conflict_target,
+)
 from modules.house_platform.application.dto.embedding_dto import (
+    HousePlatformEmbeddingSourceMark,
     HousePlatformEmbeddingUpsert,
     HousePlatformSemanticSource,
 )
@@ -27,47 +34,71 @@ from modules.house_platform.infrastructure.orm.house_platform_options_orm import
 )
 from modules.house_platform.infrastructure.orm.house_platform_orm import HousePlatformORM
 
+logger = logging.getLogger(__name__)
+
+# 업서트 한 문장에 담는 최대 행 수 (벡터가 커서 house_platform 보다 작게 잡는다)
+EMBEDDING_UPSERT_CHUNK_SIZE = 200
+
+# ON CONFLICT 대상 유니크 인덱스. 없으면 단건 업서트 경로로 폴백한다.
+#   CREATE UNIQUE INDEX uq_house_platform_embedding_house_platform_id
+#       ON house_platform_embedding (house_platform_id);
+
 
 class HousePlatformEmbeddingRepository(
     HousePlatformEmbeddingReadPort, HousePlatformEmbeddingWritePort
 ):
     """house_platform 임베딩 저장소 구현체."""
 
+    # ON CONFLICT 대상 인덱스가 없는 DB 로 확인되면 프로세스 동안 단건 경로를 쓴다.
+    _bulk_upsert_supported: bool = True
+
     def __init__(self, session_factory=None):
         self._session_factory = session_factory or get_db_session
 
     def fetch_all_sources(self) -> Sequence[HousePlatformSemanticSource]:
         """임베딩에 필요한 조인 데이터를 조회한다."""
         session, generator = open_session(self._session_factory)
+        try:
+            rows = self._source_query(session).all()
+            return [self._to_source(*row) for row in rows]
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+    def fetch_stale_sources(
+        self, after_house_platform_id: int, limit: int
+    ) -> Sequence[HousePlatformSemanticSource]:
+        """
+        임베딩 대상이 될 수 있는 매물을 키셋 페이지로 조회한다.
+        - 임베딩/내용 해시가 없거나, 기준 스냅샷 ID가 현재 스냅샷과 다른 매물
+        - 스냅샷이 없는 매물(직접 등록)은 임베딩 이후 수정된 경우
+        """
+        session, generator = open_session(self._session_factory)
         try:
             rows = (
-                session.query(
-                    HousePlatformORM,
-                    HousePlatformOptionORM,
-                    HousePlatformManagementORM,
-                    HousePlatformEmbeddingORM,
-                )
-                .outerjoin(
-                    HousePlatformOptionORM,
-                    HousePlatformOptionORM.house_platform_id
-                    == HousePlatformORM.house_platform_id,
-                )
-                .outerjoin(
-                    HousePlatformManagementORM,
-                    HousePlatformManagementORM.house_platform_id
-                    == HousePlatformORM.house_platform_id,
-                )
-                .outerjoin(
-                    HousePlatformEmbeddingORM,
-                    HousePlatformEmbeddingORM.house_platform_id
-                    == HousePlatformORM.house_platform_id,
-                )
+                self._source_query(session)
                 .filter(
+                    HousePlatformORM.house_platform_id > after_house_platform_id,
                     or_(
-                        HousePlatformORM.is_banned.is_(False),
-                        HousePlatformORM.is_banned.is_(None),
-                    )
+                        HousePlatformEmbeddingORM.house_platform_embedding_id.is_(None),
+                        HousePlatformEmbeddingORM.embedding.is_(None),
+                        HousePlatformEmbeddingORM.content_hash.is_(None),
+                        HousePlatformEmbeddingORM.source_snapshot_id.is_distinct_from(
+                            HousePlatformORM.snapshot_id
+                        ),
+                        and_(
+                            HousePlatformORM.snapshot_id.is_(None),
+                            HousePlatformEmbeddingORM.updated_at
+                            < HousePlatformORM.updated_at,
+                        ),
+                    ),
                 )
+                # 비교에 벡터 값은 필요 없으므로 로딩하지 않는다.
+                .options(defer(HousePlatformEmbeddingORM.embedding))
+                .order_by(HousePlatformORM.house_platform_id)
+                .limit(limit)
                 .all()
             )
             return [self._to_source(*row) for row in rows]
@@ -79,31 +110,29 @@ class HousePlatformEmbeddingRepository(
 
     def upsert_embeddings(self, items: Iterable[HousePlatformEmbeddingUpsert]) -> int:
         """임베딩 벡터와 설명문을 업서트한다."""
+        items = list(items)
+        if not items:
+            return 0
         session, generator = open_session(self._session_factory)
-        saved = 0
         try:
-            for item in items:
-                existing = (
-                    session.query(HousePlatformEmbeddingORM)
-                    .filter(
-                        HousePlatformEmbeddingORM.house_platform_id
-                        == item.house_platform_id
-                    )
-                    .one_or_none()
-                )
-                if existing:
-                    existing.embedding = item.embedding
-                    if item.semantic_description is not None:
-                        existing.semantic_description = item.semantic_description
-                else:
-                    session.add(
-                        HousePlatformEmbeddingORM(
-                            house_platform_id=item.house_platform_id,
-                            semantic_description=item.semantic_description,
-                            embedding=item.embedding,
+            insert_fn = self._bulk_insert_for(session)
+            if insert_fn is None:
+                saved = self._upsert_embeddings_rowwise(session, items)
+            else:
+                try:
+                    with session.begin_nested():
+                        saved = self._upsert_embeddings_bulk(
+                            session, insert_fn, items
                         )
+                except DBAPIError as exc:
+                    if not is_missing_conflict_target(exc):
+                        raise
+                    logger.warning(
+                        "ON CONFLICT 대상 유니크 인덱스가 없어 단건 업서트로 전환합니다: %s",
+                        exc.orig,
                     )
-                saved += 1
+                    HousePlatformEmbeddingRepository._bulk_upsert_supported = False
+                    saved = self._upsert_embeddings_rowwise(session, items)
             session.commit()
             return saved
         except Exception:
@@ -115,6 +144,157 @@ class HousePlatformEmbeddingRepository(
             else:
                 session.close()
 
+    def _bulk_insert_for(self, session: Session) -> Callable | None:
+        if not HousePlatformEmbeddingRepository._bulk_upsert_supported:
+            return None
+        return bulk_insert_for(session)
+
+    @staticmethod
+    def _upsert_embeddings_bulk(
+        session: Session,
+        insert_fn: Callable,
+        items: Sequence[HousePlatformEmbeddingUpsert],
+    ) -> int:
+        """house_platform_id 기준 INSERT ... ON CONFLICT DO UPDATE 를 청크 단위로 실행한다."""
+        table = HousePlatformEmbeddingORM.__table__
+        # 같은 매물이 여러 번 들어오면 마지막 값만 반영한다. (한 문장 내 중복 충돌 방지)
+        latest = {item.house_platform_id: item for item in items}
+        rows = [
+            {
+                "house_platform_id": item.house_platform_id,
+                "semantic_description": item.semantic_description,
+                "embedding": item.embedding,
+                "content_hash": item.content_hash,
+                "source_snapshot_id": item.source_snapshot_id,
+            }
+            for item in latest.values()
+        ]
+        for start in range(0, len(rows), EMBEDDING_UPSERT_CHUNK_SIZE):
+            stmt = insert_fn(table).values(
+                rows[start : start + EMBEDDING_UPSERT_CHUNK_SIZE]
+            )
+            excluded = stmt.excluded
+            session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[table.c.house_platform_id],
+                    set_={
+                        "embedding": excluded.embedding,
+                        # 설명문이 없으면 기존 설명문을 유지한다.
+                        "semantic_description": func.coalesce(
+                            excluded.semantic_description,
+                            table.c.semantic_description,
+                        ),
+                        "content_hash": excluded.content_hash,
+                        "source_snapshot_id": excluded.source_snapshot_id,
+                        "updated_at": func.current_timestamp(),
+                    },
+                )
+            )
+        return len(items)
+
+    @staticmethod
+    def _upsert_embeddings_rowwise(
+        session: Session, items: Sequence[HousePlatformEmbeddingUpsert]
+    ) -> int:
+        """매물마다 조회 후 갱신/삽입한다. (ON CONFLICT 미지원 환경용)"""
+        saved = 0
+        for item in items:
+            existing = (
+                session.query(HousePlatformEmbeddingORM)
+                .filter(
+                    HousePlatformEmbeddingORM.house_platform_id
+                    == item.house_platform_id
+                )
+                .one_or_none()
+            )
+            if existing:
+                existing.embedding = item.embedding
+                if item.semantic_description is not None:
+                    existing.semantic_description = item.semantic_description
+                existing.content_hash = item.content_hash
+                existing.source_snapshot_id = item.source_snapshot_id
+            else:
+                session.add(
+                    HousePlatformEmbeddingORM(
+                        house_platform_id=item.house_platform_id,
+                        semantic_description=item.semantic_description,
+                        embedding=item.embedding,
+                        content_hash=item.content_hash,
+                        source_snapshot_id=item.source_snapshot_id,
+                    )
+                )
+            # 같은 매물이 다시 나오면 조회에 걸리도록 바로 반영한다.
+            session.flush()
+            saved += 1
+        return saved
+
+    def mark_embedding_sources(
+        self, items: Sequence[HousePlatformEmbeddingSourceMark]
+    ) -> int:
+        """기준 스냅샷 ID만 한 번의 executemany 로 갱신한다. (updated_at 은 onupdate 로 갱신)"""
+        if not items:
+            return 0
+        table = HousePlatformEmbeddingORM.__table__
+        stmt = (
+            update(table)
+            .where(table.c.house_platform_id == bindparam("target_id"))
+            .values(source_snapshot_id=bindparam("target_snapshot_id"))
+        )
+        session, generator = open_session(self._session_factory)
+        try:
+            session.execute(
+                stmt,
+                [
+                    {
+                        "target_id": item.house_platform_id,
+                        "target_snapshot_id": item.source_snapshot_id,
+                    }
+                    for item in items
+                ],
+            )
+            session.commit()
+            return len(items)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+    @staticmethod
+    def _source_query(session: Session):
+        return (
+            session.query(
+                HousePlatformORM,
+                HousePlatformOptionORM,
+                HousePlatformManagementORM,
+                HousePlatformEmbeddingORM,
+            )
+            .outerjoin(
+                HousePlatformOptionORM,
+                HousePlatformOptionORM.house_platform_id
+                == HousePlatformORM.house_platform_id,
+            )
+            .outerjoin(
+                HousePlatformManagementORM,
+                HousePlatformManagementORM.house_platform_id
+                == HousePlatformORM.house_platform_id,
+            )
+            .outerjoin(
+                HousePlatformEmbeddingORM,
+                HousePlatformEmbeddingORM.house_platform_id
+                == HousePlatformORM.house_platform_id,
+            )
+            .filter(
+                or_(
+                    HousePlatformORM.is_banned.is_(False),
+                    HousePlatformORM.is_banned.is_(None),
+                )
+            )
+        )
+
     def _to_source(
         self,
         house: HousePlatformORM,
@@ -155,6 +335,8 @@ class HousePlatformEmbeddingRepository(
             semantic_description=embedding.semantic_description
             if embedding
             else None,
+            snapshot_id=house.snapshot_id,
+            content_hash=embedding.content_hash if embedding else None,
         )
 
     @staticmethod
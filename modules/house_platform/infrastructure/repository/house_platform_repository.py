@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import json
+import logging
 from dataclasses import asdict
-from typing import Iterable, Sequence, Set, Optional, List
+from typing import Callable, Dict, Iterable, Sequence, Set, Optional, List
 
-from sqlalchemy import or_
+from sqlalchemy import func, null, or_
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
 
 from infrastructure.db.postgres import get_db_session
 from infrastructure.db.session_helper import open_session
+from infrastructure.db.upsert_helper import (
+    bulk_insert_for,
+    is_missing_conflict_target,
+)
 from modules.house_platform.domain.house_platform import HousePlatform
 from modules.house_platform.application.dto.fetch_and_store_dto import (
     HousePlatformUpsertBundle,
@@ -38,14 +44,36 @@ from modules.house_platform.infrastructure.orm.house_platform_options_orm import
 )
 from modules.house_platform.infrastructure.orm.house_platform_orm import HousePlatformORM
 
+logger = logging.getLogger(__name__)
+
+# 업서트 한 문장에 담는 최대 행 수 (행당 바인드 파라미터 약 30개)
+UPSERT_CHUNK_SIZE = 500
+
+# ON CONFLICT 대상 유니크 인덱스. 없으면 단건 업서트 경로로 폴백한다.
+#   CREATE UNIQUE INDEX uq_house_platform_rgst_no ON house_platform (rgst_no);
+#   CREATE UNIQUE INDEX uq_house_platform_management_house_platform_id
+#       ON house_platform_management (house_platform_id);
+#   CREATE UNIQUE INDEX uq_house_platform_options_house_platform_id
+#       ON house_platform_options (house_platform_id);
+
+# 기존 레코드 갱신 시 건드리지 않는 컬럼
+_HOUSE_PLATFORM_FROZEN = {"house_platform_id", "created_at", "is_banned"}
+_MANAGEMENT_FROZEN = {"house_platform_management_id", "created_at"}
+_OPTION_FIELDS = ("built_in", "near_univ", "near_transport", "near_mart", "nearby_pois")
+
 
 class HousePlatformRepository(HousePlatformRepositoryPort):
     """house_platform 및 부속 테이블 저장소 구현체."""
 
+    # ON CONFLICT 대상 인덱스가 없는 DB 로 확인되면 프로세스 동안 단건 경로를 쓴다.
+    _bulk_upsert_supported: bool = True
+
     def __init__(self, session_factory=None):
         self._session_factory = session_factory or get_db_session
 
-    def _to_domain(self, orm: HousePlatformORM) -> HousePlatform:
+    @staticmethod
+    def to_domain(orm: HousePlatformORM) -> HousePlatform:
+        """house_platform ORM 행을 도메인 객체로 변환한다. (다른 모듈의 일괄 조회에서도 사용)"""
         return HousePlatform(
             house_platform_id=orm.house_platform_id,
             title=orm.title,
@@ -111,7 +139,7 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
                     # abang_user_id is generally immutable
                     session.commit()
                     session.refresh(orm)
-                    return self._to_domain(orm)
+                    return self.to_domain(orm)
             
             # Create
             orm = HousePlatformORM(
@@ -143,7 +171,7 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
             session.add(orm)
             session.commit()
             session.refresh(orm)
-            return self._to_domain(orm)
+            return self.to_domain(orm)
         except Exception:
             session.rollback()
             raise
@@ -159,7 +187,7 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
         try:
             orm = session.query(HousePlatformORM).filter(HousePlatformORM.house_platform_id == house_platform_id).one_or_none()
             if orm:
-                return self._to_domain(orm)
+                return self.to_domain(orm)
             return None
         finally:
             if generator:
@@ -172,7 +200,7 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
         session, generator = open_session(self._session_factory)
         try:
             orms = session.query(HousePlatformORM).filter(HousePlatformORM.abang_user_id == abang_user_id).all()
-            return [self._to_domain(orm) for orm in orms]
+            return [self.to_domain(orm) for orm in orms]
         finally:
             if generator:
                 generator.close()
@@ -217,40 +245,25 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
     def upsert_batch(self, bundles: Sequence[HousePlatformUpsertBundle]) -> int:
         """매물/관리비/옵션을 묶어 업서트한다."""
         session, generator = open_session(self._session_factory)
-        stored = 0
         try:
-            for bundle in bundles:
-                payload = self._to_house_platform_payload(bundle.house_platform)
-                rgst_no = payload.get("rgst_no")
-                if not rgst_no:
-                    continue
-                existing = (
-                    session.query(HousePlatformORM)
-                    .filter(HousePlatformORM.rgst_no == rgst_no)
-                    .one_or_none()
-                )
-                if existing:
-                    self._apply_house_platform_updates(existing, payload)
-                    house_platform_id = existing.house_platform_id
-                else:
-                    payload = self._drop_none(payload)
-                    payload.pop("house_platform_id", None)
-                    if payload.get("is_banned") is None:
-                        payload["is_banned"] = False
-                    obj = HousePlatformORM(**payload)
-                    session.add(obj)
-                    session.flush()
-                    house_platform_id = obj.house_platform_id
-
-                if bundle.management:
-                    self._upsert_management(
-                        session, house_platform_id, bundle.management
-                    )
-                if bundle.options is not None:
-                    self._upsert_options(
-                        session, house_platform_id, bundle.options
+            insert_fn = self._bulk_insert_for(session)
+            if insert_fn is None:
+                stored = self._upsert_batch_rowwise(session, bundles)
+            else:
+                try:
+                    with session.begin_nested():
+                        stored = self._upsert_batch_bulk(
+                            session, insert_fn, bundles
+                        )
+                except DBAPIError as exc:
+                    if not is_missing_conflict_target(exc):
+                        raise
+                    logger.warning(
+                        "ON CONFLICT 대상 유니크 인덱스가 없어 단건 업서트로 전환합니다: %s",
+                        exc.orig,
                     )
-                stored += 1
+                    HousePlatformRepository._bulk_upsert_supported = False
+                    stored = self._upsert_batch_rowwise(session, bundles)
             session.commit()
             return stored
         except Exception:
@@ -262,6 +275,252 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
             else:
                 session.close()
 
+    def _bulk_insert_for(self, session: Session) -> Callable | None:
+        """ON CONFLICT 를 쓸 수 있는 방언이면 insert 생성자를 반환한다."""
+        if not HousePlatformRepository._bulk_upsert_supported:
+            return None
+        return bulk_insert_for(session)
+
+    def _upsert_batch_rowwise(
+        self, session: Session, bundles: Sequence[HousePlatformUpsertBundle]
+    ) -> int:
+        """번들마다 조회 후 갱신/삽입한다. (ON CONFLICT 미지원 환경용)"""
+        stored = 0
+        for bundle in bundles:
+            payload = self._to_house_platform_payload(bundle.house_platform)
+            rgst_no = payload.get("rgst_no")
+            if not rgst_no:
+                continue
+            existing = (
+                session.query(HousePlatformORM)
+                .filter(HousePlatformORM.rgst_no == rgst_no)
+                .one_or_none()
+            )
+            if existing:
+                self._apply_house_platform_updates(existing, payload)
+                house_platform_id = existing.house_platform_id
+            else:
+                payload = self._drop_none(payload)
+                payload.pop("house_platform_id", None)
+                if payload.get("is_banned") is None:
+                    payload["is_banned"] = False
+                obj = HousePlatformORM(**payload)
+                session.add(obj)
+                session.flush()
+                house_platform_id = obj.house_platform_id
+
+            if bundle.management:
+                self._upsert_management(
+                    session, house_platform_id, bundle.management
+                )
+            if bundle.options is not None:
+                self._upsert_options(
+                    session, house_platform_id, bundle.options
+                )
+            stored += 1
+        return stored
+
+    def _upsert_batch_bulk(
+        self,
+        session: Session,
+        insert_fn: Callable,
+        bundles: Sequence[HousePlatformUpsertBundle],
+    ) -> int:
+        """
+        청크 단위 INSERT ... ON CONFLICT 로 업서트한다.
+        - 같은 rgst_no 가 한 청크에 여러 번 오면 등장 순서대로 나눠 실행한다.
+        - 값이 바뀌지 않은 행은 갱신하지 않는다. (updated_at 유지, 불필요한 행 버전 방지)
+        """
+        entries = []
+        for bundle in bundles:
+            payload = self._to_house_platform_payload(bundle.house_platform)
+            if payload.get("rgst_no"):
+                entries.append((payload, bundle))
+
+        for start in range(0, len(entries), UPSERT_CHUNK_SIZE):
+            chunk = entries[start : start + UPSERT_CHUNK_SIZE]
+            for round_entries in _split_duplicate_rgst_nos(chunk):
+                ids = self._bulk_upsert_house_platforms(
+                    session, insert_fn, [payload for payload, _ in round_entries]
+                )
+                managements = []
+                options = []
+                for payload, bundle in round_entries:
+                    house_platform_id = ids[str(payload["rgst_no"])]
+                    if bundle.management:
+                        managements.append((house_platform_id, bundle.management))
+                    if bundle.options is not None:
+                        options.append((house_platform_id, bundle.options))
+                self._bulk_upsert_managements(session, insert_fn, managements)
+                self._bulk_upsert_options(session, insert_fn, options)
+        return len(entries)
+
+    def _bulk_upsert_house_platforms(
+        self, session: Session, insert_fn: Callable, payloads: List[dict]
+    ) -> dict[str, int]:
+        """house_platform 을 rgst_no 기준으로 업서트하고 rgst_no -> PK 를 반환한다."""
+        table = HousePlatformORM.__table__
+        columns = [
+            column.name
+            for column in table.columns
+            if column.name != "house_platform_id"
+        ]
+        ids: dict[str, int] = {}
+        # 갱신 시 domain_id 가 비어 있으면 기존 값을 유지해야 하므로 문장을 나눈다.
+        for keep_domain, group in _partition(
+            payloads, lambda payload: payload.get("domain_id") is None
+        ):
+            rows = [
+                self._house_platform_insert_row(payload, columns)
+                for payload in group
+            ]
+            stmt = insert_fn(table).values(rows)
+            excluded = stmt.excluded
+            updates = {}
+            changed = []
+            for name in columns:
+                if name in _HOUSE_PLATFORM_FROZEN or name == "rgst_no":
+                    continue
+                if keep_domain and name == "domain_id":
+                    continue
+                if name == "updated_at":
+                    updates[name] = excluded[name]
+                    continue
+                value = func.coalesce(excluded[name], table.c[name])
+                updates[name] = value
+                changed.append(table.c[name].is_distinct_from(value))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.rgst_no],
+                set_=updates,
+                where=or_(*changed),
+            ).returning(table.c.house_platform_id, table.c.rgst_no)
+            for house_platform_id, rgst_no in session.execute(stmt):
+                ids[str(rgst_no)] = house_platform_id
+
+        # 변경이 없어 갱신을 건너뛴 행은 RETURNING 에 나오지 않는다.
+        missing = [
+            str(payload["rgst_no"])
+            for payload in payloads
+            if str(payload["rgst_no"]) not in ids
+        ]
+        if missing:
+            rows = session.execute(
+                table.select()
+                .with_only_columns(table.c.house_platform_id, table.c.rgst_no)
+                .where(table.c.rgst_no.in_(missing))
+            )
+            for house_platform_id, rgst_no in rows:
+                ids[str(rgst_no)] = house_platform_id
+        return ids
+
+    @staticmethod
+    def _house_platform_insert_row(payload: dict, columns: List[str]) -> dict:
+        """
+        다중 VALUES 용 행을 만든다.
+        - 단건 삽입의 _drop_none 과 같도록 빈 값은 서버 기본값, 나머지는 NULL 로 채운다.
+        """
+        row = {}
+        for name in columns:
+            value = payload.get(name)
+            if value is not None:
+                row[name] = value
+            elif name in {"created_at", "updated_at"}:
+                row[name] = func.current_timestamp()
+            elif name == "is_banned":
+                row[name] = False
+            elif name == "domain_id":
+                row[name] = 1
+            else:
+                row[name] = null()
+        return row
+
+    def _bulk_upsert_managements(
+        self,
+        session: Session,
+        insert_fn: Callable,
+        items: List[tuple[int, HousePlatformManagementUpsertModel]],
+    ) -> None:
+        """관리비 정보를 house_platform_id 기준으로 한 번에 업서트한다."""
+        if not items:
+            return
+        table = HousePlatformManagementORM.__table__
+        columns = [
+            column.name
+            for column in table.columns
+            if column.name != "house_platform_management_id"
+        ]
+        rows = []
+        for house_platform_id, model in items:
+            payload = asdict(model)
+            payload["house_platform_id"] = house_platform_id
+            row = {}
+            for name in columns:
+                value = payload.get(name)
+                if value is not None:
+                    row[name] = value
+                elif name in {"created_at", "updated_at"}:
+                    row[name] = func.current_timestamp()
+                else:
+                    row[name] = null()
+            rows.append(row)
+
+        stmt = insert_fn(table).values(rows)
+        excluded = stmt.excluded
+        updates = {"updated_at": excluded.updated_at}
+        changed = []
+        for name in ("management_included", "management_excluded"):
+            value = func.coalesce(excluded[name], table.c[name])
+            updates[name] = value
+            changed.append(table.c[name].is_distinct_from(value))
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.house_platform_id],
+                set_=updates,
+                where=or_(*changed),
+            )
+        )
+
+    @staticmethod
+    def _bulk_upsert_options(
+        session: Session,
+        insert_fn: Callable,
+        items: List[tuple[int, HousePlatformOptionUpsertModel]],
+    ) -> None:
+        """옵션/주변 정보를 house_platform_id 기준으로 한 번에 업서트한다."""
+        rows = []
+        for house_platform_id, options in items:
+            payload = _option_payload(options)
+            if payload is None:
+                continue
+            rows.append(
+                {
+                    "house_platform_id": house_platform_id,
+                    **{
+                        key: value if value is not None else null()
+                        for key, value in payload.items()
+                    },
+                }
+            )
+        if not rows:
+            return
+
+        table = HousePlatformOptionORM.__table__
+        stmt = insert_fn(table).values(rows)
+        excluded = stmt.excluded
+        updates = {}
+        changed = []
+        for name in _OPTION_FIELDS:
+            value = func.coalesce(excluded[name], table.c[name])
+            updates[name] = value
+            changed.append(table.c[name].is_distinct_from(value))
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.house_platform_id],
+                set_=updates,
+                where=or_(*changed),
+            )
+        )
+
     def soft_delete_by_id(self, house_platform_id: int) -> DeleteHousePlatformResult:
         """is_banned 플래그를 True로 설정한다."""
         session, generator = open_session(self._session_factory)
@@ -302,7 +561,7 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
     def fetch_monitor_targets(
         self, updated_before, limit: int | None = None
     ) -> Sequence[HousePlatformMonitorTarget]:
-        """updated_at 기준 모니터링 대상 목록을 조회한다."""
+        """updated_at 기준 모니터링 대상 목록을 저장된 스냅샷 ID와 함께 조회한다."""
         session, generator = open_session(self._session_factory)
         try:
             query = (
@@ -312,6 +571,7 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
                     HousePlatformORM.rgst_no,
                     HousePlatformORM.updated_at,
                     HousePlatformORM.is_banned,
+                    HousePlatformORM.snapshot_id,
                 )
                 .filter(
                     or_(
@@ -332,6 +592,7 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
                     rgst_no=row[2],
                     updated_at=row[3],
                     is_banned=row[4],
+                    snapshot_id=row[5],
                 )
                 for row in rows
             ]
@@ -380,6 +641,54 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
             else:
                 session.close()
 
+    def fetch_bundles_by_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, HousePlatformUpsertBundle]:
+        """여러 매물의 번들을 테이블별 IN 쿼리 1회씩으로 조회한다."""
+        ids = list(dict.fromkeys(house_platform_ids))
+        if not ids:
+            return {}
+        session, generator = open_session(self._session_factory)
+        try:
+            houses = (
+                session.query(HousePlatformORM)
+                .filter(HousePlatformORM.house_platform_id.in_(ids))
+                .all()
+            )
+            if not houses:
+                return {}
+            found_ids = [house.house_platform_id for house in houses]
+            managements = {
+                row.house_platform_id: row
+                for row in session.query(HousePlatformManagementORM)
+                .filter(HousePlatformManagementORM.house_platform_id.in_(found_ids))
+                .all()
+            }
+            options = {
+                row.house_platform_id: row
+                for row in session.query(HousePlatformOptionORM)
+                .filter(HousePlatformOptionORM.house_platform_id.in_(found_ids))
+                .all()
+            }
+            bundles: Dict[int, HousePlatformUpsertBundle] = {}
+            for house in houses:
+                house_platform_id = house.house_platform_id
+                management = managements.get(house_platform_id)
+                option = options.get(house_platform_id)
+                bundles[house_platform_id] = HousePlatformUpsertBundle(
+                    house_platform=self._to_house_platform_model(house),
+                    management=self._to_management_model(management)
+                    if management
+                    else None,
+                    options=self._to_options_model(option) if option else None,
+                )
+            return bundles
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
     def fetch_location_by_id(
         self, house_platform_id: int
     ) -> HousePlatformLocation | None:
@@ -395,19 +704,37 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
             )
             if not row:
                 return None
-            lat_lng = row[1] or {}
-            lat = lat_lng.get("lat")
-            lng = lat_lng.get("lng")
-            try:
-                if lat is None or lng is None:
-                    return None
-                return HousePlatformLocation(
-                    house_platform_id=int(row[0]),
-                    lat=float(lat),
-                    lng=float(lng),
+            return _to_location(row[0], row[1])
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+    def fetch_locations(
+        self, house_platform_ids: Sequence[int]
+    ) -> List[HousePlatformLocation]:
+        """매물 경위도 정보를 한 번의 쿼리로 조회한다."""
+        if not house_platform_ids:
+            return []
+        session, generator = open_session(self._session_factory)
+        try:
+            rows = (
+                session.query(
+                    HousePlatformORM.house_platform_id, HousePlatformORM.lat_lng
                 )
-            except (TypeError, ValueError):
-                return None
+                .filter(
+                    HousePlatformORM.house_platform_id.in_(list(house_platform_ids)),
+                    HousePlatformORM.lat_lng.isnot(None),
+                )
+                .all()
+            )
+            locations = []
+            for house_platform_id, lat_lng in rows:
+                location = _to_location(house_platform_id, lat_lng)
+                if location:
+                    locations.append(location)
+            return locations
         finally:
             if generator:
                 generator.close()
@@ -543,29 +870,10 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
         options: HousePlatformOptionUpsertModel,
     ) -> None:
         """옵션/주변 정보를 한 행으로 업서트한다."""
-        has_payload = any(
-            value is not None
-            for value in (
-                options.built_in,
-                options.near_univ,
-                options.near_transport,
-                options.near_mart,
-                options.nearby_pois,
-            )
-        )
-        if not has_payload:
+        payload = _option_payload(options)
+        if payload is None:
             return
 
-        payload = {
-            "built_in": json.dumps(options.built_in, ensure_ascii=False)
-            if options.built_in is not None
-            else None,
-            "near_univ": options.near_univ,
-            "near_transport": options.near_transport,
-            "near_mart": options.near_mart,
-            "nearby_pois": options.nearby_pois,
-        }
-
         existing = (
             session.query(HousePlatformOptionORM)
             .filter(HousePlatformOptionORM.house_platform_id == house_platform_id)
@@ -585,6 +893,68 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
             )
 
 
+def _option_payload(options: HousePlatformOptionUpsertModel) -> dict | None:
+    """옵션 DTO 를 저장용 dict 로 바꾼다. 모든 값이 비어 있으면 None."""
+    has_payload = any(
+        getattr(options, field) is not None for field in _OPTION_FIELDS
+    )
+    if not has_payload:
+        return None
+    return {
+        "built_in": json.dumps(options.built_in, ensure_ascii=False)
+        if options.built_in is not None
+        else None,
+        "near_univ": options.near_univ,
+        "near_transport": options.near_transport,
+        "near_mart": options.near_mart,
+        "nearby_pois": options.nearby_pois,
+    }
+
+
+def _split_duplicate_rgst_nos(entries: list) -> list[list]:
+    """
+    같은 rgst_no 가 두 번 이상 나오면 여러 라운드로 나눈다.
+    (한 ON CONFLICT 문장은 같은 행을 두 번 갱신할 수 없다)
+    """
+    rounds: list[list] = []
+    seen: list[set] = []
+    for entry in entries:
+        rgst_no = str(entry[0]["rgst_no"])
+        for index, keys in enumerate(seen):
+            if rgst_no not in keys:
+                keys.add(rgst_no)
+                rounds[index].append(entry)
+                break
+        else:
+            seen.append({rgst_no})
+            rounds.append([entry])
+    return rounds
+
+
+def _partition(items: list, key) -> list[tuple[bool, list]]:
+    groups: dict[bool, list] = {}
+    for item in items:
+        groups.setdefault(bool(key(item)), []).append(item)
+    return list(groups.items())
+
+
+def _to_location(house_platform_id, lat_lng) -> HousePlatformLocation | None:
+    """lat_lng JSON 을 위치 DTO 로 바꾼다. 값이 없거나 숫자가 아니면 None."""
+    lat_lng = lat_lng or {}
+    lat = lat_lng.get("lat")
+    lng = lat_lng.get("lng")
+    try:
+        if lat is None or lng is None:
+            return None
+        return HousePlatformLocation(
+            house_platform_id=int(house_platform_id),
+            lat=float(lat),
+            lng=float(lng),
+        )
+    except (TypeError, ValueError):
+        return None
+
+
 def _parse_json_list(value: str | None) -> list[str] | None:
     if not value:
         return None
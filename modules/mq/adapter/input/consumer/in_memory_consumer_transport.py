@@ -0,0 +1,106 @@
+import itertools
+import threading
+from collections import defaultdict, deque
+
+from modules.mq.application.port.consumer_transport_port import (
+    ConsumerChannelPort,
+    ConsumerTransportPort,
+    MessageCallback,
+)
+
+
+class InMemoryBroker:
+    """
+    프로세스 내부 큐 브로커 (테스트/로컬 실행용)
+    - prefetch / ack / 채널 종료 시 미확인 메시지 재적재를 흉내낸다.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._queues: dict[str, deque] = defaultdict(deque)
+        self._unacked: dict[int, tuple[str, bytes]] = {}
+        self._tags = itertools.count(1)
+        self.acked: dict[str, list[bytes]] = defaultdict(list)
+
+    def publish(self, queue: str, body: bytes) -> None:
+        with self._condition:
+            self._queues[queue].append(body)
+            self._condition.notify_all()
+
+    def pending_count(self, queue: str) -> int:
+        with self._condition:
+            return len(self._queues[queue])
+
+    def unacked_count(self) -> int:
+        with self._condition:
+            return len(self._unacked)
+
+    def wait_until_drained(self, queue: str, timeout: float | None = None) -> bool:
+        """큐가 비고 미확인 메시지가 없을 때까지 기다린다."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queues[queue] and not self._unacked,
+                timeout=timeout,
+            )
+
+
+class InMemoryConsumerChannel(ConsumerChannelPort):
+    def __init__(self, broker: InMemoryBroker, prefetch_count: int):
+        self._broker = broker
+        self._prefetch_count = max(1, prefetch_count)
+        self._in_flight: set[int] = set()
+        self._stopped = False
+
+    def start_consuming(self, queue: str, on_message: MessageCallback) -> None:
+        condition = self._broker._condition
+        while True:
+            with condition:
+                condition.wait_for(
+                    lambda: self._stopped
+                    or (
+                        self._broker._queues[queue]
+                        and len(self._in_flight) < self._prefetch_count
+                    )
+                )
+                if self._stopped:
+                    return
+                body = self._broker._queues[queue].popleft()
+                tag = next(self._broker._tags)
+                self._broker._unacked[tag] = (queue, body)
+                self._in_flight.add(tag)
+            on_message(tag, body)
+
+    def ack(self, delivery_tag: int) -> None:
+        condition = self._broker._condition
+        with condition:
+            queue, body = self._broker._unacked.pop(delivery_tag)
+            self._in_flight.discard(delivery_tag)
+            self._broker.acked[queue].append(body)
+            condition.notify_all()
+
+    def stop_consuming(self) -> None:
+        with self._broker._condition:
+            self._stopped = True
+            self._broker._condition.notify_all()
+
+    def close(self) -> None:
+        condition = self._broker._condition
+        with condition:
+            self._stopped = True
+            # ack 되지 않은 메시지는 브로커처럼 큐 앞쪽으로 되돌린다.
+            for tag in sorted(self._in_flight, reverse=True):
+                queue, body = self._broker._unacked.pop(tag)
+                self._broker._queues[queue].appendleft(body)
+            self._in_flight.clear()
+            condition.notify_all()
+
+
+class InMemoryConsumerTransport(ConsumerTransportPort):
+    def __init__(self, broker: InMemoryBroker):
+        self.broker = broker
+        self.opened_channels: list[InMemoryConsumerChannel] = []
+
+    def open_channel(self, prefetch_count: int) -> InMemoryConsumerChannel:
+        channel = InMemoryConsumerChannel(self.broker, prefetch_count)
+        self.opened_channels.append(channel)
+        return channel
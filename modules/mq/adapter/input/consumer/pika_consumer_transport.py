@@ -0,0 +1,106 @@
+import logging
+import time
+
+import pika
+
+from modules.mq.application.port.consumer_transport_port import (
+    ConsumerChannelPort,
+    ConsumerTransportPort,
+    MessageCallback,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PikaConsumerChannel(ConsumerChannelPort):
+    """
+    BlockingConnection 하나를 워커 하나가 독점하는 소비 채널.
+    - pika 연결은 스레드 안전하지 않으므로 ack/stop 은
+      add_callback_threadsafe 로 연결 스레드에 넘긴다.
+    """
+
+    def __init__(self, connection, channel):
+        self._connection = connection
+        self._channel = channel
+
+    def start_consuming(self, queue: str, on_message: MessageCallback) -> None:
+        def callback(ch, method, properties, body):
+            on_message(method.delivery_tag, body)
+
+        self._channel.basic_consume(
+            queue=queue,
+            on_message_callback=callback,
+            auto_ack=False,
+        )
+        self._channel.start_consuming()
+
+    def ack(self, delivery_tag: int) -> None:
+        self._connection.add_callback_threadsafe(
+            lambda: self._channel.basic_ack(delivery_tag=delivery_tag)
+        )
+
+    def stop_consuming(self) -> None:
+        try:
+            self._connection.add_callback_threadsafe(self._channel.stop_consuming)
+        except Exception as e:
+            # 이미 닫힌 연결이면 멈출 소비 루프도 없다.
+            logger.warning("[consumer] stop_consuming skipped: %s", e)
+
+    def close(self) -> None:
+        try:
+            if self._connection.is_open:
+                # 처리 스레드가 넘긴 ack 콜백을 닫기 전에 반영한다.
+                self._connection.process_data_events(time_limit=0)
+                self._connection.close()
+        except Exception as e:
+            logger.warning("[consumer] channel close failed: %s", e)
+
+
+class PikaConsumerTransport(ConsumerTransportPort):
+    """
+    워커마다 새 연결/채널을 열고 exchange/queue 토폴로지를 선언한다.
+    """
+
+    def __init__(
+        self,
+        params: pika.ConnectionParameters,
+        queue: str,
+        exchange: str,
+        routing_key: str,
+        retry: int = 60,
+        delay: float = 2,
+    ):
+        self.params = params
+        self.queue = queue
+        self.exchange = exchange
+        self.routing_key = routing_key
+        self.retry = retry
+        self.delay = delay
+
+    def open_channel(self, prefetch_count: int) -> PikaConsumerChannel:
+        connection = self._connect()
+        channel = connection.channel()
+        channel.exchange_declare(
+            exchange=self.exchange,
+            exchange_type="direct",
+            durable=True,
+        )
+        channel.queue_declare(queue=self.queue, durable=True)
+        channel.queue_bind(
+            exchange=self.exchange,
+            queue=self.queue,
+            routing_key=self.routing_key,
+        )
+        channel.basic_qos(prefetch_count=prefetch_count)
+        return PikaConsumerChannel(connection, channel)
+
+    def _connect(self):
+        for i in range(self.retry):
+            try:
+                return pika.BlockingConnection(self.params)
+            except Exception as e:
+                logger.info(
+                    "[consumer] waiting MQ... %s/%s %s", i + 1, self.retry, e
+                )
+                time.sleep(self.delay)
+        raise Exception("RabbitMQ not reachable after retries")
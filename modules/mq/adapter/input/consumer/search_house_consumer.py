@@ -8,7 +8,10 @@ from modules.mq.application.usecase.process_search_house_usecase import ProcessS
 
 print("[consumer] file loaded")
 
-from infrastructure.db.postgres import get_db_session
+from infrastructure.db.postgres import get_db_session, unit_of_work
+from modules.mq.adapter.output.event.search_house_event_factory import (
+    get_search_house_event_publisher,
+)
 from modules.recommendations.application.usecase.recommend_student_house import RecommendStudentHouseUseCase
 
 
@@ -45,6 +48,36 @@ def connect_with_retry(host, user, password, retry=20, delay=2):
     raise Exception("RabbitMQ not reachable after retries")
 
 
+def handle_search_house_message(body: bytes) -> None:
+    """
+    search_house 메시지 하나를 처리한다.
+    - 단일 소비자 / 워커 풀이 같은 처리 로직을 공유한다.
+    - 메시지마다 작업 단위를 열어, 상태 갱신과 추천 계산의 저장소 호출이
+      세션(연결) 하나를 공유한다. 스레드 간에는 세션을 공유하지 않는다.
+    """
+    payload = json.loads(body)
+    search_house_id = payload["search_house_id"]
+    print(f"[consumer][search_house] Received search_house_id={search_house_id}")
+
+    try:
+        with unit_of_work(get_db_session) as uow:
+            ai_agent = RecommendStudentHouseUseCase()
+
+            # Process UseCase에 주입
+            process_usecase = ProcessSearchHouseUseCase(
+                uow.session, ai_agent, event_publisher=get_search_house_event_publisher()
+            )
+
+            print("[consumer][callback] running process_usecase...")
+            process_usecase.execute(search_house_id)
+    except Exception as e:
+        print(f"[ERROR][consumer][callback] search_house_id={search_house_id}, error={e}")
+        traceback.print_exc()
+        raise
+    finally:
+        print("[consumer][callback] closing DB session")
+
+
 def start_search_house_consumer():
     connection = connect_with_retry(
         AMQP_HOST,
@@ -84,29 +117,12 @@ def start_search_house_consumer():
 
     def callback(ch, method, properties, body):
         print(f"[consumer][callback] raw_body={body}")
-        payload = json.loads(body)
-        search_house_id = payload["search_house_id"]
-        print(f"[consumer][search_house] Received search_house_id={search_house_id}")
-
-        db = next(get_db_session())
-
         try:
-            ai_agent = RecommendStudentHouseUseCase()
-
-            # Process UseCase에 주입
-            process_usecase = ProcessSearchHouseUseCase(db, ai_agent)
-
-            print("[consumer][callback] running process_usecase...")
-            process_usecase.execute(search_house_id)
-
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-        except Exception as e:
-            print(f"[ERROR][consumer][callback] search_house_id={search_house_id}, error={e}")
-            traceback.print_exc()
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-        finally:
-            print("[consumer][callback] closing DB session")
-            db.close()
+            handle_search_house_message(body)
+        except Exception:
+            # 처리 실패 메시지도 ack 한다. (상태는 FAILED 로 기록됨)
+            pass
+        ch.basic_ack(delivery_tag=method.delivery_tag)
 
     channel.basic_consume(
         queue=QUEUE_NAME,
@@ -0,0 +1,234 @@
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import pika
+
+from modules.mq.adapter.input.consumer.pika_consumer_transport import (
+    PikaConsumerTransport,
+)
+from modules.mq.application.port.consumer_transport_port import (
+    ConsumerChannelPort,
+    ConsumerTransportPort,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFETCH_COUNT = 1
+
+
+class SearchHouseWorkerPool:
+    """
+    search_house 큐 워커 풀
+    - 워커마다 독립 채널(연결)과 prefetch 를 가진다.
+    - 메시지 처리는 워커별 처리 스레드에서 수행하고,
+      ack 는 채널에 넘겨 연결 스레드에서 반영한다.
+      (처리가 길어져도 연결 스레드가 heartbeat 를 계속 보낸다)
+    - stop() 은 신규 수신을 멈추고 처리 중/수신된 메시지를 끝낸 뒤 채널을 닫는다.
+    """
+
+    def __init__(
+        self,
+        transport: ConsumerTransportPort,
+        handler: Callable[[bytes], None],
+        queue: str,
+        worker_count: int = 1,
+        prefetch_count: int = DEFAULT_PREFETCH_COUNT,
+    ):
+        if worker_count < 1:
+            raise ValueError("worker_count must be >= 1")
+        if prefetch_count < 1:
+            raise ValueError("prefetch_count must be >= 1")
+        self.transport = transport
+        self.handler = handler
+        self.queue = queue
+        self.worker_count = worker_count
+        self.prefetch_count = prefetch_count
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._channels: list[ConsumerChannelPort] = []
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        """워커 스레드를 띄운다."""
+        with self._lock:
+            if self._threads:
+                raise RuntimeError("worker pool already started")
+            for index in range(self.worker_count):
+                thread = threading.Thread(
+                    target=self._run_worker,
+                    args=(index,),
+                    name=f"search-house-worker-{index}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+        for thread in self._threads:
+            thread.start()
+        logger.info(
+            "[consumer] worker pool started workers=%s prefetch=%s queue=%s",
+            self.worker_count,
+            self.prefetch_count,
+            self.queue,
+        )
+
+    def stop(self, timeout: float | None = None) -> None:
+        """신규 수신을 멈추고 처리 중인 메시지가 끝날 때까지 기다린다."""
+        with self._lock:
+            self._stopping.set()
+            channels = list(self._channels)
+        for channel in channels:
+            channel.stop_consuming()
+        for thread in self._threads:
+            thread.join(timeout)
+        logger.info("[consumer] worker pool stopped")
+
+    def wait(self) -> None:
+        """모든 워커가 종료될 때까지 블로킹한다."""
+        for thread in self._threads:
+            thread.join()
+
+    def _run_worker(self, index: int) -> None:
+        try:
+            channel = self.transport.open_channel(self.prefetch_count)
+        except Exception:
+            logger.exception("[consumer] worker-%s failed to open channel", index)
+            return
+
+        with self._lock:
+            if self._stopping.is_set():
+                channel.close()
+                return
+            self._channels.append(channel)
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.prefetch_count,
+            thread_name_prefix=f"search-house-worker-{index}-job",
+        )
+
+        def on_message(delivery_tag: int, body: bytes) -> None:
+            executor.submit(self._handle, channel, delivery_tag, body)
+
+        try:
+            channel.start_consuming(self.queue, on_message)
+        except Exception:
+            logger.exception("[consumer] worker-%s consuming stopped", index)
+        finally:
+            # 이미 받은 메시지는 처리/ack 후 닫는다.
+            executor.shutdown(wait=True)
+            channel.close()
+
+    def _handle(
+        self, channel: ConsumerChannelPort, delivery_tag: int, body: bytes
+    ) -> None:
+        try:
+            self.handler(body)
+        except Exception:
+            logger.exception("[consumer] message handling failed body=%s", body)
+        finally:
+            # 단일 소비자와 동일하게 실패 메시지도 ack 한다. (상태는 FAILED 로 기록됨)
+            channel.ack(delivery_tag)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def build_search_house_transport() -> PikaConsumerTransport:
+    from modules.mq.adapter.input.consumer import search_house_consumer as consumer
+
+    params = pika.ConnectionParameters(
+        host=consumer.AMQP_HOST,
+        port=consumer.AMQP_PORT,
+        credentials=pika.PlainCredentials(
+            consumer.AMQP_USER, consumer.AMQP_PASSWORD
+        ),
+        heartbeat=30,
+        blocked_connection_timeout=60,
+    )
+    return PikaConsumerTransport(
+        params,
+        queue=consumer.QUEUE_NAME,
+        exchange=consumer.EXCHANGE_NAME,
+        routing_key=consumer.ROUTING_KEY,
+    )
+
+
+def start_search_house_worker_pool(
+    worker_count: int | None = None,
+    prefetch_count: int | None = None,
+    transport: ConsumerTransportPort | None = None,
+) -> None:
+    """
+    워커 풀 모드로 search_house 큐를 소비한다.
+    - SIGTERM/SIGINT 수신 시 graceful shutdown 한다.
+    """
+    from modules.mq.adapter.input.consumer import search_house_consumer as consumer
+
+    pool = SearchHouseWorkerPool(
+        transport=transport or build_search_house_transport(),
+        handler=consumer.handle_search_house_message,
+        queue=consumer.QUEUE_NAME,
+        worker_count=worker_count
+        or _env_int("SEARCH_HOUSE_CONSUMER_WORKERS", os.cpu_count() or 1),
+        prefetch_count=prefetch_count
+        or _env_int("SEARCH_HOUSE_CONSUMER_PREFETCH", DEFAULT_PREFETCH_COUNT),
+    )
+
+    if threading.current_thread() is threading.main_thread():
+        def shutdown(signum, frame):
+            logger.info("[consumer] signal=%s received, shutting down", signum)
+            threading.Thread(target=pool.stop, daemon=True).start()
+
+        signal.signal(signal.SIGTERM, shutdown)
+        signal.signal(signal.SIGINT, shutdown)
+
+    pool.start()
+    pool.wait()
+
+
+def run_search_house_consumer_processes(
+    process_count: int,
+    worker_count: int | None = None,
+    prefetch_count: int | None = None,
+) -> None:
+    """
+    프로세스 N개에 워커 풀을 띄운다. (추천 계산이 CPU 바운드일 때 코어 수만큼 확장)
+    - 부모가 받은 종료 신호는 자식에게 SIGTERM 으로 전달한다.
+    """
+    worker_count = worker_count or _env_int("SEARCH_HOUSE_CONSUMER_WORKERS", 1)
+    processes = [
+        multiprocessing.Process(
+            target=start_search_house_worker_pool,
+            args=(worker_count, prefetch_count),
+            name=f"search-house-consumer-{index}",
+        )
+        for index in range(process_count)
+    ]
+    for process in processes:
+        process.start()
+
+    def forward(signum, frame):
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    # DB 엔진은 consumer 모듈 import 시점에 만들어지므로 그 전에 프로필을 정한다.
+    os.environ.setdefault("DB_ENGINE_PROFILE", "worker")
+    processes = _env_int("SEARCH_HOUSE_CONSUMER_PROCESSES", 1)
+    if processes > 1:
+        run_search_house_consumer_processes(processes)
+    else:
+        start_search_house_worker_pool()
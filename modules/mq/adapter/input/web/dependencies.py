@@ -0,0 +1,63 @@
+import os
+import threading
+
+from dotenv import load_dotenv
+from fastapi import Depends
+
+from infrastructure.db.async_postgres import get_async_db_session
+from modules.mq.adapter.output.event.search_house_event_factory import (
+    get_search_house_event_subscriber,
+)
+from modules.mq.adapter.output.repository.async_search_house_repository import (
+    AsyncSearchHouseRepository,
+)
+from modules.mq.adapter.output.repository.rabbitmq_producer import RabbitMQProducer
+from modules.mq.application.port.message_queue_port import MessageQueuePort
+from modules.mq.application.usecase.get_search_house_status_async_usecase import (
+    GetSearchHouseStatusAsyncUseCase,
+)
+from modules.mq.application.usecase.stream_search_house_status_usecase import (
+    StreamSearchHouseStatusUseCase,
+)
+
+load_dotenv()
+
+_producer: RabbitMQProducer | None = None
+_producer_lock = threading.Lock()
+
+
+def get_message_queue() -> MessageQueuePort:
+    """프로세스 단위로 공유하는 RabbitMQ 발행기를 반환한다."""
+    global _producer
+    if _producer is None:
+        with _producer_lock:
+            if _producer is None:
+                _producer = RabbitMQProducer(
+                    host=os.getenv("AMQP_HOST"),
+                    port=int(os.getenv("AMQP_PORT", "5672")),
+                    user=os.getenv("AMQP_USER"),
+                    password=os.getenv("AMQP_PASSWORD"),
+                    pool_size=int(os.getenv("AMQP_PUBLISHER_POOL_SIZE", "4")),
+                )
+    return _producer
+
+
+def close_message_queue() -> None:
+    """앱 종료 시 발행기 연결을 닫는다."""
+    global _producer
+    with _producer_lock:
+        if _producer is not None:
+            _producer.close()
+            _producer = None
+
+
+def get_stream_search_house_status_usecase() -> StreamSearchHouseStatusUseCase:
+    return StreamSearchHouseStatusUseCase(
+        subscriber=get_search_house_event_subscriber()
+    )
+
+
+def get_search_house_status_async_usecase(
+    db_session=Depends(get_async_db_session),
+) -> GetSearchHouseStatusAsyncUseCase:
+    return GetSearchHouseStatusAsyncUseCase(AsyncSearchHouseRepository(db_session))
@@ -14,28 +14,27 @@ Inbound Adapter (Web)
 """
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from infrastructure.db.postgres import get_db_session
 from modules.mq.adapter.output.repository.search_house_repository import SearchHouseRepository
-from modules.mq.adapter.output.repository.rabbitmq_producer import RabbitMQProducer
+from modules.mq.adapter.input.web.dependencies import (
+    get_message_queue,
+    get_search_house_status_async_usecase,
+    get_stream_search_house_status_usecase,
+)
+from modules.mq.application.dto.search_house_event_dto import SearchHouseStatusEvent
+from modules.mq.application.port.message_queue_port import MessageQueuePort
 from modules.mq.application.usecase.enqueue_search_house import EnqueueSearchHouseUseCase
 from modules.mq.adapter.input.web.request.search_house_request import SearchHouseRequest
 from fastapi import HTTPException
-from modules.mq.application.usecase.get_search_house_status_usecase import (
-    GetSearchHouseStatusUseCase,
+from modules.mq.application.usecase.get_search_house_status_async_usecase import (
+    GetSearchHouseStatusAsyncUseCase,
+)
+from modules.mq.application.usecase.stream_search_house_status_usecase import (
+    StreamSearchHouseStatusUseCase,
 )
-
-
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-AMQP_HOST = os.getenv("AMQP_HOST")
-AMQP_PORT = int(os.getenv("AMQP_PORT", "5672"))
-AMQP_USER = os.getenv("AMQP_USER")
-AMQP_PASSWORD = os.getenv("AMQP_PASSWORD")
 
 router = APIRouter()
 
@@ -44,15 +43,10 @@ router = APIRouter()
 def enqueue_search_house(
     req: SearchHouseRequest,
     db: Session = Depends(get_db_session),
+    mq: MessageQueuePort = Depends(get_message_queue),
 ):
-    # Outbound adapters
+    # Outbound adapters (mq 는 프로세스 단위로 재사용)
     repo = SearchHouseRepository(db_session=db)
-    mq = RabbitMQProducer(
-        host=AMQP_HOST,
-        port=AMQP_PORT,
-        user=AMQP_USER,
-        password=AMQP_PASSWORD,
-    )
 
     # Usecase
     usecase = EnqueueSearchHouseUseCase(repo=repo, mq=mq)
@@ -65,19 +59,77 @@ def enqueue_search_house(
     }
 
 @router.get("/search_house/{search_house_id}")
-def get_search_house_status(
+async def get_search_house_status(
     search_house_id: int,
-    db: Session = Depends(get_db_session),
+    usecase: GetSearchHouseStatusAsyncUseCase = Depends(
+        get_search_house_status_async_usecase
+    ),
 ):
     """
     Polling API
     - 화면 로딩바 처리용
     - search_house_id(job_id) 기준 상태/결과 조회
+    - 호출 빈도가 높아 async 세션으로 조회한다. (스레드풀 워커를 점유하지 않음)
     """
-    usecase = GetSearchHouseStatusUseCase(db)
-    result = usecase.execute(search_house_id)
+    # 저장된 결과 JSON 을 파싱하지 않고 응답 본문에 그대로 싣는다.
+    body = await usecase.execute_raw(search_house_id)
+
+    if body is None:
+        raise HTTPException(status_code=404, detail="search_house not found")
 
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/search_house/{search_house_id}/status")
+async def get_search_house_status_only(
+    search_house_id: int,
+    usecase: GetSearchHouseStatusAsyncUseCase = Depends(
+        get_search_house_status_async_usecase
+    ),
+):
+    """
+    상태 전용 Polling API
+    - result_json 을 읽지 않는 가벼운 조회 (로딩바 용)
+    """
+    result = await usecase.execute_status(search_house_id)
     if result is None:
         raise HTTPException(status_code=404, detail="search_house not found")
+    return result
+
+
+@router.get("/search_house/{search_house_id}/events")
+async def stream_search_house_status(
+    search_house_id: int,
+    usecase: StreamSearchHouseStatusUseCase = Depends(
+        get_stream_search_house_status_usecase
+    ),
+):
+    """
+    Server-Sent Events 스트림
+    - 상태 전이(PROCESSING/COMPLETED/FAILED)를 push 하고 결과는 완료 시 한 번만 보낸다.
+    - 없는 search_house 면 빈 스트림 대신 404 를 반환한다.
+    """
+    events = usecase.stream(search_house_id)
+    first = await anext(events, None)
+    if first is None:
+        raise HTTPException(status_code=404, detail="search_house not found")
+
+    async def event_source():
+        try:
+            yield _to_sse(first)
+            async for event in events:
+                yield _to_sse(event)
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
-    return result
\ No newline at end of file
+def _to_sse(event: SearchHouseStatusEvent | None) -> str:
+    if event is None:
+        return ": keepalive\n\n"
+    return f"event: status\ndata: {event.to_json()}\n\n"
@@ -0,0 +1,25 @@
+"""
+Outbound Adapter (Event) - 단일 프로세스/테스트용
+- API 와 consumer 가 같은 프로세스에서 돌 때 Redis 없이 상태를 전달한다.
+"""
+
+from modules.mq.adapter.output.event.local_event_fanout import LocalEventFanout
+from modules.mq.application.dto.search_house_event_dto import SearchHouseStatusEvent
+from modules.mq.application.port.search_house_event_port import (
+    SearchHouseEventPublisherPort,
+    SearchHouseEventSubscriberPort,
+    SearchHouseEventSubscription,
+)
+
+
+class InMemorySearchHouseEventBroker(
+    SearchHouseEventPublisherPort, SearchHouseEventSubscriberPort
+):
+    def __init__(self):
+        self.fanout = LocalEventFanout()
+
+    def publish(self, event: SearchHouseStatusEvent) -> None:
+        self.fanout.dispatch(event)
+
+    async def subscribe(self, search_house_id: int) -> SearchHouseEventSubscription:
+        return self.fanout.register(search_house_id)
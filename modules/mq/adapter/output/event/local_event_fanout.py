@@ -0,0 +1,79 @@
+"""
+프로세스 내부 구독자 분배기
+- search_house_id 별로 asyncio.Queue 를 등록해 두고 이벤트를 나눠준다.
+- 구독자 이벤트 루프에 call_soon_threadsafe 로 넘기므로
+  워커 스레드/리스너 태스크 어디서 dispatch 해도 안전하다.
+"""
+
+import asyncio
+import threading
+from collections import defaultdict
+
+from modules.mq.application.dto.search_house_event_dto import SearchHouseStatusEvent
+from modules.mq.application.port.search_house_event_port import (
+    SearchHouseEventSubscription,
+)
+
+
+class LocalEventFanout:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: dict[int, set["QueueSubscription"]] = defaultdict(set)
+
+    def register(self, search_house_id: int) -> "QueueSubscription":
+        subscription = QueueSubscription(
+            self, search_house_id, asyncio.get_running_loop()
+        )
+        with self._lock:
+            self._subscribers[search_house_id].add(subscription)
+        return subscription
+
+    def unregister(self, subscription: "QueueSubscription") -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.search_house_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.search_house_id]
+
+    def subscriber_count(self, search_house_id: int | None = None) -> int:
+        with self._lock:
+            if search_house_id is None:
+                return sum(len(subs) for subs in self._subscribers.values())
+            return len(self._subscribers.get(search_house_id, ()))
+
+    def dispatch(self, event: SearchHouseStatusEvent) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(event.search_house_id, ()))
+        for subscription in subscribers:
+            subscription.deliver(event)
+
+
+class QueueSubscription(SearchHouseEventSubscription):
+    def __init__(
+        self,
+        fanout: LocalEventFanout,
+        search_house_id: int,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        self._fanout = fanout
+        self.search_house_id = search_house_id
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def deliver(self, event: SearchHouseStatusEvent) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, event)
+        except RuntimeError:
+            # 구독자 루프가 이미 닫힌 경우
+            self._fanout.unregister(self)
+
+    async def get(self, timeout: float) -> SearchHouseStatusEvent | None:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        self._fanout.unregister(self)
@@ -0,0 +1,91 @@
+"""
+Outbound Adapter (Event) - Redis pub/sub
+- consumer(별도 프로세스)는 search_house:{id} 채널로 상태를 발행한다.
+- API 프로세스는 패턴 구독 연결 하나만 유지하고,
+  받은 이벤트를 프로세스 내부 구독자(SSE 연결)에게 분배한다.
+  (SSE 연결마다 Redis 연결을 잡지 않는다)
+"""
+
+import asyncio
+import logging
+
+from redis.exceptions import RedisError
+
+from modules.mq.adapter.output.event.local_event_fanout import LocalEventFanout
+from modules.mq.application.dto.search_house_event_dto import SearchHouseStatusEvent
+from modules.mq.application.port.search_house_event_port import (
+    SearchHouseEventPublisherPort,
+    SearchHouseEventSubscriberPort,
+    SearchHouseEventSubscription,
+)
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "search_house:"
+CHANNEL_PATTERN = f"{CHANNEL_PREFIX}*"
+
+
+def channel_name(search_house_id: int) -> str:
+    return f"{CHANNEL_PREFIX}{search_house_id}"
+
+
+class RedisSearchHouseEventPublisher(SearchHouseEventPublisherPort):
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+    def publish(self, event: SearchHouseStatusEvent) -> None:
+        self.redis.publish(channel_name(event.search_house_id), event.to_json())
+
+
+class RedisSearchHouseEventSubscriber(SearchHouseEventSubscriberPort):
+    def __init__(self, async_redis_client, subscribe_timeout: float = 5.0):
+        self.redis = async_redis_client
+        self.subscribe_timeout = subscribe_timeout
+        self.fanout = LocalEventFanout()
+        self._start_lock: asyncio.Lock | None = None
+        self._listener: asyncio.Task | None = None
+
+    async def subscribe(self, search_house_id: int) -> SearchHouseEventSubscription:
+        # 리스너가 구독을 확인한 뒤 등록하므로 이후 이벤트는 유실되지 않는다.
+        await self._ensure_listening()
+        return self.fanout.register(search_house_id)
+
+    async def _ensure_listening(self) -> None:
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._listener is not None and not self._listener.done():
+                return
+            pubsub = self.redis.pubsub()
+            await pubsub.psubscribe(CHANNEL_PATTERN)
+            await self._wait_subscribed(pubsub)
+            self._listener = asyncio.create_task(self._listen(pubsub))
+
+    async def _wait_subscribed(self, pubsub) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.subscribe_timeout
+        while loop.time() < deadline:
+            message = await pubsub.get_message(timeout=0.5)
+            if message and message["type"] == "psubscribe":
+                return
+        await pubsub.aclose()
+        raise RedisError("search_house event subscription not confirmed")
+
+    async def _listen(self, pubsub) -> None:
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                try:
+                    event = SearchHouseStatusEvent.from_json(message["data"])
+                except (ValueError, KeyError) as e:
+                    logger.warning("[event] invalid search_house event: %s", e)
+                    continue
+                self.fanout.dispatch(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 다음 subscribe 호출에서 리스너를 다시 띄운다.
+            logger.warning("[event] search_house listener stopped: %s", e)
+        finally:
+            await pubsub.aclose()
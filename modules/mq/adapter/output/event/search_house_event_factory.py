@@ -0,0 +1,68 @@
+"""
+search_house 상태 이벤트 브로커 선택
+- SEARCH_HOUSE_EVENT_BROKER=redis (기본): consumer 와 API 가 다른 프로세스
+- SEARCH_HOUSE_EVENT_BROKER=memory: 같은 프로세스에서 실행하는 로컬 개발용
+"""
+
+import os
+import threading
+
+from modules.mq.adapter.output.event.in_memory_search_house_event_broker import (
+    InMemorySearchHouseEventBroker,
+)
+from modules.mq.application.port.search_house_event_port import (
+    SearchHouseEventPublisherPort,
+    SearchHouseEventSubscriberPort,
+)
+
+_lock = threading.Lock()
+_in_memory_broker: InMemorySearchHouseEventBroker | None = None
+_publisher: SearchHouseEventPublisherPort | None = None
+_subscriber: SearchHouseEventSubscriberPort | None = None
+
+
+def _use_redis() -> bool:
+    return os.getenv("SEARCH_HOUSE_EVENT_BROKER", "redis").lower() == "redis"
+
+
+def _get_in_memory_broker() -> InMemorySearchHouseEventBroker:
+    global _in_memory_broker
+    if _in_memory_broker is None:
+        _in_memory_broker = InMemorySearchHouseEventBroker()
+    return _in_memory_broker
+
+
+def get_search_house_event_publisher() -> SearchHouseEventPublisherPort:
+    global _publisher
+    if _publisher is None:
+        with _lock:
+            if _publisher is None:
+                if _use_redis():
+                    from infrastructure.db.redis_client import get_redis_client
+                    from modules.mq.adapter.output.event.redis_search_house_event_broker import (
+                        RedisSearchHouseEventPublisher,
+                    )
+
+                    _publisher = RedisSearchHouseEventPublisher(get_redis_client())
+                else:
+                    _publisher = _get_in_memory_broker()
+    return _publisher
+
+
+def get_search_house_event_subscriber() -> SearchHouseEventSubscriberPort:
+    global _subscriber
+    if _subscriber is None:
+        with _lock:
+            if _subscriber is None:
+                if _use_redis():
+                    from infrastructure.db.redis_client import get_async_redis_client
+                    from modules.mq.adapter.output.event.redis_search_house_event_broker import (
+                        RedisSearchHouseEventSubscriber,
+                    )
+
+                    _subscriber = RedisSearchHouseEventSubscriber(
+                        get_async_redis_client()
+                    )
+                else:
+                    _subscriber = _get_in_memory_broker()
+    return _subscriber
@@ -0,0 +1,51 @@
+"""
+Outbound Adapter (Persistence, async)
+- AsyncSession 을 주입받아 search_house 상태/결과를 읽는다. (쓰기는 동기 저장소 책임)
+- 엔진/세션 생성 금지 (infrastructure/db/async_postgres.py 책임)
+"""
+from sqlalchemy import select
+
+from infrastructure.orm.search_house import SearchHouse
+from modules.mq.application.factory.search_house_result_codec import (
+    stored_result_to_json_bytes,
+)
+from modules.mq.application.port.search_house_status_read_port import (
+    SearchHouseStatusReadPort,
+)
+
+
+class AsyncSearchHouseRepository(SearchHouseStatusReadPort):
+    def __init__(self, db_session):
+        self.db = db_session
+
+    async def get_status(self, search_house_id: int) -> dict | None:
+        result = await self.db.execute(
+            select(
+                SearchHouse.search_house_id,
+                SearchHouse.status,
+                SearchHouse.completed_at,
+            ).where(SearchHouse.search_house_id == search_house_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return {
+            "search_house_id": row.search_house_id,
+            "status": row.status,
+            "completed_at": row.completed_at,
+        }
+
+    async def get_result_json_bytes(self, search_house_id: int) -> bytes | None:
+        result = await self.db.execute(
+            select(
+                SearchHouse.result_blob,
+                SearchHouse.result_encoding,
+                SearchHouse.result_json,
+            ).where(SearchHouse.search_house_id == search_house_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return stored_result_to_json_bytes(
+            row.result_blob, row.result_encoding, row.result_json
+        )
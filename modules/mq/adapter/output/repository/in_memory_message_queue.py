@@ -0,0 +1,33 @@
+"""
+Outbound Adapter (Messaging) - 테스트/로컬 실행용
+- MessageQueuePort 를 프로세스 메모리로 대신한다.
+- broker 를 넘기면 InMemoryBroker 큐에도 같은 메시지를 넣어
+  워커 풀까지 이어서 검증할 수 있다.
+"""
+
+import json
+import threading
+from typing import Sequence
+
+from modules.mq.application.port.message_queue_port import MessageQueuePort
+
+
+class InMemoryMessageQueue(MessageQueuePort):
+    def __init__(self, broker=None, queue: str = "search.house.request"):
+        self.broker = broker
+        self.queue = queue
+        self.published: list[int] = []
+        self._lock = threading.Lock()
+
+    def publish_search_house(self, search_house_id: int) -> None:
+        self.publish_many([search_house_id])
+
+    def publish_many(self, search_house_ids: Sequence[int]) -> None:
+        with self._lock:
+            for search_house_id in search_house_ids:
+                self.published.append(search_house_id)
+                if self.broker is not None:
+                    self.broker.publish(
+                        self.queue,
+                        json.dumps({"search_house_id": search_house_id}).encode(),
+                    )
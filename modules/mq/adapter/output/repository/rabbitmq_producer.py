@@ -2,19 +2,58 @@
 Outbound Adapter (Messaging)
 - MessageQueuePort 구현체
 - RabbitMQ에 {search_house_id} 메시지 발행만 담당
+
+*** 연결 재사용
+- 프로세스에서 하나만 만들어 재사용한다. (요청마다 TCP+AMQP 핸드셰이크를 하지 않음)
+- pika BlockingConnection 은 스레드 안전하지 않으므로
+  (connection, channel) 쌍을 작은 풀에 두고 한 번에 한 스레드만 빌려 쓴다.
+- exchange/queue/binding 선언은 처음 연결할 때 한 번만 한다.
+- 연결이 끊겨 있으면 버리고 새로 연결해 남은 메시지만 재발행한다.
 """
 
 import json
+import queue
+import threading
+from typing import Sequence
+
 import pika
+from pika import exceptions as pika_exceptions
+
 from modules.mq.application.port.message_queue_port import MessageQueuePort
 
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_RETRIES = 2
+
+# 재연결 후 재시도할 오류 (확인 거절/라우팅 실패는 재시도하지 않음)
+_RECONNECT_ERRORS = (
+    pika_exceptions.AMQPConnectionError,
+    pika_exceptions.ChannelClosed,
+    pika_exceptions.ChannelWrongStateError,
+)
+_DELIVERY_ERRORS = (
+    pika_exceptions.UnroutableError,
+    pika_exceptions.NackError,
+)
+
 
 class RabbitMQProducer(MessageQueuePort):
-    def __init__(self, host: str, port: int, user: str, password: str):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        heartbeat: int = 60,
+    ):
         self.host = host
         self.port = port
         self.user = user
         self.password = password
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.heartbeat = heartbeat
 
         # MVP routing
         self.exchange = "recommend.exchange"
@@ -22,6 +61,12 @@ class RabbitMQProducer(MessageQueuePort):
         self.queue = "search.house.request"
         self.routing_key = "recommend.house"
 
+        # 유휴 (connection, channel) 풀 + 동시 사용 가능 슬롯
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._topology_lock = threading.Lock()
+        self._topology_declared = False
+
         print("[producer] AMQP target:", self.host)
 
     def publish_search_house(self, search_house_id: int) -> None:
@@ -30,37 +75,127 @@ class RabbitMQProducer(MessageQueuePort):
         - 단일 메시지 발행
         - 성공하면 return (예외 발생 시 상위에서 처리)
         """
+        print("[producer] publish_search_house called", search_house_id)
+        self.publish_many([search_house_id])
+
+    def publish_many(self, search_house_ids: Sequence[int]) -> None:
+        """
+        풀에서 빌린 confirm 채널 하나로 메시지를 연속 발행한다.
+        - 연결 오류 시 새 연결로 아직 확인되지 않은 메시지부터 재발행한다.
+        """
+        bodies = [
+            json.dumps({"search_house_id": search_house_id})
+            for search_house_id in search_house_ids
+        ]
+        if not bodies:
+            return
+
+        sent = 0
+        for attempt in range(self.max_retries + 1):
+            connection, channel = self._acquire()
+            try:
+                # 유휴 중 밀린 heartbeat 를 처리하고, 끊긴 연결이면 여기서 드러난다.
+                connection.process_data_events(time_limit=0)
+                while sent < len(bodies):
+                    channel.basic_publish(
+                        exchange=self.exchange,
+                        routing_key=self.routing_key,
+                        body=bodies[sent],
+                        properties=pika.BasicProperties(
+                            delivery_mode=2  # persistent message
+                        ),
+                        mandatory=True,
+                    )
+                    sent += 1
+            except _DELIVERY_ERRORS:
+                self._discard(connection)
+                raise
+            except _RECONNECT_ERRORS as e:
+                self._discard(connection)
+                if attempt >= self.max_retries:
+                    raise
+                print(f"[producer] reconnecting... {attempt + 1}/{self.max_retries} {e}")
+            except Exception:
+                self._discard(connection)
+                raise
+            else:
+                self._release(connection, channel)
+                return
+
+    def close(self) -> None:
+        """풀에 있는 연결을 모두 닫는다."""
+        while True:
+            try:
+                connection, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close_quietly(connection)
+
+    def _acquire(self):
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    connection, channel = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._open()
+                if connection.is_open and channel.is_open:
+                    return connection, channel
+                self._close_quietly(connection)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, connection, channel) -> None:
+        self._idle.put((connection, channel))
+        self._slots.release()
+
+    def _discard(self, connection) -> None:
+        self._close_quietly(connection)
+        # 브로커 재시작 등으로 끊긴 경우를 대비해 다음 연결에서 다시 선언한다.
+        self._topology_declared = False
+        self._slots.release()
+
+    def _open(self):
         credentials = pika.PlainCredentials(self.user, self.password)
         params = pika.ConnectionParameters(
             host=self.host,
             port=self.port,
             credentials=credentials,
+            heartbeat=self.heartbeat,
         )
-
         connection = pika.BlockingConnection(params)
-        channel = connection.channel()
+        try:
+            channel = connection.channel()
+            self._declare_topology(channel)
+            channel.confirm_delivery()
+        except Exception:
+            self._close_quietly(connection)
+            raise
+        return connection, channel
 
-        # 선언은 멱등(idempotent)이라 매번 호출해도 안전
-        channel.exchange_declare(
-            exchange=self.exchange,
-            exchange_type=self.exchange_type,
-            durable=True,
-        )
-        channel.queue_declare(queue=self.queue, durable=True)
-        channel.queue_bind(
-            exchange=self.exchange,
-            queue=self.queue,
-            routing_key=self.routing_key,
-        )
+    def _declare_topology(self, channel) -> None:
+        with self._topology_lock:
+            if self._topology_declared:
+                return
+            # 선언은 멱등(idempotent)이지만 연결마다 반복하지 않는다.
+            channel.exchange_declare(
+                exchange=self.exchange,
+                exchange_type=self.exchange_type,
+                durable=True,
+            )
+            channel.queue_declare(queue=self.queue, durable=True)
+            channel.queue_bind(
+                exchange=self.exchange,
+                queue=self.queue,
+                routing_key=self.routing_key,
+            )
+            self._topology_declared = True
 
-        body = json.dumps({"search_house_id": search_house_id})
-        print("[producer] publish_search_house called", search_house_id)
-        channel.confirm_delivery()
-        channel.basic_publish(
-            exchange=self.exchange,
-            routing_key=self.routing_key,
-            body=body,
-            properties=pika.BasicProperties(delivery_mode=2),  # persistent message
-        )
-        print("[producer] after publish, OK")
-        connection.close()
\ No newline at end of file
+    @staticmethod
+    def _close_quietly(connection) -> None:
+        try:
+            if connection.is_open:
+                connection.close()
+        except Exception as e:
+            print(f"[producer] close failed: {e}")
@@ -3,16 +3,25 @@ Outbound Adapter (Persistence)
 - DB Session을 주입받아 search_house 테이블 CRUD 수행
 - 엔진/세션 생성 금지 (infrastructure/db/postgres.py 책임)
 """
+import os
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import func, update
 from infrastructure.orm.search_house import SearchHouse
-import json
+from modules.mq.application.factory.search_house_result_codec import (
+    encode_search_house_result,
+    resolve_encoding,
+    stored_result_to_json_bytes,
+)
 
 
 class SearchHouseRepository:
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, result_encoding: str | None = None):
         self.db = db_session
+        # 결과 저장 형식 (json / gzip / zstd)
+        self.result_encoding = resolve_encoding(
+            result_encoding or os.getenv("SEARCH_HOUSE_RESULT_ENCODING")
+        )
 
     # job 생성
     def create_pending(self, finder_request_id: int) -> int:
@@ -63,30 +72,45 @@ class SearchHouseRepository:
         return updated
 
     # job 산출물 저장
-    def save_result(self, search_house_id: int, result: dict):
-        # dataclass → dict 변환
-        result_dict = result.dict() if hasattr(result, "dict") else result
-
-        # datetime ISO 변환을 위해 ensure_ascii + default=str 사용
-        result_json = json.dumps(result_dict, default=str)
+    def save_result(self, search_house_id: int, result):
+        """
+        결과 DTO(또는 dict)를 compact JSON 으로 직렬화/압축해 result_blob 에 저장한다.
+        - asdict 깊은 복사 / JSON 문자열 이중 인코딩을 하지 않는다.
+        """
+        blob = encode_search_house_result(result, self.result_encoding)
 
         self.db.execute(
             update(SearchHouse)
             .where(SearchHouse.search_house_id == search_house_id)
             .values(
-                result_json=result_json,
+                result_blob=blob,
+                result_encoding=self.result_encoding,
+                result_json=None,
                 completed_at=datetime.utcnow(),
                 updated_at=datetime.utcnow(),
             )
         )
         self.db.commit()
-        # self.db.query(SearchHouse).filter(
-        #     SearchHouse.search_house_id == search_house_id
-        # ).update({
-        #     "result_json": result,
-        #     "completed_at": datetime.utcnow()
-        # })
-        # self.db.commit()
+
+    def get_result_json_bytes(self, search_house_id: int) -> bytes | None:
+        """
+        저장된 결과를 JSON 바이트로 반환한다. (압축만 풀고 파싱하지 않음)
+        - 이전 형식(result_json) row 도 같은 바이트 형태로 맞춘다.
+        """
+        row = (
+            self.db.query(
+                SearchHouse.result_blob,
+                SearchHouse.result_encoding,
+                SearchHouse.result_json,
+            )
+            .filter(SearchHouse.search_house_id == search_house_id)
+            .one_or_none()
+        )
+        if row is None:
+            return None
+        return stored_result_to_json_bytes(
+            row.result_blob, row.result_encoding, row.result_json
+        )
 
     # job 성공 종료, B가 메시지를 받았다는 ACK를 받으면 호출
     def mark_completed(self, search_house_id: int):
@@ -111,6 +135,28 @@ class SearchHouseRepository:
             .one_or_none()
         )
 
+    def get_status(self, search_house_id: int) -> dict | None:
+        """
+        상태 컬럼만 조회한다. (result_json 은 읽지 않음)
+        - 로딩바 polling / 스트림 시작 시점 확인용
+        """
+        row = (
+            self.db.query(
+                SearchHouse.search_house_id,
+                SearchHouse.status,
+                SearchHouse.completed_at,
+            )
+            .filter(SearchHouse.search_house_id == search_house_id)
+            .one_or_none()
+        )
+        if row is None:
+            return None
+        return {
+            "search_house_id": row.search_house_id,
+            "status": row.status,
+            "completed_at": row.completed_at,
+        }
+
     def get_finder_request_id_by_id(self, search_house_id: int) -> int | None:
         row = (
             self.db.query(SearchHouse.finder_request_id)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from modules.mq.application.factory.search_house_result_codec import to_json_bytes
+
+TERMINAL_STATUSES = ("COMPLETED", "FAILED")
+
+
+@dataclass
+class SearchHouseStatusEvent:
+    """search_house 작업 상태 전이 이벤트 (COMPLETED 에만 결과를 싣는다)"""
+
+    search_house_id: int
+    status: str
+    result: Any = None
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def to_json(self) -> str:
+        # 결과 DTO 는 저장 시와 같은 직렬화기로 변환한다.
+        return to_json_bytes(
+            {
+                "search_house_id": self.search_house_id,
+                "status": self.status,
+                "result": self.result,
+            }
+        ).decode("utf-8")
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "SearchHouseStatusEvent":
+        payload = json.loads(data)
+        return cls(
+            search_house_id=int(payload["search_house_id"]),
+            status=payload["status"],
+            result=payload.get("result"),
+        )
@@ -0,0 +1,115 @@
+"""
+search_house 결과 직렬화/압축
+- 추천 결과 DTO 를 asdict 로 깊은 복사하지 않고 바로 compact JSON 바이트로 만든다.
+- 저장 형식은 encoding 값으로 구분한다. (json / gzip / zstd)
+- 조회 시에는 압축만 풀고 JSON 파싱 없이 바이트 그대로 응답에 싣는다.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+try:  # zstd 는 선택 의존성 (없으면 gzip 으로 대체)
+    import zstandard
+except ImportError:  # pragma: no cover - 설치 환경에 따라 다름
+    zstandard = None
+
+ENCODING_JSON = "json"
+ENCODING_GZIP = "gzip"
+ENCODING_ZSTD = "zstd"
+DEFAULT_ENCODING = ENCODING_GZIP
+
+# 결과는 한 번 쓰고 여러 번 읽으므로 압축률보다 속도를 우선한다.
+GZIP_LEVEL = 5
+ZSTD_LEVEL = 3
+
+
+def resolve_encoding(name: str | None) -> str:
+    """설정값을 지원하는 encoding 으로 정규화한다."""
+    value = (name or DEFAULT_ENCODING).strip().lower()
+    if value == ENCODING_ZSTD and zstandard is None:
+        return ENCODING_GZIP
+    if value not in (ENCODING_JSON, ENCODING_GZIP, ENCODING_ZSTD):
+        raise ValueError(f"unsupported search_house result encoding: {name}")
+    return value
+
+
+def json_default(value: Any) -> Any:
+    """표준 json 이 모르는 타입을 변환한다. (dataclass 는 얕게 펼쳐 재귀를 인코더에 맡김)"""
+    if is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+    if hasattr(value, "model_dump"):  # pydantic 모델
+        return value.model_dump()
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, "item"):  # numpy 스칼라
+        return value.item()
+    return str(value)
+
+
+_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    separators=(",", ":"),
+    default=json_default,
+)
+
+
+def to_json_bytes(result: Any) -> bytes:
+    """결과 DTO/dict 를 compact JSON UTF-8 바이트로 만든다."""
+    return _ENCODER.encode(result).encode("utf-8")
+
+
+def encode_search_house_result(result: Any, encoding: str = DEFAULT_ENCODING) -> bytes:
+    raw = to_json_bytes(result)
+    if encoding == ENCODING_GZIP:
+        return gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == ENCODING_ZSTD:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    return raw
+
+
+def decompress_search_house_result(blob: bytes, encoding: str) -> bytes:
+    """압축만 풀어 JSON 바이트를 반환한다. (파싱하지 않음)"""
+    if encoding == ENCODING_GZIP:
+        return gzip.decompress(blob)
+    if encoding == ENCODING_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd results")
+        return zstandard.ZstdDecompressor().decompress(blob)
+    return bytes(blob)
+
+
+def decode_search_house_result(blob: bytes, encoding: str) -> Any:
+    return json.loads(decompress_search_house_result(blob, encoding))
+
+
+def stored_result_to_json_bytes(
+    blob: bytes | None, encoding: str | None, legacy_json: Any = None
+) -> bytes | None:
+    """
+    search_house row 에 저장된 결과를 JSON 바이트로 맞춘다.
+    - result_blob 이 있으면 압축만 풀고, 없으면 이전 형식(result_json)을 쓴다.
+    """
+    if blob is not None:
+        return decompress_search_house_result(blob, encoding)
+    if legacy_json is None:
+        return None
+    # 이전 형식은 JSON 문자열을 JSON 컬럼에 한 번 더 감싸 저장했다.
+    if isinstance(legacy_json, str):
+        return legacy_json.encode("utf-8")
+    return to_json_bytes(legacy_json)
+
+
+def splice_result_json(envelope: dict, result: bytes | None) -> bytes:
+    """envelope JSON 객체 끝에 "result" 필드로 결과 바이트를 파싱 없이 붙인다."""
+    head = to_json_bytes(envelope)
+    return b"".join((head[:-1], b',"result":', result or b"null", b"}"))
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+# (delivery_tag, body) 를 받아 처리하는 메시지 콜백
+MessageCallback = Callable[[int, bytes], None]
+
+
+class ConsumerChannelPort(ABC):
+    """
+    Inbound Transport
+    - 워커 하나가 독점하는 소비 채널 계약
+    - ack / stop_consuming 은 다른 스레드에서 호출해도 안전해야 한다.
+    """
+
+    @abstractmethod
+    def start_consuming(self, queue: str, on_message: MessageCallback) -> None:
+        """stop_consuming 이 호출될 때까지 메시지를 받아 콜백에 넘긴다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def ack(self, delivery_tag: int) -> None:
+        """처리 완료 메시지를 ack 한다. 실제 ack 는 채널 스레드에서 수행한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stop_consuming(self) -> None:
+        """소비 루프를 멈추도록 요청한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> None:
+        """대기 중인 ack 를 반영한 뒤 채널을 닫는다."""
+        raise NotImplementedError
+
+
+class ConsumerTransportPort(ABC):
+    """
+    Inbound Transport
+    - 워커별 소비 채널을 열어주는 브로커 연결 계약
+    """
+
+    @abstractmethod
+    def open_channel(self, prefetch_count: int) -> ConsumerChannelPort:
+        """prefetch 가 설정된 새 소비 채널을 연다."""
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 
 class MessageQueuePort(ABC):
@@ -10,4 +11,12 @@ class MessageQueuePort(ABC):
     @abstractmethod
     def publish_search_house(self, search_house_id: int) -> None:
         """search_house 작업 메시지를 브로커에 발행한다."""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def publish_many(self, search_house_ids: Sequence[int]) -> None:
+        """
+        search_house 작업 메시지를 한 채널에서 연속 발행한다.
+        - 모든 메시지가 브로커에 확인(confirm)되면 return
+        """
+        raise NotImplementedError
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+
+from modules.mq.application.dto.search_house_event_dto import SearchHouseStatusEvent
+
+
+class SearchHouseEventPublisherPort(ABC):
+    """
+    Outbound Port
+    - search_house 상태 전이를 구독자에게 알린다.
+    """
+
+    @abstractmethod
+    def publish(self, event: SearchHouseStatusEvent) -> None:
+        """상태 이벤트를 발행한다. (어느 스레드에서 호출해도 된다)"""
+        raise NotImplementedError
+
+
+class SearchHouseEventSubscription(ABC):
+    """search_house 하나에 대한 구독 핸들"""
+
+    @abstractmethod
+    async def get(self, timeout: float) -> SearchHouseStatusEvent | None:
+        """다음 이벤트를 기다린다. timeout 동안 없으면 None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError
+
+
+class SearchHouseEventSubscriberPort(ABC):
+    """
+    Outbound Port
+    - search_house 상태 이벤트 구독
+    """
+
+    @abstractmethod
+    async def subscribe(self, search_house_id: int) -> SearchHouseEventSubscription:
+        """반환 이후 발행된 이벤트는 빠짐없이 전달된다."""
+        raise NotImplementedError
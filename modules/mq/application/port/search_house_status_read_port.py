@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+
+class SearchHouseStatusReadPort(ABC):
+    """
+    Outbound Port (async)
+    - polling API 가 이벤트 루프를 막지 않고 search_house 상태/결과를 읽는 계약
+    """
+
+    @abstractmethod
+    async def get_status(self, search_house_id: int) -> dict | None:
+        """search_house_id / status / completed_at 만 조회한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_result_json_bytes(self, search_house_id: int) -> bytes | None:
+        """저장된 결과를 파싱하지 않은 JSON 바이트로 반환한다."""
+        raise NotImplementedError
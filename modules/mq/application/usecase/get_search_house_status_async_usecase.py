@@ -0,0 +1,30 @@
+from modules.mq.application.factory.search_house_result_codec import (
+    splice_result_json,
+)
+from modules.mq.application.port.search_house_status_read_port import (
+    SearchHouseStatusReadPort,
+)
+
+
+class GetSearchHouseStatusAsyncUseCase:
+    """
+    Polling 전용 유즈케이스 (async)
+    - GetSearchHouseStatusUseCase 와 같은 응답을 이벤트 루프에서 만든다.
+    """
+
+    def __init__(self, reader: SearchHouseStatusReadPort):
+        self.reader = reader
+
+    async def execute_raw(self, search_house_id: int) -> bytes | None:
+        status = await self.reader.get_status(search_house_id)
+        if status is None:
+            return None
+        # 완료 전에는 결과 컬럼을 읽지 않는다.
+        result = None
+        if status["status"] == "COMPLETED":
+            result = await self.reader.get_result_json_bytes(search_house_id)
+        return splice_result_json(status, result)
+
+    async def execute_status(self, search_house_id: int) -> dict | None:
+        """결과 payload 없이 상태만 조회한다."""
+        return await self.reader.get_status(search_house_id)
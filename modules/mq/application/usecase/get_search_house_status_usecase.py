@@ -1,6 +1,11 @@
+import json
+
 from modules.mq.adapter.output.repository.search_house_repository import (
     SearchHouseRepository,
 )
+from modules.mq.application.factory.search_house_result_codec import (
+    splice_result_json,
+)
 
 class GetSearchHouseStatusUseCase:
     """
@@ -13,13 +18,30 @@ class GetSearchHouseStatusUseCase:
         self.repo = SearchHouseRepository(db_session)
 
     def execute(self, search_house_id: int) -> dict | None:
-        entity = self.repo.get_by_id(search_house_id)
-        if entity is None:
+        status = self.repo.get_status(search_house_id)
+        if status is None:
             return None
 
+        result = self.repo.get_result_json_bytes(search_house_id)
         return {
-            "search_house_id": entity.search_house_id,
-            "status": entity.status,
-            "result": entity.result_json,
-            "completed_at": entity.completed_at,
-        }
\ No newline at end of file
+            "search_house_id": status["search_house_id"],
+            "status": status["status"],
+            "result": json.loads(result) if result is not None else None,
+            "completed_at": status["completed_at"],
+        }
+
+    def execute_raw(self, search_house_id: int) -> bytes | None:
+        """
+        execute 와 같은 응답을 JSON 바이트로 만든다.
+        - 저장된 결과 JSON 바이트를 파싱하지 않고 그대로 끼워 넣는다.
+        """
+        status = self.repo.get_status(search_house_id)
+        if status is None:
+            return None
+
+        result = self.repo.get_result_json_bytes(search_house_id)
+        return splice_result_json(status, result)
+
+    def execute_status(self, search_house_id: int) -> dict | None:
+        """결과 payload 없이 상태만 조회한다."""
+        return self.repo.get_status(search_house_id)
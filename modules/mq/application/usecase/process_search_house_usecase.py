@@ -1,27 +1,40 @@
+import logging
+
 from sqlalchemy.orm import Session
 from modules.mq.adapter.output.repository.search_house_repository import SearchHouseRepository
 from modules.finder_request.adapter.output.repository.finder_request_repository import FinderRequestRepository
+from modules.mq.application.dto.search_house_event_dto import SearchHouseStatusEvent
+from modules.mq.application.port.search_house_event_port import SearchHouseEventPublisherPort
 from modules.recommendations.application.dto.recommendation_dto import RecommendStudentHouseCommand
-from dataclasses import asdict
+
+logger = logging.getLogger(__name__)
 
 
 class ProcessSearchHouseUseCase:
     """
     RabbitMQ consumer가 메시지를 하나 소비했을 때,
     AI 에이전트를 실행하고 결과를 DB에 반영하는 핵심 유즈케이스
+    - event_publisher 가 있으면 상태 전이를 구독자(SSE)에게 알린다.
     """
 
-    def __init__(self, db: Session, ai_agent):
+    def __init__(
+        self,
+        db: Session,
+        ai_agent,
+        event_publisher: SearchHouseEventPublisherPort | None = None,
+    ):
         self.db = db
         self.search_house_repo = SearchHouseRepository(db)
         self.finder_request_repo = FinderRequestRepository(db)
         self.ai_agent = ai_agent
+        self.event_publisher = event_publisher
 
     def execute(self, search_house_id: int):
         try:
             updated = self.search_house_repo.mark_processing(search_house_id)
             if not updated:
                 return
+            self._notify(search_house_id, "PROCESSING")
 
             search_house = self.search_house_repo.get_by_id(search_house_id)
             finder_request = self.finder_request_repo.find_by_id(search_house.finder_request_id)
@@ -32,11 +45,34 @@ class ProcessSearchHouseUseCase:
                 candidate_house_platform_ids=None
             )
 
-            result = asdict(self.ai_agent.execute(command))
+            # DTO 그대로 저장소 직렬화기에 넘긴다. (asdict 깊은 복사 생략)
+            result = self.ai_agent.execute(command)
 
             self.search_house_repo.save_result(search_house_id, result)
             self.search_house_repo.mark_completed(search_house_id)
+            self._notify(search_house_id, "COMPLETED", result)
 
         except Exception:
             self.search_house_repo.mark_failed(search_house_id)
-            raise
\ No newline at end of file
+            self._notify(search_house_id, "FAILED")
+            raise
+
+    def _notify(self, search_house_id: int, status: str, result=None) -> None:
+        """이벤트 발행 실패는 작업 결과에 영향을 주지 않는다. (DB 가 원본)"""
+        if self.event_publisher is None:
+            return
+        try:
+            self.event_publisher.publish(
+                SearchHouseStatusEvent(
+                    search_house_id=search_house_id,
+                    status=status,
+                    result=result,
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                "[event] publish failed search_house_id=%s status=%s: %s",
+                search_house_id,
+                status,
+                e,
+            )
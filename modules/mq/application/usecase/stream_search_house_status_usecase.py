@@ -0,0 +1,88 @@
+import asyncio
+import json
+from typing import AsyncIterator
+
+from infrastructure.db.postgres import SessionLocal
+from infrastructure.db.session_helper import open_session
+from modules.mq.adapter.output.repository.search_house_repository import (
+    SearchHouseRepository,
+)
+from modules.mq.application.dto.search_house_event_dto import SearchHouseStatusEvent
+from modules.mq.application.port.search_house_event_port import (
+    SearchHouseEventSubscriberPort,
+)
+
+
+class StreamSearchHouseStatusUseCase:
+    """
+    Push 전용 유즈케이스
+    - 상태 전이 이벤트를 구독하고 DB 는 시작 시점에 한 번만 확인한다.
+    - 결과 payload 는 완료 시 한 번만 내보낸다.
+    - 이벤트가 없는 동안 keepalive 용으로 None 을 내보낸다.
+    """
+
+    def __init__(
+        self,
+        subscriber: SearchHouseEventSubscriberPort,
+        session_factory=None,
+        timeout_sec: float = 300.0,
+        keepalive_sec: float = 15.0,
+    ):
+        self.subscriber = subscriber
+        self.session_factory = session_factory or SessionLocal
+        self.timeout_sec = timeout_sec
+        self.keepalive_sec = keepalive_sec
+
+    async def stream(
+        self, search_house_id: int
+    ) -> AsyncIterator[SearchHouseStatusEvent | None]:
+        # 구독을 먼저 걸고 현재 상태를 읽어야 그 사이 전이를 놓치지 않는다.
+        subscription = await self.subscriber.subscribe(search_house_id)
+        try:
+            current = await asyncio.to_thread(self._read_current, search_house_id)
+            if current is None:
+                return
+            yield current
+            if current.is_terminal:
+                return
+
+            last_status = current.status
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.timeout_sec
+            while (remaining := deadline - loop.time()) > 0:
+                event = await subscription.get(min(self.keepalive_sec, remaining))
+                if event is None:
+                    yield None
+                    continue
+                if event.status == last_status:
+                    continue
+                last_status = event.status
+                yield event
+                if event.is_terminal:
+                    return
+        finally:
+            await subscription.close()
+
+    def _read_current(self, search_house_id: int) -> SearchHouseStatusEvent | None:
+        # 스트림은 요청보다 오래 살아 있으므로 요청 작업 단위 세션을 붙잡지 않는다.
+        session, generator = open_session(self.session_factory, join=False)
+        try:
+            repo = SearchHouseRepository(session)
+            status = repo.get_status(search_house_id)
+            if status is None:
+                return None
+            result = None
+            if status["status"] == "COMPLETED":
+                payload = repo.get_result_json_bytes(search_house_id)
+                result = json.loads(payload) if payload is not None else None
+            return SearchHouseStatusEvent(
+                search_house_id=search_house_id,
+                status=status["status"],
+                result=result,
+            )
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
@@ -0,0 +1,26 @@
+"""관측치 재생성 진행 위치를 파일로 저장한다."""
+from __future__ import annotations
+
+from infrastructure.checkpoint.keyed_json_file_store import KeyedJsonFileStore
+from modules.observations.application.port.observation_cursor_port import (
+    ObservationCursorPort,
+)
+
+
+class FileObservationCursorStore(ObservationCursorPort):
+    """키마다 JSON 파일 하나에 저장까지 끝난 마지막 house_platform_id 를 기록한다."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._store = KeyedJsonFileStore(
+            directory, "observation_cursor", "last_house_platform_id"
+        )
+
+    def load(self, key: str) -> int | None:
+        return self._store.load(key)
+
+    def save(self, key: str, last_house_platform_id: int) -> None:
+        self._store.save(key, last_house_platform_id)
+
+    def clear(self, key: str) -> None:
+        self._store.clear(key)
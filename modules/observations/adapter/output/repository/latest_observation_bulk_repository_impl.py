@@ -0,0 +1,96 @@
+from typing import Dict, List, Sequence
+
+from infrastructure.db.session_helper import open_session
+from modules.observations.adapter.output.repository.latest_observation_pointer_repository_impl import (
+    OBSERVATION_TYPE_DISTANCE,
+    OBSERVATION_TYPE_FEATURE,
+    OBSERVATION_TYPE_PRICE,
+    latest_rows,
+)
+from modules.observations.adapter.output.repository.student_recommendation_distance_observation_repository_impl import \
+    StudentRecommendationDistanceObservationRepository
+from modules.observations.adapter.output.repository.student_recommendation_feature_observation_repository_impl import \
+    StudentRecommendationFeatureObservationRepository
+from modules.observations.adapter.output.repository.student_recommendtation_price_observation_repository_impl import \
+    StudentRecommendationPriceObservationRepository
+from modules.observations.application.port.latest_observation_bulk_read_port import LatestObservationBulkReadPort
+from modules.observations.domain.model.distance_feature_observation import DistanceFeatureObservation
+from modules.observations.domain.model.price_feature_observation import PriceFeatureObservation
+from modules.observations.domain.model.student_recommendation_feature_observation import \
+    StudentRecommendationFeatureObservation
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import \
+    StudentRecommendationDistanceObservationORM
+from modules.observations.infrastructure.orm.student_recommendation_feature_observations_orm import \
+    StudentRecommendationFeatureObservationORM
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import \
+    StudentRecommendationPriceObservationsORM
+
+
+class LatestObservationBulkRepository(LatestObservationBulkReadPort):
+    """
+    매물 ID 목록에 대한 최신 관측치를 관측 종류별로 조회한다.
+    최신 관측치 포인터를 따라 읽고, 포인터가 없는 매물만 이력 window 조회로 보완한다.
+    """
+
+    def __init__(self, session_factory):
+        self._session_factory = session_factory
+
+    def fetch_latest_features(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, StudentRecommendationFeatureObservation]:
+        orm = StudentRecommendationFeatureObservationORM
+        rows = self._fetch_latest(
+            orm, OBSERVATION_TYPE_FEATURE, orm.house_platform_id, house_platform_ids
+        )
+        return {
+            row.house_platform_id: StudentRecommendationFeatureObservationRepository._to_domain(row)
+            for row in rows
+        }
+
+    def fetch_latest_prices(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, PriceFeatureObservation]:
+        orm = StudentRecommendationPriceObservationsORM
+        rows = self._fetch_latest(
+            orm, OBSERVATION_TYPE_PRICE, orm.house_platform_id, house_platform_ids
+        )
+        return {
+            row.house_platform_id: StudentRecommendationPriceObservationRepository._to_domain(row)
+            for row in rows
+        }
+
+    def fetch_latest_distances(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, List[DistanceFeatureObservation]]:
+        orm = StudentRecommendationDistanceObservationORM
+        rows = self._fetch_latest(
+            orm,
+            OBSERVATION_TYPE_DISTANCE,
+            orm.house_id,
+            house_platform_ids,
+            extra_partition=orm.university_id,
+        )
+        grouped: Dict[int, List[DistanceFeatureObservation]] = {}
+        for row in rows:
+            grouped.setdefault(row.house_id, []).append(
+                StudentRecommendationDistanceObservationRepository._to_domain(row)
+            )
+        return grouped
+
+    def _fetch_latest(
+        self, orm, observation_type, house_column, house_platform_ids, extra_partition=None
+    ):
+        ids = list(dict.fromkeys(house_platform_ids))
+        if not ids:
+            return []
+        session, generator = open_session(self._session_factory)
+        try:
+            return latest_rows(
+                session, orm, observation_type, house_column, ids, extra_partition
+            )
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
@@ -0,0 +1,353 @@
+"""최신 관측치 포인터 테이블 갱신/조회."""
+from __future__ import annotations
+
+import time
+from typing import Iterable, Sequence
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import and_, delete, func, insert, inspect, literal, or_, select
+from sqlalchemy.orm import Session
+
+from infrastructure.db.session_helper import open_session
+from infrastructure.db.upsert_helper import bulk_insert_for
+from modules.observations.infrastructure.orm.latest_observation_pointer_orm import LatestObservationPointerORM
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import \
+    StudentRecommendationDistanceObservationORM
+from modules.observations.infrastructure.orm.student_recommendation_feature_observations_orm import \
+    StudentRecommendationFeatureObservationORM
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import \
+    StudentRecommendationPriceObservationsORM
+
+OBSERVATION_TYPE_FEATURE = "feature"
+OBSERVATION_TYPE_PRICE = "price"
+OBSERVATION_TYPE_DISTANCE = "distance"
+# 매물 단위 관측치(feature/price)의 university_id 자리 값
+NO_UNIVERSITY = 0
+
+POINTER_UPSERT_CHUNK_SIZE = 1000
+
+# 엔진별 포인터 테이블 확인 결과. 있으면 True 로 고정하고, 없으면 확인 시각을 두고 TTL 뒤 다시 확인한다.
+# (포인터 DDL 보다 먼저 뜬 프로세스가 포인터 갱신을 계속 건너뛰지 않도록 한다)
+_pointer_table_available: WeakKeyDictionary = WeakKeyDictionary()
+POINTER_TABLE_RECHECK_SEC = 60.0
+
+
+def pointer_table_available(session: Session) -> bool:
+    """세션이 가리키는 DB 에 포인터 테이블이 있는지 확인한다. 없다는 결과는 TTL 동안만 캐시한다."""
+    bind = session.get_bind()
+    engine = getattr(bind, "engine", bind)
+    cached = _pointer_table_available.get(engine)
+    if cached is True:
+        return True
+    now = time.monotonic()
+    if cached is not None and now - cached < POINTER_TABLE_RECHECK_SEC:
+        return False
+    # 같은 연결(트랜잭션)로 확인한다. 새 연결을 빌리면 sqlite 메모리 DB 등에서 진행 중인 트랜잭션이 끊긴다.
+    available = inspect(session.connection()).has_table(
+        LatestObservationPointerORM.__tablename__
+    )
+    _pointer_table_available[engine] = True if available else now
+    return available
+
+
+def update_latest_pointers(
+    session: Session, observation_type: str, rows: Iterable[tuple]
+) -> None:
+    """
+    (house_platform_id, university_id, observation_id, calculated_at) 목록으로 포인터를 갱신한다.
+    - 관측치 저장과 같은 트랜잭션에서 호출하고, 커밋은 호출자가 한다.
+    - (calculated_at, observation_id) 가 기존 포인터보다 최신일 때만 옮긴다.
+    """
+    if not pointer_table_available(session):
+        return
+    latest: dict[tuple[int, int], tuple[int, object]] = {}
+    for house_platform_id, university_id, observation_id, calculated_at in rows:
+        key = (house_platform_id, university_id or NO_UNIVERSITY)
+        current = latest.get(key)
+        if current is None or _is_newer(calculated_at, observation_id, current[1], current[0]):
+            latest[key] = (observation_id, calculated_at)
+    if not latest:
+        return
+
+    values = [
+        {
+            "observation_type": observation_type,
+            "house_platform_id": house_platform_id,
+            "university_id": university_id,
+            "observation_id": observation_id,
+            "calculated_at": calculated_at,
+        }
+        for (house_platform_id, university_id), (observation_id, calculated_at) in latest.items()
+    ]
+    insert_fn = bulk_insert_for(session)
+    if insert_fn is None:
+        _update_pointers_rowwise(session, values)
+        return
+
+    pointer = LatestObservationPointerORM
+    stmt = insert_fn(pointer)
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[pointer.observation_type, pointer.house_platform_id, pointer.university_id],
+        set_={
+            "observation_id": excluded.observation_id,
+            "calculated_at": excluded.calculated_at,
+        },
+        where=or_(
+            pointer.calculated_at.is_(None),
+            excluded.calculated_at > pointer.calculated_at,
+            and_(
+                excluded.calculated_at == pointer.calculated_at,
+                excluded.observation_id > pointer.observation_id,
+            ),
+        ),
+    )
+    for start in range(0, len(values), POINTER_UPSERT_CHUNK_SIZE):
+        session.execute(stmt, values[start : start + POINTER_UPSERT_CHUNK_SIZE])
+
+
+def insert_observations(
+    session: Session,
+    orm,
+    observation_type: str,
+    house_column,
+    values: list[dict],
+    university_column=None,
+    chunk_size: int = 5000,
+) -> list[tuple]:
+    """
+    관측 행을 청크 단위 executemany 로 넣고 같은 트랜잭션에서 포인터를 갱신한다.
+    넣은 행의 (id, house_platform_id, calculated_at) 목록을 반환한다. 커밋은 호출자가 한다.
+    """
+    if not values:
+        return []
+    columns = [orm.id, house_column, orm.calculated_at]
+    if university_column is not None:
+        columns.append(university_column)
+    stmt = insert(orm).returning(*columns)
+    rows: list[tuple] = []
+    for start in range(0, len(values), chunk_size):
+        rows.extend(tuple(row) for row in session.execute(stmt, values[start : start + chunk_size]))
+    update_latest_pointers(
+        session,
+        observation_type,
+        (
+            (row[1], row[3] if university_column is not None else NO_UNIVERSITY, row[0], row[2])
+            for row in rows
+        ),
+    )
+    return [row[:3] for row in rows]
+
+
+def latest_rows(
+    session: Session,
+    orm,
+    observation_type: str,
+    house_column,
+    house_platform_ids: Sequence[int],
+    extra_partition=None,
+) -> list:
+    """
+    매물(및 대학) 단위 최신 관측 행을 조회한다.
+    - 포인터가 있는 행은 포인터 -> PK 조인으로 읽는다. (이력 길이와 무관)
+    - 포인터가 없는 행(도입 전 데이터 등)만 이력 window 조회로 보완한다.
+      매물 단위 관측치는 매물별로, 대학별 관측치(extra_partition)는 (매물, 대학)별로 판단한다.
+    """
+    ids = list(dict.fromkeys(house_platform_ids))
+    if not ids:
+        return []
+    if not pointer_table_available(session):
+        return latest_rows_by_window(session, orm, house_column, ids, extra_partition)
+
+    pointer = LatestObservationPointerORM
+    rows = (
+        session.query(orm)
+        .join(
+            pointer,
+            and_(
+                pointer.observation_id == orm.id,
+                pointer.observation_type == observation_type,
+            ),
+        )
+        .filter(pointer.house_platform_id.in_(ids))
+        .all()
+    )
+    if extra_partition is not None:
+        # 같은 매물이라도 대학마다 포인터 유무가 다를 수 있어 (매물, 대학) 단위로 보완한다.
+        rows.extend(
+            latest_rows_by_window(
+                session,
+                orm,
+                house_column,
+                ids,
+                extra_partition,
+                unpointed_type=observation_type,
+            )
+        )
+        return rows
+    found = {getattr(row, house_column.key) for row in rows}
+    missing = [house_platform_id for house_platform_id in ids if house_platform_id not in found]
+    if missing:
+        rows.extend(latest_rows_by_window(session, orm, house_column, missing))
+    return rows
+
+
+def latest_rows_by_window(
+    session: Session,
+    orm,
+    house_column,
+    ids,
+    extra_partition=None,
+    unpointed_type: str | None = None,
+):
+    """
+    매물(및 추가 파티션) 단위 최신 관측 행을 이력 window 함수로 조회한다.
+    unpointed_type 이 있으면 그 종류의 포인터가 없는 (매물, 파티션) 행만 순위를 매긴다.
+    """
+    partition_by = [house_column]
+    if extra_partition is not None:
+        partition_by.append(extra_partition)
+    row_number = func.row_number().over(
+        partition_by=partition_by,
+        order_by=(orm.calculated_at.desc().nulls_last(), orm.id.desc()),
+    ).label("rn")
+    latest_ids_query = session.query(orm.id.label("id"), row_number).filter(
+        house_column.in_(ids)
+    )
+    if unpointed_type is not None:
+        latest_ids_query = latest_ids_query.filter(
+            ~_pointer_exists(unpointed_type, house_column, extra_partition)
+        )
+    latest_ids_subq = latest_ids_query.subquery()
+    return (
+        session.query(orm)
+        .join(latest_ids_subq, orm.id == latest_ids_subq.c.id)
+        .filter(latest_ids_subq.c.rn == 1)
+        .all()
+    )
+
+
+def _pointer_exists(observation_type: str, house_column, university_column=None):
+    pointer = LatestObservationPointerORM
+    return (
+        select(literal(1))
+        .where(pointer.observation_type == observation_type)
+        .where(pointer.house_platform_id == house_column)
+        .where(
+            pointer.university_id
+            == (university_column if university_column is not None else NO_UNIVERSITY)
+        )
+        .exists()
+    )
+
+
+class LatestObservationPointerRepository:
+    """포인터 테이블을 관측 이력에서 다시 채운다. (최초 도입/정합성 복구용)"""
+
+    _SOURCES = (
+        (
+            OBSERVATION_TYPE_FEATURE,
+            StudentRecommendationFeatureObservationORM,
+            StudentRecommendationFeatureObservationORM.house_platform_id,
+            None,
+        ),
+        (
+            OBSERVATION_TYPE_PRICE,
+            StudentRecommendationPriceObservationsORM,
+            StudentRecommendationPriceObservationsORM.house_platform_id,
+            None,
+        ),
+        (
+            OBSERVATION_TYPE_DISTANCE,
+            StudentRecommendationDistanceObservationORM,
+            StudentRecommendationDistanceObservationORM.house_id,
+            StudentRecommendationDistanceObservationORM.university_id,
+        ),
+    )
+
+    def __init__(self, session_factory):
+        self._session_factory = session_factory
+
+    def rebuild(self) -> int:
+        """포인터를 모두 지우고 관측 종류별 최신 행으로 한 트랜잭션에 다시 채운다."""
+        pointer = LatestObservationPointerORM
+        session, generator = open_session(self._session_factory)
+        try:
+            session.execute(delete(pointer))
+            total = 0
+            for observation_type, orm, house_column, university_column in self._SOURCES:
+                partition_by = [house_column]
+                if university_column is not None:
+                    partition_by.append(university_column)
+                ranked = select(
+                    orm.id.label("observation_id"),
+                    house_column.label("house_platform_id"),
+                    (
+                        university_column
+                        if university_column is not None
+                        else literal(NO_UNIVERSITY)
+                    ).label("university_id"),
+                    orm.calculated_at.label("calculated_at"),
+                    func.row_number()
+                    .over(
+                        partition_by=partition_by,
+                        order_by=(orm.calculated_at.desc().nulls_last(), orm.id.desc()),
+                    )
+                    .label("rn"),
+                ).subquery()
+                source = select(
+                    literal(observation_type),
+                    ranked.c.house_platform_id,
+                    ranked.c.university_id,
+                    ranked.c.observation_id,
+                    ranked.c.calculated_at,
+                ).where(ranked.c.rn == 1)
+                result = session.execute(
+                    insert(pointer).from_select(
+                        [
+                            pointer.observation_type,
+                            pointer.house_platform_id,
+                            pointer.university_id,
+                            pointer.observation_id,
+                            pointer.calculated_at,
+                        ],
+                        source,
+                    )
+                )
+                total += max(result.rowcount or 0, 0)
+            session.commit()
+            return total
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+
+def _is_newer(calculated_at, observation_id, other_calculated_at, other_observation_id) -> bool:
+    if other_calculated_at is None:
+        return calculated_at is not None or observation_id > other_observation_id
+    if calculated_at is None:
+        return False
+    return (calculated_at, observation_id) > (other_calculated_at, other_observation_id)
+
+
+def _update_pointers_rowwise(session: Session, values: list[dict]) -> None:
+    for value in values:
+        current = session.get(
+            LatestObservationPointerORM,
+            (value["observation_type"], value["house_platform_id"], value["university_id"]),
+        )
+        if current is None:
+            session.add(LatestObservationPointerORM(**value))
+        elif _is_newer(
+            value["calculated_at"],
+            value["observation_id"],
+            current.calculated_at,
+            current.observation_id,
+        ):
+            current.observation_id = value["observation_id"]
+            current.calculated_at = value["calculated_at"]
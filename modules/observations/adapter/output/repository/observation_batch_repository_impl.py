@@ -0,0 +1,111 @@
+from typing import Dict, Sequence
+
+from infrastructure.db.session_helper import open_session
+from modules.observations.adapter.output.repository.latest_observation_pointer_repository_impl import (
+    OBSERVATION_TYPE_DISTANCE,
+    OBSERVATION_TYPE_FEATURE,
+    OBSERVATION_TYPE_PRICE,
+    insert_observations,
+)
+from modules.observations.adapter.output.repository.student_recommendation_distance_observation_repository_impl import \
+    StudentRecommendationDistanceObservationRepository
+from modules.observations.adapter.output.repository.student_recommendation_feature_observation_repository_impl import \
+    StudentRecommendationFeatureObservationRepository
+from modules.observations.adapter.output.repository.student_recommendtation_price_observation_repository_impl import \
+    StudentRecommendationPriceObservationRepository
+from modules.observations.application.port.observation_batch_write_port import ObservationBatchWritePort
+from modules.observations.domain.model.distance_feature_observation import DistanceFeatureObservation
+from modules.observations.domain.model.price_feature_observation import PriceFeatureObservation
+from modules.observations.domain.model.student_recommendation_feature_observation import \
+    StudentRecommendationFeatureObservation
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import \
+    StudentRecommendationDistanceObservationORM
+from modules.observations.infrastructure.orm.student_recommendation_feature_observations_orm import \
+    StudentRecommendationFeatureObservationORM
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import \
+    StudentRecommendationPriceObservationsORM
+
+# execute 한 번에 넘기는 행 수. 드라이버가 insertmanyvalues 로 다시 나눠 보낸다.
+SAVE_CHUNK_SIZE = 5000
+
+
+class ObservationBatchRepository(ObservationBatchWritePort):
+    """
+    매물 청크의 관측치를 세션 하나, 커밋 한 번으로 저장한다.
+    - feature 는 RETURNING 으로 id 를 받아 가격/거리 관측치의 recommendation_observation_id 로 쓴다.
+    - 최신 관측치 포인터도 같은 트랜잭션에서 갱신한다.
+    - 도중에 실패하면 청크 전체를 롤백한다.
+    """
+
+    def __init__(self, session_factory):
+        self._session_factory = session_factory
+
+    def save_observations(
+        self,
+        features: Sequence[StudentRecommendationFeatureObservation],
+        prices: Sequence[PriceFeatureObservation],
+        distances: Sequence[DistanceFeatureObservation],
+    ) -> Dict[int, int]:
+        if not features:
+            return {}
+        session, generator = open_session(self._session_factory)
+        try:
+            feature_orm = StudentRecommendationFeatureObservationORM
+            rows = insert_observations(
+                session,
+                feature_orm,
+                OBSERVATION_TYPE_FEATURE,
+                feature_orm.house_platform_id,
+                [
+                    StudentRecommendationFeatureObservationRepository._to_values(feature)
+                    for feature in features
+                ],
+                chunk_size=SAVE_CHUNK_SIZE,
+            )
+            feature_ids = {house_platform_id: id_ for id_, house_platform_id, _ in rows}
+
+            price_values = [
+                {
+                    **StudentRecommendationPriceObservationRepository._to_values(price),
+                    "recommendation_observation_id": feature_ids[price.house_platform_id],
+                }
+                for price in prices
+            ]
+            distance_values = [
+                {
+                    **StudentRecommendationDistanceObservationRepository._to_values(distance),
+                    "recommendation_observation_id": feature_ids[distance.house_platform_id],
+                }
+                for distance in distances
+            ]
+            insert_observations(
+                session,
+                StudentRecommendationPriceObservationsORM,
+                OBSERVATION_TYPE_PRICE,
+                StudentRecommendationPriceObservationsORM.house_platform_id,
+                price_values,
+                chunk_size=SAVE_CHUNK_SIZE,
+            )
+            insert_observations(
+                session,
+                StudentRecommendationDistanceObservationORM,
+                OBSERVATION_TYPE_DISTANCE,
+                StudentRecommendationDistanceObservationORM.house_id,
+                distance_values,
+                university_column=StudentRecommendationDistanceObservationORM.university_id,
+                chunk_size=SAVE_CHUNK_SIZE,
+            )
+            session.commit()
+
+            for feature in features:
+                feature.id = feature_ids[feature.house_platform_id]
+            return feature_ids
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
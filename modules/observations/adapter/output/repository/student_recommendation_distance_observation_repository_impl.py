@@ -1,12 +1,19 @@
-from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 from typing import List
 
+from modules.observations.adapter.output.repository.latest_observation_pointer_repository_impl import (
+    OBSERVATION_TYPE_DISTANCE,
+    insert_observations,
+    latest_rows,
+)
 from modules.observations.application.port.distance_observation_repository_port import DistanceObservationRepositoryPort
 from modules.observations.domain.model.distance_feature_observation import DistanceFeatureObservation
 from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import \
     StudentRecommendationDistanceObservationORM
 
+# execute 한 번에 넘기는 행 수. 드라이버가 insertmanyvalues 로 다시 나눠 보낸다.
+SAVE_CHUNK_SIZE = 5000
+
 
 class StudentRecommendationDistanceObservationRepository(DistanceObservationRepositoryPort):
     def __init__(self, db_session: Session):
@@ -16,65 +23,61 @@ class StudentRecommendationDistanceObservationRepository(DistanceObservationRepo
         if not distances:
             return
 
-        # ORM 객체 -> dict 변환
-        values = [
-            {
-                "house_id": d.house_platform_id,
-                "recommendation_observation_id": d.recommendation_observation_id,
-                "university_id": d.university_id,
-                "학교까지_분": d.학교까지_분,
-                "거리_백분위": d.거리_백분위,
-                "거리_버킷": d.거리_버킷,
-                "거리_비선형_점수": d.거리_비선형_점수,
-                "calculated_at": d.calculated_at,
-            }
-            for d in distances
-        ]
+        # 도메인 객체 -> dict 변환
+        values = [self._to_values(d) for d in distances]
 
-        stmt = insert(StudentRecommendationDistanceObservationORM).values(values)
-        self.db_session.execute(stmt)
+        # 매물 여러 개를 묶어 저장하므로 거대한 VALUES 한 문장 대신 청크 단위 executemany 로 보내며
+        # 매물 x 대학별 최신 포인터도 함께 갱신한다.
+        insert_observations(
+            self.db_session,
+            StudentRecommendationDistanceObservationORM,
+            OBSERVATION_TYPE_DISTANCE,
+            StudentRecommendationDistanceObservationORM.house_id,
+            values,
+            university_column=StudentRecommendationDistanceObservationORM.university_id,
+            chunk_size=SAVE_CHUNK_SIZE,
+        )
         self.db_session.commit()
 
     def get_bulk_by_house_platform_id(self, house_platform_id: int) -> List[DistanceFeatureObservation]:
         """매물 ID 기준으로 대학별 최신 거리 관측치를 조회한다."""
-        row_number = func.row_number().over(
-            partition_by=StudentRecommendationDistanceObservationORM.university_id,
-            order_by=(
-                StudentRecommendationDistanceObservationORM.calculated_at.desc(),
-                StudentRecommendationDistanceObservationORM.id.desc(),
-            ),
-        ).label("rn")
-        latest_ids_subq = (
-            self.db_session.query(
-                StudentRecommendationDistanceObservationORM.id.label("id"),
-                row_number,
-            )
-            .filter(
-                StudentRecommendationDistanceObservationORM.house_id == house_platform_id
-            )
-            .subquery()
-        )
-        orms = (
-            self.db_session.query(StudentRecommendationDistanceObservationORM)
-            .join(
-                latest_ids_subq,
-                StudentRecommendationDistanceObservationORM.id == latest_ids_subq.c.id,
-            )
-            .filter(latest_ids_subq.c.rn == 1)
-            .all()
+        orms = latest_rows(
+            self.db_session,
+            StudentRecommendationDistanceObservationORM,
+            OBSERVATION_TYPE_DISTANCE,
+            StudentRecommendationDistanceObservationORM.house_id,
+            [house_platform_id],
+            extra_partition=StudentRecommendationDistanceObservationORM.university_id,
         )
 
-        return [
-            DistanceFeatureObservation(
-                id=o.id,
-                house_platform_id=o.house_id,
-                recommendation_observation_id=o.recommendation_observation_id,
-                university_id=o.university_id,
-                학교까지_분=o.학교까지_분,
-                거리_백분위=o.거리_백분위,
-                거리_버킷=o.거리_버킷,
-                거리_비선형_점수=o.거리_비선형_점수,
-                calculated_at=o.calculated_at,
-            )
-            for o in orms
-        ]
+        return [self._to_domain(o) for o in orms]
+
+    @staticmethod
+    def _to_values(d: DistanceFeatureObservation) -> dict:
+        """도메인 객체를 insert 컬럼 값으로 바꾼다. (id 제외)"""
+        return {
+            "house_id": d.house_platform_id,
+            "recommendation_observation_id": d.recommendation_observation_id,
+            "university_id": d.university_id,
+            "학교까지_분": d.학교까지_분,
+            "거리_백분위": d.거리_백분위,
+            "거리_버킷": d.거리_버킷,
+            "거리_비선형_점수": d.거리_비선형_점수,
+            "calculated_at": d.calculated_at,
+        }
+
+    @staticmethod
+    def _to_domain(
+        o: StudentRecommendationDistanceObservationORM,
+    ) -> DistanceFeatureObservation:
+        return DistanceFeatureObservation(
+            id=o.id,
+            house_platform_id=o.house_id,
+            recommendation_observation_id=o.recommendation_observation_id,
+            university_id=o.university_id,
+            학교까지_분=o.학교까지_분,
+            거리_백분위=o.거리_백분위,
+            거리_버킷=o.거리_버킷,
+            거리_비선형_점수=o.거리_비선형_점수,
+            calculated_at=o.calculated_at,
+        )
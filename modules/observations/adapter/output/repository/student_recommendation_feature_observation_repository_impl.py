@@ -1,5 +1,11 @@
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from infrastructure.db.session_helper import open_session
+from modules.observations.adapter.output.repository.latest_observation_pointer_repository_impl import (
+    NO_UNIVERSITY,
+    OBSERVATION_TYPE_FEATURE,
+    latest_rows,
+    update_latest_pointers,
+)
 from modules.observations.domain.model.student_recommendation_feature_observation import (
     StudentRecommendationFeatureObservation,
     ObservationMetadata,
@@ -21,24 +27,26 @@ class StudentRecommendationFeatureObservationRepository(ObservationRepositoryPor
     def find_latest_by_house_id(
         self, house_id: int
     ) -> Optional[StudentRecommendationFeatureObservation]:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
-            orm = (
-                db.query(StudentRecommendationFeatureObservationORM)
-                .filter(
-                    StudentRecommendationFeatureObservationORM.house_platform_id == house_id
-                )
-                .order_by(StudentRecommendationFeatureObservationORM.calculated_at.desc())
-                .first()
+            rows = latest_rows(
+                db,
+                StudentRecommendationFeatureObservationORM,
+                OBSERVATION_TYPE_FEATURE,
+                StudentRecommendationFeatureObservationORM.house_platform_id,
+                [house_id],
             )
-            return self._to_domain(orm) if orm else None
+            return self._to_domain(rows[0]) if rows else None
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     def find_history(
         self, house_id: int
     ) -> List[StudentRecommendationFeatureObservation]:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             orms = (
                 db.query(StudentRecommendationFeatureObservationORM)
@@ -50,44 +58,62 @@ class StudentRecommendationFeatureObservationRepository(ObservationRepositoryPor
             )
             return [self._to_domain(o) for o in orms]
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     def save(
         self, observation: StudentRecommendationFeatureObservation
     ) -> StudentRecommendationFeatureObservation:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             orm = StudentRecommendationFeatureObservationORM(
-                house_platform_id=observation.house_platform_id,
-                snapshot_id=observation.snapshot_id,
-
-                # 위험
-                risk_event_count=observation.위험_관측치.위험_사건_개수,
-                risk_event_types=observation.위험_관측치.위험_사건_유형,
-                risk_probability_est=observation.위험_관측치.위험_확률_추정,
-                risk_severity_score=observation.위험_관측치.위험_심각도_점수,
-                risk_nonlinear_penalty=observation.위험_관측치.위험_비선형_패널티,
-
-                # 편의
-                essential_option_coverage=observation.편의_관측치.필수_옵션_커버리지,
-                convenience_score=observation.편의_관측치.편의_점수,
-
-                # 메타
-                observation_notes=observation.관측_메모.notes,
-                observation_version=observation.메타데이터.관측치_버전,
-                source_data_version=observation.메타데이터.원본_데이터_버전,
-
-                calculated_at=observation.calculated_at,
+                **self._to_values(observation)
             )
 
             db.add(orm)
             db.flush()  # PK 생성
             observation.id = orm.id  # Domain에 반영
+            update_latest_pointers(
+                db,
+                OBSERVATION_TYPE_FEATURE,
+                [(orm.house_platform_id, NO_UNIVERSITY, orm.id, orm.calculated_at)],
+            )
             db.commit()
             return observation
 
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
+
+    @staticmethod
+    def _to_values(observation: StudentRecommendationFeatureObservation) -> dict:
+        """도메인 객체를 insert 컬럼 값으로 바꾼다. (id 제외)"""
+        return {
+            "house_platform_id": observation.house_platform_id,
+            "snapshot_id": observation.snapshot_id,
+
+            # 위험
+            "risk_event_count": observation.위험_관측치.위험_사건_개수,
+            "risk_event_types": observation.위험_관측치.위험_사건_유형,
+            "risk_probability_est": observation.위험_관측치.위험_확률_추정,
+            "risk_severity_score": observation.위험_관측치.위험_심각도_점수,
+            "risk_nonlinear_penalty": observation.위험_관측치.위험_비선형_패널티,
+
+            # 편의
+            "essential_option_coverage": observation.편의_관측치.필수_옵션_커버리지,
+            "convenience_score": observation.편의_관측치.편의_점수,
+
+            # 메타
+            "observation_notes": observation.관측_메모.notes,
+            "observation_version": observation.메타데이터.관측치_버전,
+            "source_data_version": observation.메타데이터.원본_데이터_버전,
+
+            "calculated_at": observation.calculated_at,
+        }
 
     @staticmethod
     def _to_domain(
@@ -1,11 +1,21 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
+from modules.observations.adapter.output.repository.latest_observation_pointer_repository_impl import (
+    NO_UNIVERSITY,
+    OBSERVATION_TYPE_PRICE,
+    insert_observations,
+    latest_rows,
+    update_latest_pointers,
+)
 from modules.observations.application.port.price_observation_repository_port import PriceObservationRepositoryPort
 from modules.observations.domain.model.price_feature_observation import PriceFeatureObservation
 from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import \
     StudentRecommendationPriceObservationsORM
 
+# execute 한 번에 넘기는 행 수. 드라이버가 다중 VALUES 로 묶어 보낸다.
+SAVE_CHUNK_SIZE = 5000
+
 
 class StudentRecommendationPriceObservationRepository(PriceObservationRepositoryPort):
     def __init__(self, session: Session):
@@ -13,35 +23,31 @@ class StudentRecommendationPriceObservationRepository(PriceObservationRepository
 
     def save_bulk(self, observations: List[PriceFeatureObservation]) -> None:
         """여러 PriceFeatureObservation을 DB에 저장"""
-        orm_objects = [
-            StudentRecommendationPriceObservationsORM(
-                house_platform_id=o.house_platform_id,
-                recommendation_observation_id=o.recommendation_observation_id,
-                가격_백분위=o.가격_백분위,
-                가격_z점수=o.가격_z점수,
-                예상_입주비용=o.예상_입주비용,
-                월_비용_추정=o.월_비용_추정,
-                가격_부담_비선형=o.가격_부담_비선형,
-                calculated_at=o.calculated_at,
-            )
-            for o in observations
-        ]
-        self.session.bulk_save_objects(orm_objects)
+        if not observations:
+            return
+        # ORM 객체를 만들지 않고 청크 단위 executemany 로 보내며 최신 포인터도 함께 갱신한다.
+        insert_observations(
+            self.session,
+            StudentRecommendationPriceObservationsORM,
+            OBSERVATION_TYPE_PRICE,
+            StudentRecommendationPriceObservationsORM.house_platform_id,
+            [self._to_values(o) for o in observations],
+            chunk_size=SAVE_CHUNK_SIZE,
+        )
         self.session.commit()
 
     def save(self, observation: PriceFeatureObservation) -> PriceFeatureObservation:
         """단일 PriceFeatureObservation 저장 및 PK 반환"""
         orm_obj = StudentRecommendationPriceObservationsORM(
-            house_platform_id=observation.house_platform_id,
-            recommendation_observation_id=observation.recommendation_observation_id,
-            가격_백분위=observation.가격_백분위,
-            가격_z점수=observation.가격_z점수,
-            예상_입주비용=observation.예상_입주비용,
-            월_비용_추정=observation.월_비용_추정,
-            가격_부담_비선형=observation.가격_부담_비선형,
-            calculated_at=observation.calculated_at,
+            **self._to_values(observation)
         )
         self.session.add(orm_obj)
+        self.session.flush()
+        update_latest_pointers(
+            self.session,
+            OBSERVATION_TYPE_PRICE,
+            [(orm_obj.house_platform_id, NO_UNIVERSITY, orm_obj.id, orm_obj.calculated_at)],
+        )
         self.session.commit()
 
         # frozen dataclass이므로 새 객체를 만들어 반환
@@ -59,14 +65,36 @@ class StudentRecommendationPriceObservationRepository(PriceObservationRepository
 
     def get_by_house_platform_id(self, house_platform_id: int) -> Optional[PriceFeatureObservation]:
         """매물 ID로 PriceFeatureObservation 조회 (최신)"""
-        orm = self.session.query(StudentRecommendationPriceObservationsORM) \
-            .filter(StudentRecommendationPriceObservationsORM.house_platform_id == house_platform_id) \
-            .order_by(StudentRecommendationPriceObservationsORM.calculated_at.desc()) \
-            .first()
-
-        if not orm:
+        rows = latest_rows(
+            self.session,
+            StudentRecommendationPriceObservationsORM,
+            OBSERVATION_TYPE_PRICE,
+            StudentRecommendationPriceObservationsORM.house_platform_id,
+            [house_platform_id],
+        )
+        if not rows:
             return None
 
+        return self._to_domain(rows[0])
+
+    @staticmethod
+    def _to_values(o: PriceFeatureObservation) -> dict:
+        """도메인 객체를 insert 컬럼 값으로 바꾼다. (id 제외)"""
+        return {
+            "house_platform_id": o.house_platform_id,
+            "recommendation_observation_id": o.recommendation_observation_id,
+            "가격_백분위": o.가격_백분위,
+            "가격_z점수": o.가격_z점수,
+            "예상_입주비용": o.예상_입주비용,
+            "월_비용_추정": o.월_비용_추정,
+            "가격_부담_비선형": o.가격_부담_비선형,
+            "calculated_at": o.calculated_at,
+        }
+
+    @staticmethod
+    def _to_domain(
+        orm: StudentRecommendationPriceObservationsORM,
+    ) -> PriceFeatureObservation:
         return PriceFeatureObservation(
             id=orm.id,
             house_platform_id=orm.house_platform_id,
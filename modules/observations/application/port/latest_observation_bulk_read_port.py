@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Sequence
+
+from modules.observations.domain.model.distance_feature_observation import DistanceFeatureObservation
+from modules.observations.domain.model.price_feature_observation import PriceFeatureObservation
+from modules.observations.domain.model.student_recommendation_feature_observation import StudentRecommendationFeatureObservation
+
+
+class LatestObservationBulkReadPort(ABC):
+    """매물 ID 목록 기준 최신 관측치 일괄 조회 Port"""
+
+    @abstractmethod
+    def fetch_latest_features(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, StudentRecommendationFeatureObservation]:
+        """매물별 최신 feature 관측치를 조회"""
+
+    @abstractmethod
+    def fetch_latest_prices(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, PriceFeatureObservation]:
+        """매물별 최신 가격 관측치를 조회"""
+
+    @abstractmethod
+    def fetch_latest_distances(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, List[DistanceFeatureObservation]]:
+        """매물별/대학별 최신 거리 관측치를 조회"""
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence
+
+from modules.observations.domain.model.distance_feature_observation import DistanceFeatureObservation
+from modules.observations.domain.model.price_feature_observation import PriceFeatureObservation
+from modules.observations.domain.model.student_recommendation_feature_observation import StudentRecommendationFeatureObservation
+
+
+class ObservationBatchWritePort(ABC):
+    """여러 매물의 feature/가격/거리 관측치를 한 트랜잭션으로 저장하는 Port"""
+
+    @abstractmethod
+    def save_observations(
+        self,
+        features: Sequence[StudentRecommendationFeatureObservation],
+        prices: Sequence[PriceFeatureObservation],
+        distances: Sequence[DistanceFeatureObservation],
+    ) -> Dict[int, int]:
+        """
+        feature 를 먼저 저장하고 같은 매물의 가격/거리 관측치에 그 id 를 채워 함께 저장한다.
+        house_platform_id -> feature id 를 반환한다.
+        """
+        raise NotImplementedError
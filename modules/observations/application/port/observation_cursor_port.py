@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ObservationCursorPort(ABC):
+    """전체 관측치 재생성 진행 위치(저장까지 끝난 마지막 house_platform_id)를 저장하는 Port"""
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[int]:
+        """저장된 마지막 house_platform_id 를 반환한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, key: str, last_house_platform_id: int) -> None:
+        """저장까지 끝난 마지막 house_platform_id 를 기록한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self, key: str) -> None:
+        """실행이 끝나면 진행 위치를 지운다."""
+        raise NotImplementedError
@@ -1,24 +1,59 @@
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from math import radians, sin, atan2, sqrt, cos
-from typing import List
+from typing import List, Mapping, Optional, Sequence
+
 import numpy as np
+
 from modules.observations.application.port.distance_observation_repository_port import DistanceObservationRepositoryPort
 from modules.house_platform.application.port_out.house_platform_repository_port import HousePlatformRepositoryPort
 from modules.observations.domain.model.distance_feature_observation import DistanceFeatureObservation
 from modules.university.application.port.university_repository_port import UniversityRepositoryPort
+from shared.common.utils.geo_index import GeoGridIndex, haversine_km
+
+WALK_SPEED_KMH = 5  # 도보 5km/h 가정
+
+# 거리 버킷 경계(분)와 라벨. minutes < 10 -> "0_10분", ..., 40 이상 -> "40분_이상"
+_BUCKET_EDGES = np.array([10, 20, 30, 40], dtype=float)
+_BUCKET_LABELS = ("0_10분", "10_20분", "20_30분", "30_40분", "40분_이상")
+
+
+@dataclass(frozen=True)
+class DistanceObservationContext:
+    """한 번의 실행 동안 재사용하는 대학 위치와 공간 인덱스."""
+
+    universities: Sequence
+    university_index: GeoGridIndex | None = None
+
+
+@dataclass
+class DistanceObservationBulkResult:
+    """전체 매물 거리 관측치 일괄 생성 결과."""
+
+    houses: int = 0
+    saved: int = 0
+    missing_location_ids: List[int] = field(default_factory=list)
 
 
 class GenerateDistanceObservationUseCase:
+    """
+    매물 x 대학 거리 관측치를 생성한다.
+    - 거리(분) 행렬을 NumPy 브로드캐스팅으로 한 번에 계산하고
+      백분위/버킷/비선형 점수도 행렬 단위로 계산한다.
+    - max_minutes 를 주면 대학 공간 인덱스로 반경 안의 대학만 골라 그 쌍만 저장한다.
+      (백분위는 여전히 전체 대학 기준이다)
+    """
 
     def __init__(
         self,
         distance_repo: DistanceObservationRepositoryPort,
         house_repo: HousePlatformRepositoryPort,
         university_repo: UniversityRepositoryPort,
+        max_minutes: float | None = None,
     ):
         self.distance_repo = distance_repo
         self.house_repo = house_repo
         self.university_repo = university_repo
+        self.max_minutes = max_minutes
 
     def execute(self, recommendation_observation_id: int, house_id: int) -> None:
         # House 정보
@@ -27,76 +62,248 @@ class GenerateDistanceObservationUseCase:
             raise ValueError(f"House {house_id} missing location")
 
         house = bundle.house_platform
-        universities = self.university_repo.get_university_locations()
 
-        # 모든 대학까지 시간 계산
-        all_minutes = [
-            self._calc_minutes(house.lat_lng, uni.lat, uni.lng)
-            for uni in universities
-        ]
+        # 모든 대학까지 시간 계산 (1 x U 행렬)
+        observations = self.build_observations(
+            self.load_context(),
+            house_ids=[house_id],
+            house_lat=[house.lat_lng["lat"]],
+            house_lng=[house.lat_lng["lng"]],
+            recommendation_observation_ids=[recommendation_observation_id],
+        )
 
-        observations: List[DistanceFeatureObservation] = []
+        # Repository 저장
+        self.distance_repo.save_bulk(observations)
 
-        for uni, minutes in zip(universities, all_minutes):
-            observations.append(
-                DistanceFeatureObservation(
-                    id=None,
-                    house_platform_id=house_id,
-                    recommendation_observation_id=recommendation_observation_id,
-                    university_id=uni.university_location_id,
-                    학교까지_분=minutes,
-                    거리_백분위=self._calc_percentile(minutes, all_minutes),
-                    거리_버킷=self._calc_bucket(minutes),
-                    거리_비선형_점수=self._calc_nonlinear_score(minutes),
-                    calculated_at=datetime.now(timezone.utc),
-                )
+    def execute_bulk(
+        self,
+        recommendation_observation_ids: Mapping[int, int],
+        house_chunk_size: int = 200,
+    ) -> DistanceObservationBulkResult:
+        """
+        house_platform_id -> recommendation_observation_id 전체에 대해 거리 관측치를 한 번에 생성한다.
+        - 매물 위치는 house_chunk_size 개씩 조회해 행렬을 만들고 청크마다 일괄 저장한다.
+        - 위치가 없는 매물은 건너뛰고 missing_location_ids 로 돌려준다.
+        """
+        result = DistanceObservationBulkResult()
+        house_ids = list(recommendation_observation_ids)
+        if not house_ids:
+            return result
+        context = self.load_context()
+        if not context.universities:
+            return result
+
+        house_chunk_size = max(1, house_chunk_size)
+        for start in range(0, len(house_ids), house_chunk_size):
+            chunk_ids = house_ids[start : start + house_chunk_size]
+            locations = {
+                location.house_platform_id: location
+                for location in self.house_repo.fetch_locations(chunk_ids)
+            }
+            located_ids = [hid for hid in chunk_ids if hid in locations]
+            result.missing_location_ids.extend(
+                hid for hid in chunk_ids if hid not in locations
             )
+            if not located_ids:
+                continue
 
-        # Repository 저장
-        self.distance_repo.save_bulk(observations)
+            observations = self.build_observations(
+                context,
+                house_ids=located_ids,
+                house_lat=[locations[hid].lat for hid in located_ids],
+                house_lng=[locations[hid].lng for hid in located_ids],
+                recommendation_observation_ids=[
+                    recommendation_observation_ids[hid] for hid in located_ids
+                ],
+            )
+            self.distance_repo.save_bulk(observations)
+            result.houses += len(located_ids)
+            result.saved += len(observations)
+        return result
 
     # ---------- 계산 로직 ----------
-    def _calc_minutes(self, house_latlng: dict, uni_lat: float, uni_lng: float) -> float:
-        lat1, lon1 = house_latlng["lat"], house_latlng["lng"]
-        lat2, lon2 = uni_lat, uni_lng
+    def load_context(self) -> DistanceObservationContext:
+        """대학 위치를 한 번 읽고, 반경 모드면 공간 인덱스도 만든다."""
+        universities = self.university_repo.get_university_locations()
+        return DistanceObservationContext(
+            universities=universities,
+            university_index=self._build_university_index(universities),
+        )
+
+    def _build_university_index(self, universities: Sequence) -> GeoGridIndex | None:
+        if self.max_minutes is None:
+            return None
+        # 반경과 비슷한 크기의 칸이면 질의당 3 x 3 칸 안팎만 훑는다.
+        return GeoGridIndex(
+            universities, cell_km=max(minutes_to_km(self.max_minutes), 1.0)
+        )
+
+    def build_observations(
+        self,
+        context: DistanceObservationContext,
+        house_ids: Sequence[int],
+        house_lat: Sequence[float],
+        house_lng: Sequence[float],
+        recommendation_observation_ids: Optional[Sequence[Optional[int]]] = None,
+    ) -> List[DistanceFeatureObservation]:
+        """
+        매물 좌표로 거리 관측치를 만든다. (저장하지 않는다)
+        recommendation_observation_ids 가 없으면 None 으로 두고 저장 시점에 채운다.
+        """
+        if recommendation_observation_ids is None:
+            recommendation_observation_ids = [None] * len(house_ids)
+        if context.university_index is not None:
+            return self._build_observations_within_radius(
+                house_ids,
+                recommendation_observation_ids,
+                house_lat,
+                house_lng,
+                context.university_index,
+            )
 
-        R = 6371  # 지구 반지름 km
-        dlat = radians(lat2 - lat1)
-        dlon = radians(lon2 - lon1)
+        universities = context.universities
+        university_ids = [uni.university_location_id for uni in universities]
+        minutes = build_minutes_matrix(
+            house_lat,
+            house_lng,
+            [uni.lat for uni in universities],
+            [uni.lng for uni in universities],
+        )
+        # 행렬 계산 결과는 파이썬 값으로 한 번에 바꿔 객체 생성 비용을 줄인다.
+        minutes_rows = minutes.tolist()
+        percentile_rows = calc_row_percentiles(minutes).tolist()
+        bucket_rows = calc_buckets(minutes).tolist()
+        score_rows = calc_nonlinear_scores(minutes).tolist()
+        calculated_at = datetime.now(timezone.utc)
+
+        observations: List[DistanceFeatureObservation] = []
+        for row, (house_id, recommendation_observation_id) in enumerate(
+            zip(house_ids, recommendation_observation_ids)
+        ):
+            for university_id, value, percentile, bucket, score in zip(
+                university_ids,
+                minutes_rows[row],
+                percentile_rows[row],
+                bucket_rows[row],
+                score_rows[row],
+            ):
+                observations.append(
+                    DistanceFeatureObservation(
+                        id=None,
+                        house_platform_id=house_id,
+                        recommendation_observation_id=recommendation_observation_id,
+                        university_id=university_id,
+                        학교까지_분=value,
+                        거리_백분위=percentile,
+                        거리_버킷=bucket,
+                        거리_비선형_점수=score,
+                        calculated_at=calculated_at,
+                    )
+                )
+        return observations
+
+    def _build_observations_within_radius(
+        self,
+        house_ids: Sequence[int],
+        recommendation_observation_ids: Sequence[Optional[int]],
+        house_lat: Sequence[float],
+        house_lng: Sequence[float],
+        university_index: GeoGridIndex,
+    ) -> List[DistanceFeatureObservation]:
+        """
+        매물마다 반경 안의 대학만 인덱스로 찾아 관측치를 만든다.
+        - 반경 안 대학은 거리순으로 오므로 '해당 값 이하' 개수는 searchsorted 로 구하고,
+          그보다 가까운 대학은 모두 반경 안에 있으므로 전체 대학 수로 나누면 기존 백분위와 같다.
+        """
+        radius_km = minutes_to_km(self.max_minutes)
+        total = len(university_index)
+        calculated_at = datetime.now(timezone.utc)
+        observations: List[DistanceFeatureObservation] = []
+        for house_id, recommendation_observation_id, lat, lng in zip(
+            house_ids, recommendation_observation_ids, house_lat, house_lng
+        ):
+            indices, distances = university_index.within_km_indices(
+                lat, lng, radius_km
+            )
+            if len(indices) == 0:
+                continue
+            minutes = km_to_minutes(distances)
+            percentiles = (
+                np.searchsorted(minutes, minutes, side="right") / total
+            ).tolist()
+            buckets = calc_buckets(minutes).tolist()
+            scores = calc_nonlinear_scores(minutes).tolist()
+            for index, value, percentile, bucket, score in zip(
+                indices.tolist(), minutes.tolist(), percentiles, buckets, scores
+            ):
+                observations.append(
+                    DistanceFeatureObservation(
+                        id=None,
+                        house_platform_id=house_id,
+                        recommendation_observation_id=recommendation_observation_id,
+                        university_id=university_index.items[index].university_location_id,
+                        학교까지_분=value,
+                        거리_백분위=percentile,
+                        거리_버킷=bucket,
+                        거리_비선형_점수=score,
+                        calculated_at=calculated_at,
+                    )
+                )
+        return observations
 
-        a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
-        km = R * c
 
-        return (km / 5) * 60  # 도보 5km/h 가정
+def minutes_to_km(minutes: float) -> float:
+    """도보 시간(분)을 거리(km)로 바꾼다."""
+    return minutes / 60 * WALK_SPEED_KMH
 
-    def _calc_percentile(self, minutes: float, all_minutes: List[float]) -> float:
-        arr = np.array(all_minutes)
-        return float(np.sum(arr <= minutes) / len(arr))
 
-    def _calc_bucket(self, minutes: float) -> str:
-        if minutes < 10:
-            return "0_10분"
+def km_to_minutes(km):
+    """거리(km)를 도보 시간(분)으로 바꾼다. (배열 가능)"""
+    return (km / WALK_SPEED_KMH) * 60
 
-        if minutes < 20:
-            return "10_20분"
 
-        if minutes < 30:
-            return "20_30분"
+def build_minutes_matrix(
+    house_lat: Sequence[float],
+    house_lng: Sequence[float],
+    uni_lat: Sequence[float],
+    uni_lng: Sequence[float],
+) -> np.ndarray:
+    """매물(H) x 대학(U) 도보 시간(분) 행렬을 하버사인 공식으로 계산한다."""
+    km = haversine_km(
+        np.asarray(house_lat, dtype=float)[:, None],
+        np.asarray(house_lng, dtype=float)[:, None],
+        np.asarray(uni_lat, dtype=float)[None, :],
+        np.asarray(uni_lng, dtype=float)[None, :],
+    )
+    return km_to_minutes(km)
 
-        if minutes < 40:
-            return "30_40분"
 
-        return "40분_이상"
+def calc_row_percentiles(minutes: np.ndarray) -> np.ndarray:
+    """행마다 '해당 값 이하인 대학 비율'을 구한다. (행당 정렬 1회 + searchsorted)"""
+    percentiles = np.empty_like(minutes, dtype=float)
+    count = minutes.shape[1]
+    if count == 0:
+        return percentiles
+    for i, row in enumerate(minutes):
+        percentiles[i] = np.searchsorted(np.sort(row), row, side="right") / count
+    return percentiles
 
-    def _calc_nonlinear_score(self, minutes: float) -> float:
-        if minutes <= 20:
-            return max(0.0, 1 - 0.01 * minutes)
 
-        if minutes <= 30:
-            return max(0.0, 0.8 - 0.02 * (minutes - 20))
+def calc_buckets(minutes: np.ndarray) -> np.ndarray:
+    """거리 버킷 라벨 행렬을 만든다."""
+    labels = np.array(_BUCKET_LABELS, dtype=object)
+    return labels[np.digitize(minutes, _BUCKET_EDGES, right=False)]
 
-        if minutes <= 40:
-            return max(0.0, 0.6 - 0.03 * (minutes - 30))
 
-        return 0.3
+def calc_nonlinear_scores(minutes: np.ndarray) -> np.ndarray:
+    """거리 비선형 점수 행렬을 만든다. (20분까지 완만, 40분 초과는 0.3 고정)"""
+    scores = np.select(
+        [minutes <= 20, minutes <= 30, minutes <= 40],
+        [
+            1 - 0.01 * minutes,
+            0.8 - 0.02 * (minutes - 20),
+            0.6 - 0.03 * (minutes - 30),
+        ],
+        default=0.3,
+    )
+    return np.maximum(scores, 0.0)
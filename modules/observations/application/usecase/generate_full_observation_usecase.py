@@ -1,21 +1,57 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from modules.house_platform.application.port_out.house_platform_repository_port import HousePlatformRepositoryPort
+from modules.observations.application.port.observation_batch_write_port import ObservationBatchWritePort
+from modules.observations.application.port.observation_cursor_port import ObservationCursorPort
 from modules.observations.application.usecase.generate_distance_observation_usecase import \
-    GenerateDistanceObservationUseCase
+    DistanceObservationContext, GenerateDistanceObservationUseCase
 from modules.observations.application.usecase.generate_price_observation_usecase import GeneratePriceObservationUseCase
 from modules.observations.application.usecase.generate_student_recommendation_feature_observation_usecase import \
-    GenerateStudentRecommendationFeatureObservationUseCase
+    GenerateStudentRecommendationFeatureObservationUseCase, HouseNotFoundError
+from modules.observations.domain.model.student_recommendation_feature_observation import \
+    StudentRecommendationFeatureObservation
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FullObservationBatchResult:
+    """전체 관측치 청크 생성 결과."""
+
+    processed: int = 0
+    saved: int = 0
+    errors: Dict[int, str] = field(default_factory=dict)
+    resumed_after: Optional[int] = None
 
 
 class GenerateFullObservationUseCase:
+    """
+    매물 하나(execute) 또는 매물 목록(execute_batch)의 feature/가격/거리 관측치를 생성한다.
+    - execute_batch 는 house_repo 로 chunk_size 개씩 번들을 한 번에 조회하고, 대학 위치는 실행당 한 번만 읽는다.
+    - 청크의 관측치는 메모리에서 만든 뒤 batch_writer 로 한 트랜잭션에 저장한다.
+    - 청크 저장이 실패하면 매물 단위로 다시 저장해 실패한 매물만 errors 에 남긴다.
+    - cursor_port 가 있으면 청크마다 마지막 house_platform_id 를 기록해 다음 실행이 이어서 진행한다.
+    """
 
     def __init__(
         self,
         student_feature_uc: GenerateStudentRecommendationFeatureObservationUseCase,
         price_uc: GeneratePriceObservationUseCase,
         distance_uc: GenerateDistanceObservationUseCase,
+        batch_writer: Optional[ObservationBatchWritePort] = None,
+        house_repo: Optional[HousePlatformRepositoryPort] = None,
+        cursor_port: Optional[ObservationCursorPort] = None,
+        chunk_size: int = 200,
     ):
         self.student_feature_uc = student_feature_uc
         self.price_uc = price_uc
         self.distance_uc = distance_uc
+        self.batch_writer = batch_writer
+        self.house_repo = house_repo
+        self.cursor_port = cursor_port
+        self.chunk_size = max(1, chunk_size)
 
     def execute(self, house_id: int):
         # 1. 학생 추천 Feature 생성
@@ -34,3 +70,99 @@ class GenerateFullObservationUseCase:
         )
 
         return student_feature
+
+    def execute_batch(
+        self, house_ids: Iterable[int], cursor_key: Optional[str] = None
+    ) -> FullObservationBatchResult:
+        """
+        house_ids 를 오름차순 청크로 나눠 관측치를 생성/저장한다.
+        cursor_key 에 저장된 위치가 있으면 그 id 다음 매물부터 시작한다.
+        """
+        if self.batch_writer is None or self.house_repo is None:
+            raise ValueError("execute_batch 에는 batch_writer 와 house_repo 가 필요합니다.")
+
+        cursor_key = cursor_key if self.cursor_port else None
+        resumed_after = self.cursor_port.load(cursor_key) if cursor_key else None
+        targets = sorted(set(house_ids))
+        if resumed_after is not None:
+            targets = [house_id for house_id in targets if house_id > resumed_after]
+
+        result = FullObservationBatchResult(resumed_after=resumed_after)
+        if not targets:
+            if cursor_key:
+                self.cursor_port.clear(cursor_key)
+            return result
+
+        distance_context = self.distance_uc.load_context()
+        for start in range(0, len(targets), self.chunk_size):
+            chunk = targets[start : start + self.chunk_size]
+            self._process_chunk(chunk, distance_context, result)
+            if cursor_key:
+                # 이 청크까지는 저장(또는 오류 기록)이 끝났다.
+                self.cursor_port.save(cursor_key, chunk[-1])
+
+        if cursor_key:
+            self.cursor_port.clear(cursor_key)
+        return result
+
+    def _process_chunk(
+        self,
+        house_ids: Sequence[int],
+        distance_context: DistanceObservationContext,
+        result: FullObservationBatchResult,
+    ) -> None:
+        bundles = self.house_repo.fetch_bundles_by_ids(house_ids)
+        features: List[StudentRecommendationFeatureObservation] = []
+        locations: Dict[int, dict] = {}
+        for house_id in house_ids:
+            result.processed += 1
+            try:
+                bundle = bundles.get(house_id)
+                if not bundle or not bundle.house_platform:
+                    raise HouseNotFoundError(house_id)
+                if house_id not in self.price_uc.house_prices:
+                    raise ValueError(f"House {house_id} has no price data")
+                lat_lng = bundle.house_platform.lat_lng
+                if not lat_lng:
+                    raise ValueError(f"House {house_id} missing location")
+                features.append(self.student_feature_uc.build_feature(house_id, bundle))
+                locations[house_id] = lat_lng
+            except Exception as exc:  # noqa: BLE001
+                result.errors[house_id] = str(exc)
+
+        if not features:
+            return
+        try:
+            self._save(features, locations, distance_context)
+            result.saved += len(features)
+            return
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "관측치 청크 저장 실패, 매물 단위로 다시 저장합니다. (%s~%s): %s",
+                house_ids[0],
+                house_ids[-1],
+                exc,
+            )
+
+        for feature in features:
+            try:
+                self._save([feature], locations, distance_context)
+                result.saved += 1
+            except Exception as exc:  # noqa: BLE001
+                result.errors[feature.house_platform_id] = str(exc)
+
+    def _save(
+        self,
+        features: Sequence[StudentRecommendationFeatureObservation],
+        locations: Dict[int, dict],
+        distance_context: DistanceObservationContext,
+    ) -> None:
+        house_ids = [feature.house_platform_id for feature in features]
+        prices = self.price_uc.build_observations(dict.fromkeys(house_ids))
+        distances = self.distance_uc.build_observations(
+            distance_context,
+            house_ids=house_ids,
+            house_lat=[locations[house_id]["lat"] for house_id in house_ids],
+            house_lng=[locations[house_id]["lng"] for house_id in house_ids],
+        )
+        self.batch_writer.save_observations(features, prices, distances)
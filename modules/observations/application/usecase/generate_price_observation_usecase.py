@@ -1,5 +1,6 @@
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict
+from typing import Dict, Hashable, List, Mapping, Optional
 
 import numpy as np
 
@@ -7,60 +8,169 @@ from modules.observations.application.port.price_observation_repository_port imp
 from modules.observations.domain.model.price_feature_observation import PriceFeatureObservation
 
 
+@dataclass(frozen=True)
+class _PriceCohortStats:
+    """코호트 하나의 정렬된 가격과 평균/표준편차."""
+
+    sorted_prices: np.ndarray
+    mean: float
+    std: float
+
+
+@dataclass
+class PriceObservationBulkResult:
+    """전체 매물 가격 관측치 일괄 생성 결과."""
+
+    saved: int = 0
+    missing_price_ids: List[int] = field(default_factory=list)
+
+
 class GeneratePriceObservationUseCase:
     """
     house_platform_id 단위로 PriceFeatureObservation 생성
     - 가격 백분위, z-score, 예상 입주비용, 월 비용 추정, 비선형 가격 부담 계산
+    - 코호트별 정렬 가격/평균/표준편차는 처음 한 번만 계산해 재사용한다. (백분위는 searchsorted)
+    - house_cohorts(house_platform_id -> gu_nm, sales_type 등)를 주면 코호트 안에서 통계를 낸다.
     """
 
-    def __init__(self, price_repo: PriceObservationRepositoryPort, house_prices: Dict[int, int]):
+    def __init__(
+        self,
+        price_repo: PriceObservationRepositoryPort,
+        house_prices: Dict[int, int],
+        house_cohorts: Optional[Mapping[int, Hashable]] = None,
+    ):
         """
         house_prices: dict[house_platform_id -> 가격 데이터]
+        house_cohorts: dict[house_platform_id -> 코호트 키] (없으면 전체가 한 코호트)
         """
         self.price_repo = price_repo
         self.house_prices = house_prices
+        self.house_cohorts = house_cohorts
+        self._stats: Optional[Dict[Hashable, _PriceCohortStats]] = None
 
     def execute(self, recommendation_observation_id: int, house_platform_id: int) -> PriceFeatureObservation:
         if house_platform_id not in self.house_prices:
             raise ValueError(f"House {house_platform_id} has no price data")
 
-        price = self.house_prices[house_platform_id]
-        all_prices = np.array(list(self.house_prices.values()))
-
-        # ---------- 백분위 & z-score ----------
-        price_percentile = float(np.sum(all_prices <= price) / len(all_prices))
-        mean = float(np.mean(all_prices))
-        std = float(np.std(all_prices))
-        price_zscore = float((price - mean) / std) if std > 0 else 0.0
-        # TODO: zscore 범위 정책이 확정되면 보정 방식을 조정한다.
-        # price_zscore = max(-10.0, min(10.0, price_zscore))
-
-        # ---------- 예상 비용 계산 (예시: deposit + 월세) ----------
-        expected_move_in_cost = price  # 예시: deposit = price
-        monthly_cost_estimate = int(price / 100)  # 예시: 월비 = price / 100
-
-        # ---------- 비선형 부담 점수 ----------
-        if price_zscore <= 0:
-            nonlinear_price_burden = 1.0
-        elif price_zscore <= 1:
-            nonlinear_price_burden = 0.8
-        elif price_zscore <= 2:
-            nonlinear_price_burden = 0.6
-        else:
-            nonlinear_price_burden = 0.3
-
-        # ---------- Observation 생성 ----------
-        observation = PriceFeatureObservation(
-            id=None,
-            house_platform_id=house_platform_id,
-            recommendation_observation_id=recommendation_observation_id,
-            가격_백분위=price_percentile,
-            가격_z점수=price_zscore,
-            예상_입주비용=expected_move_in_cost,
-            월_비용_추정=monthly_cost_estimate,
-            가격_부담_비선형=nonlinear_price_burden,
-            calculated_at=datetime.now(timezone.utc),
-        )
-
+        observation = self.build_observations(
+            {house_platform_id: recommendation_observation_id}
+        )[0]
         self.price_repo.save(observation)
         return observation
+
+    def execute_bulk(
+        self,
+        recommendation_observation_ids: Mapping[int, int],
+        chunk_size: int = 1000,
+    ) -> PriceObservationBulkResult:
+        """
+        house_platform_id -> recommendation_observation_id 전체의 가격 관측치를 한 번에 계산하고
+        chunk_size 개씩 save_bulk 로 저장한다. 가격이 없는 매물은 missing_price_ids 로 돌려준다.
+        """
+        result = PriceObservationBulkResult()
+        targets = {}
+        for house_platform_id, recommendation_observation_id in recommendation_observation_ids.items():
+            if house_platform_id in self.house_prices:
+                targets[house_platform_id] = recommendation_observation_id
+            else:
+                result.missing_price_ids.append(house_platform_id)
+
+        observations = self.build_observations(targets)
+        chunk_size = max(1, chunk_size)
+        for start in range(0, len(observations), chunk_size):
+            chunk = observations[start : start + chunk_size]
+            self.price_repo.save_bulk(chunk)
+            result.saved += len(chunk)
+        return result
+
+    # ---------- 계산 로직 ----------
+    def build_observations(
+        self, recommendation_observation_ids: Mapping[int, Optional[int]]
+    ) -> List[PriceFeatureObservation]:
+        """
+        대상 매물을 코호트별로 묶어 지표를 벡터 연산으로 계산한다. (저장하지 않는다)
+        recommendation_observation_id 가 아직 없으면 None 으로 두고 저장 시점에 채운다.
+        """
+        stats = self._cohort_stats()
+        groups: Dict[Hashable, List[int]] = {}
+        for house_platform_id in recommendation_observation_ids:
+            groups.setdefault(self._cohort_of(house_platform_id), []).append(
+                house_platform_id
+            )
+
+        calculated_at = datetime.now(timezone.utc)
+        observations: List[PriceFeatureObservation] = []
+        for cohort, house_ids in groups.items():
+            cohort_stats = stats[cohort]
+            prices = np.array([self.house_prices[hid] for hid in house_ids])
+
+            # ---------- 백분위 & z-score ----------
+            percentiles = (
+                np.searchsorted(cohort_stats.sorted_prices, prices, side="right")
+                / len(cohort_stats.sorted_prices)
+            )
+            if cohort_stats.std > 0:
+                zscores = (prices - cohort_stats.mean) / cohort_stats.std
+            else:
+                zscores = np.zeros(len(prices))
+            # TODO: zscore 범위 정책이 확정되면 보정 방식을 조정한다.
+            # zscores = np.clip(zscores, -10.0, 10.0)
+
+            # ---------- 비선형 부담 점수 ----------
+            burdens = calc_price_burdens(zscores)
+
+            for house_id, percentile, zscore, burden in zip(
+                house_ids,
+                percentiles.tolist(),
+                zscores.tolist(),
+                burdens.tolist(),
+            ):
+                price = self.house_prices[house_id]
+                observations.append(
+                    PriceFeatureObservation(
+                        id=None,
+                        house_platform_id=house_id,
+                        recommendation_observation_id=recommendation_observation_ids[house_id],
+                        가격_백분위=percentile,
+                        가격_z점수=zscore,
+                        # ---------- 예상 비용 계산 (예시: deposit + 월세) ----------
+                        예상_입주비용=price,  # 예시: deposit = price
+                        월_비용_추정=int(price / 100),  # 예시: 월비 = price / 100
+                        가격_부담_비선형=burden,
+                        calculated_at=calculated_at,
+                    )
+                )
+        return observations
+
+    def _cohort_of(self, house_platform_id: int) -> Hashable:
+        if self.house_cohorts is None:
+            return None
+        return self.house_cohorts.get(house_platform_id)
+
+    def _cohort_stats(self) -> Dict[Hashable, _PriceCohortStats]:
+        """코호트별 정렬 가격/평균/표준편차를 한 번만 계산한다."""
+        if self._stats is None:
+            grouped: Dict[Hashable, List[int]] = {}
+            for house_platform_id, price in self.house_prices.items():
+                grouped.setdefault(self._cohort_of(house_platform_id), []).append(
+                    price
+                )
+            stats = {}
+            for cohort, prices in grouped.items():
+                values = np.array(prices)
+                stats[cohort] = _PriceCohortStats(
+                    sorted_prices=np.sort(values),
+                    mean=float(np.mean(values)),
+                    std=float(np.std(values)),
+                )
+            self._stats = stats
+        return self._stats
+
+
+def calc_price_burdens(zscores: np.ndarray) -> np.ndarray:
+    """z-score 구간별 비선형 가격 부담 점수 (0 이하 1.0, 1 이하 0.8, 2 이하 0.6, 그 외 0.3)."""
+    return np.select(
+        [zscores <= 0, zscores <= 1, zscores <= 2],
+        [1.0, 0.8, 0.6],
+        default=0.3,
+    )
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 
+from modules.house_platform.application.dto.fetch_and_store_dto import HousePlatformUpsertBundle
 from modules.house_platform.application.port_out.house_platform_repository_port import HousePlatformRepositoryPort
 from modules.observations.application.assembler.observation_raw_assembler import ObservationRawAssembler
 from modules.observations.application.port.observation_repository_port import ObservationRepositoryPort
@@ -29,6 +30,25 @@ class GenerateStudentRecommendationFeatureObservationUseCase:
         if not bundle or not bundle.house_platform:
             raise HouseNotFoundError(house_id)
 
+        feature = self.build_feature(house_id, bundle)
+
+        # 저장 & PK 확보
+        saved_feature = self.observation_repo.save(feature)
+
+        # Distance 생성 (Orchestrator에서 None 처리 가능)
+        if self.distance_usecase:
+            self.distance_usecase.execute(
+                recommendation_observation_id=saved_feature.id,
+                house_id=house_id,
+            )
+
+        return saved_feature
+
+    @staticmethod
+    def build_feature(
+        house_id: int, bundle: HousePlatformUpsertBundle
+    ) -> StudentRecommendationFeatureObservation:
+        """조회해 둔 번들로 저장 전 feature 관측치를 만든다."""
         raw_house = bundle.house_platform
 
         # Price 생성
@@ -57,14 +77,4 @@ class GenerateStudentRecommendationFeatureObservationUseCase:
             calculated_at=datetime.now(timezone.utc),
         )
 
-        # 저장 & PK 확보
-        saved_feature = self.observation_repo.save(feature)
-
-        # Distance 생성 (Orchestrator에서 None 처리 가능)
-        if self.distance_usecase:
-            self.distance_usecase.execute(
-                recommendation_observation_id=saved_feature.id,
-                house_id=house_id,
-            )
-
-        return saved_feature
+        return feature
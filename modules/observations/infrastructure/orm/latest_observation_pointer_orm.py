@@ -0,0 +1,24 @@
+from sqlalchemy import Column, BigInteger, String, DateTime
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+
+class LatestObservationPointerORM(Base):
+    """
+    관측 종류별 최신 관측 행 id. (거리는 매물 x 대학, 그 외는 university_id = 0)
+    관측치를 저장할 때 같은 트랜잭션에서 갱신한다.
+    """
+    # CREATE TABLE latest_observation_pointers (
+    #   observation_type VARCHAR(20) NOT NULL, house_platform_id BIGINT NOT NULL,
+    #   university_id BIGINT NOT NULL DEFAULT 0, observation_id BIGINT NOT NULL,
+    #   calculated_at TIMESTAMP NULL,
+    #   PRIMARY KEY (observation_type, house_platform_id, university_id));
+    __tablename__ = "latest_observation_pointers"
+
+    observation_type = Column(String(20), primary_key=True)
+    house_platform_id = Column(BigInteger, primary_key=True)
+    university_id = Column(BigInteger, primary_key=True, default=0)
+
+    observation_id = Column(BigInteger, nullable=False)
+    calculated_at = Column(DateTime, nullable=True)
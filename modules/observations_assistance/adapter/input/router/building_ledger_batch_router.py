@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
-from infrastructure.db.postgres import get_db_session
+from infrastructure.db.postgres import get_batch_db_session
 import time
 
 from modules.observations_assistance.application.usecase.fetch_br_title_info_usecase import (
@@ -16,7 +16,7 @@ router = APIRouter()
 # http://localhost:33333/api/batch >>> 이거 돌리면 배치 시작
 
 @router.post("/batch")
-def batch_process(session=Depends(get_db_session)):
+def batch_process(session=Depends(get_batch_db_session)):
     """
     house_platform 전체를 조회 → 건축물대장 API 호출 → dj_bjdrgst 저장
     """
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List
 
-from sqlalchemy.orm import Session
+from infrastructure.db.session_helper import open_session
 
 from modules.finder_request.adapter.output.finder_request_model import FinderRequestModel
 from modules.house_platform.infrastructure.orm.house_platform_orm import (
@@ -25,7 +25,7 @@ class OwnerRecommendationRepositoryImpl(OwnerRecommendationRepositoryPort):
     def fetch_recommendations(
         self, abang_user_id: int, rent_margin: int
     ) -> List[OwnerRecommendationRow]:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             query = (
                 db.query(HousePlatformORM, FinderRequestModel)
@@ -75,4 +75,7 @@ class OwnerRecommendationRepositoryImpl(OwnerRecommendationRepositoryPort):
                 )
             return rows
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class RecommendationContext:
+    """추천 항목 조립에 필요한 매물/관측 데이터를 ID 기준으로 묶는다."""
+
+    houses: dict[int, Any] = field(default_factory=dict)
+    feature_observations: dict[int, Any] = field(default_factory=dict)
+    price_observations: dict[int, Any] = field(default_factory=dict)
+    distance_observations: dict[int, list[Any]] = field(default_factory=dict)
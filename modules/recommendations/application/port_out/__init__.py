@@ -0,0 +1,13 @@
+from modules.recommendations.application.port_out.recommendation_context_port import (
+    RecommendationContextLoaderPort,
+)
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationCacheInvalidationPort,
+    RecommendationResultCachePort,
+)
+
+__all__ = [
+    "RecommendationCacheInvalidationPort",
+    "RecommendationContextLoaderPort",
+    "RecommendationResultCachePort",
+]
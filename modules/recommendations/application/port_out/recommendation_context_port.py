@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from modules.recommendations.application.dto.recommendation_context_dto import (
+    RecommendationContext,
+)
+
+
+class RecommendationContextLoaderPort(ABC):
+    """추천 컨텍스트 일괄 조회 포트."""
+
+    @abstractmethod
+    def load(self, house_platform_ids: Sequence[int]) -> RecommendationContext:
+        """매물/최신 관측 데이터를 한 번에 조회한다."""
+        raise NotImplementedError
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendStudentHouseResult,
+)
+
+
+class RecommendationCacheInvalidationPort(ABC):
+    """추천 결과 캐시 무효화 포트."""
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """매물 스냅샷/점수 변경 시 데이터 버전을 올려 기존 결과를 무효화한다."""
+        raise NotImplementedError
+
+
+class RecommendationResultCachePort(RecommendationCacheInvalidationPort):
+    """추천 결과 캐시 포트."""
+
+    @abstractmethod
+    def data_version(self) -> int | None:
+        """현재 매물/관측 데이터 버전을 반환한다. 조회 불가면 None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, key: str) -> RecommendStudentHouseResult | None:
+        """캐시된 추천 결과를 조회한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: str, result: RecommendStudentHouseResult) -> None:
+        """추천 결과를 저장한다."""
+        raise NotImplementedError
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+import hashlib
+import json
+import os
+from dataclasses import asdict, fields, is_dataclass
 from datetime import datetime, timezone
 from typing import Any
 
@@ -10,6 +13,9 @@ from modules.finder_request.application.port.finder_request_repository_port impo
 from modules.house_platform.application.port_out.house_platform_repository_port import (
     HousePlatformRepositoryPort,
 )
+from modules.recommendations.application.dto.recommendation_context_dto import (
+    RecommendationContext,
+)
 from modules.recommendations.application.dto.recommendation_dto import (
     RecommendStudentHouseCommand,
     RecommendStudentHouseResult,
@@ -17,6 +23,18 @@ from modules.recommendations.application.dto.recommendation_dto import (
 from modules.recommendations.application.port_in.recommend_student_house_port import (
     RecommendStudentHousePort,
 )
+from modules.recommendations.application.port_out.recommendation_context_port import (
+    RecommendationContextLoaderPort,
+)
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationResultCachePort,
+)
+from modules.recommendations.infrastructure.cache.redis_recommendation_result_cache import (
+    RedisRecommendationResultCache,
+)
+from modules.recommendations.infrastructure.repository.recommendation_context_repository import (
+    RecommendationContextRepository,
+)
 from modules.ai_explanation.application.usecase.explain_finder_usecase import (
     ExplainFinderUseCase,
 )
@@ -28,6 +46,7 @@ from modules.ai_explanation.application.dto.finder_explanation_dto import (
     UserConstraintsInput,
 )
 from infrastructure.db.postgres import SessionLocal
+from infrastructure.db.redis_client import get_redis_client
 from infrastructure.db.session_helper import open_session
 from modules.decision_context_signal_builder.application.usecase.build_decision_context_signal_usecase import (
     BuildDecisionContextSignalUseCase,
@@ -53,6 +72,9 @@ from modules.student_house_decision_policy.application.usecase.filter_candidate
 from modules.student_house_decision_policy.infrastructure.repository.house_platform_candidate_repository import (
     HousePlatformCandidateRepository,
 )
+from modules.student_house_decision_policy.infrastructure.repository.observation_candidate_filter_repository import (
+    ObservationCandidateFilterRepository,
+)
 from modules.student_house_decision_policy.infrastructure.repository.student_house_score_repository import (
     StudentHouseScoreRepository,
 )
@@ -102,6 +124,8 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
         explain_usecase: ExplainFinderUseCase | None = None,
         policy: DecisionPolicyConfig | None = None,
         session_factory=SessionLocal,
+        context_loader: RecommendationContextLoaderPort | None = None,
+        result_cache: RecommendationResultCachePort | None = None,
     ):
         # 인자가 없으면 execute에서 기본 구현체를 조립한다.
         # TODO: 의존성 조립을 별도 팩토리로 분리한다.
@@ -115,6 +139,8 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
         self.filter_usecase = filter_usecase
         self.build_context_signal_usecase = build_context_signal_usecase
         self.explain_usecase = explain_usecase
+        self.context_loader = context_loader
+        self.result_cache = result_cache
         self.policy = policy or DecisionPolicyConfig()
         self._session_factory = session_factory
 
@@ -166,6 +192,9 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
             price_observation_repo=runtime_price_repo,
             distance_observation_repo=runtime_distance_repo,
             university_repo=runtime_university_repo,
+            observation_filter=ObservationCandidateFilterRepository(
+                self._session_factory
+            ),
         )
         runtime_explain_usecase = (
             self.explain_usecase or ExplainFinderUseCase()
@@ -176,6 +205,28 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
                 observation_repo=runtime_observation_repo
             )
         )
+        # 항목 조립용 저장소를 주입받지 않았으면 일괄 조회 로더를 사용한다.
+        uses_default_item_repos = (
+            self.house_platform_repo is None
+            and self.observation_repo is None
+            and self.price_observation_repo is None
+            and self.distance_observation_repo is None
+        )
+        runtime_context_loader = self.context_loader or (
+            RecommendationContextRepository(self._session_factory)
+            if uses_default_item_repos
+            else None
+        )
+        # 저장소를 모두 기본 구현체로 쓸 때만 Redis 결과 캐시를 기본 적용한다.
+        runtime_result_cache = self.result_cache or (
+            RedisRecommendationResultCache(get_redis_client())
+            if uses_default_item_repos
+            and self.finder_request_repo is None
+            and self.score_repo is None
+            and self.filter_usecase is None
+            and _result_cache_enabled()
+            else None
+        )
 
         # finder_request는 상위 흐름에서 존재를 보장한다.
         request = runtime_finder_repo.find_by_id(command.finder_request_id)
@@ -191,6 +242,8 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
             self.filter_usecase,
             self.build_context_signal_usecase,
             self.explain_usecase,
+            self.context_loader,
+            self.result_cache,
         )
         self.finder_request_repo = runtime_finder_repo
         self.house_platform_repo = runtime_house_platform_repo
@@ -202,8 +255,16 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
         self.filter_usecase = runtime_filter_usecase
         self.build_context_signal_usecase = runtime_context_signal_usecase
         self.explain_usecase = runtime_explain_usecase
+        self.context_loader = runtime_context_loader
+        self.result_cache = runtime_result_cache
 
         try:
+            cache_key = self._build_cache_key(command, request)
+            if cache_key:
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
             candidates = command.candidate_house_platform_ids
             if candidates is None:
                 filter_result = self.filter_usecase.execute(
@@ -254,6 +315,12 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
             recommended_top = recommended[: policy.top_k]
             rejected_top = rejected[: policy.top_k]
 
+            # top-k 항목의 매물/관측치를 한 번에 조회해 항목별 왕복을 없앤다.
+            context = self._load_context(
+                [item[0] for item in recommended_top + rejected_top]
+            )
+            university_ids = self._resolve_request_university_ids(request)
+
             # 정상 응답은 SUCCESS + detail None으로 기록한다.
             # TODO: 실패 수집 로직 활성화 시 FAILED + detail 채움으로 전환한다.
             status = "SUCCESS"
@@ -283,14 +350,20 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
                     request,
                     policy,
                     decision_status="RECOMMENDED",
+                    context=context,
+                    university_ids=university_ids,
                 ),
                 rejected_top_k=self._build_ranked_items(
                     rejected_top,
                     request,
                     policy,
                     decision_status="REJECTED",
+                    context=context,
+                    university_ids=university_ids,
                 ),
             )
+            if cache_key:
+                self.result_cache.put(cache_key, result)
             return result
         finally:
             (
@@ -304,12 +377,39 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
                 self.filter_usecase,
                 self.build_context_signal_usecase,
                 self.explain_usecase,
+                self.context_loader,
+                self.result_cache,
             ) = previous
             if generator:
                 generator.close()
             elif session is not None:
                 session.close()
 
+    def _build_cache_key(
+        self,
+        command: RecommendStudentHouseCommand,
+        request,
+    ) -> str | None:
+        """요청서 내용/정책 버전/데이터 버전으로 결과 캐시 키를 만든다."""
+        if self.result_cache is None or request is None:
+            return None
+        data_version = self.result_cache.data_version()
+        if data_version is None:
+            return None
+        payload = json.dumps(
+            {
+                "request": _request_fingerprint(request),
+                "candidates": command.candidate_house_platform_ids,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        content_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+        return (
+            f"{self.policy.policy_version}:{data_version}:"
+            f"{command.finder_request_id}:{content_hash}"
+        )
+
     def _fetch_score_map(
         self,
         house_platform_ids: list[int],
@@ -322,6 +422,38 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
         )
         return {score.house_platform_id: score for score in scores}
 
+    def _load_context(self, house_platform_ids: list[int]) -> RecommendationContext:
+        """항목 조립에 필요한 매물/관측 데이터를 ID 기준 맵으로 모은다."""
+        if not house_platform_ids:
+            return RecommendationContext()
+        if self.context_loader:
+            return self.context_loader.load(house_platform_ids)
+
+        # 일괄 로더가 없으면 개별 저장소로 동일한 맵을 구성한다.
+        context = RecommendationContext()
+        for house_platform_id in dict.fromkeys(house_platform_ids):
+            house = self.house_platform_repo.find_by_id(house_platform_id)
+            if house:
+                context.houses[house_platform_id] = house
+            feature_observation = self._fetch_feature_observation(
+                house_platform_id
+            )
+            if feature_observation:
+                context.feature_observations[house_platform_id] = (
+                    feature_observation
+                )
+            price_observation = self._fetch_price_observation(
+                house_platform_id
+            )
+            if price_observation:
+                context.price_observations[house_platform_id] = (
+                    price_observation
+                )
+            distances = self._fetch_distance_observations(house_platform_id)
+            if distances:
+                context.distance_observations[house_platform_id] = distances
+        return context
+
     def _collect_failure_detail(
         self,
         candidates: list[int],
@@ -355,17 +487,17 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
 
         missing_observations: list[int] = []
         snapshot_mismatches: list[int] = []
+        context = self._load_context(candidates)
         for candidate_id in candidates:
-            raw = self._build_raw(candidate_id)
-            feature_observation = self._fetch_feature_observation(
-                candidate_id
-            )
-            price_observation = self._fetch_price_observation(
+            raw = self._to_raw(context.houses.get(candidate_id))
+            feature_observation = context.feature_observations.get(
                 candidate_id
             )
+            price_observation = context.price_observations.get(candidate_id)
             distance_observation = self._select_distance_observation(
-                self._fetch_distance_observations(candidate_id),
+                context.distance_observations.get(candidate_id, []),
                 None,
+                [],
             )
             if (
                 not feature_observation
@@ -428,23 +560,32 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
         request,
         policy: DecisionPolicyConfig,
         decision_status: str,
+        context: RecommendationContext | None = None,
+        university_ids: list[int] | None = None,
     ) -> list[dict[str, Any]]:
+        if context is None:
+            context = self._load_context(
+                [item[0] for item in ranked_items]
+            )
+        if university_ids is None:
+            university_ids = self._resolve_request_university_ids(request)
+
         results = []
         for index, (house_platform_id, score, _) in enumerate(
             ranked_items, start=1
         ):
-            raw = self._build_raw(house_platform_id)
-            feature_observation = self._fetch_feature_observation(
+            raw = self._to_raw(context.houses.get(house_platform_id))
+            feature_observation = context.feature_observations.get(
                 house_platform_id
             )
-            price_observation = self._fetch_price_observation(
+            price_observation = context.price_observations.get(
                 house_platform_id
             )
-            distance_observations = self._fetch_distance_observations(
-                house_platform_id
+            distance_observations = context.distance_observations.get(
+                house_platform_id, []
             )
             distance_observation = self._select_distance_observation(
-                distance_observations, request
+                distance_observations, request, university_ids
             )
             observation_summary = self._build_observation_summary(
                 feature_observation,
@@ -522,7 +663,12 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
 
     def _build_raw(self, house_platform_id: int) -> dict[str, Any]:
         """house_platform 도메인 객체를 dict로 변환한다."""
-        house = self.house_platform_repo.find_by_id(house_platform_id)
+        return self._to_raw(
+            self.house_platform_repo.find_by_id(house_platform_id)
+        )
+
+    @staticmethod
+    def _to_raw(house) -> dict[str, Any]:
         if not house:
             return {}
         raw = asdict(house)
@@ -553,12 +699,19 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
             house_platform_id
         )
 
-    def _select_distance_observation(self, distances: list, request):
+    def _select_distance_observation(
+        self,
+        distances: list,
+        request,
+        university_ids: list[int] | None = None,
+    ):
         """대학교 기준으로 거리 관측치를 선택한다."""
         if not distances:
             return None
 
-        matched = self._find_distance_by_university(distances, request)
+        matched = self._find_distance_by_university(
+            distances, request, university_ids
+        )
         if matched:
             return DistanceObservationFeatures(
                 학교까지_분=matched.학교까지_분,
@@ -569,28 +722,39 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
 
         return self._average_latest_distance(distances)
 
-    def _find_distance_by_university(self, distances: list, request):
-        if not request or not request.university_name:
-            return None
-        if not self.university_repo:
-            return None
-
-        target_ids = self._resolve_university_ids(
-            request.university_name
+    def _find_distance_by_university(
+        self,
+        distances: list,
+        request,
+        university_ids: list[int] | None = None,
+    ):
+        target_ids = (
+            university_ids
+            if university_ids is not None
+            else self._resolve_request_university_ids(request)
         )
         if not target_ids:
             return None
 
+        target_id_set = set(target_ids)
         matched = [
             distance
             for distance in distances
-            if distance.university_id in target_ids
+            if distance.university_id in target_id_set
         ]
         if not matched:
             return None
         # 동일 학교가 여러 개면 가장 가까운 거리값을 사용한다.
         return min(matched, key=lambda item: item.학교까지_분)
 
+    def _resolve_request_university_ids(self, request) -> list[int]:
+        """요청서의 대학교 ID 목록을 요청당 한 번만 조회한다."""
+        if not request or not request.university_name:
+            return []
+        if not self.university_repo:
+            return []
+        return self._resolve_university_ids(request.university_name)
+
     def _resolve_university_ids(self, university_name: str) -> list[int]:
         normalized = (university_name or "").strip()
         if not normalized:
@@ -828,3 +992,22 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
             "text": getattr(reason, "text", ""),
             "evidence": getattr(reason, "evidence", {}),
         }
+
+
+def _result_cache_enabled() -> bool:
+    return os.getenv("RECOMMENDATION_CACHE_ENABLED", "true").lower() != "false"
+
+
+def _request_fingerprint(request) -> dict[str, Any]:
+    """추천 결과에 영향이 없는 시각 필드를 제외한 요청서 내용을 반환한다."""
+    if is_dataclass(request):
+        values = {field.name: getattr(request, field.name) for field in fields(request)}
+    else:
+        values = {
+            name: value
+            for name, value in vars(request).items()
+            if not name.startswith("_")
+        }
+    for name in ("created_at", "updated_at"):
+        values.pop(name, None)
+    return values
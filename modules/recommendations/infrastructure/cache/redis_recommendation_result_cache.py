@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import asdict
+
+from redis.exceptions import RedisError
+
+from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendStudentHouseResult,
+)
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationResultCachePort,
+)
+
+logger = logging.getLogger(__name__)
+
+RESULT_KEY_PREFIX = "recommendation:result:"
+DATA_VERSION_KEY = "recommendation:data_version"
+METRICS_KEY = "recommendation:cache:metrics"
+DEFAULT_TTL_SEC = 60 * 60
+
+
+class RedisRecommendationResultCache(RecommendationResultCachePort):
+    """추천 결과를 Redis에 저장한다.
+
+    키에 데이터 버전이 포함되므로 버전을 올리면 이전 결과는 조회되지 않고 TTL로 정리된다.
+    Redis 장애 시에는 캐시 없이 계산하도록 예외를 삼킨다.
+    """
+
+    def __init__(self, redis_client, ttl_sec: int = DEFAULT_TTL_SEC):
+        self.redis = redis_client
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._stats = {"hit": 0, "miss": 0, "error": 0}
+
+    def data_version(self) -> int | None:
+        try:
+            value = self.redis.get(DATA_VERSION_KEY)
+        except RedisError as exc:
+            self._record("error")
+            logger.warning("추천 캐시 버전 조회 실패: %s", exc)
+            return None
+        return int(value) if value else 0
+
+    def invalidate(self) -> None:
+        try:
+            self.redis.incr(DATA_VERSION_KEY)
+        except RedisError as exc:
+            # 버전을 못 올리면 이전 결과가 TTL 동안 남을 수 있다.
+            logger.warning("추천 캐시 무효화 실패: %s", exc)
+
+    def get(self, key: str) -> RecommendStudentHouseResult | None:
+        try:
+            payload = self.redis.get(RESULT_KEY_PREFIX + key)
+        except RedisError as exc:
+            self._record("error")
+            logger.warning("추천 캐시 조회 실패: %s", exc)
+            return None
+        if payload is None:
+            self._record("miss")
+            return None
+        self._record("hit")
+        return RecommendStudentHouseResult(**json.loads(payload))
+
+    def put(self, key: str, result: RecommendStudentHouseResult) -> None:
+        try:
+            self.redis.set(
+                RESULT_KEY_PREFIX + key,
+                json.dumps(asdict(result), default=str),
+                ex=self.ttl_sec,
+            )
+        except RedisError as exc:
+            logger.warning("추천 캐시 저장 실패: %s", exc)
+
+    def stats(self) -> dict[str, float]:
+        """현재 프로세스의 hit/miss/error 수를 반환한다."""
+        with self._lock:
+            stats = dict(self._stats)
+        total = stats["hit"] + stats["miss"]
+        stats["hit_ratio"] = round(stats["hit"] / total, 4) if total else 0.0
+        return stats
+
+    def _record(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+        try:
+            # 프로세스 간 합산 지표는 Redis 해시에 누적한다.
+            self.redis.hincrby(METRICS_KEY, name, 1)
+        except RedisError:
+            pass
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from sqlalchemy.orm import Session
+
+from infrastructure.db.postgres import SessionLocal
+from infrastructure.db.session_helper import open_session
+from modules.house_platform.infrastructure.orm.house_platform_orm import (
+    HousePlatformORM,
+)
+from modules.house_platform.infrastructure.repository.house_platform_repository import (
+    HousePlatformRepository,
+)
+from modules.observations.adapter.output.repository.latest_observation_bulk_repository_impl import (
+    LatestObservationBulkRepository,
+)
+from modules.recommendations.application.dto.recommendation_context_dto import (
+    RecommendationContext,
+)
+from modules.recommendations.application.port_out.recommendation_context_port import (
+    RecommendationContextLoaderPort,
+)
+
+
+class RecommendationContextRepository(RecommendationContextLoaderPort):
+    """추천 컨텍스트를 ID 목록 기준 고정 횟수 쿼리로 조회한다."""
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or SessionLocal
+        self._observation_repo = LatestObservationBulkRepository(
+            self._session_factory
+        )
+
+    def load(self, house_platform_ids: Sequence[int]) -> RecommendationContext:
+        """매물/최신 feature·price·거리 관측치를 4회 쿼리로 조회한다."""
+        ids = list(dict.fromkeys(house_platform_ids))
+        if not ids:
+            return RecommendationContext()
+
+        session, generator = open_session(self._session_factory)
+        try:
+            houses = self._load_houses(session, ids)
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+        return RecommendationContext(
+            houses=houses,
+            feature_observations=self._observation_repo.fetch_latest_features(
+                ids
+            ),
+            price_observations=self._observation_repo.fetch_latest_prices(ids),
+            distance_observations=self._observation_repo.fetch_latest_distances(
+                ids
+            ),
+        )
+
+    def _load_houses(self, session: Session, ids: list[int]) -> dict:
+        rows = (
+            session.query(HousePlatformORM)
+            .filter(HousePlatformORM.house_platform_id.in_(ids))
+            .all()
+        )
+        return {
+            row.house_platform_id: HousePlatformRepository.to_domain(row)
+            for row in rows
+        }
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from infrastructure.db.session_helper import open_session
 from modules.send_message.application.port.output.send_message_repository import SendMessageRepository
 from modules.send_message.domain.send_message import SendMessage
 from modules.send_message.infrastructure.orm.send_message_orm import SendMessageORM
@@ -22,7 +22,7 @@ class SendMessageRepositoryImpl(SendMessageRepository):
         )
 
     def save(self, send_message: SendMessage) -> SendMessage:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             if send_message.send_message_id:
                 orm = db.query(SendMessageORM).filter(SendMessageORM.send_message_id == send_message.send_message_id).first()
@@ -49,28 +49,37 @@ class SendMessageRepositoryImpl(SendMessageRepository):
             db.refresh(orm)
             return self._to_domain(orm)
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     def find_by_id(self, send_message_id: int) -> Optional[SendMessage]:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             orm = db.query(SendMessageORM).filter(SendMessageORM.send_message_id == send_message_id).first()
             if orm:
                 return self._to_domain(orm)
             return None
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     def find_by_sender_id(self, sender_id: int) -> List[SendMessage]:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             orms = db.query(SendMessageORM).filter(SendMessageORM.sender_id == sender_id).all()
             return [self._to_domain(orm) for orm in orms]
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     def find_by_receiver_id(self, receiver_id: int) -> List[SendMessage]:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             orms = (
                 db.query(SendMessageORM)
@@ -80,10 +89,13 @@ class SendMessageRepositoryImpl(SendMessageRepository):
                 ).all())
             return [self._to_domain(orm) for orm in orms]
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     def find_by_house_and_request(self, house_platform_id: int, finder_request_id: int) -> Optional[SendMessage]:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             orm = db.query(SendMessageORM).filter(
                 SendMessageORM.house_platform_id == house_platform_id,
@@ -93,10 +105,13 @@ class SendMessageRepositoryImpl(SendMessageRepository):
                 return self._to_domain(orm)
             return None
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     def find_accepted_by_receiver_id(self, receiver_id: int) -> List[SendMessage]:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             orms = db.query(SendMessageORM).filter(
                 SendMessageORM.receiver_id == receiver_id,
@@ -104,5 +119,8 @@ class SendMessageRepositoryImpl(SendMessageRepository):
             ).all()
             return [self._to_domain(orm) for orm in orms]
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
@@ -0,0 +1,53 @@
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from infrastructure.db.postgres import SessionLocal, get_db_session
+from modules.finder_request.adapter.output.repository.finder_request_repository import (
+    FinderRequestRepository,
+)
+from modules.observations.adapter.output.repository.latest_observation_bulk_repository_impl import (
+    LatestObservationBulkRepository,
+)
+from modules.student_house_decision_policy.application.usecase.filter_candidate import (
+    FilterCandidateService,
+)
+from modules.student_house_decision_policy.application.usecase.policy_sandbox import (
+    ObservationSourceCache,
+    PolicySandboxService,
+)
+from modules.student_house_decision_policy.infrastructure.repository.house_platform_candidate_repository import (
+    HousePlatformCandidateRepository,
+)
+from modules.student_house_decision_policy.infrastructure.repository.observation_candidate_filter_repository import (
+    ObservationCandidateFilterRepository,
+)
+from modules.student_house_decision_policy.infrastructure.repository.student_house_score_repository import (
+    StudentHouseScoreRepository,
+)
+from modules.university.adapter.output.university_repository import (
+    UniversityRepository,
+)
+
+# 요청 간 관측치 캐시를 공유해 반복 실험 시 재조회를 줄인다.
+_sandbox_source_cache = ObservationSourceCache()
+
+
+def get_policy_sandbox_usecase(
+    db: Session = Depends(get_db_session),
+) -> PolicySandboxService:
+    university_repo = UniversityRepository(SessionLocal)
+    filter_usecase = FilterCandidateService(
+        finder_request_repo=FinderRequestRepository(db),
+        house_platform_repo=HousePlatformCandidateRepository(SessionLocal),
+        price_observation_repo=None,
+        distance_observation_repo=None,
+        university_repo=university_repo,
+        observation_filter=ObservationCandidateFilterRepository(SessionLocal),
+    )
+    return PolicySandboxService(
+        filter_usecase=filter_usecase,
+        observation_bulk_repo=LatestObservationBulkRepository(SessionLocal),
+        university_repo=university_repo,
+        score_repo=StudentHouseScoreRepository(SessionLocal),
+        source_cache=_sandbox_source_cache,
+    )
@@ -0,0 +1,29 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class PolicySandboxRequest(BaseModel):
+    """
+    대체 정책 재계산 API 요청 모델
+    - 지정하지 않은 항목은 현재 기본 정책 값을 사용한다.
+    """
+    finder_request_id: int = Field(..., description="요구서 ID", gt=0)
+    candidate_house_platform_ids: Optional[List[int]] = Field(
+        None, description="재계산할 후보 매물 ID (없으면 요구서 조건으로 선별)"
+    )
+    policy_version: Optional[str] = Field(None, description="실험 정책 버전 라벨")
+    weight_price: Optional[float] = Field(None, ge=0)
+    weight_risk: Optional[float] = Field(None, ge=0)
+    weight_option: Optional[float] = Field(None, ge=0)
+    weight_distance: Optional[float] = Field(None, ge=0)
+    threshold_base_total: Optional[float] = Field(None, ge=0, le=100)
+    top_k: Optional[int] = Field(None, gt=0, le=100)
+    price_feature_weights: Optional[List[float]] = Field(None, min_length=3, max_length=3)
+    option_feature_weights: Optional[List[float]] = Field(None, min_length=2, max_length=2)
+    risk_feature_weights: Optional[List[float]] = Field(None, min_length=3, max_length=3)
+    distance_feature_weights: Optional[List[float]] = Field(None, min_length=3, max_length=3)
+    zscore_min: Optional[float] = None
+    zscore_max: Optional[float] = None
+    distance_full_score_min: Optional[float] = Field(None, ge=0)
+    distance_zero_score_min: Optional[float] = Field(None, ge=0)
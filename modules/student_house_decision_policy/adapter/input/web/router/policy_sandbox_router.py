@@ -0,0 +1,57 @@
+from dataclasses import asdict, replace
+
+from fastapi import APIRouter, Depends
+
+from modules.student_house_decision_policy.adapter.input.web.dependencies import (
+    get_policy_sandbox_usecase,
+)
+from modules.student_house_decision_policy.adapter.input.web.request.policy_sandbox_request import (
+    PolicySandboxRequest,
+)
+from modules.student_house_decision_policy.application.dto.policy_sandbox_dto import (
+    PolicySandboxCommand,
+)
+from modules.student_house_decision_policy.application.usecase.policy_sandbox import (
+    PolicySandboxService,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+router = APIRouter(prefix="/decision_policy", tags=["Decision Policy"])
+
+_TUPLE_FIELDS = (
+    "price_feature_weights",
+    "option_feature_weights",
+    "risk_feature_weights",
+    "distance_feature_weights",
+)
+
+
+@router.post(
+    "/sandbox",
+    summary="대체 정책 재계산",
+    description="저장 없이 대체 가중치/임계값으로 후보를 재정렬하고 저장된 순위와 비교합니다.",
+)
+def run_policy_sandbox(
+    req: PolicySandboxRequest,
+    usecase: PolicySandboxService = Depends(get_policy_sandbox_usecase),
+):
+    overrides = req.model_dump(
+        exclude_none=True,
+        exclude={"finder_request_id", "candidate_house_platform_ids"},
+    )
+    for name in _TUPLE_FIELDS:
+        if name in overrides:
+            overrides[name] = tuple(overrides[name])
+    overrides.setdefault("policy_version", "sandbox")
+    policy = replace(DecisionPolicyConfig(), **overrides)
+
+    result = usecase.execute(
+        PolicySandboxCommand(
+            finder_request_id=req.finder_request_id,
+            policy=policy,
+            candidate_house_platform_ids=req.candidate_house_platform_ids,
+        )
+    )
+    return asdict(result)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
 
 from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
     DecisionPolicyConfig,
@@ -37,6 +40,77 @@ class ObservationScoreSource:
     distance_nonlinear_score: float
 
 
+@dataclass
+class ObservationScoreColumns:
+    """점수 일괄 계산용 열 단위 관측 지표(누락값은 NaN)."""
+
+    house_platform_ids: np.ndarray
+    snapshot_ids: list[str | None]
+    price_percentile: np.ndarray
+    price_zscore: np.ndarray
+    price_burden_nonlinear: np.ndarray
+    essential_option_coverage: np.ndarray
+    convenience_score: np.ndarray
+    risk_probability_est: np.ndarray
+    risk_severity_score: np.ndarray
+    risk_nonlinear_penalty: np.ndarray
+    distance_to_school_min: np.ndarray
+    distance_percentile: np.ndarray
+    distance_nonlinear_score: np.ndarray
+
+    @classmethod
+    def from_sources(
+        cls, sources: Sequence[ObservationScoreSource]
+    ) -> "ObservationScoreColumns":
+        """ObservationScoreSource 목록을 열 배열로 변환한다."""
+
+        def column(name: str) -> np.ndarray:
+            return np.array(
+                [
+                    np.nan if getattr(source, name) is None
+                    else float(getattr(source, name))
+                    for source in sources
+                ],
+                dtype=np.float64,
+            )
+
+        return cls(
+            house_platform_ids=np.array(
+                [source.house_platform_id for source in sources],
+                dtype=np.int64,
+            ),
+            snapshot_ids=[source.snapshot_id for source in sources],
+            price_percentile=column("price_percentile"),
+            price_zscore=column("price_zscore"),
+            price_burden_nonlinear=column("price_burden_nonlinear"),
+            essential_option_coverage=column("essential_option_coverage"),
+            convenience_score=column("convenience_score"),
+            risk_probability_est=column("risk_probability_est"),
+            risk_severity_score=column("risk_severity_score"),
+            risk_nonlinear_penalty=column("risk_nonlinear_penalty"),
+            distance_to_school_min=column("distance_to_school_min"),
+            distance_percentile=column("distance_percentile"),
+            distance_nonlinear_score=column("distance_nonlinear_score"),
+        )
+
+    def __len__(self) -> int:
+        return int(self.house_platform_ids.shape[0])
+
+
+@dataclass
+class DecisionScoreBatch:
+    """일괄 계산된 점수 열(누락된 세부 점수는 NaN)."""
+
+    house_platform_ids: np.ndarray
+    snapshot_ids: list[str | None]
+    price_score: np.ndarray
+    option_score: np.ndarray
+    risk_score: np.ndarray
+    distance_score: np.ndarray
+    base_total_score: np.ndarray
+    is_student_recommended: np.ndarray
+
+
 @dataclass
 class StudentHouseScoreRecord:
     """student_house 테이블에 저장할 점수 레코드."""
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+
+@dataclass
+class PolicySandboxCommand:
+    """대체 정책 재계산 요청."""
+
+    finder_request_id: int
+    policy: DecisionPolicyConfig
+    candidate_house_platform_ids: Sequence[int] | None = None
+
+
+@dataclass
+class PolicySandboxItem:
+    """대체 정책으로 재계산한 후보 한 건."""
+
+    house_platform_id: int
+    rank: int
+    decision_status: str
+    base_total_score: float
+    price_score: float | None
+    option_score: float | None
+    risk_score: float | None
+    distance_score: float | None
+    stored_decision_status: str
+    stored_rank: int | None
+    stored_base_total_score: float
+
+
+@dataclass
+class PolicySandboxRankChange:
+    """저장된 순위 대비 변동."""
+
+    house_platform_id: int
+    stored_rank: int | None
+    sandbox_rank: int | None
+    stored_base_total_score: float
+    sandbox_base_total_score: float
+
+
+@dataclass
+class PolicySandboxDiff:
+    """저장된 추천 순위와 대체 정책 순위의 차이."""
+
+    newly_recommended: list[int] = field(default_factory=list)
+    newly_rejected: list[int] = field(default_factory=list)
+    rank_changes: list[PolicySandboxRankChange] = field(default_factory=list)
+
+
+@dataclass
+class PolicySandboxResult:
+    """대체 정책 재계산 결과(저장하지 않음)."""
+
+    finder_request_id: int
+    policy_version: str
+    baseline_policy_version: str
+    total_candidates: int
+    scored_candidates: int
+    missing_observation_ids: list[int]
+    recommended_top_k: list[PolicySandboxItem]
+    rejected_top_k: list[PolicySandboxItem]
+    diff: PolicySandboxDiff
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
+import math
+from typing import Sequence
+
+import numpy as np
+
 from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    DecisionScoreBatch,
+    ObservationScoreColumns,
     ObservationScoreSource,
     StudentHouseScoreRecord,
 )
@@ -66,6 +73,148 @@ class DecisionScoreCalculator:
             policy_version=policy_version,
         )
 
+    def calculate_many(
+        self,
+        sources: Sequence[ObservationScoreSource],
+        observation_version: str,
+        policy_version: str,
+    ) -> list[StudentHouseScoreRecord]:
+        """관측치 목록을 일괄 계산해 calculate와 같은 레코드로 반환한다."""
+        if not sources:
+            return []
+        batch = self.calculate_batch(
+            ObservationScoreColumns.from_sources(sources)
+        )
+        return [
+            StudentHouseScoreRecord(
+                house_platform_id=int(batch.house_platform_ids[index]),
+                snapshot_id=batch.snapshot_ids[index],
+                price_score=_to_optional_float(batch.price_score[index]),
+                option_score=_to_optional_float(batch.option_score[index]),
+                risk_score=_to_optional_float(batch.risk_score[index]),
+                distance_score=_to_optional_float(
+                    batch.distance_score[index]
+                ),
+                base_total_score=float(batch.base_total_score[index]),
+                is_student_recommended=bool(
+                    batch.is_student_recommended[index]
+                ),
+                observation_version=observation_version,
+                policy_version=policy_version,
+            )
+            for index in range(len(sources))
+        ]
+
+    def calculate_batch(
+        self, columns: ObservationScoreColumns
+    ) -> DecisionScoreBatch:
+        """열 단위 관측치를 벡터 연산으로 점수화한다.
+
+        연산 순서와 반올림/클램프는 calculate와 동일하게 맞춘다.
+        """
+        policy = self.policy
+
+        price_score = _weighted_average_batch(
+            (
+                (
+                    (1.0 - np.clip(columns.price_percentile, 0.0, 1.0))
+                    * 100.0,
+                    self._price_weights[0],
+                ),
+                (
+                    _zscore_to_score_batch(
+                        columns.price_zscore,
+                        policy.zscore_min,
+                        policy.zscore_max,
+                    ),
+                    self._price_weights[1],
+                ),
+                (
+                    (1.0 - np.clip(columns.price_burden_nonlinear, 0.0, 1.0))
+                    * 100.0,
+                    self._price_weights[2],
+                ),
+            )
+        )
+        option_score = _weighted_average_batch(
+            (
+                (
+                    _ratio_to_score_batch(columns.essential_option_coverage),
+                    self._option_weights[0],
+                ),
+                (
+                    _ratio_to_score_batch(columns.convenience_score),
+                    self._option_weights[1],
+                ),
+            )
+        )
+        risk_score = _weighted_average_batch(
+            (
+                (
+                    (1.0 - np.clip(columns.risk_probability_est, 0.0, 1.0))
+                    * 100.0,
+                    self._risk_weights[0],
+                ),
+                (
+                    (1.0 - np.clip(columns.risk_severity_score, 0.0, 1.0))
+                    * 100.0,
+                    self._risk_weights[1],
+                ),
+                (
+                    (1.0 - np.clip(columns.risk_nonlinear_penalty, 0.0, 1.0))
+                    * 100.0,
+                    self._risk_weights[2],
+                ),
+            )
+        )
+        # 단건 계산은 거리 백분위/비선형 점수 누락을 0으로 본다.
+        distance_percentile = np.nan_to_num(
+            columns.distance_percentile, nan=0.0
+        )
+        distance_nonlinear = np.nan_to_num(
+            _ratio_to_score_batch(columns.distance_nonlinear_score), nan=0.0
+        )
+        distance_score = _weighted_average_batch(
+            (
+                (
+                    _distance_time_to_score_batch(
+                        columns.distance_to_school_min,
+                        policy.distance_full_score_min,
+                        policy.distance_zero_score_min,
+                    ),
+                    self._distance_weights[0],
+                ),
+                (
+                    (1.0 - np.clip(distance_percentile, 0.0, 1.0)) * 100.0,
+                    self._distance_weights[1],
+                ),
+                (distance_nonlinear, self._distance_weights[2]),
+            )
+        )
+
+        total = _weighted_average_batch(
+            (
+                (price_score, self._total_weights[0]),
+                (risk_score, self._total_weights[1]),
+                (option_score, self._total_weights[2]),
+                (distance_score, self._total_weights[3]),
+            )
+        )
+        base_total_score = np.where(np.isnan(total), 0.0, total)
+
+        return DecisionScoreBatch(
+            house_platform_ids=columns.house_platform_ids,
+            snapshot_ids=columns.snapshot_ids,
+            price_score=price_score,
+            option_score=option_score,
+            risk_score=risk_score,
+            distance_score=distance_score,
+            base_total_score=base_total_score,
+            is_student_recommended=(
+                base_total_score >= policy.threshold_base_total
+            ),
+        )
+
     def _calculate_price_score(
         self, source: ObservationScoreSource
     ) -> float | None:
@@ -264,3 +413,72 @@ def _clamp_score(value: float | None) -> float:
     if value is None:
         return 0.0
     return max(0.0, min(100.0, round(float(value), 1)))
+
+
+def _to_optional_float(value) -> float | None:
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def _round1_batch(values: np.ndarray) -> np.ndarray:
+    """파이썬 round(value, 1)과 같은 결과를 벡터 연산으로 만든다."""
+    scaled = values * 10.0
+    rounded = np.round(scaled) / 10.0
+    # x*10 연산 오차로 .5 경계 근처는 결과가 달라질 수 있어 단건 round로 보정한다.
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for index in np.flatnonzero(near_tie):
+        rounded[index] = round(float(values[index]), 1)
+    return rounded
+
+
+def _clamp_score_batch(values: np.ndarray) -> np.ndarray:
+    return np.clip(_round1_batch(values), 0.0, 100.0)
+
+
+def _ratio_to_score_batch(values: np.ndarray) -> np.ndarray:
+    """0~1 비율 열을 0~100 점수 열로 변환한다(NaN 유지)."""
+    normalized = np.where(values > 1.0, values / 100.0, values)
+    return _clamp_score_batch(normalized * 100.0)
+
+
+def _zscore_to_score_batch(
+    zscores: np.ndarray, min_z: float, max_z: float
+) -> np.ndarray:
+    """zscore 열을 0~100 점수 열로 변환한다(NaN 유지)."""
+    if min_z >= max_z:
+        return np.where(np.isnan(zscores), np.nan, 50.0)
+    clamped = np.clip(zscores, min_z, max_z)
+    return _clamp_score_batch((max_z - clamped) / (max_z - min_z) * 100.0)
+
+
+def _distance_time_to_score_batch(
+    distance_min: np.ndarray,
+    full_score_min: float,
+    zero_score_min: float,
+) -> np.ndarray:
+    """도보 시간 열을 점수 열로 변환한다(NaN은 누락으로 유지)."""
+    ratio = (distance_min - full_score_min) / max(
+        zero_score_min - full_score_min, 1.0
+    )
+    scores = _clamp_score_batch(100.0 - (ratio * 100.0))
+    scores = np.where(distance_min >= zero_score_min, 0.0, scores)
+    return np.where(distance_min <= full_score_min, 100.0, scores)
+
+
+def _weighted_average_batch(
+    items: tuple[tuple[np.ndarray, float], ...]
+) -> np.ndarray:
+    """NaN 항목은 제외하고 가중 평균 열을 계산한다.
+
+    누락 항목에는 0을 더해 단건 계산과 같은 합산 순서를 유지한다.
+    """
+    total = np.zeros_like(items[0][0], dtype=np.float64)
+    total_weight = np.zeros_like(total)
+    for values, weight in items:
+        present = ~np.isnan(values)
+        total = total + np.where(present, values * weight, 0.0)
+        total_weight = total_weight + np.where(present, weight, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        averaged = total / total_weight
+    averaged = np.where(total_weight > 0, averaged, np.nan)
+    return _clamp_score_batch(averaged)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from modules.observations.domain.model.distance_feature_observation import (
+    DistanceFeatureObservation,
+)
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    ObservationScoreSource,
+)
+
+
+def build_observation_score_source(
+    house_platform_id: int,
+    snapshot_id: str | None,
+    feature,
+    price,
+    distances: list[DistanceFeatureObservation],
+    unique_university_ids: set[int],
+    expected_observation_version: str | None,
+) -> ObservationScoreSource:
+    """조회된 feature/price/거리 관측치로 점수 산출용 관측치를 만든다."""
+    observation_version = expected_observation_version
+    if feature:
+        snapshot_id = feature.snapshot_id
+        observation_version = feature.메타데이터.관측치_버전
+        if (
+            expected_observation_version
+            and feature.메타데이터.관측치_버전
+            != expected_observation_version
+        ):
+            raise ValueError("관측 버전이 일치하지 않습니다.")
+    else:
+        # TODO: feature 관측치가 없을 때 snapshot/버전 정책을 확정한다.
+        observation_version = expected_observation_version
+
+    if not price:
+        raise ValueError("price 관측치가 존재하지 않습니다.")
+
+    if unique_university_ids:
+        distances = [
+            item
+            for item in distances
+            if item.university_id in unique_university_ids
+        ]
+    if not distances:
+        raise ValueError("distance 관측치가 존재하지 않습니다.")
+
+    distance_summary = _average_distance(distances)
+    # TODO: 코호트/대표 대학 정책이 확정되면 평균 산정 대신 정책 기반 대표값을 사용한다.
+
+    return ObservationScoreSource(
+        house_platform_id=house_platform_id,
+        snapshot_id=snapshot_id,
+        observation_version=observation_version,
+        price_percentile=price.가격_백분위,
+        price_zscore=price.가격_z점수,
+        price_burden_nonlinear=price.가격_부담_비선형,
+        estimated_move_in_cost=int(price.예상_입주비용),
+        monthly_cost_est=int(price.월_비용_추정),
+        essential_option_coverage=(
+            feature.편의_관측치.필수_옵션_커버리지
+            if feature
+            else None
+        ),
+        convenience_score=feature.편의_관측치.편의_점수 if feature else None,
+        risk_probability_est=(
+            feature.위험_관측치.위험_확률_추정 if feature else None
+        ),
+        risk_severity_score=(
+            feature.위험_관측치.위험_심각도_점수 if feature else None
+        ),
+        risk_nonlinear_penalty=(
+            feature.위험_관측치.위험_비선형_패널티 if feature else None
+        ),
+        distance_to_school_min=distance_summary[0],
+        distance_percentile=distance_summary[1],
+        distance_nonlinear_score=distance_summary[2],
+    )
+
+
+def _average_distance(
+    distances: list[DistanceFeatureObservation],
+) -> tuple[float, float, float]:
+    """거리 관측치를 평균으로 요약한다."""
+    count = max(len(distances), 1)
+    minutes = sum(item.학교까지_분 for item in distances) / count
+    percentile = sum(item.거리_백분위 for item in distances) / count
+    nonlinear = sum(item.거리_비선형_점수 for item in distances) / count
+    return float(minutes), float(percentile), float(nonlinear)
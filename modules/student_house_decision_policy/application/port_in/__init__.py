@@ -1,8 +1,15 @@
 from modules.student_house_decision_policy.application.port_in.filter_candidate_port import (
     FilterCandidatePort,
 )
+from modules.student_house_decision_policy.application.port_in.policy_sandbox_port import (
+    PolicySandboxPort,
+)
 from modules.student_house_decision_policy.application.port_in.refresh_student_house_score_port import (
     RefreshStudentHouseScorePort,
 )
 
-__all__ = ["FilterCandidatePort", "RefreshStudentHouseScorePort"]
+__all__ = [
+    "FilterCandidatePort",
+    "PolicySandboxPort",
+    "RefreshStudentHouseScorePort",
+]
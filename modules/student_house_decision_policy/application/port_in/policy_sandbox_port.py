@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from modules.student_house_decision_policy.application.dto.policy_sandbox_dto import (
+    PolicySandboxCommand,
+    PolicySandboxResult,
+)
+
+
+class PolicySandboxPort(ABC):
+    """대체 정책 재계산 입력 포트."""
+
+    @abstractmethod
+    def execute(self, command: PolicySandboxCommand) -> PolicySandboxResult:
+        """저장 없이 대체 정책으로 후보를 재정렬한다."""
+        raise NotImplementedError
@@ -1,3 +1,6 @@
+from modules.student_house_decision_policy.application.port_out.observation_candidate_filter_port import (
+    ObservationCandidateFilterPort,
+)
 from modules.student_house_decision_policy.application.port_out.observation_score_port import (
     ObservationScoreReadPort,
 )
@@ -5,4 +8,8 @@ from modules.student_house_decision_policy.application.port_out.student_house_sc
     StudentHouseScorePort,
 )
 
-__all__ = ["ObservationScoreReadPort", "StudentHouseScorePort"]
+__all__ = [
+    "ObservationCandidateFilterPort",
+    "ObservationScoreReadPort",
+    "StudentHouseScorePort",
+]
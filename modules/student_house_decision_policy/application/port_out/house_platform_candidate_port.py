@@ -18,3 +18,13 @@ class HousePlatformCandidateReadPort(ABC):
     ) -> Sequence[FilterCandidate]:
         """조건에 맞는 후보를 조회한다."""
         raise NotImplementedError
+
+    @abstractmethod
+    def fetch_candidate_page(
+        self,
+        criteria: FilterCandidateCriteria,
+        after_house_platform_id: int | None,
+        limit: int,
+    ) -> Sequence[FilterCandidate]:
+        """house_platform_id 오름차순 키셋 페이지 단위로 후보를 조회한다."""
+        raise NotImplementedError
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+
+class ObservationCandidateFilterPort(ABC):
+    """관측치 기반 후보 일괄 필터 Port."""
+
+    @abstractmethod
+    def filter_house_platform_ids(
+        self,
+        house_platform_ids: Sequence[int],
+        max_deposit_limit: int | None,
+        max_rent_limit: int | None,
+        university_location_id: int | None = None,
+        max_commute_minutes: float | None = None,
+    ) -> set[int]:
+        """가격/통학 관측 조건을 통과한 매물 ID만 조회한다."""
+        raise NotImplementedError
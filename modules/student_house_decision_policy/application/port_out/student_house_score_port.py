@@ -23,6 +23,16 @@ class StudentHouseScorePort(ABC):
         """점수 계산 실패 상태를 기록한다."""
         raise NotImplementedError
 
+    @abstractmethod
+    def upsert_scores(self, scores: Sequence[StudentHouseScoreRecord]) -> int:
+        """점수 레코드 묶음을 한 번에 업서트한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_failed_bulk(self, failures: Sequence[tuple[int, str]]) -> None:
+        """(house_platform_id, 사유) 묶음의 실패 상태를 한 번에 기록한다."""
+        raise NotImplementedError
+
     @abstractmethod
     def fetch_top_k(
         self, query: StudentHouseScoreQuery
@@ -1,8 +1,15 @@
 from modules.student_house_decision_policy.application.usecase.filter_candidate import (
     FilterCandidateService,
 )
+from modules.student_house_decision_policy.application.usecase.policy_sandbox import (
+    PolicySandboxService,
+)
 from modules.student_house_decision_policy.application.usecase.refresh_student_house_score import (
     RefreshStudentHouseScoreService,
 )
 
-__all__ = ["FilterCandidateService", "RefreshStudentHouseScoreService"]
+__all__ = [
+    "FilterCandidateService",
+    "PolicySandboxService",
+    "RefreshStudentHouseScoreService",
+]
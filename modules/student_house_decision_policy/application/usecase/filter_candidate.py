@@ -22,6 +22,9 @@ from modules.student_house_decision_policy.application.port_in.filter_candidate_
 from modules.student_house_decision_policy.application.port_out.house_platform_candidate_port import (
     HousePlatformCandidateReadPort,
 )
+from modules.student_house_decision_policy.application.port_out.observation_candidate_filter_port import (
+    ObservationCandidateFilterPort,
+)
 from modules.student_house_decision_policy.domain.value_object.budget_filter_policy import (
     BudgetFilterPolicy,
 )
@@ -34,6 +37,8 @@ class FilterCandidateService(FilterCandidatePort):
     """finder_request 조건으로 후보 매물을 선별한다.
 
     여유율 변경은 BudgetFilterPolicy 주입으로 조정한다.
+    observation_filter를 주입하면 관측치 조건을 후보 건별 조회 대신
+    일괄 쿼리 한 번으로 적용한다.
     """
 
     def __init__(
@@ -44,6 +49,7 @@ class FilterCandidateService(FilterCandidatePort):
         distance_observation_repo: DistanceObservationRepositoryPort,
         university_repo: UniversityRepositoryPort,
         policy: BudgetFilterPolicy | None = None,
+        observation_filter: ObservationCandidateFilterPort | None = None,
     ):
         self.finder_request_repo = finder_request_repo
         self.house_platform_repo = house_platform_repo
@@ -51,6 +57,7 @@ class FilterCandidateService(FilterCandidatePort):
         self.distance_observation_repo = distance_observation_repo
         self.university_repo = university_repo
         self.policy = policy or BudgetFilterPolicy()
+        self.observation_filter = observation_filter
 
     def execute(self, command: FilterCandidateCommand) -> FilterCandidateResult:
         """finder_request 기준으로 후보를 조회한다."""
@@ -93,9 +100,14 @@ class FilterCandidateService(FilterCandidatePort):
             )
 
         candidates = self._fetch_candidates(criteria)
-        candidates = self._filter_by_price_observations(criteria, candidates)
-        candidates = self._filter_by_distance_observation(criteria, candidates)
-        
+        if self.observation_filter:
+            candidates = self._filter_by_observations_bulk(criteria, candidates)
+        else:
+            candidates = self._filter_by_price_observations(criteria, candidates)
+            candidates = self._filter_by_distance_observation(
+                criteria, candidates
+            )
+
         # TODO: 리스크 허용 조건이 준비되면 후보를 추가 필터링한다.
         # TODO: additional_condition 파싱 규칙이 확정되면 필터 조건에 반영한다.
 
@@ -115,6 +127,35 @@ class FilterCandidateService(FilterCandidatePort):
             return []
         return list(self.house_platform_repo.fetch_candidates(criteria))
 
+    def _filter_by_observations_bulk(
+        self,
+        criteria: FilterCandidateCriteria,
+        candidates: list,
+    ) -> list:
+        """가격/통학 관측 조건을 일괄 쿼리로 적용한다."""
+        if not candidates:
+            return []
+
+        university_id = None
+        if criteria.university_name and criteria.is_near:
+            # 대학을 찾지 못하면 건별 필터와 동일하게 거리 조건을 생략한다.
+            university_id = self._resolve_university_id(
+                criteria.university_name
+            )
+
+        passed_ids = self.observation_filter.filter_house_platform_ids(
+            [candidate.house_platform_id for candidate in candidates],
+            max_deposit_limit=criteria.max_deposit_limit,
+            max_rent_limit=criteria.max_rent_limit,
+            university_location_id=university_id,
+            max_commute_minutes=self.policy.near_commute_minutes,
+        )
+        return [
+            candidate
+            for candidate in candidates
+            if candidate.house_platform_id in passed_ids
+        ]
+
     def _filter_by_price_observations(
         self,
         criteria: FilterCandidateCriteria,
@@ -176,7 +217,7 @@ class FilterCandidateService(FilterCandidatePort):
                 continue
 
             # 통학 거리 30분 이내 (임시 기준) 필터링
-            if matched_distance.학교까지_분 <= 30.0:
+            if matched_distance.학교까지_분 <= self.policy.near_commute_minutes:
                 filtered.append(candidate)
         
         return filtered
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Sequence
+
+from modules.observations.application.port.latest_observation_bulk_read_port import (
+    LatestObservationBulkReadPort,
+)
+from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    FilterCandidateCommand,
+)
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    ObservationScoreColumns,
+    ObservationScoreSource,
+)
+from modules.student_house_decision_policy.application.dto.policy_sandbox_dto import (
+    PolicySandboxCommand,
+    PolicySandboxDiff,
+    PolicySandboxItem,
+    PolicySandboxRankChange,
+    PolicySandboxResult,
+)
+from modules.student_house_decision_policy.application.factory.decision_score_calculator import (
+    DecisionScoreCalculator,
+)
+from modules.student_house_decision_policy.application.factory.observation_score_source_factory import (
+    build_observation_score_source,
+)
+from modules.student_house_decision_policy.application.port_in.filter_candidate_port import (
+    FilterCandidatePort,
+)
+from modules.student_house_decision_policy.application.port_in.policy_sandbox_port import (
+    PolicySandboxPort,
+)
+from modules.student_house_decision_policy.application.port_out.student_house_score_port import (
+    StudentHouseScorePort,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+from modules.university.application.port.university_repository_port import (
+    UniversityRepositoryPort,
+)
+
+RECOMMENDED = "RECOMMENDED"
+REJECTED = "REJECTED"
+MAX_CACHED_SOURCES = 50000
+
+
+class ObservationSourceCache:
+    """매물별 점수 산출용 관측치 캐시.
+
+    요청 스레드 간에 공유되므로 조회/저장/정리를 모두 잠금 안에서 수행한다.
+    """
+
+    def __init__(self, max_size: int = MAX_CACHED_SOURCES):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # house_platform_id -> (적재 시각, 점수 산출용 관측치 | None)
+        self._items: dict[int, tuple[float, ObservationScoreSource | None]] = {}
+
+    def get(
+        self, house_platform_id: int, now: float, ttl_sec: float
+    ) -> tuple[bool, ObservationScoreSource | None]:
+        """만료되지 않은 항목이 있으면 (True, 관측치)를 반환한다."""
+        with self._lock:
+            cached = self._items.get(house_platform_id)
+        if cached and now - cached[0] < ttl_sec:
+            return True, cached[1]
+        return False, None
+
+    def put_many(
+        self,
+        sources: dict[int, ObservationScoreSource | None],
+        now: float,
+        ttl_sec: float,
+    ) -> None:
+        """가득 찼으면 만료 항목을 정리한 뒤 저장한다."""
+        with self._lock:
+            self._evict_expired(now, ttl_sec)
+            for house_platform_id, source in sources.items():
+                self._items[house_platform_id] = (now, source)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def _evict_expired(self, now: float, ttl_sec: float) -> None:
+        if len(self._items) < self.max_size:
+            return
+        expired = [
+            house_id
+            for house_id, (loaded_at, _) in self._items.items()
+            if now - loaded_at >= ttl_sec
+        ]
+        for house_id in expired:
+            self._items.pop(house_id, None)
+        if len(self._items) >= self.max_size:
+            self._items.clear()
+
+
+class PolicySandboxService(PolicySandboxPort):
+    """대체 정책으로 후보 점수를 메모리에서 재계산하고 저장 순위와 비교한다.
+
+    관측치는 매물 단위로 캐시해 같은 후보군 실험을 반복할 때 재조회하지 않는다.
+    student_house 테이블에는 아무것도 쓰지 않는다.
+    """
+
+    def __init__(
+        self,
+        filter_usecase: FilterCandidatePort,
+        observation_bulk_repo: LatestObservationBulkReadPort,
+        university_repo: UniversityRepositoryPort,
+        score_repo: StudentHouseScorePort,
+        baseline_policy: DecisionPolicyConfig | None = None,
+        cache_ttl_sec: float = 300.0,
+        source_cache: ObservationSourceCache | None = None,
+    ):
+        self.filter_usecase = filter_usecase
+        self.observation_bulk_repo = observation_bulk_repo
+        self.university_repo = university_repo
+        self.score_repo = score_repo
+        self.baseline_policy = baseline_policy or DecisionPolicyConfig()
+        self.cache_ttl_sec = cache_ttl_sec
+        # 요청마다 서비스를 조립하는 경우 외부에서 캐시를 공유해 주입한다.
+        self._source_cache = (
+            source_cache if source_cache is not None else ObservationSourceCache()
+        )
+
+    def execute(self, command: PolicySandboxCommand) -> PolicySandboxResult:
+        """저장 없이 대체 정책으로 후보를 재정렬한다."""
+        policy = command.policy
+        baseline = self.baseline_policy
+
+        candidates = command.candidate_house_platform_ids
+        if candidates is None:
+            filter_result = self.filter_usecase.execute(
+                FilterCandidateCommand(
+                    finder_request_id=command.finder_request_id
+                )
+            )
+            candidates = [
+                candidate.house_platform_id
+                for candidate in filter_result.candidates
+            ]
+        candidates = list(dict.fromkeys(candidates))
+
+        sources = self._load_sources(candidates)
+        scored = [sources[house_id] for house_id in candidates if sources.get(house_id)]
+        missing = [house_id for house_id in candidates if not sources.get(house_id)]
+
+        batch = DecisionScoreCalculator(policy).calculate_batch(
+            ObservationScoreColumns.from_sources(scored)
+        )
+        sandbox_scores = {
+            int(house_id): index
+            for index, house_id in enumerate(batch.house_platform_ids)
+        }
+
+        stored_scores = {
+            score.house_platform_id: score
+            for score in self.score_repo.fetch_by_house_platform_ids(
+                candidates, policy_version=baseline.policy_version
+            )
+        }
+        stored_totals = {
+            house_id: (
+                float(stored_scores[house_id].base_total_score)
+                if house_id in stored_scores
+                else 0.0
+            )
+            for house_id in candidates
+        }
+        sandbox_totals = {
+            house_id: (
+                float(batch.base_total_score[sandbox_scores[house_id]])
+                if house_id in sandbox_scores
+                else 0.0
+            )
+            for house_id in candidates
+        }
+
+        stored_recommended, stored_rejected = _rank(
+            candidates, stored_totals, baseline
+        )
+        sandbox_recommended, sandbox_rejected = _rank(
+            candidates, sandbox_totals, policy
+        )
+        stored_positions = _positions(stored_recommended, stored_rejected)
+
+        def to_item(house_id: int, rank: int, status: str) -> PolicySandboxItem:
+            index = sandbox_scores.get(house_id)
+            stored_status, stored_rank = stored_positions[house_id]
+            return PolicySandboxItem(
+                house_platform_id=house_id,
+                rank=rank,
+                decision_status=status,
+                base_total_score=sandbox_totals[house_id],
+                price_score=_score_at(batch.price_score, index),
+                option_score=_score_at(batch.option_score, index),
+                risk_score=_score_at(batch.risk_score, index),
+                distance_score=_score_at(batch.distance_score, index),
+                stored_decision_status=stored_status,
+                stored_rank=stored_rank,
+                stored_base_total_score=stored_totals[house_id],
+            )
+
+        return PolicySandboxResult(
+            finder_request_id=command.finder_request_id,
+            policy_version=policy.policy_version,
+            baseline_policy_version=baseline.policy_version,
+            total_candidates=len(candidates),
+            scored_candidates=len(scored),
+            missing_observation_ids=missing,
+            recommended_top_k=[
+                to_item(house_id, rank, RECOMMENDED)
+                for rank, house_id in enumerate(
+                    sandbox_recommended[: policy.top_k], start=1
+                )
+            ],
+            rejected_top_k=[
+                to_item(house_id, rank, REJECTED)
+                for rank, house_id in enumerate(
+                    sandbox_rejected[: policy.top_k], start=1
+                )
+            ],
+            diff=_build_diff(
+                stored_recommended[: baseline.top_k],
+                sandbox_recommended[: policy.top_k],
+                stored_totals,
+                sandbox_totals,
+            ),
+        )
+
+    def _load_sources(
+        self, house_platform_ids: Sequence[int]
+    ) -> dict[int, ObservationScoreSource | None]:
+        """캐시에 없거나 만료된 매물만 관측치를 일괄 조회한다."""
+        now = time.monotonic()
+        sources: dict[int, ObservationScoreSource | None] = {}
+        stale: list[int] = []
+        for house_id in house_platform_ids:
+            hit, source = self._source_cache.get(house_id, now, self.cache_ttl_sec)
+            if hit:
+                sources[house_id] = source
+            else:
+                stale.append(house_id)
+        if not stale:
+            return sources
+
+        unique_university_ids = set(
+            self.university_repo.get_unique_university_locations()
+        )
+        features = self.observation_bulk_repo.fetch_latest_features(stale)
+        prices = self.observation_bulk_repo.fetch_latest_prices(stale)
+        distances = self.observation_bulk_repo.fetch_latest_distances(stale)
+        loaded: dict[int, ObservationScoreSource | None] = {}
+        for house_id in stale:
+            try:
+                source = build_observation_score_source(
+                    house_id,
+                    None,
+                    features.get(house_id),
+                    prices.get(house_id),
+                    distances.get(house_id, []),
+                    unique_university_ids,
+                    None,
+                )
+            except ValueError:
+                # 관측치가 부족한 매물은 재계산 대상에서 제외한다.
+                source = None
+            loaded[house_id] = source
+        self._source_cache.put_many(loaded, now, self.cache_ttl_sec)
+        sources.update(loaded)
+        return sources
+
+
+def _rank(
+    candidates: list[int],
+    totals: dict[int, float],
+    policy: DecisionPolicyConfig,
+) -> tuple[list[int], list[int]]:
+    """추천 유스케이스와 같은 기준으로 추천/제외 목록을 정렬한다."""
+    recommended = [
+        house_id
+        for house_id in candidates
+        if totals[house_id] >= policy.threshold_base_total
+    ]
+    rejected = [
+        house_id
+        for house_id in candidates
+        if totals[house_id] < policy.threshold_base_total
+    ]
+    recommended.sort(key=lambda house_id: totals[house_id], reverse=True)
+    rejected.sort(key=lambda house_id: totals[house_id], reverse=True)
+    return recommended, rejected
+
+
+def _positions(
+    recommended: list[int], rejected: list[int]
+) -> dict[int, tuple[str, int]]:
+    positions = {
+        house_id: (RECOMMENDED, rank)
+        for rank, house_id in enumerate(recommended, start=1)
+    }
+    positions.update(
+        {
+            house_id: (REJECTED, rank)
+            for rank, house_id in enumerate(rejected, start=1)
+        }
+    )
+    return positions
+
+
+def _build_diff(
+    stored_top: list[int],
+    sandbox_top: list[int],
+    stored_totals: dict[int, float],
+    sandbox_totals: dict[int, float],
+) -> PolicySandboxDiff:
+    """추천 top-k 기준으로 진입/이탈/순위 변동을 계산한다."""
+    stored_ranks = {house_id: rank for rank, house_id in enumerate(stored_top, start=1)}
+    sandbox_ranks = {house_id: rank for rank, house_id in enumerate(sandbox_top, start=1)}
+    rank_changes = [
+        PolicySandboxRankChange(
+            house_platform_id=house_id,
+            stored_rank=stored_ranks.get(house_id),
+            sandbox_rank=sandbox_ranks.get(house_id),
+            stored_base_total_score=stored_totals[house_id],
+            sandbox_base_total_score=sandbox_totals[house_id],
+        )
+        for house_id in dict.fromkeys(sandbox_top + stored_top)
+        if stored_ranks.get(house_id) != sandbox_ranks.get(house_id)
+    ]
+    return PolicySandboxDiff(
+        newly_recommended=[
+            house_id for house_id in sandbox_top if house_id not in stored_ranks
+        ],
+        newly_rejected=[
+            house_id for house_id in stored_top if house_id not in sandbox_ranks
+        ],
+        rank_changes=rank_changes,
+    )
+
+
+def _score_at(values, index: int | None) -> float | None:
+    if index is None:
+        return None
+    value = float(values[index])
+    return None if value != value else value
@@ -10,6 +10,9 @@ from modules.student_house_decision_policy.application.dto.decision_score_dto im
 from modules.student_house_decision_policy.application.factory.decision_score_calculator import (
     DecisionScoreCalculator,
 )
+from modules.student_house_decision_policy.application.factory.observation_score_source_factory import (
+    build_observation_score_source,
+)
 from modules.student_house_decision_policy.application.port_in.refresh_student_house_score_port import (
     RefreshStudentHouseScorePort,
 )
@@ -34,16 +37,26 @@ from modules.observations.application.port.price_observation_repository_port imp
 from modules.observations.application.port.distance_observation_repository_port import (
     DistanceObservationRepositoryPort,
 )
+from modules.observations.application.port.latest_observation_bulk_read_port import (
+    LatestObservationBulkReadPort,
+)
 from modules.university.application.port.university_repository_port import (
     UniversityRepositoryPort,
 )
-from modules.observations.domain.model.distance_feature_observation import (
-    DistanceFeatureObservation,
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationCacheInvalidationPort,
 )
 
 
+DEFAULT_CHUNK_SIZE = 500
+
+
 class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
-    """관측 버전에 맞춰 student_house 점수를 갱신한다."""
+    """관측 버전에 맞춰 student_house 점수를 갱신한다.
+
+    observation_bulk_repo를 주입하면 후보를 청크 단위로 스트리밍하고,
+    청크마다 관측치를 일괄 조회한 뒤 점수를 한 번에 업서트한다.
+    """
 
     def __init__(
         self,
@@ -54,6 +67,9 @@ class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
         university_repo: UniversityRepositoryPort,
         student_house_repo: StudentHouseScorePort,
         policy: DecisionPolicyConfig | None = None,
+        observation_bulk_repo: LatestObservationBulkReadPort | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        cache_invalidator: RecommendationCacheInvalidationPort | None = None,
     ):
         self.house_platform_repo = house_platform_repo
         self.feature_observation_repo = feature_observation_repo
@@ -62,9 +78,22 @@ class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
         self.university_repo = university_repo
         self.student_house_repo = student_house_repo
         self.policy = policy or DecisionPolicyConfig()
+        self.observation_bulk_repo = observation_bulk_repo
+        self.chunk_size = max(int(chunk_size), 1)
+        self.cache_invalidator = cache_invalidator
 
     def execute(
         self, command: RefreshStudentHouseScoreCommand
+    ) -> RefreshStudentHouseScoreResult:
+        try:
+            return self._refresh(command)
+        finally:
+            # 점수가 일부라도 바뀌었을 수 있으므로 추천 결과 캐시를 무효화한다.
+            if self.cache_invalidator:
+                self.cache_invalidator.invalidate()
+
+    def _refresh(
+        self, command: RefreshStudentHouseScoreCommand
     ) -> RefreshStudentHouseScoreResult:
         policy = command.policy or self.policy
         calculator = DecisionScoreCalculator(policy)
@@ -75,6 +104,11 @@ class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
             self.university_repo.get_unique_university_locations()
         )
 
+        if self.observation_bulk_repo:
+            return self._execute_in_chunks(
+                command, policy, calculator, unique_university_ids
+            )
+
         candidates = self.house_platform_repo.fetch_candidates(
             FilterCandidateCriteria(
                 max_deposit_limit=None,
@@ -116,6 +150,109 @@ class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
             failed_count=failed,
         )
 
+    def _execute_in_chunks(
+        self,
+        command: RefreshStudentHouseScoreCommand,
+        policy: DecisionPolicyConfig,
+        calculator: DecisionScoreCalculator,
+        unique_university_ids: set[int],
+    ) -> RefreshStudentHouseScoreResult:
+        """후보를 청크 단위로 읽어 관측 일괄 조회/계산/업서트를 수행한다."""
+        criteria = FilterCandidateCriteria(
+            max_deposit_limit=None,
+            max_rent_limit=None,
+            budget_margin_ratio=0.0,
+        )
+        total = 0
+        processed = 0
+        failed = 0
+        last_id = None
+        while True:
+            chunk = list(
+                self.house_platform_repo.fetch_candidate_page(
+                    criteria,
+                    after_house_platform_id=last_id,
+                    limit=self.chunk_size,
+                )
+            )
+            if not chunk:
+                break
+            last_id = chunk[-1].house_platform_id
+            total += len(chunk)
+
+            chunk_processed, chunk_failed = self._refresh_chunk(
+                chunk,
+                command,
+                policy,
+                calculator,
+                unique_university_ids,
+            )
+            processed += chunk_processed
+            failed += chunk_failed
+            if len(chunk) < self.chunk_size:
+                break
+
+        return RefreshStudentHouseScoreResult(
+            observation_version=command.observation_version,
+            policy_version=policy.policy_version,
+            total_observations=total,
+            processed_count=processed,
+            failed_count=failed,
+        )
+
+    def _refresh_chunk(
+        self,
+        chunk: list,
+        command: RefreshStudentHouseScoreCommand,
+        policy: DecisionPolicyConfig,
+        calculator: DecisionScoreCalculator,
+        unique_university_ids: set[int],
+    ) -> tuple[int, int]:
+        """청크 하나의 점수를 계산해 일괄 저장하고 (성공, 실패) 수를 반환한다."""
+        ids = [candidate.house_platform_id for candidate in chunk]
+        features = self.observation_bulk_repo.fetch_latest_features(ids)
+        prices = self.observation_bulk_repo.fetch_latest_prices(ids)
+        distances = self.observation_bulk_repo.fetch_latest_distances(ids)
+
+        sources = []
+        failures: list[tuple[int, str]] = []
+        for candidate in chunk:
+            house_platform_id = candidate.house_platform_id
+            try:
+                sources.append(
+                    build_observation_score_source(
+                        house_platform_id,
+                        candidate.snapshot_id,
+                        features.get(house_platform_id),
+                        prices.get(house_platform_id),
+                        distances.get(house_platform_id, []),
+                        unique_university_ids,
+                        command.observation_version,
+                    )
+                )
+            except Exception as exc:
+                failures.append((house_platform_id, str(exc)))
+
+        # 청크 단위 점수는 벡터 연산으로 한 번에 계산한다.
+        records = calculator.calculate_many(
+            sources,
+            observation_version=command.observation_version,
+            policy_version=policy.policy_version,
+        )
+
+        if records:
+            try:
+                self.student_house_repo.upsert_scores(records)
+            except Exception as exc:
+                # 청크 저장이 실패하면 해당 청크 전체를 실패로 기록한다.
+                failures.extend(
+                    (record.house_platform_id, str(exc)) for record in records
+                )
+                records = []
+        if failures:
+            self.student_house_repo.mark_failed_bulk(failures)
+        return len(records), len(failures)
+
     def _build_score_source(
         self,
         house_platform_id: int,
@@ -125,70 +262,22 @@ class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
     ) -> ObservationScoreSource:
         """관측 포트를 조합해 점수 산출용 관측치를 만든다."""
         feature = self._find_latest_feature(house_platform_id)
-        observation_version = expected_observation_version
-        if feature:
-            snapshot_id = feature.snapshot_id
-            observation_version = feature.메타데이터.관측치_버전
-            if (
-                expected_observation_version
-                and feature.메타데이터.관측치_버전
-                != expected_observation_version
-            ):
-                raise ValueError("관측 버전이 일치하지 않습니다.")
-        else:
-            # TODO: feature 관측치가 없을 때 snapshot/버전 정책을 확정한다.
-            observation_version = expected_observation_version
-
         price = self.price_observation_repo.get_by_house_platform_id(
             house_platform_id
         )
-        if not price:
-            raise ValueError("price 관측치가 존재하지 않습니다.")
-
         distances = (
             self.distance_observation_repo.get_bulk_by_house_platform_id(
                 house_platform_id
             )
         )
-        if unique_university_ids:
-            distances = [
-                item
-                for item in distances
-                if item.university_id in unique_university_ids
-            ]
-        if not distances:
-            raise ValueError("distance 관측치가 존재하지 않습니다.")
-
-        distance_summary = _average_distance(distances)
-        # TODO: 코호트/대표 대학 정책이 확정되면 평균 산정 대신 정책 기반 대표값을 사용한다.
-
-        return ObservationScoreSource(
-            house_platform_id=house_platform_id,
-            snapshot_id=snapshot_id,
-            observation_version=observation_version,
-            price_percentile=price.가격_백분위,
-            price_zscore=price.가격_z점수,
-            price_burden_nonlinear=price.가격_부담_비선형,
-            estimated_move_in_cost=int(price.예상_입주비용),
-            monthly_cost_est=int(price.월_비용_추정),
-            essential_option_coverage=(
-                feature.편의_관측치.필수_옵션_커버리지
-                if feature
-                else None
-            ),
-            convenience_score=feature.편의_관측치.편의_점수 if feature else None,
-            risk_probability_est=(
-                feature.위험_관측치.위험_확률_추정 if feature else None
-            ),
-            risk_severity_score=(
-                feature.위험_관측치.위험_심각도_점수 if feature else None
-            ),
-            risk_nonlinear_penalty=(
-                feature.위험_관측치.위험_비선형_패널티 if feature else None
-            ),
-            distance_to_school_min=distance_summary[0],
-            distance_percentile=distance_summary[1],
-            distance_nonlinear_score=distance_summary[2],
+        return build_observation_score_source(
+            house_platform_id,
+            snapshot_id,
+            feature,
+            price,
+            distances,
+            unique_university_ids,
+            expected_observation_version,
         )
 
     def _find_latest_feature(self, house_platform_id: int):
@@ -198,13 +287,3 @@ class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
             house_platform_id
         )
 
-
-def _average_distance(
-    distances: list[DistanceFeatureObservation],
-) -> tuple[float, float, float]:
-    """거리 관측치를 평균으로 요약한다."""
-    count = max(len(distances), 1)
-    minutes = sum(item.학교까지_분 for item in distances) / count
-    percentile = sum(item.거리_백분위 for item in distances) / count
-    nonlinear = sum(item.거리_비선형_점수 for item in distances) / count
-    return float(minutes), float(percentile), float(nonlinear)
@@ -11,6 +11,8 @@ class BudgetFilterPolicy:
     """
 
     budget_margin_ratio: float = 0.1
+    # 가까운 매물 요청 시 허용하는 통학 시간(분) 상한
+    near_commute_minutes: float = 30.0
 
     def clamp_budget(self, value: int | None) -> int | None:
         """예산 상한선에 여유율을 적용해 확장한다."""
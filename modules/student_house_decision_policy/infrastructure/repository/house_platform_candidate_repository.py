@@ -29,41 +29,65 @@ class HousePlatformCandidateRepository(HousePlatformCandidateReadPort):
         """조건을 만족하는 house_platform 후보를 조회한다."""
         session = self._session_factory()
         try:
-            query = (
-                session.query(
-                    HousePlatformORM.house_platform_id,
-                    HousePlatformORM.snapshot_id,
-                    HousePlatformORM.deposit,
-                    HousePlatformORM.monthly_rent,
-                    HousePlatformORM.manage_cost,
-                )
-                .filter(
-                    or_(
-                        HousePlatformORM.is_banned.is_(False),
-                        HousePlatformORM.is_banned.is_(None),
-                    )
-                )
-            )
-
-            query = self._apply_price_type_filters(query, criteria)
-            query = self._apply_request_filters(query, criteria)
-
+            query = self._build_query(session, criteria)
             if limit is not None:
                 query = query.limit(limit)
-            rows = query.all()
-            return [
-                FilterCandidate(
-                    house_platform_id=row[0],
-                    snapshot_id=row[1],
-                    deposit=int(row[2]) if row[2] is not None else None,
-                    monthly_rent=int(row[3]) if row[3] is not None else None,
-                    manage_cost=int(row[4]) if row[4] is not None else None,
+            return [self._to_candidate(row) for row in query.all()]
+        finally:
+            session.close()
+
+    def fetch_candidate_page(
+        self,
+        criteria: FilterCandidateCriteria,
+        after_house_platform_id: int | None,
+        limit: int,
+    ) -> Sequence[FilterCandidate]:
+        """house_platform_id 오름차순 키셋 페이지 단위로 후보를 조회한다."""
+        session = self._session_factory()
+        try:
+            query = self._build_query(session, criteria)
+            if after_house_platform_id is not None:
+                query = query.filter(
+                    HousePlatformORM.house_platform_id > after_house_platform_id
                 )
-                for row in rows
-            ]
+            rows = (
+                query.order_by(HousePlatformORM.house_platform_id.asc())
+                .limit(limit)
+                .all()
+            )
+            return [self._to_candidate(row) for row in rows]
         finally:
             session.close()
 
+    def _build_query(self, session, criteria: FilterCandidateCriteria):
+        query = (
+            session.query(
+                HousePlatformORM.house_platform_id,
+                HousePlatformORM.snapshot_id,
+                HousePlatformORM.deposit,
+                HousePlatformORM.monthly_rent,
+                HousePlatformORM.manage_cost,
+            )
+            .filter(
+                or_(
+                    HousePlatformORM.is_banned.is_(False),
+                    HousePlatformORM.is_banned.is_(None),
+                )
+            )
+        )
+        query = self._apply_price_type_filters(query, criteria)
+        return self._apply_request_filters(query, criteria)
+
+    @staticmethod
+    def _to_candidate(row) -> FilterCandidate:
+        return FilterCandidate(
+            house_platform_id=row[0],
+            snapshot_id=row[1],
+            deposit=int(row[2]) if row[2] is not None else None,
+            monthly_rent=int(row[3]) if row[3] is not None else None,
+            manage_cost=int(row[4]) if row[4] is not None else None,
+        )
+
     @staticmethod
     def _apply_price_type_filters(query, criteria: FilterCandidateCriteria):
         """price_type 조건을 적용한다."""
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from sqlalchemy import and_, func, literal, select, union_all
+
+from infrastructure.db.postgres import SessionLocal
+from infrastructure.db.session_helper import open_session
+from modules.observations.adapter.output.repository.latest_observation_pointer_repository_impl import (
+    NO_UNIVERSITY,
+    OBSERVATION_TYPE_DISTANCE,
+    OBSERVATION_TYPE_PRICE,
+    pointer_table_available,
+)
+from modules.observations.infrastructure.orm.latest_observation_pointer_orm import (
+    LatestObservationPointerORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import (
+    StudentRecommendationDistanceObservationORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import (
+    StudentRecommendationPriceObservationsORM,
+)
+from modules.student_house_decision_policy.application.port_out.observation_candidate_filter_port import (
+    ObservationCandidateFilterPort,
+)
+
+
+class ObservationCandidateFilterRepository(ObservationCandidateFilterPort):
+    """
+    최신 가격/거리 관측치를 조인해 후보를 한 번에 필터링한다.
+    관측 종류마다 포인터가 있는 매물은 포인터로 최신 행을 고르고, 없는 매물만 이력 window 로 고른다.
+    """
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or SessionLocal
+
+    def filter_house_platform_ids(
+        self,
+        house_platform_ids: Sequence[int],
+        max_deposit_limit: int | None,
+        max_rent_limit: int | None,
+        university_location_id: int | None = None,
+        max_commute_minutes: float | None = None,
+    ) -> set[int]:
+        """가격/통학 관측 조건을 통과한 매물 ID만 조회한다."""
+        ids = list(dict.fromkeys(house_platform_ids))
+        if not ids:
+            return set()
+
+        session, generator = open_session(self._session_factory)
+        try:
+            price_pointed: set[int] = set()
+            distance_pointed: set[int] = set()
+            if pointer_table_available(session):
+                # 가격은 매물별로, 거리는 (매물, 대상 대학)별로 포인터 유무를 판단한다.
+                price_pointed = _pointed_house_ids(
+                    session, OBSERVATION_TYPE_PRICE, ids, NO_UNIVERSITY
+                )
+                if university_location_id is not None:
+                    distance_pointed = _pointed_house_ids(
+                        session, OBSERVATION_TYPE_DISTANCE, ids, university_location_id
+                    )
+            return self._filter(
+                session, ids, price_pointed, distance_pointed,
+                max_deposit_limit, max_rent_limit,
+                university_location_id, max_commute_minutes,
+            )
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+    @staticmethod
+    def _filter(
+        session,
+        ids: list[int],
+        price_pointed: set[int],
+        distance_pointed: set[int],
+        max_deposit_limit: int | None,
+        max_rent_limit: int | None,
+        university_location_id: int | None,
+        max_commute_minutes: float | None,
+    ) -> set[int]:
+        price = StudentRecommendationPriceObservationsORM
+        latest_price = _latest_subquery(
+            (
+                price.house_platform_id.label("house_platform_id"),
+                price.예상_입주비용.label("move_in_cost"),
+                price.월_비용_추정.label("monthly_cost"),
+            ),
+            price,
+            price.house_platform_id,
+            OBSERVATION_TYPE_PRICE,
+            ids,
+            price_pointed,
+        )
+
+        query = select(latest_price.c.house_platform_id).where(
+            latest_price.c.rn == 1
+        )
+        if max_deposit_limit is not None:
+            query = query.where(latest_price.c.move_in_cost <= max_deposit_limit)
+        if max_rent_limit is not None:
+            query = query.where(latest_price.c.monthly_cost <= max_rent_limit)
+
+        if university_location_id is not None:
+            distance = StudentRecommendationDistanceObservationORM
+            latest_distance = _latest_subquery(
+                (
+                    distance.house_id.label("house_id"),
+                    distance.학교까지_분.label("minutes"),
+                ),
+                distance,
+                distance.house_id,
+                OBSERVATION_TYPE_DISTANCE,
+                ids,
+                distance_pointed,
+                university_id=university_location_id,
+                university_column=distance.university_id,
+            )
+            query = query.join(
+                latest_distance,
+                latest_distance.c.house_id == latest_price.c.house_platform_id,
+            ).where(latest_distance.c.rn == 1)
+            if max_commute_minutes is not None:
+                query = query.where(
+                    latest_distance.c.minutes <= max_commute_minutes
+                )
+
+        return {int(row[0]) for row in session.execute(query).all()}
+
+
+def _pointed_house_ids(session, observation_type: str, ids, university_id: int) -> set[int]:
+    """해당 종류(와 대학)의 최신 포인터가 있는 매물 ID를 조회한다."""
+    pointer = LatestObservationPointerORM
+    return {
+        int(row[0])
+        for row in session.execute(
+            select(pointer.house_platform_id)
+            .where(pointer.observation_type == observation_type)
+            .where(pointer.university_id == university_id)
+            .where(pointer.house_platform_id.in_(ids))
+        ).all()
+    }
+
+
+def _latest_subquery(
+    columns,
+    orm,
+    house_column,
+    observation_type: str,
+    ids: list[int],
+    pointed: set[int],
+    university_id: int | None = None,
+    university_column=None,
+):
+    """포인터가 있는 매물은 포인터로, 나머지는 이력 window 로 고른 최신 행을 합친다."""
+    parts = []
+    if pointed:
+        parts.append(
+            _pointed(
+                select(*columns),
+                orm.id,
+                observation_type,
+                [house_platform_id for house_platform_id in ids if house_platform_id in pointed],
+                university_id=university_id,
+            )
+        )
+    rest = [house_platform_id for house_platform_id in ids if house_platform_id not in pointed]
+    if rest:
+        window = select(
+            *columns,
+            func.row_number()
+            .over(
+                partition_by=house_column,
+                order_by=(orm.calculated_at.desc(), orm.id.desc()),
+            )
+            .label("rn"),
+        ).where(house_column.in_(rest))
+        if university_column is not None:
+            window = window.where(university_column == university_id)
+        parts.append(window)
+    if len(parts) == 1:
+        return parts[0].subquery()
+    return union_all(*parts).subquery()
+
+
+def _pointed(query, id_column, observation_type: str, ids, university_id=None):
+    """최신 포인터가 가리키는 행만 고른다. (window 버전과 맞추려고 rn = 1 을 붙인다)"""
+    pointer = LatestObservationPointerORM
+    conditions = [
+        pointer.observation_id == id_column,
+        pointer.observation_type == observation_type,
+    ]
+    if university_id is not None:
+        conditions.append(pointer.university_id == university_id)
+    return (
+        query.add_columns(literal(1).label("rn"))
+        .join(pointer, and_(*conditions))
+        .where(pointer.house_platform_id.in_(ids))
+    )
@@ -3,6 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Sequence
 
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from infrastructure.db.postgres import SessionLocal
@@ -115,6 +117,103 @@ class StudentHouseScoreRepository(StudentHouseScorePort):
             else:
                 session.close()
 
+    def upsert_scores(self, scores: Sequence[StudentHouseScoreRecord]) -> int:
+        """점수 묶음을 INSERT ... ON CONFLICT 한 번으로 업서트한다."""
+        # 같은 묶음 안에 중복 ID가 있으면 ON CONFLICT가 실패하므로 마지막 값만 남긴다.
+        unique_scores = {
+            score.house_platform_id: score for score in scores
+        }
+        if not unique_scores:
+            return 0
+        values = [
+            {
+                "house_platform_id": score.house_platform_id,
+                "price_score": score.price_score,
+                "option_score": score.option_score,
+                "risk_score": score.risk_score,
+                "distance_score": score.distance_score,
+                "base_total_score": score.base_total_score,
+                "is_student_recommended": score.is_student_recommended,
+                "observation_version": score.observation_version,
+                "policy_version": score.policy_version,
+                "processing_status": self.STATUS_COMPLETED,
+                "last_error": None,
+                "last_error_at": None,
+            }
+            for score in unique_scores.values()
+        ]
+        stmt = insert(StudentHouseORM).values(values)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StudentHouseORM.house_platform_id],
+            set_={
+                "price_score": excluded.price_score,
+                "option_score": excluded.option_score,
+                "risk_score": excluded.risk_score,
+                "distance_score": excluded.distance_score,
+                "base_total_score": excluded.base_total_score,
+                "is_student_recommended": excluded.is_student_recommended,
+                "observation_version": excluded.observation_version,
+                "policy_version": excluded.policy_version,
+                "processing_status": excluded.processing_status,
+                "last_error": None,
+                "last_error_at": None,
+                "updated_at": func.now(),
+            },
+        )
+        self._execute_write(stmt)
+        return len(values)
+
+    def mark_failed_bulk(self, failures: Sequence[tuple[int, str]]) -> None:
+        """실패 묶음을 기록하고 기존 점수는 유지한다."""
+        unique_failures = dict(failures)
+        if not unique_failures:
+            return
+        failed_at = datetime.utcnow()
+        values = [
+            {
+                "house_platform_id": house_platform_id,
+                "price_score": 0.0,
+                "option_score": 0.0,
+                "risk_score": 0.0,
+                "distance_score": 0.0,
+                "base_total_score": 0.0,
+                "is_student_recommended": False,
+                "observation_version": None,
+                "policy_version": None,
+                "processing_status": self.STATUS_FAILED,
+                "last_error": reason,
+                "last_error_at": failed_at,
+            }
+            for house_platform_id, reason in unique_failures.items()
+        ]
+        stmt = insert(StudentHouseORM).values(values)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StudentHouseORM.house_platform_id],
+            set_={
+                "processing_status": excluded.processing_status,
+                "last_error": excluded.last_error,
+                "last_error_at": excluded.last_error_at,
+                "updated_at": func.now(),
+            },
+        )
+        self._execute_write(stmt)
+
+    def _execute_write(self, stmt) -> None:
+        session, generator = open_session(self._session_factory)
+        try:
+            session.execute(stmt)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
     def fetch_top_k(
         self, query: StudentHouseScoreQuery
     ) -> Sequence[StudentHouseScoreSummary]:
@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+
+from infrastructure.db.engine_factory import get_all_pool_stats
+
+router = APIRouter(prefix="/system", tags=["System"])
+
+
+@router.get(
+    "/db_pool",
+    summary="DB 커넥션 풀 상태 조회",
+    description="프로세스에 생성된 엔진(프로필)별 풀 크기, 사용 중/오버플로 연결 수, 획득 대기 시간을 반환합니다.",
+)
+def get_db_pool_stats():
+    return {"engines": get_all_pool_stats()}
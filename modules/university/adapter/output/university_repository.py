@@ -1,7 +1,6 @@
 from typing import List
 
-from sqlalchemy.orm import Session
-
+from infrastructure.db.session_helper import open_session
 from modules.university.adapter.output.university_model import UniversityLocation
 from modules.university.application.dto.university_location_dto import (
     UniversityLocationDTO,
@@ -15,7 +14,7 @@ class UniversityRepository(UniversityRepositoryPort):
         self.db_session_factory = db_session_factory
 
     def get_all_university_names(self) -> List[str]:
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             # DISTINCT university_name ORDER BY university_name ASC
             results = db.query(UniversityLocation.university_name)\
@@ -26,11 +25,14 @@ class UniversityRepository(UniversityRepositoryPort):
             # results is list of (university_name,) tuples
             return [row[0] for row in results if row[0]]
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     def get_university_locations(self) -> List[UniversityLocationDTO]:
         """대학 위치 목록을 조회한다."""
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             rows = (
                 db.query(UniversityLocation)
@@ -52,11 +54,14 @@ class UniversityRepository(UniversityRepositoryPort):
                 for row in rows
             ]
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
 
     def get_unique_university_locations(self) -> List[int]:
         """주소가 중복되지 않는 대학 위치 ID 목록을 조회한다."""
-        db: Session = self.db_session_factory()
+        db, generator = open_session(self.db_session_factory)
         try:
             rows = (
                 db.query(UniversityLocation)
@@ -78,4 +83,7 @@ class UniversityRepository(UniversityRepositoryPort):
                 unique_ids.append(int(row.university_location_id))
             return unique_ids
         finally:
-            db.close()
+            if generator:
+                generator.close()
+            else:
+                db.close()
@@ -0,0 +1,183 @@
+"""위경도 좌표용 메모리 공간 인덱스 (균등 격자)."""
+from __future__ import annotations
+
+import math
+from typing import Callable, Generic, Sequence, TypeVar
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+# 위도 1도의 길이(km)
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+
+T = TypeVar("T")
+
+
+def haversine_km(lat1, lng1, lat2, lng2) -> np.ndarray:
+    """하버사인 거리(km). 배열을 넣으면 NumPy 브로드캐스팅 규칙대로 계산한다."""
+    lat1 = np.radians(np.asarray(lat1, dtype=float))
+    lng1 = np.radians(np.asarray(lng1, dtype=float))
+    lat2 = np.radians(np.asarray(lat2, dtype=float))
+    lng2 = np.radians(np.asarray(lng2, dtype=float))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    )
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+class GeoGridIndex(Generic[T]):
+    """
+    좌표를 cell_km 크기의 위경도 격자 칸에 나눠 담는 공간 인덱스.
+    - within_km: 반경 안의 칸만 훑어 거리순으로 반환한다.
+    - nearest: 질의 칸에서 바깥 고리로 넓혀 가며 k 개가 확정되면 멈춘다.
+    조회 비용은 전체 개수가 아니라 주변 칸에 든 항목 수에 비례한다.
+    """
+
+    def __init__(
+        self,
+        items: Sequence[T],
+        lat_of: Callable[[T], float] = lambda item: item.lat,
+        lng_of: Callable[[T], float] = lambda item: item.lng,
+        cell_km: float = 5.0,
+    ):
+        if cell_km <= 0:
+            raise ValueError("cell_km 는 0보다 커야 합니다.")
+        self.items = list(items)
+        self.cell_deg = cell_km / KM_PER_DEGREE
+        self._lats = np.array([lat_of(item) for item in self.items], dtype=float)
+        self._lngs = np.array([lng_of(item) for item in self.items], dtype=float)
+
+        cells: dict[tuple[int, int], list[int]] = {}
+        for index, (lat, lng) in enumerate(zip(self._lats, self._lngs)):
+            cells.setdefault(self._cell_of(lat, lng), []).append(index)
+        self._cells = {key: np.array(value) for key, value in cells.items()}
+        if cells:
+            rows = [key[0] for key in cells]
+            cols = [key[1] for key in cells]
+            self._bounds = (min(rows), max(rows), min(cols), max(cols))
+        else:
+            self._bounds = None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def within_km(
+        self, lat: float, lng: float, radius_km: float
+    ) -> list[tuple[T, float]]:
+        """반경 radius_km 이내 항목을 (항목, 거리km) 로 가까운 순서대로 반환한다."""
+        indices, distances = self.within_km_indices(lat, lng, radius_km)
+        return [
+            (self.items[index], distance)
+            for index, distance in zip(indices.tolist(), distances.tolist())
+        ]
+
+    def within_km_indices(
+        self, lat: float, lng: float, radius_km: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """within_km 의 배열 버전. (항목 인덱스, 거리km) 를 거리순으로 반환한다."""
+        if not self._cells or radius_km < 0:
+            return _EMPTY_INDICES, _EMPTY_DISTANCES
+        lat_span = radius_km / KM_PER_DEGREE
+        # 경도 1도의 길이는 고위도일수록 짧으므로 상자 안에서 가장 높은 위도를 기준으로 잡는다.
+        edge_lat = min(abs(lat) + lat_span, 89.9)
+        lng_span = min(lat_span / math.cos(math.radians(edge_lat)), 180.0)
+        row_from, col_from = self._cell_of(lat - lat_span, lng - lng_span)
+        row_to, col_to = self._cell_of(lat + lat_span, lng + lng_span)
+        candidates = self._collect(row_from, row_to, col_from, col_to)
+        return self._rank(candidates, lat, lng, radius_km)
+
+    def nearest(self, lat: float, lng: float, k: int) -> list[tuple[T, float]]:
+        """가장 가까운 k 개 항목을 (항목, 거리km) 로 가까운 순서대로 반환한다."""
+        if not self._cells or k <= 0:
+            return []
+        row, col = self._cell_of(lat, lng)
+        row_min, row_max, col_min, col_max = self._bounds
+        max_ring = max(
+            abs(row - row_min), abs(row - row_max), abs(col - col_min), abs(col - col_max)
+        )
+        found: list[np.ndarray] = []
+        ring = 0
+        while True:
+            found.extend(self._ring_cells(row, col, ring))
+            if ring >= max_ring:
+                break
+            if found:
+                candidates = np.concatenate(found)
+                if len(candidates) >= k:
+                    distances = haversine_km(
+                        lat, lng, self._lats[candidates], self._lngs[candidates]
+                    )
+                    kth = np.partition(distances, k - 1)[k - 1]
+                    # ring 칸까지 훑었으면 적어도 이 거리 안은 빠짐없이 본 셈이다.
+                    if kth <= self._covered_km(lat, ring):
+                        break
+            ring += 1
+
+        candidates = np.concatenate(found) if found else _EMPTY_INDICES
+        indices, distances = self._rank(candidates, lat, lng, None)
+        return [
+            (self.items[index], distance)
+            for index, distance in zip(indices[:k].tolist(), distances[:k].tolist())
+        ]
+
+    def _cell_of(self, lat: float, lng: float) -> tuple[int, int]:
+        return (math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg))
+
+    def _collect(
+        self, row_from: int, row_to: int, col_from: int, col_to: int
+    ) -> np.ndarray:
+        # 범위가 채워진 칸 수보다 넓으면 채워진 칸만 훑는다.
+        if (row_to - row_from + 1) * (col_to - col_from + 1) > len(self._cells):
+            parts = [
+                indices
+                for (row, col), indices in self._cells.items()
+                if row_from <= row <= row_to and col_from <= col <= col_to
+            ]
+        else:
+            parts = [
+                self._cells[(row, col)]
+                for row in range(row_from, row_to + 1)
+                for col in range(col_from, col_to + 1)
+                if (row, col) in self._cells
+            ]
+        return np.concatenate(parts) if parts else _EMPTY_INDICES
+
+    def _ring_cells(self, row: int, col: int, ring: int) -> list[np.ndarray]:
+        if ring == 0:
+            cell = self._cells.get((row, col))
+            return [cell] if cell is not None else []
+        keys = [(row - ring, c) for c in range(col - ring, col + ring + 1)]
+        keys += [(row + ring, c) for c in range(col - ring, col + ring + 1)]
+        keys += [(r, col - ring) for r in range(row - ring + 1, row + ring)]
+        keys += [(r, col + ring) for r in range(row - ring + 1, row + ring)]
+        return [self._cells[key] for key in keys if key in self._cells]
+
+    def _covered_km(self, lat: float, ring: int) -> float:
+        """질의 칸 기준 ring 고리까지 훑었을 때 빠짐없이 확인된 반경(km)."""
+        span_deg = ring * self.cell_deg
+        edge_lat = min(abs(lat) + span_deg, 89.9)
+        return span_deg * KM_PER_DEGREE * math.cos(math.radians(edge_lat))
+
+    def _rank(
+        self,
+        candidates: np.ndarray,
+        lat: float,
+        lng: float,
+        radius_km: float | None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if len(candidates) == 0:
+            return _EMPTY_INDICES, _EMPTY_DISTANCES
+        distances = haversine_km(
+            lat, lng, self._lats[candidates], self._lngs[candidates]
+        )
+        if radius_km is not None:
+            mask = distances <= radius_km
+            candidates = candidates[mask]
+            distances = distances[mask]
+        order = np.argsort(distances, kind="stable")
+        return candidates[order], distances[order]
+
+
+_EMPTY_INDICES = np.array([], dtype=int)
+_EMPTY_DISTANCES = np.array([], dtype=float)
@@ -0,0 +1,205 @@
+"""search_house 결과 저장/조회 직렬화 벤치마크.
+
+실제 추천 결과와 같은 형태(top_k 10 x 추천/제외, raw 매물/관측 요약/설명)로
+기존 방식(asdict + json.dumps(default=str) 를 JSON 컬럼에 저장)과
+compact JSON + 압축 저장 방식의 크기/쓰기/읽기 시간을 비교한다.
+
+python test/dev_lsy/search_house_result_codec_benchmark.py --repeat 200
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from modules.house_platform.domain.house_platform import HousePlatform
+from modules.mq.application.factory.search_house_result_codec import (
+    ENCODING_GZIP,
+    ENCODING_JSON,
+    ENCODING_ZSTD,
+    decompress_search_house_result,
+    encode_search_house_result,
+    to_json_bytes,
+    zstandard,
+)
+from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendStudentHouseResult,
+)
+
+
+def build_result(top_k: int) -> RecommendStudentHouseResult:
+    """추천/제외 top_k 항목을 가진 결과를 만든다."""
+    base = datetime(2026, 1, 1, 9, 0, 0)
+
+    def item(rank: int, house_id: int, status: str) -> dict:
+        house = HousePlatform(
+            house_platform_id=house_id,
+            title=f"신촌역 도보 {rank}분 풀옵션 원룸 채광 좋은 남향",
+            address=f"서울특별시 서대문구 창천동 {house_id}-{rank}",
+            deposit=1000 + rank * 50,
+            domain_id=1,
+            rgst_no=str(40000000 + house_id),
+            sales_type="월세",
+            monthly_rent=55 + rank,
+            room_type="원룸",
+            contract_area=26.4,
+            exclusive_area=19.83,
+            floor_no=3,
+            all_floors=5,
+            lat_lng={"lat": 37.5559 + rank / 1000, "lng": 126.9368},
+            manage_cost=7,
+            can_park=False,
+            has_elevator=True,
+            image_urls=json.dumps(
+                [
+                    f"https://ic.zigbang.com/ic/items/{house_id}/{index}.jpg"
+                    for index in range(15)
+                ]
+            ),
+            pnu_cd="1141010700101230004",
+            is_banned=False,
+            residence_type="다가구",
+            gu_nm="서대문구",
+            dong_nm="창천동",
+            registered_at=base - timedelta(days=rank),
+            crawled_at=base,
+            snapshot_id="a" * 64,
+            abang_user_id=1,
+            created_at=base,
+            updated_at=base,
+        )
+        raw = asdict(house)
+        raw.pop("crawled_at", None)
+        entry = {
+            "rank": rank,
+            "decision_status": status,
+            "house_platform_id": house_id,
+            "raw": raw,
+            "observation_summary": {
+                "snapshot_id": "a" * 64,
+                "observation_version": "v1",
+                "price": {
+                    "가격_백분위": 0.42,
+                    "가격_z점수": -0.21,
+                    "예상_입주비용": 1210,
+                    "월_비용_추정": 62.5,
+                    "가격_부담_비선형": 0.37,
+                },
+                "commute": {
+                    "학교까지_분": 12.0,
+                    "거리_백분위": 0.3,
+                    "거리_버킷": "10_20분",
+                    "거리_비선형_점수": 0.71,
+                },
+                "risk": {"risk_flags": ["위반건축물_아님"], "risk_score": 0.1},
+                "options": ["에어컨", "세탁기", "냉장고", "인덕션", "옷장"],
+            },
+            "score_breakdown": {
+                "price_score": 71.2,
+                "option_score": 80.0,
+                "risk_score": 90.0,
+                "distance_score": 76.5,
+                "base_total_score": 78.1,
+            },
+            "ai_explanation": {
+                "recommended_reasons": [
+                    {
+                        "code": "PRICE_GOOD",
+                        "text": "동일 지역 대비 월 비용이 낮은 편입니다.",
+                        "evidence": {"가격_백분위": 0.42},
+                    },
+                    {
+                        "code": "COMMUTE_NEAR",
+                        "text": "학교까지 12분 거리입니다.",
+                        "evidence": {"학교까지_분": 12.0},
+                    },
+                ],
+                "warnings": [],
+            },
+        }
+        return entry
+
+    return RecommendStudentHouseResult(
+        finder_request_id=1,
+        generated_at=base.isoformat(),
+        status="SUCCESS",
+        detail=None,
+        query_context={"segment_id": "STUDENT_DEFAULT", "policy_version": "v1"},
+        summary={"total_candidates": 500, "recommended_count": 120},
+        recommended_top_k=[
+            item(rank, 1000 + rank, "RECOMMENDED") for rank in range(1, top_k + 1)
+        ],
+        rejected_top_k=[
+            item(rank, 2000 + rank, "REJECTED") for rank in range(1, top_k + 1)
+        ],
+    )
+
+
+def _timed(fn, repeat: int) -> tuple[float, object]:
+    start = time.perf_counter()
+    value = None
+    for _ in range(repeat):
+        value = fn()
+    return (time.perf_counter() - start) / repeat * 1000, value
+
+
+def legacy_write(result) -> str:
+    # save_result: asdict → json.dumps(default=str) → JSON 컬럼 바인딩 시 한 번 더 dumps
+    text = json.dumps(asdict(result), default=str)
+    return json.dumps(text)
+
+
+def legacy_read(stored: str) -> bytes:
+    # psycopg2 JSON 파싱 → 응답 직렬화 (결과 문자열을 다시 escape)
+    value = json.loads(stored)
+    return json.dumps({"status": "COMPLETED", "result": value}).encode("utf-8")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=200)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    result = build_result(args.top_k)
+
+    write_ms, stored = _timed(lambda: legacy_write(result), args.repeat)
+    read_ms, _ = _timed(lambda: legacy_read(stored), args.repeat)
+    rows = [("legacy json column", len(stored.encode("utf-8")), write_ms, read_ms)]
+
+    encodings = [ENCODING_JSON, ENCODING_GZIP]
+    if zstandard is not None:
+        encodings.append(ENCODING_ZSTD)
+    for encoding in encodings:
+        write_ms, blob = _timed(
+            lambda: encode_search_house_result(result, encoding), args.repeat
+        )
+        envelope = to_json_bytes({"status": "COMPLETED"})
+
+        def read() -> bytes:
+            body = decompress_search_house_result(blob, encoding)
+            return b"".join((envelope[:-1], b',"result":', body, b"}"))
+
+        read_ms, _ = _timed(read, args.repeat)
+        rows.append((f"blob {encoding}", len(blob), write_ms, read_ms))
+
+    print(f"top_k={args.top_k} items={args.top_k * 2} repeat={args.repeat}")
+    print(f"{'format':<20}{'bytes':>10}{'write ms':>12}{'read ms':>12}")
+    for name, size, write_ms, read_ms in rows:
+        print(f"{name:<20}{size:>10}{write_ms:>12.3f}{read_ms:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,13 @@ from modules.house_platform.application.usecase.fetch_and_store_house_platform i
 from modules.house_platform.infrastructure.client.zigbang_api_client import (
     ZigbangApiClient,
 )
+from modules.house_platform.infrastructure.checkpoint.file_crawl_checkpoint_store import (
+    FileCrawlCheckpointStore,
+)
+from infrastructure.db.redis_client import get_redis_client
+from modules.recommendations.infrastructure.cache.redis_recommendation_result_cache import (
+    RedisRecommendationResultCache,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -48,15 +55,42 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--chunk-size", type=int, default=15)
     parser.add_argument("--sleep-min", type=float, default=3)
     parser.add_argument("--sleep-max", type=float, default=7)
+    parser.add_argument(
+        "--detail-rps",
+        type=float,
+        default=None,
+        help="상세 조회 초당 요청 수(지정 시 동시 조회 모드)",
+    )
+    parser.add_argument(
+        "--detail-concurrency", type=int, default=1, help="상세 조회 동시 요청 수"
+    )
     return parser.parse_args()
 
 
-def build_usecase(region_filters: list[str]) -> FetchAndStoreHousePlatformService:
+def build_usecase(
+    region_filters: list[str],
+    detail_rps: float | None = None,
+    detail_concurrency: int = 1,
+    summary_chunk_size: int = 15,
+    sleep_range: tuple[float, float] | None = None,
+) -> FetchAndStoreHousePlatformService:
     """클라이언트/리포지토리를 엮어 유스케이스를 구성한다."""
-    client = ZigbangApiClient()
+    client = ZigbangApiClient(
+        requests_per_sec=detail_rps, max_concurrency=detail_concurrency
+    )
     repository = HousePlatformRepository()
+    # 요약 청크 사이에 --sleep-min~--sleep-max 초 쉬어 요청 간격을 유지한다.
+    chunk_delay = (
+        (lambda: time.sleep(random.uniform(*sleep_range))) if sleep_range else None
+    )
     return FetchAndStoreHousePlatformService(
-        client, repository, region_filters=region_filters
+        client,
+        repository,
+        region_filters=region_filters,
+        cache_invalidator=RedisRecommendationResultCache(get_redis_client()),
+        checkpoint_port=FileCrawlCheckpointStore(CURRENT_DIR),
+        summary_chunk_size=summary_chunk_size,
+        chunk_delay=chunk_delay,
     )
 
 
@@ -235,29 +269,18 @@ def run_stateful_crawl(
             interval_items,
         )
 
-        fetched = 0
-        stored = 0
-        skipped = 0
-        errors: list[str] = []
-
-        for chunk in chunked(range(next_start, cycle_end + 1), args.chunk_size):
-            cmd = FetchAndStoreCommand(item_ids=chunk)
-            result = usecase.execute(cmd)
-            fetched += result.fetched
-            stored += result.stored
-            skipped += result.skipped
-            errors.extend(result.errors)
-            _save_state(chunk[-1] + 1)
-            time.sleep(random.uniform(args.sleep_min, args.sleep_max))
-            logger.info(
-                "[청크] ids=%s..%s fetched=%s stored=%s skipped=%s errors=%s",
-                chunk[0],
-                chunk[-1],
-                result.fetched,
-                result.stored,
-                result.skipped,
-                len(result.errors),
-            )
+        # 사이클 범위를 스트리밍으로 처리한다. 중간에 끊기면 같은 키로 이어서 수행한다.
+        cmd = FetchAndStoreCommand(
+            item_ids=list(range(next_start, cycle_end + 1)),
+            checkpoint_key=f"house_platform_{next_start}_{cycle_end}",
+        )
+        result = usecase.execute(cmd)
+        fetched = result.fetched
+        stored = result.stored
+        skipped = result.skipped
+        errors = result.errors
+        if result.resumed_from:
+            logger.info("[사이클] 체크포인트에서 재개 offset=%s", result.resumed_from)
 
         next_start = cycle_end + 1
         _save_state(next_start)
@@ -284,7 +307,13 @@ def main():
     load_dotenv()
     args = parse_args()
     region_filters = parse_region_filters(args)
-    usecase = build_usecase(region_filters)
+    usecase = build_usecase(
+        region_filters,
+        detail_rps=args.detail_rps,
+        detail_concurrency=args.detail_concurrency,
+        summary_chunk_size=args.chunk_size,
+        sleep_range=(args.sleep_min, args.sleep_max),
+    )
     item_ids = parse_item_ids(args.item_ids)
     if item_ids:
         run_once(usecase, args)
@@ -41,10 +41,25 @@ def _get_concurrency() -> int:
         return 5
 
 
+def _is_incremental() -> bool:
+    """HOUSE_PLATFORM_EMBED_MODE=full 이면 전체 재임베딩, 기본은 증분이다."""
+    return os.getenv("HOUSE_PLATFORM_EMBED_MODE", "incremental").lower() != "full"
+
+
+def _get_page_size() -> int:
+    raw = os.getenv("HOUSE_PLATFORM_EMBED_PAGE_SIZE", "1000")
+    try:
+        return int(raw)
+    except ValueError:
+        return 1000
+
+
 async def main():
     load_dotenv()
     batch_size = _get_batch_size()
     concurrency = _get_concurrency()
+    incremental = _is_incremental()
+    page_size = _get_page_size()
 
     repository = HousePlatformEmbeddingRepository()
     embedder = OpenAIEmbeddingAgent()
@@ -53,12 +68,19 @@ async def main():
     )
 
     logger.info(
-        "임베딩 시작 (batch_size=%s concurrency=%s dummy=%s)",
+        "임베딩 시작 (batch_size=%s concurrency=%s incremental=%s page_size=%s dummy=%s)",
         batch_size,
         concurrency,
+        incremental,
+        page_size,
         embedder.is_dummy(),
     )
-    result = await usecase.execute(batch_size=batch_size, concurrency=concurrency)
+    result = await usecase.execute(
+        batch_size=batch_size,
+        concurrency=concurrency,
+        incremental=incremental,
+        page_size=page_size,
+    )
     logger.info(
         "임베딩 완료 total=%s embedded=%s saved=%s skipped=%s errors=%s",
         result.total,
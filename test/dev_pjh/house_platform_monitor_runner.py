@@ -25,6 +25,10 @@ from modules.house_platform.infrastructure.client.zigbang_api_client import (
 from modules.house_platform.infrastructure.repository.house_platform_repository import (
     HousePlatformRepository,
 )
+from infrastructure.db.redis_client import get_redis_client
+from modules.recommendations.infrastructure.cache.redis_recommendation_result_cache import (
+    RedisRecommendationResultCache,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -40,21 +44,40 @@ def parse_args() -> argparse.Namespace:
         help="updated_at 기준 경과 시간(분)",
     )
     parser.add_argument("--limit", type=int, default=50, help="최대 처리 건수")
+    parser.add_argument(
+        "--detail-rps",
+        type=float,
+        default=None,
+        help="상세 조회 초당 요청 수(지정 시 동시 조회 모드)",
+    )
+    parser.add_argument(
+        "--detail-concurrency", type=int, default=1, help="상세 조회 동시 요청 수"
+    )
     return parser.parse_args()
 
 
-def build_usecase() -> MonitorHousePlatformService:
+def build_usecase(
+    detail_rps: float | None = None, detail_concurrency: int = 1
+) -> MonitorHousePlatformService:
     """클라이언트/리포지토리를 엮어 유스케이스를 구성한다."""
-    client = ZigbangApiClient()
+    client = ZigbangApiClient(
+        requests_per_sec=detail_rps, max_concurrency=detail_concurrency
+    )
     repository = HousePlatformRepository()
-    return MonitorHousePlatformService(client, repository)
+    return MonitorHousePlatformService(
+        client,
+        repository,
+        cache_invalidator=RedisRecommendationResultCache(get_redis_client()),
+    )
 
 
 def main() -> None:
     """모니터링을 실행한다."""
     load_dotenv()
     args = parse_args()
-    usecase = build_usecase()
+    usecase = build_usecase(
+        detail_rps=args.detail_rps, detail_concurrency=args.detail_concurrency
+    )
     cmd = MonitorHousePlatformCommand(
         since_minutes=args.since_minutes, limit=args.limit
     )
@@ -0,0 +1,147 @@
+"""house_platform 스냅샷 ID 계산 벤치마크.
+
+직방 상세 응답 크기의 번들(이미지 20장, 주변 POI 15개, 빌트인 옵션 10개)로
+기존 방식(asdict 정규화 dict + json.dumps(sort_keys=True))과 전용 인코더,
+전용 인코더 + 필드 캐시의 번들당 계산 시간을 비교한다.
+
+python test/dev_pjh/house_platform_snapshot_benchmark.py --bundles 1000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from modules.house_platform.application.dto.fetch_and_store_dto import (
+    HousePlatformUpsertBundle,
+)
+from modules.house_platform.application.dto.house_platform_dto import (
+    HousePlatformManagementUpsertModel,
+    HousePlatformOptionUpsertModel,
+    HousePlatformUpsertModel,
+)
+from modules.house_platform.application.factory.house_platform_snapshot_encoder import (
+    SnapshotFieldCache,
+)
+from modules.house_platform.application.factory.house_platform_snapshot_factory import (
+    build_house_platform_snapshot_id,
+    normalize_house_platform_bundle,
+)
+
+POI_TYPES = ["편의점", "지하철", "버스", "카페", "마트"]
+
+
+def build_bundle(index: int) -> HousePlatformUpsertBundle:
+    """직방 상세 응답을 변환한 것과 같은 형태의 번들을 만든다."""
+    base = datetime(2026, 1, 1, 9, 0, 0)
+    return HousePlatformUpsertBundle(
+        house_platform=HousePlatformUpsertModel(
+            title=f"신촌역 도보 {index % 10}분 풀옵션 원룸 채광 좋은 남향",
+            address=f"서울특별시 서대문구 창천동 {index}",
+            deposit=1000 + index % 50 * 10,
+            registered_at=base + timedelta(minutes=index),
+            domain_id=1,
+            rgst_no=str(40000000 + index),
+            pnu_cd="1141010100100010000",
+            sales_type="월세",
+            monthly_rent=50 + index % 20,
+            room_type="원룸",
+            residence_type="빌라",
+            contract_area=33.06,
+            exclusive_area=19.83,
+            floor_no=index % 5 + 1,
+            all_floors=5,
+            lat_lng={"lat": 37.55 + index * 1e-5, "lng": 126.93},
+            manage_cost=7,
+            can_park=index % 2 == 0,
+            has_elevator=True,
+            # 같은 건물 매물은 이미지 일부를 공유하는 경우가 많다.
+            image_urls=[
+                f"https://ic.zigbang.com/ic/items/{index % 50}/{n}.jpg"
+                for n in range(20)
+            ],
+            gu_nm="서대문구",
+            dong_nm="창천동",
+        ),
+        management=HousePlatformManagementUpsertModel(
+            management_included='["수도", "인터넷", "TV"]',
+            management_excluded='["전기", "가스"]',
+        ),
+        options=HousePlatformOptionUpsertModel(
+            built_in=["에어컨", "세탁기", "냉장고", "인덕션", "전자레인지",
+                      "옷장", "신발장", "책상", "침대", "비데"],
+            near_univ=True,
+            near_transport=True,
+            near_mart=index % 3 == 0,
+            nearby_pois=[
+                {"poiType": POI_TYPES[n % 5], "distance": 100 + n * 37}
+                for n in range(15)
+            ],
+        ),
+    )
+
+
+def legacy_snapshot_id(bundle: HousePlatformUpsertBundle) -> str:
+    payload = normalize_house_platform_bundle(bundle, include_snapshot_id=False)
+    serialized = json.dumps(
+        payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _timed_per_bundle(fn, bundles, repeat: int) -> tuple[float, list[str]]:
+    best = None
+    ids: list[str] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ids = [fn(bundle) for bundle in bundles]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(bundles) * 1_000_000, ids
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bundles", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    bundles = [build_bundle(index) for index in range(args.bundles)]
+
+    legacy_us, expected = _timed_per_bundle(legacy_snapshot_id, bundles, args.repeat)
+    encoder_us, encoded = _timed_per_bundle(
+        build_house_platform_snapshot_id, bundles, args.repeat
+    )
+    cache = SnapshotFieldCache()
+    cached_us, cached = _timed_per_bundle(
+        lambda bundle: build_house_platform_snapshot_id(bundle, cache=cache),
+        bundles,
+        args.repeat,
+    )
+    assert encoded == expected and cached == expected, "스냅샷 ID 불일치"
+
+    print(f"bundles={args.bundles} repeat={args.repeat} (best run)")
+    print(f"{'method':<28}{'us/bundle':>12}{'speedup':>10}")
+    for name, per_bundle in [
+        ("legacy asdict + dumps", legacy_us),
+        ("canonical encoder", encoder_us),
+        ("canonical encoder + cache", cached_us),
+    ]:
+        print(f"{name:<28}{per_bundle:>12.1f}{legacy_us / per_bundle:>9.2f}x")
+    print(f"cache hits={cache.hits} misses={cache.misses}")
+
+
+if __name__ == "__main__":
+    main()
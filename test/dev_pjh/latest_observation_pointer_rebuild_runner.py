@@ -0,0 +1,31 @@
+"""
+최신 관측치 포인터 테이블 재구성 러너.
+포인터 테이블 생성 후 POINTER_TABLE_RECHECK_SEC 이상 지나 실행 중인 프로세스가
+테이블을 인식한 뒤 1회 실행한다. (그 사이 포인터 없이 저장된 관측치도 반영된다)
+"""
+from __future__ import annotations
+
+import os
+import sys
+
+from dotenv import load_dotenv
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from infrastructure.db.postgres import SessionLocal
+from modules.observations.adapter.output.repository.latest_observation_pointer_repository_impl import (
+    LatestObservationPointerRepository,
+)
+
+
+def main() -> None:
+    load_dotenv()
+    pointers = LatestObservationPointerRepository(SessionLocal).rebuild()
+    print(f"latest observation pointers rebuilt: {pointers}")
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,15 @@ from modules.observations.adapter.output.repository.student_recommendtation_pric
 from modules.observations.adapter.output.repository.student_recommendation_distance_observation_repository_impl import (
     StudentRecommendationDistanceObservationRepository,
 )
+from modules.observations.adapter.output.repository.latest_observation_bulk_repository_impl import (
+    LatestObservationBulkRepository,
+)
+from modules.observations.adapter.output.repository.observation_batch_repository_impl import (
+    ObservationBatchRepository,
+)
+from modules.observations.adapter.output.checkpoint.file_observation_cursor_store import (
+    FileObservationCursorStore,
+)
 from modules.student_house_decision_policy.infrastructure.repository.house_platform_candidate_repository import (
     HousePlatformCandidateRepository,
 )
@@ -59,6 +68,10 @@ from modules.observations.application.usecase.generate_price_observation_usecase
 from modules.observations.application.usecase.generate_student_recommendation_feature_observation_usecase import (
     GenerateStudentRecommendationFeatureObservationUseCase,
 )
+from infrastructure.db.redis_client import get_redis_client
+from modules.recommendations.infrastructure.cache.redis_recommendation_result_cache import (
+    RedisRecommendationResultCache,
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -87,6 +100,24 @@ def parse_args() -> argparse.Namespace:
         default=10,
         help="상위 후보 개수",
     )
+    parser.add_argument(
+        "--distance-max-minutes",
+        type=float,
+        default=None,
+        help="이 도보 시간(분) 안의 대학만 거리 관측치로 저장 (미지정 시 전체 대학)",
+    )
+    parser.add_argument(
+        "--observation-chunk-size",
+        type=int,
+        default=200,
+        help="관측치를 한 번에 조회/저장할 매물 수",
+    )
+    parser.add_argument(
+        "--observation-cursor-key",
+        type=str,
+        default="full_observation",
+        help="관측치 생성 진행 위치 키 (실패 후 재실행 시 이어서 진행)",
+    )
     return parser.parse_args()
 
 
@@ -142,6 +173,7 @@ def main() -> None:
             distance_repo=distance_repo,
             house_repo=house_platform_detail_repo,
             university_repo=university_repo,
+            max_minutes=args.distance_max_minutes,
         )
         price_uc = GeneratePriceObservationUseCase(
             price_repo=price_repo,
@@ -156,26 +188,24 @@ def main() -> None:
             student_feature_uc=feature_uc,
             price_uc=price_uc,
             distance_uc=distance_uc,
+            batch_writer=ObservationBatchRepository(SessionLocal),
+            house_repo=house_platform_detail_repo,
+            cursor_port=FileObservationCursorStore(CURRENT_DIR),
+            chunk_size=args.observation_chunk_size,
         )
-        
-        obs_processed = 0
-        obs_failed = 0
+
         total_candidates = len(candidates)
         print(f"Generating observations for {total_candidates} candidates...")
-        
-        for i, candidate in enumerate(candidates, 1):
-            try:
-                full_uc.execute(candidate.house_platform_id)
-                obs_processed += 1
-            except Exception as e:
-                obs_failed += 1
-                # print(f"[Warning] Failed to generate observation for house {candidate.house_platform_id}: {e}")
-            
-            if i % 10 == 0:
-                print(f"Progress: {i}/{total_candidates} ({(i/total_candidates)*100:.1f}%) - Processed: {obs_processed}, Failed: {obs_failed}", end='\r')
-        
-        print() # Newline after loop
-        print(f"Observation generation finished: processed={obs_processed}, failed={obs_failed}")
+        obs_result = full_uc.execute_batch(
+            [candidate.house_platform_id for candidate in candidates],
+            cursor_key=args.observation_cursor_key,
+        )
+        if obs_result.resumed_after is not None:
+            print(f"Resumed after house_platform_id={obs_result.resumed_after}")
+        print(
+            f"Observation generation finished: processed={obs_result.processed}, "
+            f"saved={obs_result.saved}, failed={len(obs_result.errors)}"
+        )
 
         usecase = RefreshStudentHouseScoreService(
             house_platform_repo=house_platform_repo,
@@ -185,6 +215,8 @@ def main() -> None:
             university_repo=university_repo,
             student_house_repo=student_house_repo,
             policy=policy,
+            observation_bulk_repo=LatestObservationBulkRepository(SessionLocal),
+            cache_invalidator=RedisRecommendationResultCache(get_redis_client()),
         )
 
         result = usecase.execute(
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-import math
 import os
 import sys
 
@@ -24,6 +23,7 @@ from modules.house_platform.infrastructure.repository.house_platform_repository
 from modules.university.adapter.output.university_repository import (
     UniversityRepository,
 )
+from shared.common.utils.geo_index import GeoGridIndex
 
 
 def parse_args() -> argparse.Namespace:
@@ -54,21 +54,6 @@ def _find_sample_house_platform_id() -> int | None:
             session.close()
 
 
-def _haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """위경도 직선 거리를 계산한다."""
-    radius_km = 6371.0
-    d_lat = math.radians(lat2 - lat1)
-    d_lng = math.radians(lng2 - lng1)
-    a = (
-        math.sin(d_lat / 2) ** 2
-        + math.cos(math.radians(lat1))
-        * math.cos(math.radians(lat2))
-        * math.sin(d_lng / 2) ** 2
-    )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return radius_km * c
-
-
 def _estimate_walk_minutes(distance_km: float) -> float:
     """도보 이동 시간을 추정한다."""
     # 도보 평균 속도 4.8km/h 기준 (분당 80m)
@@ -109,39 +94,33 @@ def main() -> None:
         print("대학 위치 정보가 없습니다.")
         return
 
-    distances = []
-    for university in universities:
-        if university.campus != "본교":
-            continue
-        base_name = _normalize_university_name(university.university_name)
-        km = _haversine_km(
-            house_location.lat,
-            house_location.lng,
-            university.lat,
-            university.lng,
-        )
-        minutes = _estimate_walk_minutes(km)
-        distances.append(
-            {
+    main_campuses = [
+        university for university in universities if university.campus == "본교"
+    ]
+    index = GeoGridIndex(main_campuses)
+    limit = max(1, args.limit)
+
+    # 같은 대학교(본교)는 하나만 남기므로 모자라면 k 를 늘려 다시 찾는다.
+    k = limit
+    while True:
+        unique_by_name = {}
+        for university, km in index.nearest(
+            house_location.lat, house_location.lng, k
+        ):
+            base_name = _normalize_university_name(university.university_name)
+            if base_name in unique_by_name:
+                continue
+            unique_by_name[base_name] = {
                 "university_name": base_name,
                 "campus": university.campus,
                 "distance_km": km,
-                "minutes_to_school": minutes,
+                "minutes_to_school": _estimate_walk_minutes(km),
             }
-        )
-
-    # 같은 대학교(본교)는 하나만 남긴다.
-    unique_by_name = {}
-    for item in distances:
-        key = item["university_name"]
-        existing = unique_by_name.get(key)
-        if not existing or item["distance_km"] < existing["distance_km"]:
-            unique_by_name[key] = item
+        if len(unique_by_name) >= limit or k >= len(index):
+            break
+        k *= 2
 
-    sorted_distances = sorted(
-        unique_by_name.values(), key=lambda item: item["distance_km"]
-    )
-    top = sorted_distances[: max(1, args.limit)]
+    top = list(unique_by_name.values())[:limit]
 
     print(
         f"house_platform_id={house_platform_id} 위치 기반 가까운 대학 {len(top)}곳"
@@ -0,0 +1,155 @@
+import hashlib
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from modules.house_platform.application.dto.fetch_and_store_dto import (
+    HousePlatformUpsertBundle,
+)
+from modules.house_platform.application.dto.house_platform_dto import (
+    HousePlatformManagementUpsertModel,
+    HousePlatformOptionUpsertModel,
+    HousePlatformUpsertModel,
+)
+from modules.house_platform.application.factory.house_platform_snapshot_encoder import (
+    SnapshotFieldCache,
+    hash_house_platform_bundle,
+)
+from modules.house_platform.application.factory.house_platform_snapshot_factory import (
+    build_house_platform_snapshot_id,
+    normalize_house_platform_bundle,
+)
+from modules.house_platform.domain.value_object.house_platform_domain import (
+    HousePlatformDomainType,
+)
+
+
+def _legacy_snapshot_id(bundle: HousePlatformUpsertBundle) -> str:
+    payload = normalize_house_platform_bundle(bundle, include_snapshot_id=False)
+    serialized = json.dumps(
+        payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _full_bundle(rgst_no: str = "41234567") -> HousePlatformUpsertBundle:
+    return HousePlatformUpsertBundle(
+        house_platform=HousePlatformUpsertModel(
+            house_platform_id=7,
+            title='신촌역 도보 5분 "풀옵션" 원룸\n남향 ☀',
+            address="서울특별시 서대문구 창천동",
+            deposit=1000,
+            created_at=datetime(2026, 1, 2, 3, 4, 5),
+            updated_at=datetime(2026, 1, 3),
+            registered_at=datetime(2026, 1, 1, 9, 0, 0, 123456),
+            domain_id=HousePlatformDomainType.ZIGBANG,
+            rgst_no=rgst_no,
+            snapshot_id="이전 스냅샷",
+            pnu_cd="1141010100100010000",
+            sales_type="월세",
+            monthly_rent=55,
+            room_type="원룸",
+            contract_area=33.06,
+            exclusive_area=19.0,
+            floor_no=3,
+            all_floors=5,
+            lat_lng={"lng": 126.93, "lat": "37.55"},
+            manage_cost=7,
+            can_park=False,
+            has_elevator=True,
+            image_urls=["https://img/1.jpg", "https://img/2.jpg"],
+            gu_nm="서대문구",
+            dong_nm="창천동",
+        ),
+        management=HousePlatformManagementUpsertModel(
+            management_included='["수도", "인터넷", ""]',
+            management_excluded=["전기", "가스"],
+        ),
+        options=HousePlatformOptionUpsertModel(
+            built_in=["에어컨", "세탁기"],
+            near_univ=True,
+            near_transport=None,
+            near_mart=False,
+            nearby_pois=[
+                {"poiType": "편의점", "distance": "120.7"},
+                {"poiType": "지하철", "distance": 300},
+                {"poiType": None, "distance": None},
+                "invalid",
+            ],
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "bundle",
+    [
+        _full_bundle(),
+        HousePlatformUpsertBundle(house_platform=HousePlatformUpsertModel()),
+        HousePlatformUpsertBundle(
+            house_platform=HousePlatformUpsertModel(
+                rgst_no="1", is_banned=True, domain_id=None, image_urls=("a",)
+            ),
+            management=HousePlatformManagementUpsertModel(),
+            options=HousePlatformOptionUpsertModel(built_in=[], nearby_pois=[]),
+        ),
+        HousePlatformUpsertBundle(
+            house_platform=HousePlatformUpsertModel(
+                rgst_no="2", image_urls=[], lat_lng={"lat": None, "lng": 1}
+            ),
+            management=HousePlatformManagementUpsertModel(management_included="관리비"),
+            options=HousePlatformOptionUpsertModel(near_mart=True),
+        ),
+    ],
+)
+def test_snapshot_id_matches_legacy_serialization(bundle):
+    """전용 인코더는 기존 dict + json.dumps 방식과 같은 스냅샷 ID를 만든다."""
+    expected = _legacy_snapshot_id(bundle)
+
+    assert hash_house_platform_bundle(bundle) == expected
+    assert build_house_platform_snapshot_id(bundle) == expected
+    assert build_house_platform_snapshot_id(bundle, cache=SnapshotFieldCache()) == expected
+
+
+def test_field_cache_reuses_serialized_sub_structures():
+    """같은 이미지/POI 목록은 캐시에서 재사용하고 결과는 바뀌지 않는다."""
+    cache = SnapshotFieldCache()
+    first = _full_bundle("1")
+    second = _full_bundle("2")
+
+    assert build_house_platform_snapshot_id(first, cache=cache) == _legacy_snapshot_id(first)
+    misses = cache.misses
+    assert build_house_platform_snapshot_id(second, cache=cache) == _legacy_snapshot_id(second)
+
+    assert cache.misses == misses
+    assert cache.hits >= 4
+
+    second.options.nearby_pois = [{"poiType": "카페", "distance": 50}]
+    assert build_house_platform_snapshot_id(second, cache=cache) == _legacy_snapshot_id(second)
+
+
+def test_field_cache_distinguishes_value_types():
+    """값이 같아도 타입이 다르면(list/tuple) 다른 캐시 항목으로 본다."""
+    cache = SnapshotFieldCache()
+    as_list = HousePlatformUpsertBundle(
+        house_platform=HousePlatformUpsertModel(image_urls=["a"])
+    )
+    as_tuple = HousePlatformUpsertBundle(
+        house_platform=HousePlatformUpsertModel(image_urls=("a",))
+    )
+
+    assert build_house_platform_snapshot_id(as_list, cache=cache) == _legacy_snapshot_id(as_list)
+    assert build_house_platform_snapshot_id(as_tuple, cache=cache) == _legacy_snapshot_id(as_tuple)
+
+
+def test_unserializable_value_raises_like_legacy():
+    """JSON 으로 직렬화할 수 없는 값은 기존과 같이 TypeError 를 낸다."""
+    bundle = HousePlatformUpsertBundle(
+        house_platform=HousePlatformUpsertModel(contract_area=Decimal("33.06"))
+    )
+
+    with pytest.raises(TypeError):
+        _legacy_snapshot_id(bundle)
+    with pytest.raises(TypeError):
+        build_house_platform_snapshot_id(bundle)
@@ -0,0 +1,186 @@
+import pytest
+
+from modules.house_platform.application.dto.fetch_and_store_dto import (
+    FetchAndStoreCommand,
+    HousePlatformUpsertBundle,
+)
+from modules.house_platform.application.dto.house_platform_dto import (
+    HousePlatformUpsertModel,
+)
+from modules.house_platform.application.port_out.crawl_checkpoint_port import (
+    CrawlCheckpointPort,
+)
+from modules.house_platform.application.port_out.zigbang_fetch_port import (
+    ZigbangFetchPort,
+)
+from modules.house_platform.application.usecase.fetch_and_store_house_platform import (
+    FetchAndStoreHousePlatformService,
+)
+
+
+class FakeFetchPort(ZigbangFetchPort):
+    def __init__(self):
+        self.summary_calls: list[list[int]] = []
+        self.detail_calls: list[int] = []
+
+    def fetch_by_item_ids(self, item_ids):
+        item_ids = list(item_ids)
+        self.summary_calls.append(item_ids)
+        return [{"item_id": item_id} for item_id in item_ids if item_id % 7 != 0]
+
+    def fetch_detail(self, item_id):
+        self.detail_calls.append(item_id)
+        if item_id == 13:
+            raise RuntimeError("detail failed")
+        return {"item_id": item_id}
+
+
+class FakeRepository:
+    def __init__(self, existing=(), fail_on_call=None):
+        self.existing = {str(rgst_no) for rgst_no in existing}
+        self.fail_on_call = fail_on_call
+        self.batches: list[list[HousePlatformUpsertBundle]] = []
+
+    def exists_rgst_nos(self, rgst_nos):
+        return {rgst_no for rgst_no in rgst_nos if rgst_no in self.existing}
+
+    def upsert_batch(self, bundles):
+        if self.fail_on_call == len(self.batches) + 1:
+            raise RuntimeError("db down")
+        self.batches.append(list(bundles))
+        return len(bundles)
+
+
+class MemoryCheckpoint(CrawlCheckpointPort):
+    def __init__(self):
+        self.offsets: dict[str, int] = {}
+        self.history: list[int] = []
+
+    def load(self, key):
+        return self.offsets.get(key)
+
+    def save(self, key, next_offset):
+        self.offsets[key] = next_offset
+        self.history.append(next_offset)
+
+    def clear(self, key):
+        self.offsets.pop(key, None)
+
+
+class CountingInvalidator:
+    def __init__(self):
+        self.calls = 0
+
+    def invalidate(self):
+        self.calls += 1
+
+
+def _service(fetch_port, repository, checkpoint=None, **kwargs):
+    service = FetchAndStoreHousePlatformService(
+        fetch_port,
+        repository,
+        checkpoint_port=checkpoint,
+        summary_chunk_size=5,
+        upsert_batch_size=10,
+        **kwargs,
+    )
+    service.adapter._map_raw_item_to_bundle = lambda detail: HousePlatformUpsertBundle(
+        house_platform=HousePlatformUpsertModel(
+            rgst_no=str(detail["item_id"]), title=f"매물 {detail['item_id']}"
+        )
+    )
+    return service
+
+
+def _stored_ids(repository):
+    return [int(b.house_platform.rgst_no) for batch in repository.batches for b in batch]
+
+
+def test_execute_streams_bounded_batches_with_snapshot_ids():
+    """청크 단위로 흘려 보내며 제한된 크기로 나눠 저장한다."""
+    fetch_port = FakeFetchPort()
+    repository = FakeRepository(existing=[3])
+    checkpoint = MemoryCheckpoint()
+    invalidator = CountingInvalidator()
+    service = _service(
+        fetch_port, repository, checkpoint, cache_invalidator=invalidator
+    )
+
+    result = service.execute(
+        FetchAndStoreCommand(item_ids=list(range(1, 41)), checkpoint_key="k")
+    )
+
+    expected = [
+        i for i in range(1, 41) if i % 7 != 0 and i not in {3, 13}
+    ]
+    assert _stored_ids(repository) == expected
+    assert all(len(batch) < 10 + 5 for batch in repository.batches)
+    assert len(repository.batches) > 1
+    assert all(
+        b.house_platform.snapshot_id for batch in repository.batches for b in batch
+    )
+    assert result.fetched == 35
+    assert result.stored == len(expected)
+    assert result.skipped == 35 - len(expected)
+    assert any("13" in err for err in result.errors)
+    assert checkpoint.offsets == {}
+    assert checkpoint.history == sorted(checkpoint.history)
+    assert invalidator.calls == 1
+
+
+def test_execute_resumes_from_last_stored_batch():
+    """저장 중 실패하면 마지막으로 저장된 배치 다음부터 이어서 수행한다."""
+    checkpoint = MemoryCheckpoint()
+    invalidator = CountingInvalidator()
+    failing = FakeRepository(fail_on_call=2)
+    command = FetchAndStoreCommand(item_ids=list(range(1, 41)), checkpoint_key="k")
+
+    with pytest.raises(RuntimeError):
+        _service(
+            FakeFetchPort(), failing, checkpoint, cache_invalidator=invalidator
+        ).execute(command)
+
+    saved = checkpoint.offsets["k"]
+    assert 0 < saved < 40
+    assert invalidator.calls == 1
+
+    fetch_port = FakeFetchPort()
+    repository = FakeRepository()
+    result = _service(fetch_port, repository, checkpoint).execute(command)
+
+    assert result.resumed_from == saved
+    assert fetch_port.summary_calls[0][0] == saved + 1
+    assert set(_stored_ids(failing)) | set(_stored_ids(repository)) == {
+        i for i in range(1, 41) if i % 7 != 0 and i != 13
+    }
+    assert checkpoint.offsets == {}
+
+
+def test_execute_without_checkpoint_key_starts_from_beginning():
+    """체크포인트 키가 없으면 저장된 위치를 쓰지 않는다."""
+    checkpoint = MemoryCheckpoint()
+    checkpoint.offsets["k"] = 20
+    fetch_port = FakeFetchPort()
+
+    _service(fetch_port, FakeRepository(), checkpoint).execute(
+        FetchAndStoreCommand(item_ids=list(range(1, 11)))
+    )
+
+    assert fetch_port.summary_calls[0][0] == 1
+    assert checkpoint.offsets == {"k": 20}
+
+
+def test_execute_waits_between_summary_chunks():
+    """chunk_delay 는 요약 청크 사이마다 한 번씩 호출된다."""
+    fetch_port = FakeFetchPort()
+    delays: list[int] = []
+    service = _service(
+        fetch_port,
+        FakeRepository(),
+        chunk_delay=lambda: delays.append(len(fetch_port.summary_calls)),
+    )
+
+    service.execute(FetchAndStoreCommand(item_ids=list(range(1, 16))))
+
+    assert len(fetch_port.summary_calls) == 3
+    assert delays == [1, 2]
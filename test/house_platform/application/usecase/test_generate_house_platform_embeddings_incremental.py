@@ -0,0 +1,156 @@
+import asyncio
+
+from modules.house_platform.application.dto.embedding_dto import (
+    HousePlatformSemanticSource,
+)
+from modules.house_platform.application.factory.house_platform_semantic_factory import (
+    build_semantic_house_description,
+    hash_semantic_description,
+)
+from modules.house_platform.application.usecase.generate_house_platform_embeddings import (
+    GenerateHousePlatformEmbeddingsService,
+)
+
+
+def _source(house_platform_id: int, **fields) -> HousePlatformSemanticSource:
+    base = dict(
+        house_platform_id=house_platform_id,
+        address="서울 동대문구",
+        room_type="원룸",
+        residence_type="오피스텔",
+        deposit=1000,
+        monthly_rent=50,
+        manage_cost=5,
+        contract_area=None,
+        exclusive_area=None,
+        floor_no=3,
+        all_floors=5,
+        can_park=None,
+        has_elevator=True,
+        built_in=None,
+        near_univ=None,
+        near_transport=None,
+        near_mart=None,
+        management_included=None,
+        management_excluded=None,
+        semantic_description=None,
+        snapshot_id=f"snap-{house_platform_id}",
+    )
+    base.update(fields)
+    return HousePlatformSemanticSource(**base)
+
+
+def _unchanged(source: HousePlatformSemanticSource) -> HousePlatformSemanticSource:
+    source.content_hash = hash_semantic_description(
+        build_semantic_house_description(source)
+    )
+    return source
+
+
+class FakeStore:
+    def __init__(self, stale):
+        self.stale = stale
+        self.page_calls: list[tuple[int, int]] = []
+        self.upserts = []
+        self.marks = []
+
+    def fetch_all_sources(self):
+        raise AssertionError("증분 모드는 전체 조회를 하지 않는다.")
+
+    def fetch_stale_sources(self, after_house_platform_id, limit):
+        self.page_calls.append((after_house_platform_id, limit))
+        rows = [
+            source
+            for source in self.stale
+            if source.house_platform_id > after_house_platform_id
+        ]
+        return rows[:limit]
+
+    def upsert_embeddings(self, items):
+        items = list(items)
+        self.upserts.extend(items)
+        return len(items)
+
+    def mark_embedding_sources(self, items):
+        self.marks.extend(items)
+        return len(items)
+
+
+class FakeEmbedder:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def embed_texts(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+def test_incremental_embeds_only_changed_text_in_keyset_pages():
+    """설명문이 바뀐 매물만 임베딩하고, 같은 매물은 스냅샷만 갱신한다."""
+    stale = [
+        _source(1),
+        _unchanged(_source(2, snapshot_id="snap-2-new")),
+        _source(3, deposit=2000),
+        _source(5),
+        _unchanged(_source(8)),
+    ]
+    store = FakeStore(stale)
+    embedder = FakeEmbedder()
+    usecase = GenerateHousePlatformEmbeddingsService(store, store, embedder)
+
+    result = asyncio.run(
+        usecase.execute(batch_size=2, concurrency=2, incremental=True, page_size=2)
+    )
+
+    assert store.page_calls == [(0, 2), (2, 2), (5, 2)]
+    assert result.total == 5
+    assert result.embedded == 3
+    assert result.saved == 3
+    assert result.skipped == 2
+    assert result.errors == []
+    assert sum(len(call) for call in embedder.calls) == 3
+
+    assert [item.house_platform_id for item in store.upserts] == [1, 3, 5]
+    first = store.upserts[0]
+    assert first.source_snapshot_id == "snap-1"
+    assert first.semantic_description == build_semantic_house_description(stale[0])
+    assert first.content_hash == hash_semantic_description(first.semantic_description)
+
+    assert [(m.house_platform_id, m.source_snapshot_id) for m in store.marks] == [
+        (2, "snap-2-new"),
+        (8, "snap-8"),
+    ]
+
+
+def test_incremental_without_changes_does_not_call_embedder():
+    """바뀐 매물이 없으면 임베딩 API 를 호출하지 않는다."""
+    store = FakeStore([])
+    embedder = FakeEmbedder()
+    usecase = GenerateHousePlatformEmbeddingsService(store, store, embedder)
+
+    result = asyncio.run(
+        usecase.execute(batch_size=10, concurrency=1, incremental=True)
+    )
+
+    assert result.total == 0
+    assert embedder.calls == []
+    assert store.page_calls == [(0, 1000)]
+
+
+def test_full_mode_records_hash_of_stored_description():
+    """전체 모드도 다음 증분 실행을 위해 해시와 스냅샷 ID를 남긴다."""
+
+    class FullStore(FakeStore):
+        def fetch_all_sources(self):
+            return self.stale
+
+    store = FullStore([_source(1, semantic_description="저장된 설명")])
+    usecase = GenerateHousePlatformEmbeddingsService(store, store, FakeEmbedder())
+
+    result = asyncio.run(usecase.execute(batch_size=10, concurrency=1))
+
+    assert result.embedded == 1
+    (item,) = store.upserts
+    assert item.semantic_description is None
+    assert item.content_hash == hash_semantic_description("저장된 설명")
+    assert item.source_snapshot_id == "snap-1"
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+
+from modules.house_platform.application.usecase.generate_house_platform_embeddings import (
+    GenerateHousePlatformEmbeddingsService,
+)
+from modules.house_platform.application.dto.embedding_dto import (
+    HousePlatformSemanticSource,
+)
+
+
+def _source(house_platform_id: int, description: str) -> HousePlatformSemanticSource:
+    fields = dict.fromkeys(
+        HousePlatformSemanticSource.__dataclass_fields__, None
+    )
+    fields.update(
+        house_platform_id=house_platform_id, semantic_description=description
+    )
+    return HousePlatformSemanticSource(**fields)
+
+
+class SlowEmbedder:
+    """설명문 앞의 번호로 지연 시간을 정하는 가짜 임베더. (음수면 실패)"""
+
+    def __init__(self, latency_by_first_id):
+        self.latency_by_first_id = latency_by_first_id
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def embed_texts(self, texts):
+        first_id = int(texts[0].split("|", 1)[0])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency_by_first_id[first_id])
+        finally:
+            self.in_flight -= 1
+        if first_id < 0:
+            raise RuntimeError("embedding failed")
+        return [[1.0] for _ in texts]
+
+
+class FakeStore:
+    def __init__(self, sources, write_delay=0.0):
+        self.sources = sources
+        self.write_delay = write_delay
+        self.upsert_calls = []
+        self.write_threads = set()
+
+    def fetch_all_sources(self):
+        return self.sources
+
+    def upsert_embeddings(self, items):
+        self.write_threads.add(threading.get_ident())
+        time.sleep(self.write_delay)
+        items = list(items)
+        self.upsert_calls.append([item.house_platform_id for item in items])
+        return len(items)
+
+
+def _usecase(store, embedder):
+    return GenerateHousePlatformEmbeddingsService(store, store, embedder)
+
+
+def test_pipeline_refills_slots_instead_of_waiting_for_slowest_in_wave():
+    """느린 배치가 있어도 빈 슬롯은 바로 다음 배치를 시작한다."""
+    # 배치 크기 1, 동시성 2: 매 웨이브마다 느린 배치가 하나씩 끼어 있다.
+    ids = list(range(1, 9))
+    latency = {i: (0.2 if i % 2 else 0.01) for i in ids}
+    sources = [_source(i, f"{i}|설명") for i in ids]
+    store = FakeStore(sources, write_delay=0.01)
+    embedder = SlowEmbedder(latency)
+
+    started = time.perf_counter()
+    result = asyncio.run(
+        _usecase(store, embedder).execute(batch_size=1, concurrency=2)
+    )
+    elapsed = time.perf_counter() - started
+
+    # 웨이브 방식이면 4 * 0.2 = 0.8초, 파이프라인은 약 (4 * 0.2 + 4 * 0.01) / 2 초
+    wave_time = sum(max(latency[i], latency[i + 1]) for i in ids[::2])
+    assert elapsed < wave_time * 0.8
+    assert embedder.max_in_flight == 2
+    assert result.embedded == 8
+    assert result.saved == 8
+    assert result.errors == []
+    assert sorted(i for call in store.upsert_calls for i in call) == ids
+    assert threading.get_ident() not in store.write_threads
+
+
+def test_pipeline_collects_embedding_errors_and_keeps_others():
+    """실패한 배치는 오류로 남기고 나머지는 저장한다."""
+    sources = [
+        _source(1, "1|설명"),
+        _source(2, "-1|설명"),
+        _source(3, "3|설명"),
+    ]
+    store = FakeStore(sources)
+    embedder = SlowEmbedder({1: 0.0, -1: 0.0, 3: 0.0})
+
+    result = asyncio.run(
+        _usecase(store, embedder).execute(batch_size=1, concurrency=3)
+    )
+
+    assert result.embedded == 2
+    assert result.skipped == 1
+    assert result.errors == ["embedding failed"]
+    assert sorted(i for call in store.upsert_calls for i in call) == [1, 3]
@@ -0,0 +1,44 @@
+import asyncio
+
+from modules.house_platform.application.port_out.house_platform_detail_read_port import (
+    HousePlatformDetailReadPort,
+)
+from modules.house_platform.application.usecase.get_house_platform_usecase import (
+    GetHousePlatformDetailAsyncUseCase,
+)
+from modules.house_platform.domain.house_platform import HousePlatform
+
+
+class _FakeDetailReader(HousePlatformDetailReadPort):
+    def __init__(self, accepted: set[tuple[int, int, int]]):
+        self.accepted = accepted
+        self.phone_reads = 0
+
+    async def find_by_id(self, house_platform_id: int):
+        if house_platform_id != 10:
+            return None
+        fields = {name: None for name in HousePlatform.__dataclass_fields__}
+        fields.update(house_platform_id=10, title="원룸", abang_user_id=7)
+        return HousePlatform(**fields)
+
+    async def has_accepted_offer(self, house_platform_id, owner_id, viewer_id):
+        return (house_platform_id, owner_id, viewer_id) in self.accepted
+
+    async def find_phone_number(self, abang_user_id):
+        self.phone_reads += 1
+        return "01012345678"
+
+
+def test_phone_number_exposed_only_to_owner_or_accepted_viewer():
+    reader = _FakeDetailReader(accepted={(10, 7, 3)})
+    usecase = GetHousePlatformDetailAsyncUseCase(reader)
+
+    accepted = asyncio.run(usecase.execute(10, viewer_id=3))
+    owner = asyncio.run(usecase.execute(10, viewer_id=7))
+    stranger = asyncio.run(usecase.execute(10, viewer_id=4))
+
+    assert accepted.phone_number == "01012345678"
+    assert owner.phone_number == "01012345678"
+    assert not hasattr(stranger, "phone_number")
+    assert reader.phone_reads == 2
+    assert asyncio.run(usecase.execute(99, viewer_id=3)) is None
@@ -0,0 +1,128 @@
+from modules.house_platform.adapter.output.zigbang_adapter import ZigbangAdapter
+from modules.house_platform.application.dto.monitor_house_platform_dto import (
+    HousePlatformMonitorTarget,
+    MonitorHousePlatformCommand,
+)
+from modules.house_platform.application.factory.house_platform_snapshot_factory import (
+    build_house_platform_snapshot_id,
+)
+from modules.house_platform.application.port_out.zigbang_fetch_port import (
+    ZigbangFetchPort,
+)
+from modules.house_platform.application.usecase.monitor_house_platform import (
+    MonitorHousePlatformService,
+)
+
+
+def _detail(item_id: int, title: str, status: str = "open") -> dict:
+    return {"itemId": item_id, "title": title, "status": status}
+
+
+def _snapshot(detail: dict) -> str:
+    bundle = ZigbangAdapter(None).convert_detail_item(detail)
+    bundle.house_platform.updated_at = None
+    return build_house_platform_snapshot_id(bundle)
+
+
+class FakeFetchPort(ZigbangFetchPort):
+    def __init__(self, details):
+        self.details = details
+        self.fetch_details_calls: list[list[int]] = []
+
+    def fetch_by_item_ids(self, item_ids):
+        return []
+
+    def fetch_detail(self, item_id):
+        if item_id not in self.details:
+            raise RuntimeError("not found")
+        return self.details[item_id]
+
+    def fetch_details(self, item_ids):
+        self.fetch_details_calls.append(list(item_ids))
+        return super().fetch_details(item_ids)
+
+
+class FakeRepository:
+    def __init__(self, targets, fail_rgst_nos=()):
+        self.targets = targets
+        self.fail_rgst_nos = set(fail_rgst_nos)
+        self.upsert_calls: list[list[str]] = []
+
+    def fetch_monitor_targets(self, updated_before, limit=None):
+        return self.targets
+
+    def fetch_bundle_by_id(self, house_platform_id):
+        raise AssertionError("번들 재조회 없이 스냅샷 ID로 비교해야 한다.")
+
+    def upsert_batch(self, bundles):
+        rgst_nos = [bundle.house_platform.rgst_no for bundle in bundles]
+        self.upsert_calls.append(rgst_nos)
+        if self.fail_rgst_nos & set(rgst_nos):
+            raise RuntimeError("db error")
+        return len(bundles)
+
+
+class CountingInvalidator:
+    def __init__(self):
+        self.calls = 0
+
+    def invalidate(self):
+        self.calls += 1
+
+
+def _target(house_platform_id, rgst_no, snapshot_id=None, domain_id=1):
+    return HousePlatformMonitorTarget(
+        house_platform_id=house_platform_id,
+        domain_id=domain_id,
+        rgst_no=rgst_no,
+        snapshot_id=snapshot_id,
+    )
+
+
+def test_execute_upserts_only_changed_bundles_in_one_batch():
+    """저장된 스냅샷 ID와 다른 매물만 한 번의 업서트로 저장한다."""
+    details = {
+        1: _detail(1, "그대로"),
+        2: _detail(2, "바뀜"),
+        3: _detail(3, "닫힘", status="close"),
+    }
+    targets = [
+        _target(10, "1", snapshot_id=_snapshot(details[1])),
+        _target(20, "2", snapshot_id=_snapshot(_detail(2, "예전 제목"))),
+        _target(30, "3", snapshot_id=None),
+        _target(40, "4"),
+        _target(50, "5", domain_id=2),
+        _target(60, None),
+    ]
+    fetch_port = FakeFetchPort(details)
+    repository = FakeRepository(targets)
+    invalidator = CountingInvalidator()
+
+    result = MonitorHousePlatformService(
+        fetch_port, repository, cache_invalidator=invalidator
+    ).execute(MonitorHousePlatformCommand())
+
+    assert fetch_port.fetch_details_calls == [[1, 2, 3, 4]]
+    assert repository.upsert_calls == [["2", "3"]]
+    assert result.checked == 6
+    assert result.updated == 2
+    assert result.skipped == 3
+    assert result.banned == 1
+    assert len(result.errors) == 1 and result.errors[0].startswith("상세 조회 실패 4")
+    assert invalidator.calls == 1
+
+
+def test_execute_isolates_failed_bundle_when_batch_upsert_fails():
+    """일괄 업서트가 실패하면 건별로 다시 저장해 실패 건만 에러로 남긴다."""
+    details = {1: _detail(1, "a"), 2: _detail(2, "b")}
+    repository = FakeRepository(
+        [_target(10, "1"), _target(20, "2")], fail_rgst_nos={"2"}
+    )
+
+    result = MonitorHousePlatformService(
+        FakeFetchPort(details), repository
+    ).execute(MonitorHousePlatformCommand())
+
+    assert repository.upsert_calls == [["1", "2"], ["1"], ["2"]]
+    assert result.updated == 1
+    assert result.errors == ["업데이트 실패 2: db error"]
@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from modules.finder_request.domain.finder_request import FinderRequest
+from modules.house_platform.application.dto.house_platform_dto import (
+    HousePlatformUpdateRequest,
+)
+from modules.house_platform.application.usecase.delete_house_platform_usecase import (
+    DeleteHousePlatformUseCase,
+)
+from modules.house_platform.application.usecase.update_house_platform_usecase import (
+    UpdateHousePlatformUseCase,
+)
+from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendStudentHouseCommand,
+)
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationResultCachePort,
+)
+from modules.recommendations.application.usecase.recommend_student_house import (
+    RecommendStudentHouseUseCase,
+)
+
+
+class VersionedCache(RecommendationResultCachePort):
+    def __init__(self):
+        self.version = 0
+
+    def data_version(self):
+        return self.version
+
+    def invalidate(self):
+        self.version += 1
+
+    def get(self, key):
+        return None
+
+    def put(self, key, result):
+        pass
+
+
+class FakeRepository:
+    def __init__(self, owner_id=1, delete_result=True):
+        self.house = SimpleNamespace(abang_user_id=owner_id, title="원룸")
+        self.delete_result = delete_result
+
+    def find_by_id(self, house_platform_id):
+        return self.house
+
+    def save(self, house):
+        return house
+
+    def delete(self, house_platform_id):
+        return self.delete_result
+
+
+def _cache_key(cache):
+    usecase = RecommendStudentHouseUseCase(
+        finder_request_repo=MagicMock(),
+        result_cache=cache,
+    )
+    request = FinderRequest(abang_user_id=1, status="Y", finder_request_id=7)
+    return usecase._build_cache_key(
+        RecommendStudentHouseCommand(finder_request_id=7), request
+    )
+
+
+def test_owner_delete_changes_recommendation_cache_key():
+    """소유자가 매물을 삭제하면 데이터 버전이 올라 추천 캐시 키가 바뀐다."""
+    cache = VersionedCache()
+    before = _cache_key(cache)
+
+    deleted = DeleteHousePlatformUseCase(FakeRepository(), cache).execute(1, 10)
+
+    assert deleted is True
+    assert _cache_key(cache) != before
+
+
+def test_failed_or_forbidden_delete_keeps_cache_key():
+    """삭제되지 않았거나 권한이 없으면 캐시를 무효화하지 않는다."""
+    cache = VersionedCache()
+    before = _cache_key(cache)
+
+    assert DeleteHousePlatformUseCase(
+        FakeRepository(delete_result=False), cache
+    ).execute(1, 10) is False
+    with pytest.raises(PermissionError):
+        DeleteHousePlatformUseCase(FakeRepository(owner_id=2), cache).execute(1, 10)
+
+    assert _cache_key(cache) == before
+
+
+def test_owner_update_invalidates_recommendation_cache():
+    """매물 수정이 저장되면 추천 캐시를 무효화한다."""
+    cache = VersionedCache()
+
+    UpdateHousePlatformUseCase(FakeRepository(), cache).execute(
+        1, 10, HousePlatformUpdateRequest(title="투룸")
+    )
+
+    assert cache.version == 1
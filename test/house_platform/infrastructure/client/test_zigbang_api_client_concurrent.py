@@ -0,0 +1,200 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from modules.house_platform.adapter.output.zigbang_adapter import ZigbangAdapter
+from modules.house_platform.infrastructure.client.rate_limiter import (
+    TokenBucketRateLimiter,
+)
+from modules.house_platform.infrastructure.client.zigbang_api_client import (
+    ZigbangApiClient,
+)
+
+
+class _FakeZigbangServer:
+    """/items/{id} 에 응답하는 로컬 가짜 직방 상세 API."""
+
+    def __init__(self, delay_sec: float = 0.0):
+        self.delay_sec = delay_sec
+        self.fail_first = set()
+        self.throttle_first = set()
+        self.always_fail = set()
+        self.calls: list[tuple[int, float]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._seen: set[int] = set()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                item_id = int(self.path.split("?")[0].rsplit("/", 1)[-1])
+                with server._lock:
+                    first = item_id not in server._seen
+                    server._seen.add(item_id)
+                    server.calls.append((item_id, time.monotonic()))
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    time.sleep(server.delay_sec)
+                    if item_id in server.always_fail or (
+                        first and item_id in server.fail_first
+                    ):
+                        self._send(500, {"error": "boom"})
+                    elif first and item_id in server.throttle_first:
+                        self._send(429, {"error": "slow down"}, {"Retry-After": "0"})
+                    else:
+                        self._send(200, {"item": {"item_id": item_id}})
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def _send(self, status, body, headers=None):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def fake_server():
+    with _FakeZigbangServer(delay_sec=0.1) as server:
+        yield server
+
+
+def _client(server, **kwargs) -> ZigbangApiClient:
+    kwargs.setdefault("backoff_base_sec", 0.01)
+    return ZigbangApiClient(
+        base_url=server.base_url, min_delay_sec=0, max_delay_sec=0, **kwargs
+    )
+
+
+def test_fetch_details_overlaps_requests_up_to_concurrency(fake_server):
+    """동시 조회 모드는 요청을 겹치되 동시 요청 수 상한을 지킨다."""
+    client = _client(fake_server, max_concurrency=4)
+
+    started = time.monotonic()
+    results = client.fetch_details(list(range(1, 9)))
+    elapsed = time.monotonic() - started
+
+    assert [r.item_id for r in results] == list(range(1, 9))
+    assert [r.detail for r in results] == [{"item_id": i} for i in range(1, 9)]
+    assert 1 < fake_server.max_in_flight <= 4
+    assert elapsed < 8 * 0.1
+
+
+def test_fetch_details_respects_per_host_cap(fake_server):
+    """호스트별 상한이 전체 동시 수보다 작으면 호스트 상한을 따른다."""
+    client = _client(fake_server, max_concurrency=6, max_per_host=2)
+
+    client.fetch_details(list(range(1, 7)))
+
+    assert fake_server.max_in_flight <= 2
+
+
+def test_fetch_details_respects_requests_per_sec():
+    """초당 요청 수 예산을 넘지 않도록 요청 시작 간격을 맞춘다."""
+    with _FakeZigbangServer() as server:
+        client = _client(server, max_concurrency=4, requests_per_sec=20)
+
+        client.fetch_details(list(range(1, 11)))
+
+        starts = sorted(at for _, at in server.calls)
+    # 버킷이 1개로 시작하므로 10건은 최소 9/20초에 걸쳐 시작된다.
+    assert starts[-1] - starts[0] >= 9 / 20 * 0.9
+
+
+def test_concurrency_without_rate_uses_delay_based_default():
+    """동시 조회에 속도를 주지 않으면 순차 모드의 평균 지연으로 요청 간격을 맞춘다."""
+    with _FakeZigbangServer() as server:
+        client = ZigbangApiClient(
+            base_url=server.base_url,
+            min_delay_sec=0.04,
+            max_delay_sec=0.06,
+            max_concurrency=4,
+        )
+
+        client.fetch_details(list(range(1, 7)))
+
+        starts = sorted(at for _, at in server.calls)
+    assert client.rate_limiter.rate_per_sec == pytest.approx(20)
+    assert starts[-1] - starts[0] >= 5 / 20 * 0.9
+
+
+def test_fetch_details_retries_with_backoff_and_reports_failures(fake_server):
+    """일시 오류/429 는 재시도하고, 재시도 후에도 실패한 건은 error 로 돌려준다."""
+    fake_server.fail_first = {2}
+    fake_server.throttle_first = {3}
+    fake_server.always_fail = {4}
+    client = _client(fake_server, max_concurrency=4, max_retries=2)
+
+    results = {r.item_id: r for r in client.fetch_details([1, 2, 3, 4])}
+
+    assert results[2].detail == {"item_id": 2}
+    assert results[3].detail == {"item_id": 3}
+    assert results[4].detail is None
+    assert results[4].error is not None
+    assert sum(1 for item_id, _ in fake_server.calls if item_id == 4) == 3
+
+
+def test_adapter_convert_details_uses_concurrent_fetch(fake_server, monkeypatch):
+    """어댑터는 입력 순서대로 변환하고 실패 건은 에러로 모은다."""
+    fake_server.always_fail = {2}
+    client = _client(fake_server, max_concurrency=3, max_retries=0)
+    adapter = ZigbangAdapter(client)
+    monkeypatch.setattr(
+        adapter, "_map_raw_item_to_bundle", lambda detail: detail["item_id"]
+    )
+
+    converted, errors = adapter.convert_details(
+        [{"item_id": 1}, {"item_id": 2}, {"itemId": 3}, {"item_id": 4}, {}],
+        skip_ids={"4"},
+    )
+
+    assert converted == [1, 3]
+    assert errors[0] == "item_id 없음"
+    assert errors[1].startswith("상세 조회/매핑 실패 2:")
+
+
+def test_token_bucket_waits_for_refill():
+    """토큰이 없으면 다음 토큰이 찰 때까지 기다린다."""
+    now = [0.0]
+    waits = []
+
+    def sleep(seconds):
+        waits.append(seconds)
+        now[0] += seconds
+
+    limiter = TokenBucketRateLimiter(
+        rate_per_sec=4, burst=2, clock=lambda: now[0], sleep=sleep
+    )
+    for _ in range(4):
+        limiter.acquire()
+
+    assert waits == [pytest.approx(0.25), pytest.approx(0.25)]
@@ -0,0 +1,179 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from modules.house_platform.application.dto.embedding_dto import (
+    HousePlatformEmbeddingSourceMark,
+    HousePlatformEmbeddingUpsert,
+)
+from modules.house_platform.infrastructure.repository.house_platform_embedding_repository import (
+    HousePlatformEmbeddingRepository,
+)
+
+# sqlite 는 BIGINT PK 를 자동 증가시키지 않으므로 테스트용 DDL 을 직접 만든다.
+_DDL = [
+    """
+    CREATE TABLE house_platform (
+        house_platform_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT, address TEXT, deposit BIGINT, abang_user_id BIGINT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        registered_at DATETIME, domain_id INTEGER DEFAULT 1,
+        rgst_no VARCHAR(50), snapshot_id VARCHAR(64), pnu_cd TEXT,
+        is_banned BOOLEAN DEFAULT 0, sales_type VARCHAR(20),
+        monthly_rent BIGINT, room_type VARCHAR(20), residence_type VARCHAR(50),
+        contract_area NUMERIC(10, 2), exclusive_area NUMERIC(10, 2),
+        floor_no INTEGER, all_floors INTEGER, lat_lng JSON,
+        manage_cost BIGINT, can_park BOOLEAN, has_elevator BOOLEAN,
+        image_urls TEXT, gu_nm VARCHAR(10), dong_nm VARCHAR(10)
+    )
+    """,
+    """
+    CREATE TABLE house_platform_management (
+        house_platform_management_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        house_platform_id BIGINT NOT NULL,
+        management_included TEXT, management_excluded TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE house_platform_options (
+        house_platform_options_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        house_platform_id BIGINT NOT NULL,
+        built_in TEXT, near_univ BOOLEAN, near_transport BOOLEAN,
+        near_mart BOOLEAN, nearby_pois JSON
+    )
+    """,
+    """
+    CREATE TABLE house_platform_embedding (
+        house_platform_embedding_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        house_platform_id BIGINT NOT NULL,
+        semantic_description TEXT, embedding TEXT,
+        content_hash VARCHAR(64), source_snapshot_id VARCHAR(64),
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+]
+_UNIQUE_INDEX = (
+    "CREATE UNIQUE INDEX uq_house_platform_embedding_house_platform_id "
+    "ON house_platform_embedding (house_platform_id)"
+)
+
+
+def _make_session_factory(with_unique_index: bool = True):
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        for ddl in _DDL + ([_UNIQUE_INDEX] if with_unique_index else []):
+            conn.execute(text(ddl))
+    return engine, sessionmaker(bind=engine)
+
+
+def _vector(value: float) -> list[float]:
+    return [value] * 1536
+
+
+def _upsert(house_platform_id: int, value: float, **fields):
+    return HousePlatformEmbeddingUpsert(
+        house_platform_id=house_platform_id, embedding=_vector(value), **fields
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_bulk_flag(monkeypatch):
+    monkeypatch.setattr(
+        HousePlatformEmbeddingRepository, "_bulk_upsert_supported", True
+    )
+
+
+def _rows(engine):
+    with engine.connect() as conn:
+        return conn.execute(
+            text(
+                "SELECT house_platform_id, semantic_description, content_hash, "
+                "source_snapshot_id, substr(embedding, 1, 4) "
+                "FROM house_platform_embedding ORDER BY house_platform_id"
+            )
+        ).all()
+
+
+def test_upsert_embeddings_bulk_keeps_description_when_missing():
+    """한 문장으로 업서트하고, 설명문이 없으면 기존 설명문을 유지한다."""
+    engine, factory = _make_session_factory()
+    repo = HousePlatformEmbeddingRepository(factory)
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    assert (
+        repo.upsert_embeddings(
+            [
+                _upsert(1, 1.0, semantic_description="설명1", content_hash="h1"),
+                _upsert(2, 2.0, semantic_description="설명2", content_hash="h2"),
+            ]
+        )
+        == 2
+    )
+    assert repo.upsert_embeddings([_upsert(1, 3.0, content_hash="h1b")]) == 1
+
+    writes = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(writes) == 2
+    assert _rows(engine) == [
+        (1, "설명1", "h1b", None, "[3.0"),
+        (2, "설명2", "h2", None, "[2.0"),
+    ]
+
+
+def test_upsert_embeddings_falls_back_to_rowwise_without_unique_index():
+    """ON CONFLICT 대상 인덱스가 없으면 단건 업서트로 전환한다."""
+    engine, factory = _make_session_factory(with_unique_index=False)
+    repo = HousePlatformEmbeddingRepository(factory)
+
+    assert repo.upsert_embeddings([_upsert(1, 1.0, semantic_description="설명")]) == 1
+    assert repo.upsert_embeddings([_upsert(1, 2.0, source_snapshot_id="s1")]) == 1
+
+    assert HousePlatformEmbeddingRepository._bulk_upsert_supported is False
+    assert _rows(engine) == [(1, "설명", None, "s1", "[2.0")]
+
+
+def test_fetch_stale_sources_pages_changed_listings():
+    """임베딩이 없거나 스냅샷이 바뀐 매물만 ID 순 키셋 페이지로 조회한다."""
+    engine, factory = _make_session_factory()
+    repo = HousePlatformEmbeddingRepository(factory)
+    with engine.begin() as conn:
+        for house_platform_id, snapshot_id, is_banned in [
+            (1, "s1", 0),
+            (2, "s2", 0),
+            (3, "s3-new", 0),
+            (4, "s4", 1),
+            (5, "s5", 0),
+        ]:
+            conn.execute(
+                text(
+                    "INSERT INTO house_platform (house_platform_id, snapshot_id, is_banned) "
+                    "VALUES (:id, :snapshot_id, :is_banned)"
+                ),
+                {"id": house_platform_id, "snapshot_id": snapshot_id, "is_banned": is_banned},
+            )
+    repo.upsert_embeddings(
+        [
+            _upsert(1, 1.0, content_hash="h1", source_snapshot_id="s1"),
+            _upsert(3, 1.0, content_hash="h3", source_snapshot_id="s3"),
+        ]
+    )
+
+    first = repo.fetch_stale_sources(0, 1)
+    second = repo.fetch_stale_sources(first[-1].house_platform_id, 10)
+
+    assert [source.house_platform_id for source in first] == [2]
+    assert [source.house_platform_id for source in second] == [3, 5]
+    assert (second[0].snapshot_id, second[0].content_hash) == ("s3-new", "h3")
+
+    repo.mark_embedding_sources(
+        [HousePlatformEmbeddingSourceMark(house_platform_id=3, source_snapshot_id="s3-new")]
+    )
+    assert [s.house_platform_id for s in repo.fetch_stale_sources(0, 10)] == [2, 5]
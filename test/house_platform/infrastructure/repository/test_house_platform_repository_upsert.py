@@ -0,0 +1,236 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from modules.house_platform.application.dto.fetch_and_store_dto import (
+    HousePlatformUpsertBundle,
+)
+from modules.house_platform.application.dto.house_platform_dto import (
+    HousePlatformManagementUpsertModel,
+    HousePlatformOptionUpsertModel,
+    HousePlatformUpsertModel,
+)
+from modules.house_platform.infrastructure.repository.house_platform_repository import (
+    HousePlatformRepository,
+)
+
+# sqlite 는 BIGINT PK 를 자동 증가시키지 않으므로 테스트용 DDL 을 직접 만든다.
+_DDL = [
+    """
+    CREATE TABLE house_platform (
+        house_platform_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT, address TEXT, deposit BIGINT, abang_user_id BIGINT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        registered_at DATETIME, domain_id INTEGER DEFAULT 1,
+        rgst_no VARCHAR(50), snapshot_id VARCHAR(64), pnu_cd TEXT,
+        is_banned BOOLEAN DEFAULT 0, sales_type VARCHAR(20),
+        monthly_rent BIGINT, room_type VARCHAR(20), residence_type VARCHAR(50),
+        contract_area NUMERIC(10, 2), exclusive_area NUMERIC(10, 2),
+        floor_no INTEGER, all_floors INTEGER, lat_lng JSON,
+        manage_cost BIGINT, can_park BOOLEAN, has_elevator BOOLEAN,
+        image_urls TEXT, gu_nm VARCHAR(10), dong_nm VARCHAR(10)
+    )
+    """,
+    """
+    CREATE TABLE house_platform_management (
+        house_platform_management_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        house_platform_id BIGINT NOT NULL,
+        management_included TEXT, management_excluded TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE house_platform_options (
+        house_platform_options_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        house_platform_id BIGINT NOT NULL,
+        built_in TEXT, near_univ BOOLEAN, near_transport BOOLEAN,
+        near_mart BOOLEAN, nearby_pois JSON
+    )
+    """,
+]
+_UNIQUE_INDEXES = [
+    "CREATE UNIQUE INDEX uq_house_platform_rgst_no ON house_platform (rgst_no)",
+    "CREATE UNIQUE INDEX uq_house_platform_management_house_platform_id "
+    "ON house_platform_management (house_platform_id)",
+    "CREATE UNIQUE INDEX uq_house_platform_options_house_platform_id "
+    "ON house_platform_options (house_platform_id)",
+]
+
+
+def _make_session_factory(with_unique_indexes: bool = True):
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        for ddl in _DDL + (_UNIQUE_INDEXES if with_unique_indexes else []):
+            conn.execute(text(ddl))
+    return engine, sessionmaker(bind=engine)
+
+
+def _bundle(rgst_no: str, **fields) -> HousePlatformUpsertBundle:
+    management = fields.pop("management", None)
+    options = fields.pop("options", None)
+    return HousePlatformUpsertBundle(
+        house_platform=HousePlatformUpsertModel(rgst_no=rgst_no, **fields),
+        management=management,
+        options=options,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_bulk_flag(monkeypatch):
+    monkeypatch.setattr(HousePlatformRepository, "_bulk_upsert_supported", True)
+
+
+def test_upsert_batch_inserts_with_defaults_and_keeps_values_on_update():
+    """신규 행은 기본값을 채우고, 갱신 시 빈 값/차단 여부는 기존 값을 유지한다."""
+    engine, factory = _make_session_factory()
+    repo = HousePlatformRepository(factory)
+
+    stored = repo.upsert_batch(
+        [
+            _bundle("A1", title="원룸", deposit=1000, lat_lng={"lat": 37.5, "lng": 127.0}),
+            _bundle("A2", title="투룸", domain_id=None),
+            _bundle(None, title="번호 없음"),
+        ]
+    )
+    assert stored == 2
+
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE house_platform SET is_banned = 1 WHERE rgst_no = 'A1'"))
+
+    stored = repo.upsert_batch(
+        [_bundle("A1", title="원룸(수정)", deposit=None, is_banned=False)]
+    )
+    assert stored == 1
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT rgst_no, title, deposit, is_banned, domain_id, lat_lng, created_at "
+                "FROM house_platform ORDER BY rgst_no"
+            )
+        ).all()
+    assert [row[0] for row in rows] == ["A1", "A2"]
+    a1, a2 = rows
+    assert a1[1] == "원룸(수정)"
+    assert a1[2] == 1000
+    assert a1[3] == 1
+    assert a1[5] == '{"lat": 37.5, "lng": 127.0}'
+    assert a1[6] is not None
+    assert a2[3] == 0
+    assert a2[4] == 1
+
+
+def test_upsert_batch_applies_duplicate_rgst_no_in_order():
+    """한 배치 안의 같은 rgst_no 는 순서대로 반영된다."""
+    engine, factory = _make_session_factory()
+    repo = HousePlatformRepository(factory)
+
+    stored = repo.upsert_batch(
+        [
+            _bundle("B1", title="첫번째", deposit=500),
+            _bundle("B1", title="두번째"),
+        ]
+    )
+
+    assert stored == 2
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT title, deposit FROM house_platform WHERE rgst_no = 'B1'")
+        ).all()
+    assert rows == [("두번째", 500)]
+
+
+def test_upsert_batch_upserts_management_and_options():
+    """관리비/옵션은 매물 PK 기준으로 한 행만 유지하며 빈 값은 덮어쓰지 않는다."""
+    engine, factory = _make_session_factory()
+    repo = HousePlatformRepository(factory)
+
+    repo.upsert_batch(
+        [
+            _bundle(
+                "C1",
+                management=HousePlatformManagementUpsertModel(
+                    management_included='["수도"]',
+                    management_excluded='["전기"]',
+                ),
+                options=HousePlatformOptionUpsertModel(
+                    built_in=["에어컨"], near_univ=True
+                ),
+            ),
+            _bundle("C2", options=HousePlatformOptionUpsertModel()),
+        ]
+    )
+    repo.upsert_batch(
+        [
+            _bundle(
+                "C1",
+                management=HousePlatformManagementUpsertModel(
+                    management_included='["수도", "인터넷"]'
+                ),
+                options=HousePlatformOptionUpsertModel(near_mart=False),
+            )
+        ]
+    )
+
+    with engine.connect() as conn:
+        house_platform_id = conn.execute(
+            text("SELECT house_platform_id FROM house_platform WHERE rgst_no = 'C1'")
+        ).scalar_one()
+        management = conn.execute(
+            text(
+                "SELECT house_platform_id, management_included, management_excluded "
+                "FROM house_platform_management"
+            )
+        ).all()
+        options = conn.execute(
+            text(
+                "SELECT house_platform_id, built_in, near_univ, near_mart "
+                "FROM house_platform_options"
+            )
+        ).all()
+    assert management == [(house_platform_id, '["수도", "인터넷"]', '["전기"]')]
+    assert options == [(house_platform_id, '["에어컨"]', 1, 0)]
+
+
+def test_upsert_batch_uses_few_statements_per_chunk():
+    """번들 수와 무관하게 청크당 몇 개의 문장만 실행한다."""
+    engine, factory = _make_session_factory()
+    repo = HousePlatformRepository(factory)
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    bundles = [
+        _bundle(
+            f"D{i}",
+            title=f"매물 {i}",
+            management=HousePlatformManagementUpsertModel(management_included="[]"),
+            options=HousePlatformOptionUpsertModel(near_univ=True),
+        )
+        for i in range(200)
+    ]
+    assert repo.upsert_batch(bundles) == 200
+
+    writes = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(writes) == 3
+
+
+def test_upsert_batch_falls_back_to_rowwise_without_unique_index():
+    """ON CONFLICT 대상 인덱스가 없으면 단건 업서트로 전환한다."""
+    engine, factory = _make_session_factory(with_unique_indexes=False)
+    repo = HousePlatformRepository(factory)
+
+    assert repo.upsert_batch([_bundle("E1", title="원룸")]) == 1
+    assert repo.upsert_batch([_bundle("E1", title="원룸(수정)")]) == 1
+
+    assert HousePlatformRepository._bulk_upsert_supported is False
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT title, is_banned FROM house_platform")
+        ).all()
+    assert rows == [("원룸(수정)", 0)]
@@ -0,0 +1,34 @@
+import json
+
+from infrastructure.checkpoint.keyed_json_file_store import KeyedJsonFileStore
+from modules.house_platform.infrastructure.checkpoint.file_crawl_checkpoint_store import (
+    FileCrawlCheckpointStore,
+)
+
+
+def test_store_writes_prefix_and_field_per_key(tmp_path):
+    """키별 파일에 지정한 필드로 값을 쓰고, 다른 prefix 와 섞이지 않는다."""
+    offsets = KeyedJsonFileStore(str(tmp_path), "crawl_checkpoint", "next_offset")
+    cursors = KeyedJsonFileStore(str(tmp_path), "observation_cursor", "last_house_platform_id")
+
+    offsets.save("run/1", 30)
+    cursors.save("run/1", 500)
+
+    payload = json.loads((tmp_path / ".crawl_checkpoint_run_1.json").read_text())
+    assert payload == {"key": "run/1", "next_offset": 30}
+    assert offsets.load("run/1") == 30
+    assert cursors.load("run/1") == 500
+
+    offsets.clear("run/1")
+    offsets.clear("run/1")
+    assert offsets.load("run/1") is None
+    assert cursors.load("run/1") == 500
+
+
+def test_crawl_checkpoint_store_reads_existing_files(tmp_path):
+    """공용 저장소로 옮겨도 기존 크롤링 체크포인트 파일을 그대로 읽는다."""
+    (tmp_path / ".crawl_checkpoint_k.json").write_text(
+        json.dumps({"key": "k", "next_offset": 45}), encoding="utf-8"
+    )
+
+    assert FileCrawlCheckpointStore(str(tmp_path)).load("k") == 45
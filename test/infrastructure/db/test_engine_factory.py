@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import exc, text
+
+from infrastructure.db import engine_factory
+from infrastructure.db.engine_factory import (
+    ENGINE_PROFILES,
+    InstrumentedQueuePool,
+    create_db_engine,
+    get_all_pool_stats,
+    get_pool_stats,
+    load_engine_profile,
+)
+
+
+def test_load_engine_profile_defaults_to_api_without_echo():
+    profile = load_engine_profile(environ={})
+
+    assert profile == ENGINE_PROFILES["api"]
+    assert profile.echo is False
+
+
+def test_load_engine_profile_applies_env_overrides():
+    environ = {
+        "DB_ENGINE_PROFILE": "worker",
+        "DB_POOL_SIZE": "7",
+        "DB_ECHO": "true",
+        "DB_BATCH_POOL_TIMEOUT": "90",
+    }
+
+    worker = load_engine_profile(environ=environ)
+    batch = load_engine_profile("batch", environ=environ)
+
+    assert worker.name == "worker"
+    assert worker.pool_size == 7
+    assert worker.echo is True
+    # 공통 키는 프로세스 기본 프로필에만 적용된다.
+    assert batch.pool_size == ENGINE_PROFILES["batch"].pool_size
+    assert batch.pool_timeout == 90
+
+
+def test_load_engine_profile_rejects_unknown_profile():
+    with pytest.raises(ValueError):
+        load_engine_profile("unknown", environ={})
+
+
+def test_pool_stats_report_checked_out_and_timeouts(tmp_path, monkeypatch):
+    # 프로세스 전역 엔진 등록부를 오염시키지 않는다.
+    monkeypatch.setattr(engine_factory, "_engines", {})
+    profile = load_engine_profile(
+        "batch",
+        environ={"DB_BATCH_POOL_SIZE": "1", "DB_BATCH_MAX_OVERFLOW": "0",
+                 "DB_BATCH_POOL_TIMEOUT": "0.05"},
+    )
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", profile)
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+
+    conn = engine.connect()
+    conn.execute(text("SELECT 1"))
+    stats = get_pool_stats(engine)
+    assert stats["profile"] == "batch"
+    assert stats["checked_out"] == 1
+    assert stats["wait"]["acquired"] == 1
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    conn.close()
+
+    stats = get_pool_stats(engine)
+    assert stats["checked_out"] == 0
+    assert stats["checked_in"] == 1
+    assert stats["wait"]["timeouts"] == 1
+    assert stats["wait"]["max_wait_ms"] >= 40
+
+    # dispose 로 풀이 다시 만들어져도 누적 통계는 유지된다.
+    engine.dispose()
+    assert get_pool_stats(engine)["wait"]["timeouts"] == 1
+    assert any(item["profile"] == "batch" for item in get_all_pool_stats())
+    engine.dispose()
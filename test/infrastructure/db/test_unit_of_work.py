@@ -0,0 +1,129 @@
+import threading
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.db.session_helper import (
+    UnitOfWork,
+    current_unit_of_work,
+    open_session,
+)
+
+
+class _CountingFactory:
+    def __init__(self, engine):
+        self._factory = sessionmaker(bind=engine)
+        self.created = 0
+
+    def __call__(self):
+        self.created += 1
+        return self._factory()
+
+
+@pytest.fixture
+def factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'uow.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)"))
+    yield _CountingFactory(engine)
+    engine.dispose()
+
+
+def _repository_call(factory, sql: str, params=None):
+    # 저장소 메서드와 같은 open_session 사용 패턴
+    session, generator = open_session(factory)
+    try:
+        result = session.execute(text(sql), params or {})
+        if sql.lstrip().upper().startswith("INSERT"):
+            session.commit()
+            return None
+        return result.scalar()
+    finally:
+        if generator:
+            generator.close()
+        else:
+            session.close()
+
+
+def test_repository_calls_share_one_session_inside_unit_of_work(factory):
+    with UnitOfWork(factory) as uow:
+        _repository_call(factory, "INSERT INTO item (id, name) VALUES (1, 'a')")
+        count = _repository_call(factory, "SELECT COUNT(*) FROM item")
+        assert current_unit_of_work() is uow
+
+    assert count == 1
+    assert factory.created == 1
+    assert current_unit_of_work() is None
+
+    _repository_call(factory, "SELECT COUNT(*) FROM item")
+    _repository_call(factory, "SELECT COUNT(*) FROM item")
+    assert factory.created == 3
+
+
+def test_unit_of_work_commits_on_success_and_rolls_back_on_error(factory):
+    with UnitOfWork(factory) as uow:
+        uow.session.execute(text("INSERT INTO item (id, name) VALUES (1, 'a')"))
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(factory) as uow:
+            uow.session.execute(text("INSERT INTO item (id, name) VALUES (2, 'b')"))
+            raise RuntimeError("boom")
+
+    assert _repository_call(factory, "SELECT COUNT(*) FROM item") == 1
+
+
+def test_other_factories_and_join_false_open_new_sessions(factory, tmp_path):
+    other = _CountingFactory(create_engine(f"sqlite:///{tmp_path / 'other.db'}"))
+
+    with UnitOfWork(factory) as uow:
+        session, generator = open_session(other)
+        assert session is not uow.session
+        session.close()
+
+        session, generator = open_session(factory, join=False)
+        assert session is not uow.session
+        session.close()
+
+    assert factory.created == 2
+    assert other.created == 1
+
+
+def test_unit_of_work_is_not_shared_across_threads(factory):
+    seen = {}
+
+    with UnitOfWork(factory):
+        thread = threading.Thread(
+            target=lambda: seen.setdefault("uow", current_unit_of_work())
+        )
+        thread.start()
+        thread.join()
+
+    assert seen["uow"] is None
+
+
+def test_request_scope_dependency_reaches_sync_endpoint(factory):
+    async def scope():
+        uow = UnitOfWork(factory)
+        uow.__enter__()
+        try:
+            yield uow.session
+        finally:
+            uow.__exit__(None, None, None)
+
+    router = APIRouter(dependencies=[Depends(scope)])
+
+    @router.get("/items")
+    def list_items():
+        _repository_call(factory, "INSERT INTO item (id, name) VALUES (1, 'a')")
+        return {"count": _repository_call(factory, "SELECT COUNT(*) FROM item")}
+
+    app = FastAPI()
+    app.include_router(router)
+
+    response = TestClient(app).get("/items")
+
+    assert response.json() == {"count": 1}
+    assert factory.created == 1
@@ -0,0 +1,102 @@
+import json
+import threading
+import time
+
+from modules.mq.adapter.input.consumer.in_memory_consumer_transport import (
+    InMemoryBroker,
+    InMemoryConsumerTransport,
+)
+from modules.mq.adapter.input.consumer.search_house_worker_pool import (
+    SearchHouseWorkerPool,
+)
+
+QUEUE = "search.house.request"
+
+
+def _publish(broker: InMemoryBroker, count: int) -> None:
+    for search_house_id in range(1, count + 1):
+        broker.publish(
+            QUEUE, json.dumps({"search_house_id": search_house_id}).encode()
+        )
+
+
+def test_worker_pool_processes_messages_concurrently_and_acks():
+    broker = InMemoryBroker()
+    transport = InMemoryConsumerTransport(broker)
+    _publish(broker, 12)
+
+    # 워커 4개가 동시에 처리 중이어야 barrier 를 통과한다.
+    barrier = threading.Barrier(4, timeout=5)
+    handled = []
+    lock = threading.Lock()
+
+    def handler(body: bytes) -> None:
+        search_house_id = json.loads(body)["search_house_id"]
+        if search_house_id <= 4:
+            barrier.wait()
+        with lock:
+            handled.append(search_house_id)
+
+    pool = SearchHouseWorkerPool(
+        transport, handler, queue=QUEUE, worker_count=4, prefetch_count=1
+    )
+    pool.start()
+    try:
+        assert broker.wait_until_drained(QUEUE, timeout=5)
+    finally:
+        pool.stop(timeout=5)
+
+    assert sorted(handled) == list(range(1, 13))
+    assert len(broker.acked[QUEUE]) == 12
+    assert len(transport.opened_channels) == 4
+    assert not barrier.broken
+
+
+def test_worker_pool_acks_failed_messages():
+    broker = InMemoryBroker()
+    transport = InMemoryConsumerTransport(broker)
+    _publish(broker, 3)
+
+    def handler(body: bytes) -> None:
+        raise RuntimeError("recommend failed")
+
+    pool = SearchHouseWorkerPool(transport, handler, queue=QUEUE, worker_count=2)
+    pool.start()
+    try:
+        assert broker.wait_until_drained(QUEUE, timeout=5)
+    finally:
+        pool.stop(timeout=5)
+
+    assert len(broker.acked[QUEUE]) == 3
+
+
+def test_worker_pool_stop_finishes_in_flight_and_keeps_undelivered():
+    broker = InMemoryBroker()
+    transport = InMemoryConsumerTransport(broker)
+    _publish(broker, 5)
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def handler(body: bytes) -> None:
+        started.set()
+        release.wait(timeout=5)
+
+    pool = SearchHouseWorkerPool(
+        transport, handler, queue=QUEUE, worker_count=1, prefetch_count=2
+    )
+    pool.start()
+    assert started.wait(timeout=5)
+    deadline = time.monotonic() + 5
+    while broker.unacked_count() < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    stopper = threading.Thread(target=pool.stop, kwargs={"timeout": 5})
+    stopper.start()
+    release.set()
+    stopper.join(timeout=5)
+
+    # prefetch 로 받은 2건은 처리/ack 되고 나머지는 큐에 남는다.
+    assert len(broker.acked[QUEUE]) == 2
+    assert broker.pending_count(QUEUE) == 3
+    assert broker.unacked_count() == 0
@@ -0,0 +1,116 @@
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pika import exceptions as pika_exceptions
+
+from modules.mq.adapter.output.repository.rabbitmq_producer import RabbitMQProducer
+
+BLOCKING_CONNECTION = (
+    "modules.mq.adapter.output.repository.rabbitmq_producer.pika.BlockingConnection"
+)
+
+
+def _fake_connection():
+    connection = MagicMock()
+    connection.is_open = True
+    channel = MagicMock()
+    channel.is_open = True
+    connection.channel.return_value = channel
+    return connection, channel
+
+
+def _published_ids(channel) -> list[int]:
+    return [
+        json.loads(call.kwargs["body"])["search_house_id"]
+        for call in channel.basic_publish.call_args_list
+    ]
+
+
+def test_producer_reuses_connection_and_declares_topology_once():
+    connection, channel = _fake_connection()
+    with patch(BLOCKING_CONNECTION, return_value=connection) as factory:
+        producer = RabbitMQProducer("localhost", 5672, "u", "p")
+        producer.publish_search_house(1)
+        producer.publish_search_house(2)
+        producer.publish_many([3, 4])
+
+    assert factory.call_count == 1
+    channel.exchange_declare.assert_called_once()
+    channel.queue_declare.assert_called_once()
+    channel.queue_bind.assert_called_once()
+    channel.confirm_delivery.assert_called_once()
+    assert _published_ids(channel) == [1, 2, 3, 4]
+
+
+def test_producer_reconnects_and_republishes_unconfirmed_messages():
+    broken, broken_channel = _fake_connection()
+    # 두 번째 메시지에서 연결이 끊긴다.
+    broken_channel.basic_publish.side_effect = [
+        None,
+        pika_exceptions.StreamLostError("lost"),
+    ]
+    healthy, healthy_channel = _fake_connection()
+
+    with patch(BLOCKING_CONNECTION, side_effect=[broken, healthy]):
+        producer = RabbitMQProducer("localhost", 5672, "u", "p")
+        producer.publish_many([10, 11, 12])
+
+    assert json.loads(
+        broken_channel.basic_publish.call_args_list[0].kwargs["body"]
+    ) == {"search_house_id": 10}
+    assert _published_ids(healthy_channel) == [11, 12]
+    broken.close.assert_called_once()
+    # 재연결 시 토폴로지를 다시 선언한다.
+    healthy_channel.exchange_declare.assert_called_once()
+
+
+def test_producer_does_not_retry_nacked_messages():
+    connection, channel = _fake_connection()
+    channel.basic_publish.side_effect = pika_exceptions.NackError([])
+
+    with patch(BLOCKING_CONNECTION, return_value=connection) as factory:
+        producer = RabbitMQProducer("localhost", 5672, "u", "p")
+        with pytest.raises(pika_exceptions.NackError):
+            producer.publish_search_house(1)
+
+    assert factory.call_count == 1
+
+
+def test_producer_pool_serves_concurrent_publishers():
+    connections = [_fake_connection() for _ in range(2)]
+    in_use = threading.Semaphore(0)
+    release = threading.Event()
+
+    def slow_publish(**kwargs):
+        in_use.release()
+        release.wait(timeout=5)
+
+    for _, channel in connections:
+        channel.basic_publish.side_effect = slow_publish
+
+    with patch(
+        BLOCKING_CONNECTION, side_effect=[connection for connection, _ in connections]
+    ) as factory:
+        producer = RabbitMQProducer("localhost", 5672, "u", "p", pool_size=2)
+        threads = [
+            threading.Thread(target=producer.publish_search_house, args=(i,))
+            for i in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        # 두 스레드가 서로 다른 채널로 동시에 발행 중이어야 한다.
+        assert in_use.acquire(timeout=5) and in_use.acquire(timeout=5)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        producer.publish_search_house(3)
+        producer.close()
+
+    assert factory.call_count == 2
+    assert sorted(
+        _published_ids(connections[0][1]) + _published_ids(connections[1][1])
+    ) == [0, 1, 3]
+    for connection, _ in connections:
+        connection.close.assert_called_once()
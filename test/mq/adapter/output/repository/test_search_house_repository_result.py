@@ -0,0 +1,69 @@
+import json
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.orm.search_house import SearchHouse
+from modules.mq.adapter.output.repository.search_house_repository import (
+    SearchHouseRepository,
+)
+from modules.mq.application.usecase.get_search_house_status_usecase import (
+    GetSearchHouseStatusUseCase,
+)
+
+
+def _session(*rows):
+    engine = create_engine("sqlite://")
+    SearchHouse.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all(rows)
+    session.commit()
+    return session
+
+
+def test_save_result_stores_compressed_blob_and_raw_poll_matches_parsed_poll():
+    session = _session(
+        SearchHouse(search_house_id=1, finder_request_id=3, status="COMPLETED")
+    )
+    repo = SearchHouseRepository(session, result_encoding="gzip")
+    repo.save_result(1, {"recommended_top_k": [{"rank": 1, "title": "신촌"}]})
+
+    row = session.query(SearchHouse.result_blob, SearchHouse.result_encoding).one()
+    assert row.result_encoding == "gzip"
+    assert row.result_blob[:2] == b"\x1f\x8b"
+
+    usecase = GetSearchHouseStatusUseCase(session)
+    raw = usecase.execute_raw(1)
+    parsed = usecase.execute(1)
+
+    # 기존 polling 응답(FastAPI 인코딩)과 같은 JSON 이어야 한다.
+    assert json.loads(raw) == jsonable_encoder(parsed)
+    assert parsed["result"] == {"recommended_top_k": [{"rank": 1, "title": "신촌"}]}
+
+
+def test_legacy_result_json_rows_are_served_as_objects():
+    session = _session(
+        SearchHouse(
+            search_house_id=1,
+            finder_request_id=3,
+            status="COMPLETED",
+            result_json='{"items": [3]}',
+        )
+    )
+
+    raw = GetSearchHouseStatusUseCase(session).execute_raw(1)
+
+    assert json.loads(raw)["result"] == {"items": [3]}
+
+
+def test_raw_poll_without_result_returns_null():
+    session = _session(
+        SearchHouse(search_house_id=1, finder_request_id=3, status="QUEUED")
+    )
+
+    payload = json.loads(GetSearchHouseStatusUseCase(session).execute_raw(1))
+
+    assert payload["status"] == "QUEUED"
+    assert payload["result"] is None
+    assert GetSearchHouseStatusUseCase(session).execute_raw(2) is None
@@ -0,0 +1,76 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from modules.mq.application.factory.search_house_result_codec import (
+    ENCODING_GZIP,
+    ENCODING_JSON,
+    ENCODING_ZSTD,
+    decode_search_house_result,
+    decompress_search_house_result,
+    encode_search_house_result,
+    resolve_encoding,
+    zstandard,
+)
+from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendStudentHouseResult,
+)
+
+
+def _result() -> RecommendStudentHouseResult:
+    return RecommendStudentHouseResult(
+        finder_request_id=7,
+        generated_at="2026-01-01T00:00:00+00:00",
+        status="SUCCESS",
+        detail=None,
+        query_context={"policy_version": "v1"},
+        summary={"total_candidates": 2},
+        recommended_top_k=[
+            {
+                "rank": 1,
+                "house_platform_id": 1,
+                "raw": {
+                    "title": "신촌 원룸",
+                    "registered_at": datetime(2026, 1, 2, 3, 4, 5),
+                    "contract_area": Decimal("23.5"),
+                },
+            }
+        ],
+        rejected_top_k=[],
+    )
+
+
+@pytest.mark.parametrize("encoding", [ENCODING_JSON, ENCODING_GZIP])
+def test_round_trip_matches_asdict_json(encoding):
+    blob = encode_search_house_result(_result(), encoding)
+
+    decoded = decode_search_house_result(blob, encoding)
+
+    assert decoded["finder_request_id"] == 7
+    item = decoded["recommended_top_k"][0]["raw"]
+    assert item == {
+        "title": "신촌 원룸",
+        "registered_at": "2026-01-02T03:04:05",
+        "contract_area": 23.5,
+    }
+
+
+def test_json_encoding_is_compact_utf8():
+    raw = decompress_search_house_result(
+        encode_search_house_result({"title": "신촌", "a": [1, 2]}, ENCODING_JSON),
+        ENCODING_JSON,
+    )
+
+    assert raw == '{"title":"신촌","a":[1,2]}'.encode("utf-8")
+    assert json.loads(raw) == {"title": "신촌", "a": [1, 2]}
+
+
+def test_resolve_encoding_falls_back_when_zstd_missing():
+    expected = ENCODING_ZSTD if zstandard is not None else ENCODING_GZIP
+
+    assert resolve_encoding("ZSTD") == expected
+    assert resolve_encoding(None) == ENCODING_GZIP
+    with pytest.raises(ValueError):
+        resolve_encoding("brotli")
@@ -0,0 +1,52 @@
+from modules.mq.adapter.input.consumer.in_memory_consumer_transport import (
+    InMemoryBroker,
+)
+from modules.mq.adapter.output.repository.in_memory_message_queue import (
+    InMemoryMessageQueue,
+)
+from modules.mq.application.usecase.enqueue_search_house import (
+    EnqueueSearchHouseUseCase,
+)
+
+
+class FakeSearchHouseRepository:
+    def __init__(self):
+        self.next_id = 100
+        self.statuses: dict[int, str] = {}
+
+    def create_pending(self, finder_request_id: int) -> int:
+        self.next_id += 1
+        self.statuses[self.next_id] = "PENDING"
+        return self.next_id
+
+    def mark_queued(self, search_house_id: int) -> None:
+        self.statuses[search_house_id] = "QUEUED"
+
+
+class FailingMessageQueue(InMemoryMessageQueue):
+    def publish_many(self, search_house_ids):
+        raise ConnectionError("broker down")
+
+
+def test_enqueue_publishes_and_marks_queued():
+    broker = InMemoryBroker()
+    repo = FakeSearchHouseRepository()
+    mq = InMemoryMessageQueue(broker=broker)
+
+    search_house_id = EnqueueSearchHouseUseCase(repo=repo, mq=mq).execute(7)
+
+    assert mq.published == [search_house_id]
+    assert broker.pending_count("search.house.request") == 1
+    assert repo.statuses[search_house_id] == "QUEUED"
+
+
+def test_enqueue_keeps_pending_when_publish_fails():
+    repo = FakeSearchHouseRepository()
+    usecase = EnqueueSearchHouseUseCase(repo=repo, mq=FailingMessageQueue())
+
+    try:
+        usecase.execute(7)
+    except ConnectionError:
+        pass
+
+    assert list(repo.statuses.values()) == ["PENDING"]
@@ -0,0 +1,81 @@
+import asyncio
+import json
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from modules.mq.adapter.input.web.dependencies import (
+    get_search_house_status_async_usecase,
+)
+from modules.mq.adapter.input.web.router.search_house_router import router
+from modules.mq.application.port.search_house_status_read_port import (
+    SearchHouseStatusReadPort,
+)
+from modules.mq.application.usecase.get_search_house_status_async_usecase import (
+    GetSearchHouseStatusAsyncUseCase,
+)
+
+
+class _FakeReader(SearchHouseStatusReadPort):
+    def __init__(self, rows: dict[int, tuple[str, bytes | None]]):
+        self.rows = rows
+        self.result_reads = 0
+
+    async def get_status(self, search_house_id: int) -> dict | None:
+        if search_house_id not in self.rows:
+            return None
+        status, _ = self.rows[search_house_id]
+        return {
+            "search_house_id": search_house_id,
+            "status": status,
+            "completed_at": datetime(2026, 1, 1, 9, 0)
+            if status == "COMPLETED"
+            else None,
+        }
+
+    async def get_result_json_bytes(self, search_house_id: int) -> bytes | None:
+        self.result_reads += 1
+        return self.rows[search_house_id][1]
+
+
+def test_execute_raw_splices_result_only_when_completed():
+    reader = _FakeReader(
+        {
+            1: ("COMPLETED", b'{"status":"SUCCESS","items":[1,2]}'),
+            2: ("PROCESSING", None),
+        }
+    )
+    usecase = GetSearchHouseStatusAsyncUseCase(reader)
+
+    completed = json.loads(asyncio.run(usecase.execute_raw(1)))
+    processing = json.loads(asyncio.run(usecase.execute_raw(2)))
+
+    assert completed == {
+        "search_house_id": 1,
+        "status": "COMPLETED",
+        "completed_at": "2026-01-01T09:00:00",
+        "result": {"status": "SUCCESS", "items": [1, 2]},
+    }
+    assert processing["result"] is None
+    assert reader.result_reads == 1
+    assert asyncio.run(usecase.execute_raw(3)) is None
+
+
+def test_polling_routes_use_async_usecase():
+    reader = _FakeReader({1: ("COMPLETED", b'{"ok":true}')})
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_search_house_status_async_usecase] = (
+        lambda: GetSearchHouseStatusAsyncUseCase(reader)
+    )
+    client = TestClient(app)
+
+    body = client.get("/search_house/1").json()
+    status = client.get("/search_house/1/status").json()
+
+    assert body["result"] == {"ok": True}
+    assert status["status"] == "COMPLETED"
+    assert "result" not in status
+    assert client.get("/search_house/9").status_code == 404
+    assert client.get("/search_house/9/status").status_code == 404
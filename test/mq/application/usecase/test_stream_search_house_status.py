@@ -0,0 +1,139 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from infrastructure.orm.search_house import SearchHouse
+from modules.mq.adapter.output.event.in_memory_search_house_event_broker import (
+    InMemorySearchHouseEventBroker,
+)
+from modules.mq.adapter.output.repository.search_house_repository import (
+    SearchHouseRepository,
+)
+from modules.mq.application.dto.search_house_event_dto import SearchHouseStatusEvent
+from modules.mq.application.usecase.process_search_house_usecase import (
+    ProcessSearchHouseUseCase,
+)
+from modules.mq.application.usecase.stream_search_house_status_usecase import (
+    StreamSearchHouseStatusUseCase,
+)
+
+
+def _session_factory(*rows: SearchHouse):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SearchHouse.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+    session = factory()
+    session.add_all(rows)
+    session.commit()
+    session.close()
+    return factory
+
+
+async def _collect(usecase, search_house_id, on_subscribed=None):
+    events = []
+    async for event in usecase.stream(search_house_id):
+        events.append(event)
+        if on_subscribed and len(events) == 1:
+            on_subscribed()
+    return events
+
+
+def test_stream_pushes_transitions_until_completed():
+    broker = InMemorySearchHouseEventBroker()
+    factory = _session_factory(
+        SearchHouse(search_house_id=1, finder_request_id=10, status="QUEUED")
+    )
+    usecase = StreamSearchHouseStatusUseCase(
+        broker, session_factory=factory, keepalive_sec=0.05
+    )
+
+    def publish_from_worker():
+        # consumer 워커 스레드에서 발행하는 상황을 흉내낸다.
+        def run():
+            broker.publish(SearchHouseStatusEvent(1, "PROCESSING"))
+            broker.publish(SearchHouseStatusEvent(2, "COMPLETED", {"other": True}))
+            broker.publish(SearchHouseStatusEvent(1, "COMPLETED", {"items": [1]}))
+
+        threading.Timer(0.12, run).start()
+
+    events = asyncio.run(_collect(usecase, 1, publish_from_worker))
+
+    statuses = [event.status for event in events if event is not None]
+    assert statuses == ["QUEUED", "PROCESSING", "COMPLETED"]
+    assert None in events  # 대기 중 keepalive
+    assert events[-1].result == {"items": [1]}
+    assert broker.fanout.subscriber_count() == 0
+
+
+def test_stream_returns_stored_result_once_when_already_completed():
+    broker = InMemorySearchHouseEventBroker()
+    factory = _session_factory(
+        SearchHouse(
+            search_house_id=1,
+            finder_request_id=10,
+            status="COMPLETED",
+            result_json='{"items": [3]}',
+        )
+    )
+    usecase = StreamSearchHouseStatusUseCase(broker, session_factory=factory)
+
+    events = asyncio.run(_collect(usecase, 1))
+
+    assert [(event.status, event.result) for event in events] == [
+        ("COMPLETED", {"items": [3]})
+    ]
+
+
+def test_stream_is_empty_for_unknown_search_house():
+    usecase = StreamSearchHouseStatusUseCase(
+        InMemorySearchHouseEventBroker(), session_factory=_session_factory()
+    )
+
+    assert asyncio.run(_collect(usecase, 404)) == []
+
+
+def test_status_only_query_skips_result_payload():
+    factory = _session_factory(
+        SearchHouse(
+            search_house_id=1,
+            finder_request_id=10,
+            status="COMPLETED",
+            result_json='{"items": [3]}',
+        )
+    )
+
+    status = SearchHouseRepository(factory()).get_status(1)
+
+    assert status["status"] == "COMPLETED"
+    assert "result" not in status
+
+
+def test_process_usecase_publishes_state_transitions():
+    published = []
+    publisher = MagicMock()
+    publisher.publish.side_effect = published.append
+    ai_agent = MagicMock()
+    ai_agent.execute.side_effect = RuntimeError("agent failed")
+
+    usecase = ProcessSearchHouseUseCase(MagicMock(), ai_agent, event_publisher=publisher)
+    usecase.search_house_repo = MagicMock()
+    usecase.search_house_repo.mark_processing.return_value = 1
+    usecase.finder_request_repo = MagicMock()
+
+    try:
+        usecase.execute(5)
+    except RuntimeError:
+        pass
+
+    assert [(event.search_house_id, event.status) for event in published] == [
+        (5, "PROCESSING"),
+        (5, "FAILED"),
+    ]
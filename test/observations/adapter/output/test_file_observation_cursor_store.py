@@ -0,0 +1,27 @@
+from modules.observations.adapter.output.checkpoint.file_observation_cursor_store import (
+    FileObservationCursorStore,
+)
+
+
+def test_cursor_store_round_trip(tmp_path):
+    """마지막 house_platform_id 를 키별 파일에 저장/조회/삭제한다."""
+    store = FileObservationCursorStore(str(tmp_path))
+
+    assert store.load("full/run") is None
+    store.save("full/run", 120)
+    store.save("full/run", 240)
+    assert store.load("full/run") == 240
+    assert FileObservationCursorStore(str(tmp_path)).load("full/run") == 240
+
+    store.clear("full/run")
+    store.clear("full/run")
+    assert store.load("full/run") is None
+
+
+def test_cursor_store_ignores_broken_file(tmp_path):
+    """깨진 파일은 진행 위치가 없는 것으로 본다."""
+    store = FileObservationCursorStore(str(tmp_path))
+    store.save("run", 10)
+    (tmp_path / ".observation_cursor_run.json").write_text("{", encoding="utf-8")
+
+    assert store.load("run") is None
@@ -0,0 +1,305 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from modules.observations.adapter.output.repository.latest_observation_bulk_repository_impl import (
+    LatestObservationBulkRepository,
+)
+from modules.observations.adapter.output.repository import (
+    latest_observation_pointer_repository_impl as pointer_module,
+)
+from modules.observations.adapter.output.repository.latest_observation_pointer_repository_impl import (
+    LatestObservationPointerRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendation_distance_observation_repository_impl import (
+    StudentRecommendationDistanceObservationRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendtation_price_observation_repository_impl import (
+    StudentRecommendationPriceObservationRepository,
+)
+from modules.observations.domain.model.distance_feature_observation import DistanceFeatureObservation
+from modules.observations.domain.model.price_feature_observation import PriceFeatureObservation
+from modules.observations.infrastructure.orm.latest_observation_pointer_orm import (
+    LatestObservationPointerORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import (
+    StudentRecommendationDistanceObservationORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import (
+    StudentRecommendationPriceObservationsORM,
+)
+from modules.student_house_decision_policy.infrastructure.repository.observation_candidate_filter_repository import (
+    ObservationCandidateFilterRepository,
+)
+
+BASE_TIME = datetime(2026, 1, 1)
+
+
+def _build_session_factory():
+    engine = create_engine("sqlite:///:memory:")
+    LatestObservationPointerORM.metadata.create_all(engine)
+    # sqlite 는 BIGINT PK 를 자동 증가시키지 않으므로 이력 테이블은 INTEGER PK 로 만든다.
+    # feature 는 ARRAY 컬럼을 만들 수 없어 포인터 재구성에 필요한 컬럼만 둔다.
+    ddl = (
+        "CREATE TABLE student_recommendation_price_observations ("
+        "id INTEGER PRIMARY KEY, house_platform_id BIGINT NOT NULL, "
+        "recommendation_observation_id BIGINT NOT NULL, \"가격_백분위\" FLOAT NOT NULL, "
+        "\"가격_z점수\" FLOAT NOT NULL, \"예상_입주비용\" INTEGER NOT NULL, "
+        "\"월_비용_추정\" INTEGER NOT NULL, \"가격_부담_비선형\" FLOAT NOT NULL, "
+        "calculated_at DATETIME)",
+        "CREATE TABLE student_recommendation_distance_observations ("
+        "id INTEGER PRIMARY KEY, house_id BIGINT NOT NULL, "
+        "recommendation_observation_id BIGINT NOT NULL, university_id BIGINT NOT NULL, "
+        "\"학교까지_분\" FLOAT NOT NULL, \"거리_백분위\" FLOAT NOT NULL, "
+        "\"거리_버킷\" VARCHAR(20) NOT NULL, \"거리_비선형_점수\" FLOAT NOT NULL, "
+        "calculated_at DATETIME)",
+        "CREATE TABLE student_recommendation_feature_observations ("
+        "id INTEGER PRIMARY KEY, house_platform_id BIGINT, calculated_at DATETIME)",
+    )
+    with engine.begin() as conn:
+        for statement in ddl:
+            conn.execute(text(statement))
+    return sessionmaker(bind=engine)
+
+
+def _price(house_id, move_in, minutes_offset):
+    return PriceFeatureObservation(
+        id=None,
+        house_platform_id=house_id,
+        recommendation_observation_id=house_id,
+        가격_백분위=0.5,
+        가격_z점수=0.0,
+        예상_입주비용=move_in,
+        월_비용_추정=move_in // 100,
+        가격_부담_비선형=0.5,
+        calculated_at=BASE_TIME + timedelta(minutes=minutes_offset),
+    )
+
+
+def _distance(house_id, university_id, minutes, minutes_offset):
+    return DistanceFeatureObservation(
+        id=None,
+        house_platform_id=house_id,
+        recommendation_observation_id=house_id,
+        university_id=university_id,
+        학교까지_분=minutes,
+        거리_백분위=0.5,
+        거리_버킷="10_20분",
+        거리_비선형_점수=0.5,
+        calculated_at=BASE_TIME + timedelta(minutes=minutes_offset),
+    )
+
+
+def _pointers(session):
+    return {
+        (row.observation_type, row.house_platform_id, row.university_id): row.observation_id
+        for row in session.query(LatestObservationPointerORM).all()
+    }
+
+
+def test_save_bulk_moves_pointer_only_forward():
+    """저장 시 포인터가 갱신되고, 더 오래된 관측치가 늦게 들어와도 포인터는 그대로다."""
+    Session = _build_session_factory()
+    session = Session()
+    try:
+        price_repo = StudentRecommendationPriceObservationRepository(session)
+        distance_repo = StudentRecommendationDistanceObservationRepository(session)
+
+        price_repo.save_bulk([_price(1, 9000, 0), _price(1, 8000, 5), _price(2, 7000, 0)])
+        distance_repo.save_bulk(
+            [_distance(1, 10, 20.0, 0), _distance(1, 10, 15.0, 5), _distance(1, 20, 30.0, 0)]
+        )
+        # 늦게 들어온 과거 관측치
+        price_repo.save_bulk([_price(1, 1000, -10)])
+        distance_repo.save_bulk([_distance(1, 10, 50.0, -10)])
+
+        pointers = _pointers(session)
+        assert pointers[("price", 1, 0)] == 2
+        assert pointers[("price", 2, 0)] == 3
+        assert pointers[("distance", 1, 10)] == 2
+        assert pointers[("distance", 1, 20)] == 3
+        assert len(pointers) == 4
+
+        assert price_repo.get_by_house_platform_id(1).예상_입주비용 == 8000
+        by_university = {
+            item.university_id: item.학교까지_분
+            for item in distance_repo.get_bulk_by_house_platform_id(1)
+        }
+        assert by_university == {10: 15.0, 20: 30.0}
+    finally:
+        session.close()
+
+
+def test_bulk_read_uses_pointer_and_falls_back_for_unpointed_houses():
+    """포인터가 있는 매물은 포인터로, 포인터가 없는 매물은 이력에서 최신 행을 읽는다."""
+    Session = _build_session_factory()
+    session = Session()
+    try:
+        StudentRecommendationPriceObservationRepository(session).save_bulk(
+            [_price(1, 9000, 0), _price(1, 8000, 5)]
+        )
+        # 포인터 도입 전 데이터처럼 이력만 있는 매물
+        session.add_all(
+            [
+                StudentRecommendationPriceObservationsORM(
+                    id=100, house_platform_id=2, recommendation_observation_id=2,
+                    가격_백분위=0.5, 가격_z점수=0.0, 예상_입주비용=5000, 월_비용_추정=50,
+                    가격_부담_비선형=0.5, calculated_at=BASE_TIME,
+                ),
+                StudentRecommendationPriceObservationsORM(
+                    id=101, house_platform_id=2, recommendation_observation_id=2,
+                    가격_백분위=0.5, 가격_z점수=0.0, 예상_입주비용=6000, 월_비용_추정=60,
+                    가격_부담_비선형=0.5, calculated_at=BASE_TIME + timedelta(minutes=1),
+                ),
+            ]
+        )
+        session.commit()
+    finally:
+        session.close()
+
+    prices = LatestObservationBulkRepository(Session).fetch_latest_prices([1, 2, 3])
+
+    assert {hid: p.예상_입주비용 for hid, p in prices.items()} == {1: 8000, 2: 6000}
+
+
+def test_rebuild_fills_pointers_and_filter_reads_them():
+    """이력에서 포인터를 다시 채우면 후보 필터도 포인터 기준 최신 관측치로 거른다."""
+    Session = _build_session_factory()
+    session = Session()
+    try:
+        session.add_all(
+            [
+                StudentRecommendationPriceObservationsORM(
+                    id=1, house_platform_id=1, recommendation_observation_id=1,
+                    가격_백분위=0.5, 가격_z점수=0.0, 예상_입주비용=20000, 월_비용_추정=200,
+                    가격_부담_비선형=0.5, calculated_at=BASE_TIME,
+                ),
+                StudentRecommendationPriceObservationsORM(
+                    id=2, house_platform_id=1, recommendation_observation_id=1,
+                    가격_백분위=0.5, 가격_z점수=0.0, 예상_입주비용=9000, 월_비용_추정=90,
+                    가격_부담_비선형=0.5, calculated_at=BASE_TIME + timedelta(minutes=5),
+                ),
+                StudentRecommendationPriceObservationsORM(
+                    id=3, house_platform_id=2, recommendation_observation_id=2,
+                    가격_백분위=0.5, 가격_z점수=0.0, 예상_입주비용=9000, 월_비용_추정=90,
+                    가격_부담_비선형=0.5, calculated_at=BASE_TIME,
+                ),
+                StudentRecommendationDistanceObservationORM(
+                    id=1, house_id=1, recommendation_observation_id=1, university_id=10,
+                    학교까지_분=40.0, 거리_백분위=0.5, 거리_버킷="40분_이상",
+                    거리_비선형_점수=0.3, calculated_at=BASE_TIME,
+                ),
+                StudentRecommendationDistanceObservationORM(
+                    id=2, house_id=1, recommendation_observation_id=1, university_id=10,
+                    학교까지_분=20.0, 거리_백분위=0.5, 거리_버킷="10_20분",
+                    거리_비선형_점수=0.8, calculated_at=BASE_TIME + timedelta(minutes=5),
+                ),
+                StudentRecommendationDistanceObservationORM(
+                    id=3, house_id=2, recommendation_observation_id=2, university_id=10,
+                    학교까지_분=45.0, 거리_백분위=0.5, 거리_버킷="40분_이상",
+                    거리_비선형_점수=0.3, calculated_at=BASE_TIME,
+                ),
+            ]
+        )
+        session.commit()
+    finally:
+        session.close()
+
+    assert LatestObservationPointerRepository(Session).rebuild() == 4
+
+    session = Session()
+    try:
+        assert _pointers(session) == {
+            ("price", 1, 0): 2,
+            ("price", 2, 0): 3,
+            ("distance", 1, 10): 2,
+            ("distance", 2, 10): 3,
+        }
+    finally:
+        session.close()
+
+    result = ObservationCandidateFilterRepository(Session).filter_house_platform_ids(
+        [1, 2, 3],
+        max_deposit_limit=10000,
+        max_rent_limit=100,
+        university_location_id=10,
+        max_commute_minutes=30.0,
+    )
+    assert result == {1}
+
+
+def test_partial_pointer_coverage_falls_back_per_type_and_university():
+    """가격 포인터만 있거나 일부 대학만 포인터가 있어도 이력의 최신 거리 관측치를 함께 읽는다."""
+    Session = _build_session_factory()
+    session = Session()
+    try:
+        # 1: 가격은 포인터가 있고 거리는 도입 전 이력만 있다.
+        # 2: 대학 10 거리는 포인터가 있고 대학 20 거리는 이력만 있다.
+        StudentRecommendationPriceObservationRepository(session).save_bulk(
+            [_price(1, 9000, 0), _price(2, 9000, 0)]
+        )
+        StudentRecommendationDistanceObservationRepository(session).save_bulk(
+            [_distance(2, 10, 25.0, 0)]
+        )
+        session.add_all(
+            [
+                StudentRecommendationDistanceObservationORM(
+                    id=100, house_id=1, recommendation_observation_id=1, university_id=10,
+                    학교까지_분=50.0, 거리_백분위=0.5, 거리_버킷="40분_이상",
+                    거리_비선형_점수=0.3, calculated_at=BASE_TIME,
+                ),
+                StudentRecommendationDistanceObservationORM(
+                    id=101, house_id=1, recommendation_observation_id=1, university_id=10,
+                    학교까지_분=20.0, 거리_백분위=0.5, 거리_버킷="10_20분",
+                    거리_비선형_점수=0.8, calculated_at=BASE_TIME + timedelta(minutes=1),
+                ),
+                StudentRecommendationDistanceObservationORM(
+                    id=102, house_id=2, recommendation_observation_id=2, university_id=20,
+                    학교까지_분=35.0, 거리_백분위=0.5, 거리_버킷="30_40분",
+                    거리_비선형_점수=0.4, calculated_at=BASE_TIME,
+                ),
+            ]
+        )
+        session.commit()
+    finally:
+        session.close()
+
+    distances = LatestObservationBulkRepository(Session).fetch_latest_distances([1, 2])
+    assert {
+        hid: {item.university_id: item.학교까지_분 for item in items}
+        for hid, items in distances.items()
+    } == {1: {10: 20.0}, 2: {10: 25.0, 20: 35.0}}
+
+    result = ObservationCandidateFilterRepository(Session).filter_house_platform_ids(
+        [1, 2],
+        max_deposit_limit=10000,
+        max_rent_limit=100,
+        university_location_id=10,
+        max_commute_minutes=30.0,
+    )
+    assert result == {1, 2}
+
+
+def test_missing_pointer_table_is_rechecked_after_ttl(monkeypatch):
+    """테이블이 없다는 결과는 TTL 동안만 캐시하고, 이후 생긴 테이블은 다시 인식한다."""
+    engine = create_engine("sqlite:///:memory:")
+    Session = sessionmaker(bind=engine)
+    clock = [1000.0]
+    monkeypatch.setattr(pointer_module.time, "monotonic", lambda: clock[0])
+
+    session = Session()
+    try:
+        assert pointer_module.pointer_table_available(session) is False
+    finally:
+        session.close()
+
+    LatestObservationPointerORM.metadata.create_all(engine)
+    session = Session()
+    try:
+        clock[0] += pointer_module.POINTER_TABLE_RECHECK_SEC - 1
+        assert pointer_module.pointer_table_available(session) is False
+        clock[0] += 1
+        assert pointer_module.pointer_table_available(session) is True
+    finally:
+        session.close()
@@ -0,0 +1,193 @@
+from math import atan2, cos, radians, sin, sqrt
+
+import numpy as np
+import pytest
+
+from modules.house_platform.application.dto.house_platform_location_dto import (
+    HousePlatformLocation,
+)
+from modules.observations.application.usecase.generate_distance_observation_usecase import (
+    GenerateDistanceObservationUseCase,
+    build_minutes_matrix,
+    calc_buckets,
+    calc_nonlinear_scores,
+    calc_row_percentiles,
+)
+
+
+# ---------- 기존 단건 계산식 (비교 기준) ----------
+def _scalar_minutes(lat1, lon1, lat2, lon2):
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    return (6371 * 2 * atan2(sqrt(a), sqrt(1 - a)) / 5) * 60
+
+
+def _scalar_bucket(minutes):
+    for edge, label in ((10, "0_10분"), (20, "10_20분"), (30, "20_30분"), (40, "30_40분")):
+        if minutes < edge:
+            return label
+    return "40분_이상"
+
+
+def _scalar_score(minutes):
+    if minutes <= 20:
+        return max(0.0, 1 - 0.01 * minutes)
+    if minutes <= 30:
+        return max(0.0, 0.8 - 0.02 * (minutes - 20))
+    if minutes <= 40:
+        return max(0.0, 0.6 - 0.03 * (minutes - 30))
+    return 0.3
+
+
+class FakeUniversity:
+    def __init__(self, uid, lat, lng):
+        self.university_location_id = uid
+        self.lat = lat
+        self.lng = lng
+
+
+class FakeUniversityRepo:
+    def __init__(self, universities):
+        self.universities = universities
+
+    def get_university_locations(self):
+        return self.universities
+
+
+class FakeHouseRepo:
+    def __init__(self, locations):
+        self.locations = locations
+        self.calls = []
+
+    def fetch_locations(self, house_platform_ids):
+        self.calls.append(list(house_platform_ids))
+        return [self.locations[hid] for hid in house_platform_ids if hid in self.locations]
+
+
+class FakeDistanceRepo:
+    def __init__(self):
+        self.batches = []
+
+    def save_bulk(self, distances):
+        self.batches.append(distances)
+
+
+def test_vectorized_calculation_matches_scalar_formulas():
+    """행렬 계산 결과가 기존 단건 계산과 같다."""
+    rng = np.random.default_rng(0)
+    house_lat = 37.45 + rng.random(7) * 0.2
+    house_lng = 126.9 + rng.random(7) * 0.2
+    uni_lat = 37.45 + rng.random(30) * 0.2
+    uni_lng = 126.9 + rng.random(30) * 0.2
+
+    minutes = build_minutes_matrix(house_lat, house_lng, uni_lat, uni_lng)
+    percentiles = calc_row_percentiles(minutes)
+    buckets = calc_buckets(minutes)
+    scores = calc_nonlinear_scores(minutes)
+
+    assert minutes.shape == (7, 30)
+    for i in range(7):
+        row = [
+            _scalar_minutes(house_lat[i], house_lng[i], uni_lat[j], uni_lng[j])
+            for j in range(30)
+        ]
+        assert minutes[i].tolist() == pytest.approx(row)
+        for j, value in enumerate(minutes[i]):
+            assert percentiles[i, j] == np.sum(minutes[i] <= value) / 30
+            assert buckets[i, j] == _scalar_bucket(value)
+            assert scores[i, j] == pytest.approx(_scalar_score(value))
+
+
+def test_bucket_and_score_boundaries():
+    minutes = np.array([[0.0, 10.0, 20.0, 30.0, 40.0, 55.0]])
+
+    assert calc_buckets(minutes).tolist() == [
+        ["0_10분", "10_20분", "20_30분", "30_40분", "40분_이상", "40분_이상"]
+    ]
+    assert calc_nonlinear_scores(minutes).tolist()[0] == pytest.approx(
+        [1.0, 0.9, 0.8, 0.6, 0.3, 0.3]
+    )
+    # 같은 값은 같은 백분위를 가진다.
+    assert calc_row_percentiles(np.array([[5.0, 5.0, 1.0, 9.0]])).tolist() == [
+        [0.75, 0.75, 0.25, 1.0]
+    ]
+
+
+def test_execute_bulk_saves_one_batch_per_house_chunk():
+    """청크마다 위치를 한 번 조회하고 한 번 저장하며, 위치 없는 매물은 건너뛴다."""
+    universities = [FakeUniversity(uid, 37.5 + uid * 0.01, 127.0) for uid in range(1, 6)]
+    locations = {
+        hid: HousePlatformLocation(house_platform_id=hid, lat=37.5, lng=127.0 + hid * 0.001)
+        for hid in (1, 2, 3, 5)
+    }
+    house_repo = FakeHouseRepo(locations)
+    distance_repo = FakeDistanceRepo()
+    usecase = GenerateDistanceObservationUseCase(
+        distance_repo=distance_repo,
+        house_repo=house_repo,
+        university_repo=FakeUniversityRepo(universities),
+    )
+
+    result = usecase.execute_bulk({1: 11, 2: 12, 3: 13, 4: 14, 5: 15}, house_chunk_size=2)
+
+    assert house_repo.calls == [[1, 2], [3, 4], [5]]
+    assert [len(batch) for batch in distance_repo.batches] == [10, 5, 5]
+    assert result.houses == 4
+    assert result.saved == 20
+    assert result.missing_location_ids == [4]
+
+    house_3 = [o for o in distance_repo.batches[1] if o.house_platform_id == 3]
+    assert {o.recommendation_observation_id for o in house_3} == {13}
+    assert [o.university_id for o in house_3] == [1, 2, 3, 4, 5]
+    expected = _scalar_minutes(37.5, 127.003, universities[2].lat, universities[2].lng)
+    assert house_3[2].학교까지_분 == pytest.approx(expected)
+    assert isinstance(house_3[2].학교까지_분, float)
+
+
+def test_execute_bulk_with_radius_keeps_only_nearby_pairs_and_full_percentile():
+    """반경을 주면 가까운 대학 쌍만 저장하고, 백분위는 전체 대학 기준 값과 같다."""
+    rng = np.random.default_rng(3)
+    universities = [
+        FakeUniversity(uid, 37.3 + rng.random() * 0.6, 126.8 + rng.random() * 0.6)
+        for uid in range(60)
+    ]
+    locations = {
+        hid: HousePlatformLocation(
+            house_platform_id=hid,
+            lat=37.4 + rng.random() * 0.4,
+            lng=126.9 + rng.random() * 0.4,
+        )
+        for hid in range(1, 6)
+    }
+    full_repo = FakeDistanceRepo()
+    GenerateDistanceObservationUseCase(
+        distance_repo=full_repo,
+        house_repo=FakeHouseRepo(locations),
+        university_repo=FakeUniversityRepo(universities),
+    ).execute_bulk({hid: hid for hid in locations})
+    radius_repo = FakeDistanceRepo()
+    result = GenerateDistanceObservationUseCase(
+        distance_repo=radius_repo,
+        house_repo=FakeHouseRepo(locations),
+        university_repo=FakeUniversityRepo(universities),
+        max_minutes=120,
+    ).execute_bulk({hid: hid for hid in locations})
+
+    full = {
+        (o.house_platform_id, o.university_id): o
+        for batch in full_repo.batches
+        for o in batch
+    }
+    nearby = [o for batch in radius_repo.batches for o in batch]
+    expected_keys = {key for key, o in full.items() if o.학교까지_분 <= 120}
+
+    assert 0 < len(nearby) < len(full)
+    assert result.saved == len(nearby)
+    assert {(o.house_platform_id, o.university_id) for o in nearby} == expected_keys
+    for o in nearby:
+        reference = full[(o.house_platform_id, o.university_id)]
+        assert o.학교까지_분 == pytest.approx(reference.학교까지_분)
+        assert o.거리_백분위 == reference.거리_백분위
+        assert o.거리_버킷 == reference.거리_버킷
+        assert o.거리_비선형_점수 == pytest.approx(reference.거리_비선형_점수)
@@ -0,0 +1,190 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from modules.observations.application.usecase.generate_distance_observation_usecase import \
+    GenerateDistanceObservationUseCase
+from modules.observations.application.usecase.generate_full_observation_usecase import GenerateFullObservationUseCase
+from modules.observations.application.usecase.generate_price_observation_usecase import GeneratePriceObservationUseCase
+from modules.observations.application.usecase.generate_student_recommendation_feature_observation_usecase import \
+    GenerateStudentRecommendationFeatureObservationUseCase
+
+
+class MockHouse:
+    def __init__(self, house_id: int):
+        self.lat_lng = {"lat": 37.5 + house_id * 0.001, "lng": 127.0}
+        self.deposit = 1000
+        self.monthly_rent = 50
+        self.manage_cost = 5
+        self.is_banned = False
+        self.floor_no = 3
+        self.all_floors = 10
+        self.gu_nm = "TestGu"
+        self.snapshot_id = f"snapshot_{house_id}"
+        self.data_version = "v1.0"
+
+
+class MockBundle:
+    def __init__(self, house_id: int):
+        self.house_platform = MockHouse(house_id)
+        self.options = None
+
+
+class MockUniversity:
+    def __init__(self, uid, lat, lng):
+        self.university_location_id = uid
+        self.lat = lat
+        self.lng = lng
+
+
+class FakeHouseRepo:
+    def __init__(self, house_ids, fail_on=None):
+        self.bundles = {house_id: MockBundle(house_id) for house_id in house_ids}
+        self.fail_on = fail_on
+        self.calls = []
+
+    def fetch_bundles_by_ids(self, house_ids):
+        self.calls.append(list(house_ids))
+        if self.fail_on in house_ids:
+            raise RuntimeError("db down")
+        return {hid: self.bundles[hid] for hid in house_ids if hid in self.bundles}
+
+    def fetch_bundle_by_id(self, house_id):
+        raise AssertionError("일괄 실행은 단건 번들 조회를 하지 않는다.")
+
+
+class FakeUniversityRepo:
+    def __init__(self):
+        self.calls = 0
+
+    def get_university_locations(self):
+        self.calls += 1
+        return [MockUniversity(uid=i, lat=37.5 + i * 0.01, lng=127.0) for i in range(3)]
+
+
+class FakeBatchWriter:
+    def __init__(self, poison=None):
+        self.poison = poison
+        self.calls = []
+        self.next_id = 100
+
+    def save_observations(self, features, prices, distances):
+        house_ids = [feature.house_platform_id for feature in features]
+        self.calls.append(house_ids)
+        if self.poison in house_ids:
+            raise RuntimeError("constraint violation")
+        feature_ids = {}
+        for feature in features:
+            feature_ids[feature.house_platform_id] = self.next_id
+            feature.id = self.next_id
+            self.next_id += 1
+        self.saved_prices = list(prices)
+        self.saved_distances = list(distances)
+        return feature_ids
+
+
+class FakeCursor:
+    def __init__(self, value=None):
+        self.values = {"run": value} if value is not None else {}
+        self.saves = []
+        self.cleared = False
+
+    def load(self, key):
+        return self.values.get(key)
+
+    def save(self, key, last_house_platform_id):
+        self.values[key] = last_house_platform_id
+        self.saves.append(last_house_platform_id)
+
+    def clear(self, key):
+        self.values.pop(key, None)
+        self.cleared = True
+
+
+def _build(house_repo, writer, cursor=None, house_prices=None, chunk_size=2):
+    university_repo = FakeUniversityRepo()
+    distance_uc = GenerateDistanceObservationUseCase(
+        distance_repo=MagicMock(),
+        house_repo=house_repo,
+        university_repo=university_repo,
+    )
+    price_uc = GeneratePriceObservationUseCase(
+        price_repo=MagicMock(),
+        house_prices=house_prices or {hid: 1000 + hid for hid in range(1, 10)},
+    )
+    feature_uc = GenerateStudentRecommendationFeatureObservationUseCase(
+        observation_repo=MagicMock(),
+        distance_usecase=None,
+        house_repo=house_repo,
+    )
+    full_uc = GenerateFullObservationUseCase(
+        student_feature_uc=feature_uc,
+        price_uc=price_uc,
+        distance_uc=distance_uc,
+        batch_writer=writer,
+        house_repo=house_repo,
+        cursor_port=cursor,
+        chunk_size=chunk_size,
+    )
+    return full_uc, university_repo
+
+
+def test_execute_batch_loads_chunks_once_and_records_errors():
+    """청크마다 번들을 한 번에 읽고, 대학은 한 번만 읽으며, 누락 매물은 오류로 남긴다."""
+    house_repo = FakeHouseRepo([1, 2, 4, 5])  # 3 은 매물 없음
+    writer = FakeBatchWriter()
+    cursor = FakeCursor()
+    prices = {1: 1000, 2: 2000, 3: 3000, 5: 5000}  # 4 는 가격 없음
+    full_uc, university_repo = _build(house_repo, writer, cursor, house_prices=prices)
+
+    result = full_uc.execute_batch([5, 3, 1, 4, 2, 1], cursor_key="run")
+
+    assert house_repo.calls == [[1, 2], [3, 4], [5]]
+    assert university_repo.calls == 1
+    assert writer.calls == [[1, 2], [5]]
+    assert result.processed == 5
+    assert result.saved == 3
+    assert set(result.errors) == {3, 4}
+    assert result.resumed_after is None
+    assert writer.saved_distances and all(
+        d.house_platform_id == 5 for d in writer.saved_distances
+    )
+    assert [p.house_platform_id for p in writer.saved_prices] == [5]
+    assert cursor.saves == [2, 4, 5]
+    assert cursor.cleared
+    assert cursor.values == {}
+
+
+def test_execute_batch_isolates_failing_house_in_chunk():
+    """청크 저장이 실패하면 매물 단위로 다시 저장해 실패한 매물만 오류로 남긴다."""
+    house_repo = FakeHouseRepo([1, 2, 3])
+    writer = FakeBatchWriter(poison=2)
+    full_uc, _ = _build(house_repo, writer, chunk_size=3)
+
+    result = full_uc.execute_batch([1, 2, 3])
+
+    assert writer.calls == [[1, 2, 3], [1], [2], [3]]
+    assert result.saved == 2
+    assert list(result.errors) == [2]
+
+
+def test_execute_batch_resumes_after_saved_cursor():
+    """중간에 실패하면 진행 위치가 남고, 다음 실행은 그 다음 매물부터 이어서 진행한다."""
+    cursor = FakeCursor()
+    failing_repo = FakeHouseRepo([1, 2, 3, 4], fail_on=3)
+    full_uc, _ = _build(failing_repo, FakeBatchWriter(), cursor)
+
+    with pytest.raises(RuntimeError):
+        full_uc.execute_batch([1, 2, 3, 4], cursor_key="run")
+    assert cursor.values == {"run": 2}
+
+    house_repo = FakeHouseRepo([1, 2, 3, 4])
+    writer = FakeBatchWriter()
+    full_uc, _ = _build(house_repo, writer, cursor)
+
+    result = full_uc.execute_batch([1, 2, 3, 4], cursor_key="run")
+
+    assert result.resumed_after == 2
+    assert house_repo.calls == [[3, 4]]
+    assert result.saved == 2
+    assert cursor.values == {}
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from modules.observations.application.usecase.generate_price_observation_usecase import (
+    GeneratePriceObservationUseCase,
+)
+
+
+class FakePriceRepo:
+    def __init__(self):
+        self.saved = []
+        self.batches = []
+
+    def save(self, observation):
+        self.saved.append(observation)
+        return observation
+
+    def save_bulk(self, observations):
+        self.batches.append(list(observations))
+
+
+def _reference(price, all_prices):
+    """기존 단건 계산식."""
+    arr = np.array(all_prices)
+    percentile = float(np.sum(arr <= price) / len(arr))
+    mean = float(np.mean(arr))
+    std = float(np.std(arr))
+    zscore = float((price - mean) / std) if std > 0 else 0.0
+    if zscore <= 0:
+        burden = 1.0
+    elif zscore <= 1:
+        burden = 0.8
+    elif zscore <= 2:
+        burden = 0.6
+    else:
+        burden = 0.3
+    return percentile, zscore, burden
+
+
+def test_execute_bulk_matches_single_house_formula_and_chunks_saves():
+    rng = np.random.default_rng(0)
+    house_prices = {hid: int(price) for hid, price in enumerate(rng.integers(0, 5000, 250), 1)}
+    house_prices[251] = house_prices[1]  # 동률 포함
+    repo = FakePriceRepo()
+    usecase = GeneratePriceObservationUseCase(repo, house_prices)
+
+    targets = {hid: hid + 1000 for hid in house_prices}
+    targets[999] = 1999  # 가격 없는 매물
+    result = usecase.execute_bulk(targets, chunk_size=100)
+
+    assert [len(batch) for batch in repo.batches] == [100, 100, 51]
+    assert result.saved == 251
+    assert result.missing_price_ids == [999]
+    all_prices = list(house_prices.values())
+    for observation in (o for batch in repo.batches for o in batch):
+        price = house_prices[observation.house_platform_id]
+        percentile, zscore, burden = _reference(price, all_prices)
+        assert observation.recommendation_observation_id == observation.house_platform_id + 1000
+        assert observation.가격_백분위 == percentile
+        assert observation.가격_z점수 == pytest.approx(zscore)
+        assert observation.가격_부담_비선형 == burden
+        assert observation.예상_입주비용 == price
+        assert observation.월_비용_추정 == int(price / 100)
+
+
+def test_cohort_partitioned_statistics():
+    """코호트를 주면 같은 코호트 안에서 백분위/z-score 를 계산한다."""
+    house_prices = {1: 100, 2: 200, 3: 300, 4: 1000, 5: 1000}
+    cohorts = {1: "관악구", 2: "관악구", 3: "관악구", 4: "강남구", 5: "강남구"}
+    repo = FakePriceRepo()
+    usecase = GeneratePriceObservationUseCase(repo, house_prices, house_cohorts=cohorts)
+
+    usecase.execute_bulk({hid: hid for hid in house_prices})
+    saved = {o.house_platform_id: o for batch in repo.batches for o in batch}
+
+    for hid in (1, 2, 3):
+        percentile, zscore, _ = _reference(house_prices[hid], [100, 200, 300])
+        assert saved[hid].가격_백분위 == percentile
+        assert saved[hid].가격_z점수 == pytest.approx(zscore)
+    # 표준편차가 0 인 코호트는 z-score 0
+    assert saved[4].가격_백분위 == 1.0
+    assert saved[4].가격_z점수 == 0.0
+    assert saved[4].가격_부담_비선형 == 1.0
+
+    single = usecase.execute(recommendation_observation_id=7, house_platform_id=3)
+    assert single.가격_백분위 == saved[3].가격_백분위
+    assert repo.saved == [single]
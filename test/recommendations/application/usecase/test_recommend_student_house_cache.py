@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from modules.finder_request.domain.finder_request import FinderRequest
+from modules.recommendations.application.dto.recommendation_context_dto import (
+    RecommendationContext,
+)
+from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendStudentHouseCommand,
+)
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationResultCachePort,
+)
+from modules.recommendations.application.usecase.recommend_student_house import (
+    RecommendStudentHouseUseCase,
+)
+from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    FilterCandidateCriteria,
+    FilterCandidateResult,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+
+class FakeResultCache(RecommendationResultCachePort):
+    def __init__(self):
+        self.version = 0
+        self.items = {}
+        self.hits = 0
+        self.misses = 0
+
+    def data_version(self):
+        return self.version
+
+    def invalidate(self):
+        self.version += 1
+
+    def get(self, key):
+        if key in self.items:
+            self.hits += 1
+            return self.items[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, result):
+        self.items[key] = result
+
+
+class FakeFinderRequestRepo:
+    def __init__(self, request: FinderRequest):
+        self.request = request
+
+    def find_by_id(self, finder_request_id):
+        return self.request
+
+
+class CountingFilterUsecase:
+    def __init__(self):
+        self.calls = 0
+
+    def execute(self, command):
+        self.calls += 1
+        return FilterCandidateResult(
+            finder_request_id=command.finder_request_id,
+            criteria=FilterCandidateCriteria(
+                max_deposit_limit=None,
+                max_rent_limit=None,
+                budget_margin_ratio=0.0,
+            ),
+        )
+
+
+def _build_usecase(request, cache, policy=None):
+    filter_usecase = CountingFilterUsecase()
+    context_loader = MagicMock()
+    context_loader.load.return_value = RecommendationContext()
+    usecase = RecommendStudentHouseUseCase(
+        finder_request_repo=FakeFinderRequestRepo(request),
+        house_platform_repo=MagicMock(),
+        observation_repo=MagicMock(),
+        score_repo=MagicMock(),
+        price_observation_repo=MagicMock(),
+        distance_observation_repo=MagicMock(),
+        university_repo=MagicMock(),
+        filter_usecase=filter_usecase,
+        build_context_signal_usecase=MagicMock(),
+        explain_usecase=MagicMock(),
+        policy=policy,
+        context_loader=context_loader,
+        result_cache=cache,
+    )
+    return usecase, filter_usecase
+
+
+def _request(**overrides) -> FinderRequest:
+    values = dict(
+        abang_user_id=1,
+        status="Y",
+        finder_request_id=7,
+        max_deposit=1000,
+        max_rent=50,
+    )
+    values.update(overrides)
+    return FinderRequest(**values)
+
+
+def test_repeat_search_is_served_from_cache():
+    cache = FakeResultCache()
+    usecase, filter_usecase = _build_usecase(_request(), cache)
+    command = RecommendStudentHouseCommand(finder_request_id=7)
+
+    first = usecase.execute(command)
+    second = usecase.execute(command)
+
+    assert second is first
+    assert filter_usecase.calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_key_changes_with_request_content_policy_and_data_version():
+    cache = FakeResultCache()
+    command = RecommendStudentHouseCommand(finder_request_id=7)
+
+    usecase, filter_usecase = _build_usecase(_request(), cache)
+    usecase.execute(command)
+
+    # 요청서 수정
+    edited, edited_filter = _build_usecase(_request(max_rent=60), cache)
+    edited.execute(command)
+    assert edited_filter.calls == 1
+
+    # 정책 버전 변경
+    other_policy, policy_filter = _build_usecase(
+        _request(), cache, DecisionPolicyConfig(policy_version="v-next")
+    )
+    other_policy.execute(command)
+    assert policy_filter.calls == 1
+
+    # 점수/스냅샷 변경으로 데이터 버전이 오르면 다시 계산한다.
+    cache.invalidate()
+    usecase.execute(command)
+    assert filter_usecase.calls == 2
+    assert cache.hits == 0
+
+
+def test_cache_is_skipped_when_version_unavailable():
+    cache = FakeResultCache()
+    cache.data_version = lambda: None
+    usecase, filter_usecase = _build_usecase(_request(), cache)
+    command = RecommendStudentHouseCommand(finder_request_id=7)
+
+    usecase.execute(command)
+    usecase.execute(command)
+
+    assert filter_usecase.calls == 2
+    assert cache.items == {}
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from modules.finder_request.domain.finder_request import FinderRequest
+from modules.recommendations.application.dto.recommendation_context_dto import (
+    RecommendationContext,
+)
+from modules.recommendations.application.usecase.recommend_student_house import (
+    RecommendStudentHouseUseCase,
+)
+
+
+class FakeUniversityRepo:
+    def __init__(self, locations):
+        self.locations = locations
+        self.calls = 0
+
+    def get_university_locations(self):
+        self.calls += 1
+        return self.locations
+
+
+def _location(location_id, name):
+    return SimpleNamespace(university_location_id=location_id, university_name=name)
+
+
+def _request(university_name):
+    return FinderRequest(
+        abang_user_id=1,
+        status="Y",
+        finder_request_id=7,
+        university_name=university_name,
+    )
+
+
+def test_load_context_delegates_to_bulk_loader():
+    """일괄 로더가 있으면 개별 저장소를 거치지 않고 한 번에 읽는다."""
+    loaded = RecommendationContext(houses={1: "house"})
+    loader = MagicMock()
+    loader.load.return_value = loaded
+    house_repo = MagicMock()
+    usecase = RecommendStudentHouseUseCase(
+        house_platform_repo=house_repo, context_loader=loader
+    )
+
+    assert usecase._load_context([1, 2]) is loaded
+    loader.load.assert_called_once_with([1, 2])
+    house_repo.find_by_id.assert_not_called()
+    assert usecase._load_context([]) == RecommendationContext()
+    assert loader.load.call_count == 1
+
+
+def test_load_context_without_loader_builds_same_maps():
+    """로더가 없으면 개별 저장소 조회 결과로 같은 형태의 맵을 만든다."""
+    house_repo = MagicMock()
+    house_repo.find_by_id.side_effect = lambda house_id: (
+        f"house-{house_id}" if house_id != 2 else None
+    )
+    observation_repo = MagicMock()
+    observation_repo.find_latest_by_house_id.side_effect = lambda house_id: f"feature-{house_id}"
+    price_repo = MagicMock()
+    price_repo.get_by_house_platform_id.return_value = None
+    distance_repo = MagicMock()
+    distance_repo.get_bulk_by_house_platform_id.side_effect = lambda house_id: (
+        [f"distance-{house_id}"] if house_id == 1 else []
+    )
+    usecase = RecommendStudentHouseUseCase(
+        house_platform_repo=house_repo,
+        observation_repo=observation_repo,
+        price_observation_repo=price_repo,
+        distance_observation_repo=distance_repo,
+    )
+
+    context = usecase._load_context([1, 2, 1])
+
+    assert house_repo.find_by_id.call_count == 2
+    assert context.houses == {1: "house-1"}
+    assert context.feature_observations == {1: "feature-1", 2: "feature-2"}
+    assert context.price_observations == {}
+    assert context.distance_observations == {1: ["distance-1"]}
+
+
+def test_resolve_request_university_ids_matches_trimmed_name():
+    """요청서 대학명과 공백을 제외하고 같은 이름의 위치 ID를 모두 반환한다."""
+    university_repo = FakeUniversityRepo(
+        [
+            _location(10, "서울대학교"),
+            _location(11, " 서울대학교 "),
+            _location(20, "연세대학교"),
+            _location(30, None),
+        ]
+    )
+    usecase = RecommendStudentHouseUseCase(university_repo=university_repo)
+
+    assert usecase._resolve_request_university_ids(_request(" 서울대학교")) == [10, 11]
+    assert university_repo.calls == 1
+
+
+def test_resolve_request_university_ids_without_name_or_repo():
+    """대학명이나 대학 저장소가 없으면 조회하지 않고 빈 목록을 반환한다."""
+    university_repo = FakeUniversityRepo([_location(10, "서울대학교")])
+    usecase = RecommendStudentHouseUseCase(university_repo=university_repo)
+
+    assert usecase._resolve_request_university_ids(None) == []
+    assert usecase._resolve_request_university_ids(_request(None)) == []
+    assert usecase._resolve_request_university_ids(_request("   ")) == []
+    assert university_repo.calls == 0
+    assert RecommendStudentHouseUseCase()._resolve_request_university_ids(
+        _request("서울대학교")
+    ) == []
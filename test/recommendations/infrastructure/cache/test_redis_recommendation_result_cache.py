@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendStudentHouseResult,
+)
+from modules.recommendations.infrastructure.cache.redis_recommendation_result_cache import (
+    METRICS_KEY,
+    RedisRecommendationResultCache,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+        self.ttl = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value.encode() if isinstance(value, str) else value
+        self.ttl[key] = ex
+
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1).encode()
+
+    def hincrby(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        bucket[field] = bucket.get(field, 0) + amount
+
+
+class DownRedis:
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise RedisConnectionError("down")
+
+        return fail
+
+
+def _result() -> RecommendStudentHouseResult:
+    return RecommendStudentHouseResult(
+        finder_request_id=7,
+        generated_at="2026-01-01T00:00:00+00:00",
+        status="SUCCESS",
+        detail=None,
+        query_context={"policy_version": "v1"},
+        summary={"total_candidates": 1},
+        recommended_top_k=[{"house_platform_id": 1, "rank": 1}],
+        rejected_top_k=[],
+    )
+
+
+def test_round_trip_and_metrics():
+    redis = FakeRedis()
+    cache = RedisRecommendationResultCache(redis, ttl_sec=60)
+
+    assert cache.get("k") is None
+    cache.put("k", _result())
+
+    assert cache.get("k") == _result()
+    assert cache.stats()["hit"] == 1
+    assert cache.stats()["miss"] == 1
+    assert cache.stats()["hit_ratio"] == 0.5
+    assert redis.hashes[METRICS_KEY] == {"miss": 1, "hit": 1}
+    assert set(redis.ttl.values()) == {60}
+
+
+def test_invalidate_bumps_data_version():
+    cache = RedisRecommendationResultCache(FakeRedis())
+
+    assert cache.data_version() == 0
+    cache.invalidate()
+    cache.invalidate()
+
+    assert cache.data_version() == 2
+
+
+def test_redis_failure_falls_back_to_compute():
+    cache = RedisRecommendationResultCache(DownRedis())
+
+    assert cache.data_version() is None
+    assert cache.get("k") is None
+    cache.put("k", _result())
+    cache.invalidate()
+    assert cache.stats()["error"] == 2
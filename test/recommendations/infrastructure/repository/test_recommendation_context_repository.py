@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from modules.house_platform.domain.house_platform import HousePlatform
+from modules.recommendations.infrastructure.repository.recommendation_context_repository import (
+    RecommendationContextRepository,
+)
+
+BASE_TIME = datetime(2026, 1, 1)
+
+
+def _build_engine():
+    engine = create_engine("sqlite:///:memory:")
+    # sqlite 는 BIGINT PK 를 자동 증가시키지 않고 ARRAY/JSONB 를 만들 수 없어 DDL 로 만든다.
+    ddl = (
+        "CREATE TABLE house_platform ("
+        "house_platform_id INTEGER PRIMARY KEY, title TEXT, address TEXT, "
+        "deposit BIGINT, abang_user_id BIGINT, created_at DATETIME, "
+        "updated_at DATETIME, registered_at DATETIME, domain_id INTEGER, "
+        "rgst_no VARCHAR(50), snapshot_id VARCHAR(64), pnu_cd TEXT, "
+        "is_banned BOOLEAN, sales_type VARCHAR(20), monthly_rent BIGINT, "
+        "room_type VARCHAR(20), residence_type VARCHAR(50), "
+        "contract_area NUMERIC(10, 2), exclusive_area NUMERIC(10, 2), "
+        "floor_no INTEGER, all_floors INTEGER, lat_lng JSON, "
+        "manage_cost BIGINT, can_park BOOLEAN, has_elevator BOOLEAN, "
+        "image_urls TEXT, gu_nm VARCHAR(10), dong_nm VARCHAR(10))",
+        "CREATE TABLE student_recommendation_feature_observations ("
+        "id INTEGER PRIMARY KEY, house_platform_id BIGINT NOT NULL, "
+        "snapshot_id VARCHAR, risk_event_count INTEGER, risk_event_types TEXT, "
+        "risk_probability_est FLOAT, risk_severity_score FLOAT, "
+        "risk_nonlinear_penalty FLOAT, essential_option_coverage FLOAT, "
+        "convenience_score FLOAT, observation_notes JSON, "
+        "observation_version VARCHAR(20), source_data_version VARCHAR(20), "
+        "calculated_at DATETIME)",
+        "CREATE TABLE student_recommendation_price_observations ("
+        "id INTEGER PRIMARY KEY, house_platform_id BIGINT NOT NULL, "
+        "recommendation_observation_id BIGINT NOT NULL, \"가격_백분위\" FLOAT NOT NULL, "
+        "\"가격_z점수\" FLOAT NOT NULL, \"예상_입주비용\" INTEGER NOT NULL, "
+        "\"월_비용_추정\" INTEGER NOT NULL, \"가격_부담_비선형\" FLOAT NOT NULL, "
+        "calculated_at DATETIME)",
+        "CREATE TABLE student_recommendation_distance_observations ("
+        "id INTEGER PRIMARY KEY, house_id BIGINT NOT NULL, "
+        "recommendation_observation_id BIGINT NOT NULL, university_id BIGINT NOT NULL, "
+        "\"학교까지_분\" FLOAT NOT NULL, \"거리_백분위\" FLOAT NOT NULL, "
+        "\"거리_버킷\" VARCHAR(20) NOT NULL, \"거리_비선형_점수\" FLOAT NOT NULL, "
+        "calculated_at DATETIME)",
+        "INSERT INTO house_platform "
+        "(house_platform_id, title, deposit, monthly_rent, contract_area, lat_lng) "
+        "VALUES (1, '원룸', 1000, 50, 20.5, '{\"lat\": 37.5, \"lng\": 127.0}'), "
+        "(2, '투룸', 3000, 70, NULL, NULL)",
+    )
+    with engine.begin() as conn:
+        for statement in ddl:
+            conn.execute(text(statement))
+        for observation_id, move_in, minutes in ((1, 9000, 0), (2, 8000, 5)):
+            conn.execute(
+                text(
+                    "INSERT INTO student_recommendation_price_observations VALUES "
+                    "(:id, 1, 1, 0.5, 0.0, :move_in, 80, 0.5, :calculated_at)"
+                ),
+                dict(
+                    id=observation_id,
+                    move_in=move_in,
+                    calculated_at=BASE_TIME + timedelta(minutes=minutes),
+                ),
+            )
+        for observation_id, university_id, commute, minutes in (
+            (1, 10, 40.0, 0),
+            (2, 10, 20.0, 5),
+            (3, 20, 35.0, 0),
+        ):
+            conn.execute(
+                text(
+                    "INSERT INTO student_recommendation_distance_observations VALUES "
+                    "(:id, 1, 1, :university_id, :commute, 0.5, '10_20분', 0.5, "
+                    ":calculated_at)"
+                ),
+                dict(
+                    id=observation_id,
+                    university_id=university_id,
+                    commute=commute,
+                    calculated_at=BASE_TIME + timedelta(minutes=minutes),
+                ),
+            )
+    return engine
+
+
+def test_load_reads_each_kind_in_one_query():
+    """매물과 feature/가격/거리 관측치를 종류별 한 번의 조회로 모은다."""
+    engine = _build_engine()
+    statements: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    context = RecommendationContextRepository(sessionmaker(bind=engine)).load(
+        [2, 1, 2, 3]
+    )
+
+    selects = [
+        statement
+        for statement in statements
+        if statement.lstrip().upper().startswith("SELECT")
+    ]
+    assert len(selects) == 4
+    assert set(context.houses) == {1, 2}
+    assert isinstance(context.houses[1], HousePlatform)
+    assert context.houses[1].title == "원룸"
+    assert context.houses[1].contract_area == 20.5
+    assert context.houses[1].lat_lng == {"lat": 37.5, "lng": 127.0}
+    assert context.feature_observations == {}
+    assert {
+        house_id: price.예상_입주비용
+        for house_id, price in context.price_observations.items()
+    } == {1: 8000}
+    assert {
+        house_id: {item.university_id: item.학교까지_분 for item in items}
+        for house_id, items in context.distance_observations.items()
+    } == {1: {10: 20.0, 20: 35.0}}
+
+
+def test_load_skips_queries_for_empty_ids():
+    """ID 가 없으면 조회하지 않는다."""
+    engine = _build_engine()
+    statements: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    context = RecommendationContextRepository(sessionmaker(bind=engine)).load([])
+
+    assert context.houses == {}
+    assert statements == []
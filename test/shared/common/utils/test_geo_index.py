@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from modules.house_platform.application.dto.house_platform_location_dto import (
+    HousePlatformLocation,
+)
+from shared.common.utils.geo_index import GeoGridIndex, haversine_km
+
+
+class Point:
+    def __init__(self, point_id, lat, lng):
+        self.point_id = point_id
+        self.lat = lat
+        self.lng = lng
+
+
+def _points(count=500, seed=0):
+    rng = np.random.default_rng(seed)
+    lats = 35.0 + rng.random(count) * 3.0
+    lngs = 126.5 + rng.random(count) * 3.0
+    return [Point(i, float(lat), float(lng)) for i, (lat, lng) in enumerate(zip(lats, lngs))]
+
+
+def _brute_force(points, lat, lng):
+    distances = [(p, float(haversine_km(lat, lng, p.lat, p.lng))) for p in points]
+    return sorted(distances, key=lambda item: item[1])
+
+
+@pytest.mark.parametrize("radius_km", [0.5, 3.0, 12.0, 80.0])
+def test_within_km_matches_brute_force(radius_km):
+    points = _points()
+    index = GeoGridIndex(points, cell_km=4.0)
+
+    for query in _points(count=20, seed=1):
+        expected = [
+            (p.point_id, pytest.approx(d))
+            for p, d in _brute_force(points, query.lat, query.lng)
+            if d <= radius_km
+        ]
+        actual = [
+            (p.point_id, d) for p, d in index.within_km(query.lat, query.lng, radius_km)
+        ]
+        assert actual == expected
+
+
+@pytest.mark.parametrize("k", [1, 5, 40])
+def test_nearest_matches_brute_force(k):
+    points = _points()
+    index = GeoGridIndex(points, cell_km=2.0)
+
+    for query in _points(count=20, seed=2) + [Point(-1, 33.0, 124.0)]:
+        expected = [
+            p.point_id for p, _ in _brute_force(points, query.lat, query.lng)[:k]
+        ]
+        actual = [p.point_id for p, _ in index.nearest(query.lat, query.lng, k)]
+        assert actual == expected
+
+
+def test_nearest_returns_all_when_k_exceeds_size_and_handles_empty():
+    points = _points(count=3)
+    assert len(GeoGridIndex(points).nearest(36.0, 127.0, 10)) == 3
+    assert GeoGridIndex([]).nearest(36.0, 127.0, 3) == []
+    assert GeoGridIndex([]).within_km(36.0, 127.0, 10.0) == []
+
+
+def test_index_over_house_locations():
+    """매물 좌표(HousePlatformLocation)도 같은 인덱스로 반경 조회한다."""
+    houses = [
+        HousePlatformLocation(house_platform_id=1, lat=37.5665, lng=126.9780),
+        HousePlatformLocation(house_platform_id=2, lat=37.5700, lng=126.9820),
+        HousePlatformLocation(house_platform_id=3, lat=35.1796, lng=129.0756),
+    ]
+    index = GeoGridIndex(houses, cell_km=1.0)
+
+    nearby = index.within_km(37.5665, 126.9780, 2.0)
+
+    assert [house.house_platform_id for house, _ in nearby] == [1, 2]
+    assert nearby[0][1] == pytest.approx(0.0)
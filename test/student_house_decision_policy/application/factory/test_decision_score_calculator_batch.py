@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import random
+
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    ObservationScoreSource,
+)
+from modules.student_house_decision_policy.application.factory.decision_score_calculator import (
+    DecisionScoreCalculator,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+
+def _maybe(rng: random.Random, value: float) -> float | None:
+    return None if rng.random() < 0.15 else value
+
+
+def _build_sources(count: int, seed: int = 7) -> list[ObservationScoreSource]:
+    rng = random.Random(seed)
+    sources = []
+    for index in range(count):
+        # 반올림 경계값이 자주 나오도록 소수 둘째 자리 값을 섞는다.
+        ratio = lambda: rng.choice(
+            [round(rng.random(), 2), rng.random(), rng.uniform(-0.2, 1.2)]
+        )
+        sources.append(
+            ObservationScoreSource(
+                house_platform_id=index + 1,
+                snapshot_id=f"snap-{index}",
+                observation_version="v1",
+                price_percentile=_maybe(rng, ratio()),
+                price_zscore=_maybe(rng, rng.uniform(-4.0, 4.0)),
+                price_burden_nonlinear=_maybe(rng, ratio()),
+                estimated_move_in_cost=rng.randint(0, 50000),
+                monthly_cost_est=rng.randint(0, 200),
+                essential_option_coverage=_maybe(
+                    rng, rng.choice([ratio(), rng.uniform(1.0, 100.0)])
+                ),
+                convenience_score=_maybe(rng, ratio()),
+                risk_probability_est=_maybe(rng, ratio()),
+                risk_severity_score=_maybe(rng, ratio()),
+                risk_nonlinear_penalty=_maybe(rng, ratio()),
+                distance_to_school_min=rng.choice(
+                    [rng.uniform(0.0, 90.0), float(rng.randint(0, 90))]
+                ),
+                distance_percentile=ratio(),
+                distance_nonlinear_score=ratio(),
+            )
+        )
+    return sources
+
+
+def _assert_same_records(policy: DecisionPolicyConfig, count: int) -> None:
+    calculator = DecisionScoreCalculator(policy)
+    sources = _build_sources(count)
+
+    expected = [
+        calculator.calculate(source, "v1", policy.policy_version)
+        for source in sources
+    ]
+    actual = calculator.calculate_many(sources, "v1", policy.policy_version)
+
+    assert actual == expected
+
+
+def test_calculate_many_matches_calculate_with_default_policy():
+    """일괄 계산 결과가 단건 계산과 정확히 같아야 한다."""
+    _assert_same_records(DecisionPolicyConfig(), 5000)
+
+
+def test_calculate_many_matches_calculate_with_custom_policy():
+    """가중치/구간을 바꾼 정책에서도 단건 계산과 같아야 한다."""
+    policy = DecisionPolicyConfig(
+        weight_price=0.5,
+        weight_risk=0.1,
+        weight_option=0.1,
+        weight_distance=0.3,
+        threshold_base_total=60.0,
+        price_feature_weights=(0.2, 0.2, 0.6),
+        option_feature_weights=(0.0, 0.0),
+        zscore_min=-2.0,
+        zscore_max=2.5,
+        distance_full_score_min=5.0,
+        distance_zero_score_min=45.0,
+    )
+    _assert_same_records(policy, 2000)
+
+
+def test_calculate_many_with_all_missing_scores():
+    """모든 선택 지표가 없으면 거리 점수만으로 총점을 계산한다."""
+    source = ObservationScoreSource(
+        house_platform_id=1,
+        snapshot_id=None,
+        observation_version=None,
+        price_percentile=None,
+        price_zscore=None,
+        price_burden_nonlinear=None,
+        estimated_move_in_cost=0,
+        monthly_cost_est=0,
+        essential_option_coverage=None,
+        convenience_score=None,
+        risk_probability_est=None,
+        risk_severity_score=None,
+        risk_nonlinear_penalty=None,
+        distance_to_school_min=10.0,
+        distance_percentile=0.25,
+        distance_nonlinear_score=0.35,
+    )
+    calculator = DecisionScoreCalculator(DecisionPolicyConfig())
+
+    [record] = calculator.calculate_many([source], "v1", "v1")
+
+    assert record == calculator.calculate(source, "v1", "v1")
+    assert record.price_score is None
+    assert record.option_score is None
+    assert record.risk_score is None
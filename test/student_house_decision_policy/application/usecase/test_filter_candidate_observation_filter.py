@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from modules.finder_request.domain.finder_request import FinderRequest
+from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    FilterCandidateCommand,
+)
+from modules.student_house_decision_policy.application.usecase.filter_candidate import (
+    FilterCandidateService,
+)
+from modules.student_house_decision_policy.domain.value_object.budget_filter_policy import (
+    BudgetFilterPolicy,
+)
+
+
+class FakeFinderRequestRepo:
+    def __init__(self, request):
+        self.request = request
+
+    def find_by_id(self, finder_request_id):
+        return self.request
+
+
+class FakeCandidateRepo:
+    def fetch_candidates(self, criteria):
+        return [SimpleNamespace(house_platform_id=house_id) for house_id in (1, 2, 3)]
+
+
+class FakeUniversityRepo:
+    def get_university_locations(self):
+        return [SimpleNamespace(university_location_id=10, university_name="서울대학교")]
+
+
+class FakeObservationFilter:
+    """통학 시간 관측치로 일괄 쿼리를 흉내 낸다. (3 은 가격 초과)"""
+
+    def __init__(self):
+        self.minutes = {1: 10.0, 2: 25.0, 3: 5.0}
+        self.calls: list[dict] = []
+
+    def filter_house_platform_ids(
+        self,
+        house_platform_ids,
+        max_deposit_limit,
+        max_rent_limit,
+        university_location_id=None,
+        max_commute_minutes=None,
+    ):
+        self.calls.append(
+            dict(
+                ids=list(house_platform_ids),
+                max_deposit_limit=max_deposit_limit,
+                university_location_id=university_location_id,
+                max_commute_minutes=max_commute_minutes,
+            )
+        )
+        passed = {house_id for house_id in house_platform_ids if house_id != 3}
+        if university_location_id is not None and max_commute_minutes is not None:
+            passed = {
+                house_id
+                for house_id in passed
+                if self.minutes[house_id] <= max_commute_minutes
+            }
+        return passed
+
+
+class ForbiddenRepo:
+    def __getattr__(self, name):
+        raise AssertionError("일괄 필터 사용 시 건별 관측 조회를 하면 안 된다.")
+
+
+def _service(observation_filter, policy=None, is_near=True):
+    request = FinderRequest(
+        abang_user_id=1,
+        status="Y",
+        finder_request_id=7,
+        max_deposit=1000,
+        max_rent=50,
+        university_name="서울대학교",
+        is_near=is_near,
+    )
+    return FilterCandidateService(
+        finder_request_repo=FakeFinderRequestRepo(request),
+        house_platform_repo=FakeCandidateRepo(),
+        price_observation_repo=ForbiddenRepo(),
+        distance_observation_repo=ForbiddenRepo(),
+        university_repo=FakeUniversityRepo(),
+        policy=policy,
+        observation_filter=observation_filter,
+    )
+
+
+def _candidate_ids(result):
+    return [candidate.house_platform_id for candidate in result.candidates]
+
+
+def test_observation_filter_applies_near_commute_threshold():
+    """가까운 매물 요청이면 대학 ID와 정책의 통학 상한으로 일괄 필터링한다."""
+    observation_filter = FakeObservationFilter()
+
+    default_result = _service(observation_filter).execute(
+        FilterCandidateCommand(finder_request_id=7)
+    )
+    strict_result = _service(
+        observation_filter, policy=BudgetFilterPolicy(near_commute_minutes=20.0)
+    ).execute(FilterCandidateCommand(finder_request_id=7))
+
+    assert _candidate_ids(default_result) == [1, 2]
+    assert _candidate_ids(strict_result) == [1]
+    assert [call["max_commute_minutes"] for call in observation_filter.calls] == [30.0, 20.0]
+    assert all(call["university_location_id"] == 10 for call in observation_filter.calls)
+    assert observation_filter.calls[0]["ids"] == [1, 2, 3]
+    assert observation_filter.calls[0]["max_deposit_limit"] == 1100
+
+
+def test_observation_filter_skips_distance_when_not_near():
+    """가까운 매물 요청이 아니면 거리 조건 없이 가격 조건만 적용한다."""
+    observation_filter = FakeObservationFilter()
+
+    result = _service(
+        observation_filter,
+        policy=BudgetFilterPolicy(near_commute_minutes=20.0),
+        is_near=False,
+    ).execute(FilterCandidateCommand(finder_request_id=7))
+
+    assert _candidate_ids(result) == [1, 2]
+    assert observation_filter.calls[0]["university_location_id"] is None
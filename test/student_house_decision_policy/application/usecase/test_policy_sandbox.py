@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import threading
+
+from modules.observations.domain.model.distance_feature_observation import (
+    DistanceFeatureObservation,
+)
+from modules.observations.domain.model.price_feature_observation import (
+    PriceFeatureObservation,
+)
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    StudentHouseScoreSummary,
+)
+from modules.student_house_decision_policy.application.dto.policy_sandbox_dto import (
+    PolicySandboxCommand,
+)
+from modules.student_house_decision_policy.application.usecase.policy_sandbox import (
+    ObservationSourceCache,
+    PolicySandboxService,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+
+class _FakeBulkObservationRepository:
+    def __init__(self):
+        # 1: 싸지만 멀다, 2: 비싸지만 가깝다, 3: 가격 관측치 없음
+        self._prices = {
+            1: _price(1, percentile=0.1, burden=0.1),
+            2: _price(2, percentile=0.9, burden=0.9),
+        }
+        self._distances = {
+            1: [_distance(1, minutes=55.0, percentile=0.9, score=0.1)],
+            2: [_distance(2, minutes=5.0, percentile=0.1, score=0.9)],
+            3: [_distance(3, minutes=5.0, percentile=0.1, score=0.9)],
+        }
+        self.calls = 0
+
+    def fetch_latest_features(self, ids):
+        self.calls += 1
+        return {}
+
+    def fetch_latest_prices(self, ids):
+        return {i: self._prices[i] for i in ids if i in self._prices}
+
+    def fetch_latest_distances(self, ids):
+        return {i: self._distances[i] for i in ids if i in self._distances}
+
+
+class _FakeUniversityRepository:
+    def get_unique_university_locations(self):
+        return [1]
+
+
+class _ReadOnlyScoreRepository:
+    def fetch_by_house_platform_ids(self, ids, policy_version=None):
+        return [_summary(1, 70.0), _summary(2, 40.0)]
+
+    def upsert_score(self, score):
+        raise AssertionError("샌드박스는 점수를 저장하면 안 된다.")
+
+    def upsert_scores(self, scores):
+        raise AssertionError("샌드박스는 점수를 저장하면 안 된다.")
+
+
+def _price(house_id, percentile, burden):
+    return PriceFeatureObservation(
+        id=house_id,
+        house_platform_id=house_id,
+        recommendation_observation_id=house_id,
+        가격_백분위=percentile,
+        가격_z점수=0.0,
+        예상_입주비용=1000,
+        월_비용_추정=50,
+        가격_부담_비선형=burden,
+    )
+
+
+def _distance(house_id, minutes, percentile, score):
+    return DistanceFeatureObservation(
+        id=house_id,
+        house_platform_id=house_id,
+        recommendation_observation_id=house_id,
+        university_id=1,
+        학교까지_분=minutes,
+        거리_백분위=percentile,
+        거리_버킷="0_10분",
+        거리_비선형_점수=score,
+    )
+
+
+def _summary(house_id, total):
+    return StudentHouseScoreSummary(
+        house_platform_id=house_id,
+        base_total_score=total,
+        price_score=total,
+        option_score=total,
+        risk_score=total,
+        distance_score=total,
+        observation_version="v1",
+        policy_version="v1",
+    )
+
+
+def test_policy_sandbox_reranks_without_persisting():
+    """거리 가중치를 키우면 가까운 매물이 추천으로 올라와야 한다."""
+    observation_repo = _FakeBulkObservationRepository()
+    service = PolicySandboxService(
+        filter_usecase=None,
+        observation_bulk_repo=observation_repo,
+        university_repo=_FakeUniversityRepository(),
+        score_repo=_ReadOnlyScoreRepository(),
+    )
+    command = PolicySandboxCommand(
+        finder_request_id=1,
+        policy=DecisionPolicyConfig(
+            weight_price=0.0,
+            weight_risk=0.0,
+            weight_option=0.0,
+            weight_distance=1.0,
+            policy_version="sandbox",
+        ),
+        candidate_house_platform_ids=[1, 2, 3],
+    )
+
+    result = service.execute(command)
+
+    assert result.missing_observation_ids == [3]
+    assert [item.house_platform_id for item in result.recommended_top_k] == [2]
+    assert result.recommended_top_k[0].stored_decision_status == "REJECTED"
+    assert result.diff.newly_recommended == [2]
+    assert result.diff.newly_rejected == [1]
+
+    # 같은 후보군 재실험은 캐시된 관측치를 사용한다.
+    service.execute(command)
+    assert observation_repo.calls == 1
+
+
+def test_shared_source_cache_is_safe_across_threads():
+    """여러 요청 스레드가 같은 캐시에 동시에 저장/정리해도 예외 없이 크기 한도를 지킨다."""
+    cache = ObservationSourceCache(max_size=100)
+    errors: list[Exception] = []
+
+    def worker(offset: int):
+        try:
+            for step in range(200):
+                now = float(step)
+                cache.put_many({offset * 1000 + step: None}, now, ttl_sec=5.0)
+                cache.get(offset * 1000 + step, now, ttl_sec=5.0)
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(cache) <= 100
+
+
+def test_source_cache_expires_entries_after_ttl():
+    """TTL 이 지난 항목은 조회되지 않는다."""
+    cache = ObservationSourceCache()
+    cache.put_many({1: None}, now=0.0, ttl_sec=10.0)
+
+    assert cache.get(1, now=5.0, ttl_sec=10.0) == (True, None)
+    assert cache.get(1, now=10.0, ttl_sec=10.0) == (False, None)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from modules.observations.domain.model.distance_feature_observation import (
+    DistanceFeatureObservation,
+)
+from modules.observations.domain.model.price_feature_observation import (
+    PriceFeatureObservation,
+)
+from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    FilterCandidate,
+)
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    RefreshStudentHouseScoreCommand,
+)
+from modules.student_house_decision_policy.application.usecase.refresh_student_house_score import (
+    RefreshStudentHouseScoreService,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+
+class _FakeCandidateRepository:
+    def __init__(self, ids):
+        self._candidates = [
+            FilterCandidate(
+                house_platform_id=house_id,
+                snapshot_id=f"snap-{house_id}",
+                deposit=1000,
+                monthly_rent=50,
+                manage_cost=5,
+            )
+            for house_id in ids
+        ]
+        self.page_calls = 0
+
+    def fetch_candidates(self, criteria, limit=None):
+        return list(self._candidates)
+
+    def fetch_candidate_page(self, criteria, after_house_platform_id, limit):
+        self.page_calls += 1
+        rows = [
+            item
+            for item in self._candidates
+            if after_house_platform_id is None
+            or item.house_platform_id > after_house_platform_id
+        ]
+        return rows[:limit]
+
+
+class _FakeObservationRepository:
+    """건별/일괄 조회를 모두 제공하는 관측 mock 저장소."""
+
+    def __init__(self, prices, distances):
+        self._prices = prices
+        self._distances = distances
+        self.bulk_calls = 0
+
+    def find_latest_by_house_id(self, house_id):
+        return None
+
+    def get_by_house_platform_id(self, house_platform_id):
+        return self._prices.get(house_platform_id)
+
+    def get_bulk_by_house_platform_id(self, house_platform_id):
+        return self._distances.get(house_platform_id, [])
+
+    def fetch_latest_features(self, house_platform_ids):
+        self.bulk_calls += 1
+        return {}
+
+    def fetch_latest_prices(self, house_platform_ids):
+        self.bulk_calls += 1
+        return {
+            house_id: self._prices[house_id]
+            for house_id in house_platform_ids
+            if house_id in self._prices
+        }
+
+    def fetch_latest_distances(self, house_platform_ids):
+        self.bulk_calls += 1
+        return {
+            house_id: self._distances[house_id]
+            for house_id in house_platform_ids
+            if house_id in self._distances
+        }
+
+
+class _FakeUniversityRepository:
+    def get_unique_university_locations(self):
+        return [1]
+
+
+class _FakeScoreRepository:
+    def __init__(self):
+        self.scores = {}
+        self.failures = {}
+        self.upsert_calls = 0
+
+    def upsert_score(self, score):
+        self.scores[score.house_platform_id] = score
+        return score.house_platform_id
+
+    def mark_failed(self, house_platform_id, reason):
+        self.failures[house_platform_id] = reason
+
+    def upsert_scores(self, scores):
+        self.upsert_calls += 1
+        for score in scores:
+            self.scores[score.house_platform_id] = score
+        return len(scores)
+
+    def mark_failed_bulk(self, failures):
+        self.failures.update(dict(failures))
+
+
+def _build_observations(ids):
+    prices = {
+        house_id: PriceFeatureObservation(
+            id=house_id,
+            house_platform_id=house_id,
+            recommendation_observation_id=house_id,
+            가격_백분위=(house_id % 10) / 10,
+            가격_z점수=0.0,
+            예상_입주비용=1000,
+            월_비용_추정=60,
+            가격_부담_비선형=0.5,
+        )
+        for house_id in ids
+        if house_id % 7 != 0
+    }
+    distances = {
+        house_id: [
+            DistanceFeatureObservation(
+                id=house_id,
+                house_platform_id=house_id,
+                recommendation_observation_id=house_id,
+                university_id=1,
+                학교까지_분=float(house_id % 40),
+                거리_백분위=0.5,
+                거리_버킷="10_20분",
+                거리_비선형_점수=0.5,
+            )
+        ]
+        for house_id in ids
+    }
+    return prices, distances
+
+
+def _build_service(ids, score_repo, chunked):
+    prices, distances = _build_observations(ids)
+    observation_repo = _FakeObservationRepository(prices, distances)
+    candidate_repo = _FakeCandidateRepository(ids)
+    service = RefreshStudentHouseScoreService(
+        house_platform_repo=candidate_repo,
+        feature_observation_repo=observation_repo,
+        price_observation_repo=observation_repo,
+        distance_observation_repo=observation_repo,
+        university_repo=_FakeUniversityRepository(),
+        student_house_repo=score_repo,
+        policy=DecisionPolicyConfig(policy_version="v-test"),
+        observation_bulk_repo=observation_repo if chunked else None,
+        chunk_size=10,
+    )
+    return service, candidate_repo, observation_repo
+
+
+def test_chunked_refresh_matches_per_house_refresh():
+    """청크 일괄 갱신 결과가 건별 갱신 결과와 같아야 한다."""
+    ids = list(range(1, 26))
+    command = RefreshStudentHouseScoreCommand(observation_version="v1")
+
+    legacy_repo = _FakeScoreRepository()
+    legacy_service, _, _ = _build_service(ids, legacy_repo, chunked=False)
+    legacy_result = legacy_service.execute(command)
+
+    chunked_repo = _FakeScoreRepository()
+    chunked_service, candidate_repo, observation_repo = _build_service(
+        ids, chunked_repo, chunked=True
+    )
+    chunked_result = chunked_service.execute(command)
+
+    assert chunked_result == legacy_result
+    assert chunked_repo.scores == legacy_repo.scores
+    assert chunked_repo.failures == legacy_repo.failures
+    assert set(chunked_repo.failures) == {7, 14, 21}
+    # 25건을 10건 청크로 나누면 3페이지, 청크당 관측 조회 3회/업서트 1회다.
+    assert candidate_repo.page_calls == 3
+    assert observation_repo.bulk_calls == 9
+    assert chunked_repo.upsert_calls == 3
+
+
+def test_refresh_invalidates_recommendation_cache():
+    """점수 갱신 후 추천 결과 캐시를 무효화해야 한다."""
+    invalidations = []
+
+    class _Invalidator:
+        def invalidate(self):
+            invalidations.append(True)
+
+    service, _, _ = _build_service(
+        list(range(1, 6)), _FakeScoreRepository(), chunked=True
+    )
+    service.cache_invalidator = _Invalidator()
+    service.execute(RefreshStudentHouseScoreCommand(observation_version="v1"))
+
+    assert invalidations == [True]
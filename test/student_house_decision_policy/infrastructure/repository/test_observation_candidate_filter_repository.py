@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import (
+    StudentRecommendationDistanceObservationORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import (
+    StudentRecommendationPriceObservationsORM,
+)
+from modules.student_house_decision_policy.infrastructure.repository.observation_candidate_filter_repository import (
+    ObservationCandidateFilterRepository,
+)
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _price(id_, house_id, move_in, monthly, minutes_offset=0):
+    return StudentRecommendationPriceObservationsORM(
+        id=id_,
+        house_platform_id=house_id,
+        recommendation_observation_id=id_,
+        가격_백분위=0.5,
+        가격_z점수=0.0,
+        예상_입주비용=move_in,
+        월_비용_추정=monthly,
+        가격_부담_비선형=0.5,
+        calculated_at=BASE_TIME + timedelta(minutes=minutes_offset),
+    )
+
+
+def _distance(id_, house_id, university_id, minutes, minutes_offset=0):
+    return StudentRecommendationDistanceObservationORM(
+        id=id_,
+        house_id=house_id,
+        recommendation_observation_id=id_,
+        university_id=university_id,
+        학교까지_분=minutes,
+        거리_백분위=0.5,
+        거리_버킷="10_20분",
+        거리_비선형_점수=0.5,
+        calculated_at=BASE_TIME + timedelta(minutes=minutes_offset),
+    )
+
+
+def _build_session_factory():
+    engine = create_engine("sqlite:///:memory:")
+    StudentRecommendationPriceObservationsORM.metadata.create_all(engine)
+    StudentRecommendationDistanceObservationORM.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    session.add_all(
+        [
+            # 1: 최신 가격이 예산 이내
+            _price(1, 1, 9000, 90, 0),
+            _price(2, 1, 20000, 200, -10),
+            # 2: 최신 가격이 예산 초과
+            _price(3, 2, 9000, 90, -10),
+            _price(4, 2, 20000, 200, 0),
+            # 3: 예산 이내, 통학 거리 초과
+            _price(5, 3, 5000, 50, 0),
+            # 4: 가격 관측치 없음
+        ]
+    )
+    session.add_all(
+        [
+            _distance(1, 1, 10, 40.0, -10),
+            _distance(2, 1, 10, 20.0, 0),
+            _distance(3, 1, 20, 50.0, 0),
+            _distance(4, 3, 10, 45.0, 0),
+            _distance(5, 3, 20, 10.0, 0),
+            _distance(6, 4, 10, 5.0, 0),
+        ]
+    )
+    session.commit()
+    session.close()
+    return Session
+
+
+def test_filter_house_platform_ids_applies_latest_price_budget():
+    """최신 가격 관측치 기준으로 예산 조건을 적용한다."""
+    repo = ObservationCandidateFilterRepository(_build_session_factory())
+
+    result = repo.filter_house_platform_ids(
+        [1, 2, 3, 4], max_deposit_limit=10000, max_rent_limit=100
+    )
+
+    assert result == {1, 3}
+
+
+def test_filter_house_platform_ids_applies_university_commute():
+    """대학별 최신 거리 관측치로 통학 조건을 함께 적용한다."""
+    repo = ObservationCandidateFilterRepository(_build_session_factory())
+
+    result = repo.filter_house_platform_ids(
+        [1, 2, 3, 4],
+        max_deposit_limit=10000,
+        max_rent_limit=100,
+        university_location_id=10,
+        max_commute_minutes=30.0,
+    )
+
+    assert result == {1}